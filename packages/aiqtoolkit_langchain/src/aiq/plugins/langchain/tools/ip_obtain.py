@@ -1,7 +1,18 @@
+import logging
+
+from pydantic import Field
+
 from aiq.builder.builder import Builder
 from aiq.builder.function_info import FunctionInfo
 from aiq.cli.register_workflow import register_function
 from aiq.data_models.function import FunctionBaseConfig
+from aiq.plugins.langchain.tools.ttl_cache import AsyncTTLCache
+
+logger = logging.getLogger(__name__)
+
+# Shared by every ip_obtain instance in the process, the public IP is the same for all of them
+_public_ip_cache: AsyncTTLCache[str] = AsyncTTLCache(max_entries=8)
+
 
 class IPObtainToolConfig(FunctionBaseConfig, name="ip_obtain"):
     """
@@ -9,20 +20,34 @@ class IPObtainToolConfig(FunctionBaseConfig, name="ip_obtain"):
     """
     max_results: int = 1
     api_key: str = ""
-    
+    url: str = Field(default="https://ifconfig.me/ip", description="Service returning the caller's public IP as text.")
+    timeout: float = Field(default=10.0, description="Request timeout in seconds.")
+    cache_ttl_seconds: float = Field(default=600.0,
+                                     description="How long the public IP is cached. Set to 0 to disable caching.",
+                                     ge=0)
+
+
 @register_function(config_type=IPObtainToolConfig)
 async def ip_obtain(tool_config: IPObtainToolConfig, builder: Builder):
-    import os 
-    import requests
-    
-    async def get_public_ip(question: str) -> str:
-        return requests.get("https://ifconfig.me").text.strip()
-    
-    yield FunctionInfo.from_fn(
-        get_public_ip,
-        description=("""This tool retrieves relevant IP from public.
-
-                        Args:
-                            question (str): The question to be answered.
-                    """),
-    )
\ No newline at end of file
+    import httpx
+
+    async with httpx.AsyncClient(timeout=tool_config.timeout, follow_redirects=True) as client:
+
+        async def _fetch_public_ip() -> str:
+            response = await client.get(tool_config.url)
+            response.raise_for_status()
+            return response.text.strip()
+
+        async def get_public_ip(question: str) -> str:
+            return await _public_ip_cache.get_or_set(tool_config.url,
+                                                     _fetch_public_ip,
+                                                     ttl_seconds=tool_config.cache_ttl_seconds)
+
+        yield FunctionInfo.from_fn(
+            get_public_ip,
+            description=("""This tool retrieves relevant IP from public.
+
+                            Args:
+                                question (str): The question to be answered.
+                        """),
+        )
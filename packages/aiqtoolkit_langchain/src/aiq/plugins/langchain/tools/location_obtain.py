@@ -1,43 +1,122 @@
+import logging
+
+from pydantic import Field
+
 from aiq.builder.builder import Builder
 from aiq.builder.function_info import FunctionInfo
 from aiq.cli.register_workflow import register_function
 from aiq.data_models.function import FunctionBaseConfig
+from aiq.plugins.langchain.tools.ttl_cache import AsyncTTLCache
+
+logger = logging.getLogger(__name__)
+
+# Shared by every current_location instance in the process, keyed by (backend, ip)
+_location_cache: AsyncTTLCache[dict] = AsyncTTLCache(max_entries=4096)
+
 
 class LocationToolConfig(FunctionBaseConfig, name="current_location"):
     max_results: int = 1
     api_key: str = ""
-    
+    timeout: float = Field(default=10.0, description="Request timeout in seconds for the ip-api.com lookup.")
+    cache_ttl_seconds: float = Field(default=24 * 60 * 60,
+                                     description="How long IP to location results are cached. Set to 0 to disable.",
+                                     ge=0)
+    geoip_database: str | None = Field(
+        default=None,
+        description=("Path to a MaxMind GeoLite2/GeoIP2 City database. When set, lookups are answered offline from "
+                     "the database (requires the `geoip2` package) instead of calling ip-api.com."))
+
+
+def _is_success(data: dict) -> bool:
+    return data.get("status") == "success"
+
+
+def _format_location(data: dict) -> str:
+    # 格式化输出，使其更具可读性
+    return (f"IP 地址: {data['query']}\n"
+            f"国家: {data['country']} ({data['countryCode']})\n"
+            f"地区: {data['regionName']} ({data['region']})\n"
+            f"城市: {data['city']}\n"
+            f"经度: {data['lon']}\n"
+            f"纬度: {data['lat']}\n"
+            f"ISP: {data['isp']}\n"
+            f"组织: {data['org']}")
+
+
+def _lookup_geoip(reader, ip_address: str) -> dict:
+    import geoip2.errors
+
+    try:
+        record = reader.city(ip_address)
+    except (geoip2.errors.AddressNotFoundError, ValueError):
+        return {"status": "fail", "query": ip_address}
+
+    subdivision = record.subdivisions.most_specific
+
+    # Normalize to the ip-api.com field names so both backends share the same formatting
+    return {
+        "status": "success",
+        "query": ip_address,
+        "country": record.country.name or "",
+        "countryCode": record.country.iso_code or "",
+        "regionName": subdivision.name or "",
+        "region": subdivision.iso_code or "",
+        "city": record.city.name or "",
+        "lon": record.location.longitude,
+        "lat": record.location.latitude,
+        "isp": "",
+        "org": "",
+    }
+
 
 @register_function(config_type=LocationToolConfig)
 async def location_obtain(tool_config: LocationToolConfig, builder: Builder):
-    import os 
-    import requests
-    
-    async def get_ip_location(ip_address: str) -> str:
-        # 使用 ip-api.com 的免费 API
-        url = f"http://ip-api.com/json/{ip_address}?lang=zh-CN"
-        response = requests.get(url)
-        data = response.json()
-
-        if data['status'] == 'success':
-            # 格式化输出，使其更具可读性
-            location_info = (
-                f"IP 地址: {data['query']}\n"
-                f"国家: {data['country']} ({data['countryCode']})\n"
-                f"地区: {data['regionName']} ({data['region']})\n"
-                f"城市: {data['city']}\n"
-                f"经度: {data['lon']}\n"
-                f"纬度: {data['lat']}\n"
-                f"ISP: {data['isp']}\n"
-                f"组织: {data['org']}"
+    import httpx
+
+    reader = None
+    if tool_config.geoip_database:
+        from aiq.utils.optional_imports import optional_import
+
+        geoip2_database = optional_import("geoip2.database")
+        reader = geoip2_database.Reader(tool_config.geoip_database, locales=["zh-CN", "en"])
+
+    async with httpx.AsyncClient(timeout=tool_config.timeout) as client:
+
+        async def _fetch_location(ip_address: str) -> dict:
+            if reader is not None:
+                # Memory-mapped database lookups take microseconds, no need to leave the event loop
+                return _lookup_geoip(reader, ip_address)
+
+            # 使用 ip-api.com 的免费 API
+            response = await client.get(f"http://ip-api.com/json/{ip_address}", params={"lang": "zh-CN"})
+            response.raise_for_status()
+            return response.json()
+
+        async def get_ip_location(ip_address: str) -> str:
+            ip_address = ip_address.strip()
+            backend = "geoip" if reader is not None else "ip-api"
+
+            # Only successful lookups are cached, a failed one (`"status": "fail"`) is retried on the next call
+            data = await _location_cache.get_or_set((backend, ip_address),
+                                                    factory=lambda: _fetch_location(ip_address),
+                                                    ttl_seconds=tool_config.cache_ttl_seconds,
+                                                    should_cache=_is_success)
+
+            if not _is_success(data):
+                logger.warning("Location lookup failed for IP '%s': %s", ip_address, data.get("message", ""))
+                return f"无法获取 IP 地址 {ip_address} 的位置信息"
+
+            return _format_location(data)
+
+        try:
+            yield FunctionInfo.from_fn(
+                get_ip_location,
+                description=("""This tool retrieves relevant location from IP.
+
+                                Args:
+                                    question (str): The question to be answered.
+                            """),
             )
-            return location_info
-    
-    yield FunctionInfo.from_fn(
-        get_ip_location,
-        description=("""This tool retrieves relevant location from IP.
-
-                        Args:
-                            question (str): The question to be answered.
-                    """),
-    )
\ No newline at end of file
+        finally:
+            if reader is not None:
+                reader.close()
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+import typing
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+T = typing.TypeVar("T")
+
+
+class AsyncTTLCache(typing.Generic[T]):
+    """
+    Small in-process cache whose entries expire ``ttl_seconds`` after they were stored.
+
+    Concurrent misses for the same key share a single call to the value factory, so a burst of sessions asking for
+    the same lookup only produces one upstream request.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self._max_entries = max_entries
+        self._entries: dict[typing.Hashable, tuple[float, T]] = {}
+        self._pending: dict[typing.Hashable, asyncio.Task[T]] = {}
+
+    def get(self, key: typing.Hashable) -> T | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        return value
+
+    def set(self, key: typing.Hashable, value: T, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0:
+            return
+
+        if key not in self._entries and len(self._entries) >= self._max_entries:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del self._entries[next(iter(self._entries))]
+
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_set(self,
+                         key: typing.Hashable,
+                         factory: Callable[[], Awaitable[T]],
+                         ttl_seconds: float,
+                         should_cache: Callable[[T], bool] | None = None) -> T:
+        """
+        Return the cached value of ``key``, or the value returned by ``factory``. Values for which ``should_cache``
+        returns False, e.g. failed lookups, are handed to the concurrent callers but not stored.
+
+        The factory runs in its own task, so a caller being cancelled cancels neither the lookup nor the other callers
+        waiting for it.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, factory, ttl_seconds, should_cache))
+            task.add_done_callback(_retrieve_exception)
+            self._pending[key] = task
+
+        return await asyncio.shield(task)
+
+    async def _load(self,
+                    key: typing.Hashable,
+                    factory: Callable[[], Awaitable[T]],
+                    ttl_seconds: float,
+                    should_cache: Callable[[T], bool] | None) -> T:
+        try:
+            value = await factory()
+            if should_cache is None or should_cache(value):
+                self.set(key, value, ttl_seconds)
+            return value
+        finally:
+            del self._pending[key]
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # Mark the exception as retrieved when every caller was cancelled before the lookup failed
+    if not task.cancelled():
+        task.exception()
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+from aiq.plugins.langchain.tools.ttl_cache import AsyncTTLCache
+
+
+async def test_concurrent_misses_share_one_lookup():
+    cache = AsyncTTLCache[str]()
+    calls = 0
+
+    async def factory() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    values = await asyncio.gather(*(cache.get_or_set("key", factory, ttl_seconds=60) for _ in range(5)))
+
+    assert values == ["value"] * 5
+    assert calls == 1
+    assert cache.get("key") == "value"
+
+
+async def test_cancelled_first_caller_does_not_cancel_waiters():
+    cache = AsyncTTLCache[str]()
+    release = asyncio.Event()
+
+    async def factory() -> str:
+        await release.wait()
+        return "value"
+
+    first = asyncio.create_task(cache.get_or_set("key", factory, ttl_seconds=60))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_set("key", factory, ttl_seconds=60))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    release.set()
+    assert await waiter == "value"
+    assert cache.get("key") == "value"
+
+
+async def test_failed_lookup_is_raised_to_every_caller_and_not_cached():
+    cache = AsyncTTLCache[str]()
+
+    async def factory() -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("lookup failed")
+
+    results = await asyncio.gather(*(cache.get_or_set("key", factory, ttl_seconds=60) for _ in range(2)),
+                                   return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert cache.get("key") is None
+
+
+async def test_should_cache_skips_storing_value():
+    cache = AsyncTTLCache[dict]()
+
+    async def factory() -> dict:
+        return {"status": "fail"}
+
+    value = await cache.get_or_set("key", factory, ttl_seconds=60, should_cache=lambda v: v["status"] == "success")
+
+    assert value == {"status": "fail"}
+    assert cache.get("key") is None
@@ -51,6 +51,10 @@ class SpanToOtelProcessor(Processor[Span, OtelSpan]):
         return convert_span_to_otel(item)  # type: ignore
 
 
+def _trace_id(span: OtelSpan) -> int:
+    return span.get_span_context().trace_id
+
+
 class OtelSpanBatchProcessor(BatchingProcessor[OtelSpan]):
     """Processor that batches OtelSpans with explicit type information.
 
@@ -95,7 +99,11 @@ class OtelSpanExporter(SpanExporter[Span, OtelSpan]):  # pylint: disable=R0901
                  max_queue_size: int = 1000,
                  drop_on_overflow: bool = False,
                  shutdown_timeout: float = 10.0,
-                 resource_attributes: dict[str, str] | None = None):
+                 resource_attributes: dict[str, str] | None = None,
+                 adaptive_batching: bool = False,
+                 max_batch_bytes: int | None = None,
+                 target_export_latency: float | None = None,
+                 max_concurrent_exports: int = 1):
         """Initialize the OpenTelemetry exporter.
 
         Args:
@@ -106,6 +114,10 @@ class OtelSpanExporter(SpanExporter[Span, OtelSpan]):  # pylint: disable=R0901
             drop_on_overflow: Whether to drop spans on overflow.
             shutdown_timeout: The shutdown timeout in seconds.
             resource_attributes: Additional resource attributes for spans.
+            adaptive_batching: Export batches concurrently and adapt their size to the export latency.
+            max_batch_bytes: Flush a batch once its estimated size reaches this many bytes.
+            target_export_latency: Export latency in seconds that adaptive batching aims for.
+            max_concurrent_exports: Maximum concurrent batch exports, spans of one trace stay in order.
         """
         super().__init__(context_state)
 
@@ -119,7 +131,12 @@ class OtelSpanExporter(SpanExporter[Span, OtelSpan]):  # pylint: disable=R0901
                                                           max_queue_size=max_queue_size,
                                                           drop_on_overflow=drop_on_overflow,
                                                           shutdown_timeout=shutdown_timeout,
-                                                          done_callback=self.export_processed)
+                                                          done_callback=self.export_processed,
+                                                          adaptive=adaptive_batching,
+                                                          max_batch_bytes=max_batch_bytes,
+                                                          target_export_latency=target_export_latency,
+                                                          max_concurrent_exports=max_concurrent_exports,
+                                                          ordering_key=_trace_id)
 
         self.add_processor(SpanToOtelProcessor())
         self.add_processor(self._batching_processor)
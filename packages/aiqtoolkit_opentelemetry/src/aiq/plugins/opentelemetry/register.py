@@ -59,7 +59,11 @@ async def langfuse_telemetry_exporter(config: LangfuseTelemetryExporter, builder
                                   flush_interval=config.flush_interval,
                                   max_queue_size=config.max_queue_size,
                                   drop_on_overflow=config.drop_on_overflow,
-                                  shutdown_timeout=config.shutdown_timeout)
+                                  shutdown_timeout=config.shutdown_timeout,
+                                  adaptive_batching=config.adaptive_batching,
+                                  max_batch_bytes=config.max_batch_bytes,
+                                  target_export_latency=config.target_export_latency,
+                                  max_concurrent_exports=config.max_concurrent_exports)
 
 
 class LangsmithTelemetryExporter(BatchConfigMixin, CollectorConfigMixin, TelemetryExporterBaseConfig, name="langsmith"):
@@ -91,7 +95,11 @@ async def langsmith_telemetry_exporter(config: LangsmithTelemetryExporter, build
                                   flush_interval=config.flush_interval,
                                   max_queue_size=config.max_queue_size,
                                   drop_on_overflow=config.drop_on_overflow,
-                                  shutdown_timeout=config.shutdown_timeout)
+                                  shutdown_timeout=config.shutdown_timeout,
+                                  adaptive_batching=config.adaptive_batching,
+                                  max_batch_bytes=config.max_batch_bytes,
+                                  target_export_latency=config.target_export_latency,
+                                  max_concurrent_exports=config.max_concurrent_exports)
 
 
 class OtelCollectorTelemetryExporter(BatchConfigMixin,
@@ -128,7 +136,11 @@ async def otel_telemetry_exporter(config: OtelCollectorTelemetryExporter, builde
                                   flush_interval=config.flush_interval,
                                   max_queue_size=config.max_queue_size,
                                   drop_on_overflow=config.drop_on_overflow,
-                                  shutdown_timeout=config.shutdown_timeout)
+                                  shutdown_timeout=config.shutdown_timeout,
+                                  adaptive_batching=config.adaptive_batching,
+                                  max_batch_bytes=config.max_batch_bytes,
+                                  target_export_latency=config.target_export_latency,
+                                  max_concurrent_exports=config.max_concurrent_exports)
 
 
 class PatronusTelemetryExporter(BatchConfigMixin, CollectorConfigMixin, TelemetryExporterBaseConfig, name="patronus"):
@@ -159,7 +171,11 @@ async def patronus_telemetry_exporter(config: PatronusTelemetryExporter, builder
                                   flush_interval=config.flush_interval,
                                   max_queue_size=config.max_queue_size,
                                   drop_on_overflow=config.drop_on_overflow,
-                                  shutdown_timeout=config.shutdown_timeout)
+                                  shutdown_timeout=config.shutdown_timeout,
+                                  adaptive_batching=config.adaptive_batching,
+                                  max_batch_bytes=config.max_batch_bytes,
+                                  target_export_latency=config.target_export_latency,
+                                  max_concurrent_exports=config.max_concurrent_exports)
 
 
 # pylint: disable=W0613
@@ -192,4 +208,8 @@ async def galileo_telemetry_exporter(config: GalileoTelemetryExporter, builder:
         max_queue_size=config.max_queue_size,
         drop_on_overflow=config.drop_on_overflow,
         shutdown_timeout=config.shutdown_timeout,
+        adaptive_batching=config.adaptive_batching,
+        max_batch_bytes=config.max_batch_bytes,
+        target_export_latency=config.target_export_latency,
+        max_concurrent_exports=config.max_concurrent_exports,
     )
@@ -68,6 +68,10 @@ async def catalyst_telemetry_exporter(config: CatalystTelemetryExporter, builder
                                      flush_interval=config.flush_interval,
                                      max_queue_size=config.max_queue_size,
                                      drop_on_overflow=config.drop_on_overflow,
-                                     shutdown_timeout=config.shutdown_timeout)
+                                     shutdown_timeout=config.shutdown_timeout,
+                                     adaptive_batching=config.adaptive_batching,
+                                     max_batch_bytes=config.max_batch_bytes,
+                                     target_export_latency=config.target_export_latency,
+                                     max_concurrent_exports=config.max_concurrent_exports)
     except Exception as e:
         logger.warning("Error creating catalyst telemetry exporter: %s", e, exc_info=True)
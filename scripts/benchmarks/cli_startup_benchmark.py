@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measure the cold start of the CLI: ``aiq --help`` and loading a workflow config, each in a fresh interpreter.
+
+Config loading is measured twice, ``cold`` without a plugin index, which imports every installed plugin and writes the
+index, and ``warm`` with the index, which only imports the plugins the config references. The script exits with a
+non-zero status when the median of a warm measurement is above ``--budget`` seconds, so it can guard the start time in
+CI.
+
+Usage:
+    python scripts/benchmarks/cli_startup_benchmark.py --config_file configs/hackathon_config.yml --budget 1.0
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+_LOAD_CONFIG = "import sys; from aiq.runtime.loader import load_config; load_config(sys.argv[1])"
+
+
+def _time(command: list[str], env: dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config_file", required=True, help="Workflow config to load")
+    parser.add_argument("--repeats", type=int, default=5, help="Number of runs of each measurement")
+    parser.add_argument("--budget", type=float, default=None, help="Maximum median of the warm measurements (s)")
+    args = parser.parse_args()
+
+    aiq = shutil.which("aiq") or "aiq"
+    load_config = [sys.executable, "-c", _LOAD_CONFIG, args.config_file]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Keep the plugin index of the benchmark away from the user's cache
+        env = {**os.environ, "XDG_CACHE_HOME": cache_dir}
+        index_dir = os.path.join(cache_dir, "aiq")
+
+        cold = []
+        for _ in range(args.repeats):
+            shutil.rmtree(index_dir, ignore_errors=True)
+            cold.append(_time(load_config, env))
+
+        results = {
+            "aiq --help": [_time([aiq, "--help"], env) for _ in range(args.repeats)],
+            "load_config (cold)": cold,
+            "load_config (warm)": [_time(load_config, env) for _ in range(args.repeats)],
+        }
+
+    print(f"{'measurement':<20} {'median (s)':>11} {'min (s)':>8} {'max (s)':>8}")
+    for name, times in results.items():
+        print(f"{name:<20} {statistics.median(times):>11.3f} {min(times):>8.3f} {max(times):>8.3f}")
+
+    if args.budget is not None:
+        over = [name for name in ("aiq --help", "load_config (warm)") if statistics.median(results[name]) > args.budget]
+        if over:
+            print(f"Over the budget of {args.budget:.2f}s: {', '.join(over)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measure intermediate step event stream throughput (events/sec) with 0, 1, 5 and 20 subscribers.
+
+"locking" reproduces the previous ``Subject.on_next`` (take an ``RLock`` and copy the observer list on every event),
+"copy-on-write" is the current ``Subject`` delivering synchronously and "queued" subscribes every observer through a
+``QueuedObserver``. Only the time spent inside ``on_next`` is counted, which is what the producer (the agent) pays per
+event; queued deliveries run later on the event loop.
+
+Usage:
+    python scripts/benchmarks/event_stream_benchmark.py --events 200000
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+
+from aiq.utils.reactive.observer import Observer
+from aiq.utils.reactive.queued_observer import QueuedObserver
+from aiq.utils.reactive.subject import Subject
+
+
+class _LockingSubject:
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._observers: list[Observer] = []
+        self._closed = False
+        self._disposed = False
+
+    def subscribe(self, observer: Observer):
+        with self._lock:
+            self._observers.append(observer)
+
+    def on_next(self, value):
+        with self._lock:
+            if self._closed or self._disposed:
+                return
+            current_observers = list(self._observers)
+
+        for obs in current_observers:
+            obs.on_next(value)
+
+
+_EVENT = {
+    "parent_id": "root",
+    "function_ancestry": {
+        "function_name": "react_agent", "function_id": "0f4c"
+    },
+    "payload": {
+        "event_type": "LLM_NEW_TOKEN", "name": "nim_llm", "data": {
+            "chunk": "上海浦东新区的房价"
+        }
+    },
+}
+
+
+def _observer() -> Observer:
+    # roughly what an exporter does with every step: serialize it
+    return Observer(on_next=lambda value: json.dumps(_EVENT, ensure_ascii=False))
+
+
+async def _produce(subject, events: int, burst: int) -> float:
+    """Emit ``events`` in bursts, yielding to the event loop in between like an agent awaiting its LLM would."""
+    producer_time = 0.0
+    for offset in range(0, events, burst):
+        start = time.perf_counter()
+        for i in range(offset, min(offset + burst, events)):
+            subject.on_next(i)
+        producer_time += time.perf_counter() - start
+        # queued deliveries run here, outside of the producer's time
+        await asyncio.sleep(0)
+    return events / producer_time
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=200_000, help="Events emitted per measurement")
+    parser.add_argument("--burst", type=int, default=64, help="Events emitted between two event loop iterations")
+    parser.add_argument("--queue_size", type=int, default=4096, help="Queue size of the queued subscribers")
+    args = parser.parse_args()
+
+    print(f"{'subscribers':>11} {'locking ev/s':>14} {'copy-on-write ev/s':>20} {'queued ev/s':>13}")
+    for subscribers in (0, 1, 5, 20):
+        locking = _LockingSubject()
+        copy_on_write = Subject()
+        queued = Subject()
+        for _ in range(subscribers):
+            locking.subscribe(_observer())
+            copy_on_write.subscribe(_observer())
+            queued.subscribe(QueuedObserver(_observer(), max_queue_size=args.queue_size, overflow="block"))
+
+        results = [await _produce(subject, args.events, args.burst) for subject in (locking, copy_on_write, queued)]
+        print(f"{subscribers:>11} {results[0]:>14,.0f} {results[1]:>20,.0f} {results[2]:>13,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Load test ``aiq serve`` with an increasing number of workers and report the requests/sec reached with each.
+
+Every run starts the server from ``--config_file`` with ``--workers N``, waits for it to accept requests, then keeps
+``--concurrency`` requests in flight against ``--path`` for ``--duration`` seconds. With more than one worker the job
+store and the shared state automatically use their SQLite backends, so async jobs can be polled from any worker.
+
+Usage:
+    python scripts/benchmarks/fastapi_workers_benchmark.py --config_file configs/hackathon_config.yml \
+        --workers 1 2 4 --concurrency 64 --duration 20 --payload '{"input_message": "上海的房价如何？"}'
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+async def _wait_until_ready(base_url: str, timeout: float):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                response = await client.get(f"{base_url}/docs")
+                if response.status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.5)
+    raise TimeoutError(f"Server at {base_url} did not start within {timeout} seconds")
+
+
+async def _run_load(url: str, payload: dict, concurrency: int, duration: float) -> tuple[int, int, float]:
+    ok = 0
+    failed = 0
+    deadline = time.monotonic() + duration
+
+    async def _worker(client: httpx.AsyncClient):
+        nonlocal ok, failed
+        while time.monotonic() < deadline:
+            try:
+                response = await client.post(url, json=payload)
+                if response.status_code == 200:
+                    ok += 1
+                else:
+                    failed += 1
+            except httpx.HTTPError:
+                failed += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=300, limits=limits) as client:
+        start = time.monotonic()
+        await asyncio.gather(*(_worker(client) for _ in range(concurrency)))
+        elapsed = time.monotonic() - start
+
+    return ok, failed, elapsed
+
+
+def _start_server(config_file: str, workers: int, host: str, port: int) -> subprocess.Popen:
+    command = [
+        "aiq", "serve", "--config_file", config_file, "--host", host, "--port", str(port), "--workers", str(workers)
+    ]
+    # a new process group, so the uvicorn supervisor and all of its workers are stopped together
+    return subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+
+
+def _stop_server(process: subprocess.Popen):
+    os.killpg(process.pid, signal.SIGINT)
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config_file", required=True, help="Workflow configuration served by `aiq serve`")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to benchmark")
+    parser.add_argument("--path", default="/generate", help="Endpoint receiving the load")
+    parser.add_argument("--payload", default='{"input_message": "hello"}', help="JSON request body")
+    parser.add_argument("--concurrency", type=int, default=64, help="Requests kept in flight")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of load per worker count")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--startup_timeout", type=float, default=120.0, help="Seconds to wait for the server")
+    args = parser.parse_args()
+
+    payload = json.loads(args.payload)
+    base_url = f"http://{args.host}:{args.port}"
+
+    print(f"{'workers':>8} {'ok':>8} {'failed':>8} {'req/s':>10} {'scaling':>9}")
+    baseline = None
+    for workers in args.workers:
+        process = _start_server(args.config_file, workers, args.host, args.port)
+        try:
+            await _wait_until_ready(base_url, args.startup_timeout)
+            ok, failed, elapsed = await _run_load(f"{base_url}{args.path}", payload, args.concurrency, args.duration)
+        finally:
+            _stop_server(process)
+
+        throughput = ok / elapsed
+        baseline = baseline or throughput
+        print(f"{workers:>8} {ok:>8} {failed:>8} {throughput:>10.1f} {throughput / baseline:>8.2f}x")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measure the overhead of ``Function.ainvoke`` against the nesting depth of the functions.
+
+A call at depth ``N`` goes through ``N`` nested functions, each one invoking the next, the way an agent calls a tool
+which calls another tool. The overhead per level is compared to plain coroutine calls, for three cases:
+
+- ``untraced``: nothing is subscribed to the event stream, the function steps are not built.
+- ``traced``: a subscriber receives every function start and end step.
+- ``sampled out``: a subscriber is attached but the run is not sampled, see
+  ``general.telemetry.trace_sample_rate``.
+
+Usage:
+    python scripts/benchmarks/function_invocation_benchmark.py --depths 1 4 16 --iterations 2000
+"""
+
+import argparse
+import asyncio
+import time
+
+from aiq.builder.context import AIQContext
+from aiq.builder.context import AIQContextState
+from aiq.builder.function import Function
+from aiq.builder.function import LambdaFunction
+from aiq.builder.function_info import FunctionInfo
+from aiq.data_models.function import EmptyFunctionConfig
+from aiq.utils.reactive.subject import Subject
+
+
+def _chain(depth: int) -> Function:
+    """Functions nested ``depth`` deep, the outermost one is returned."""
+
+    async def leaf(value: str) -> str:
+        return value
+
+    def caller(inner: Function):
+
+        async def call(value: str) -> str:
+            return await inner.ainvoke(value)
+
+        return call
+
+    fn = LambdaFunction.from_info(config=EmptyFunctionConfig(), info=FunctionInfo.from_fn(leaf), instance_name="leaf")
+    for level in range(depth - 1):
+        fn = LambdaFunction.from_info(config=EmptyFunctionConfig(),
+                                      info=FunctionInfo.from_fn(caller(fn)),
+                                      instance_name=f"level_{level}")
+    return fn
+
+
+async def _plain(depth: int, value: str) -> str:
+    return value if depth == 1 else await _plain(depth - 1, value)
+
+
+async def _time(call, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await call()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def _run_case(case: str, fn: Function, iterations: int) -> float:
+    context_state = AIQContextState.get()
+    # A fresh event stream per case, as every workflow run gets
+    context_state.event_stream.set(Subject())
+    context_state.trace_sampled.set(case != "sampled out")
+
+    steps = []
+    if case != "untraced":
+        AIQContext.get().intermediate_step_manager.subscribe(steps.append)
+
+    return await _time(lambda: fn.ainvoke("浦东 两房"), iterations)
+
+
+async def _main(depths: list[int], iterations: int):
+    cases = ("untraced", "traced", "sampled out")
+    header = [f"{'depth':>5}", f"{'plain (us)':>11}"]
+    header += [f"{case + ' (us)':>17}" for case in cases] + [f"{case + ' /level':>19}" for case in cases]
+    print(" ".join(header))
+
+    for depth in depths:
+        fn = _chain(depth)
+        plain = await _time(lambda depth=depth: _plain(depth, "浦东 两房"), iterations)
+        results = [await _run_case(case, fn, iterations) for case in cases]
+        per_level = [(result - plain) / depth for result in results]
+        row = [f"{depth:>5}", f"{plain:>11.1f}"]
+        row += [f"{result:>17.1f}" for result in results] + [f"{overhead:>19.1f}" for overhead in per_level]
+        print(" ".join(row))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Nesting depths to measure")
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    asyncio.run(_main(args.depths, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare serial and concurrent page fetching with ``aiq.tool.lianjia_fetcher.PageFetcher``.
+
+A local stub HTTP server answers every ``/loupan/pg{page}/`` request with a small JSON listing page after a fixed
+delay, which stands in for the network round trip to Lianjia.
+
+Usage:
+    python scripts/benchmarks/lianjia_fetch_benchmark.py --pages 20 --latency 0.1 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import httpx
+
+from aiq.tool.lianjia_fetcher import PageFetcher
+
+
+def _make_handler(latency: float):
+
+    class _StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            time.sleep(latency)
+            body = json.dumps({
+                "data": {
+                    "list": [{
+                        "title": f"楼盘 {i}", "average_price": 50000 + i, "district_name": "浦东", "bizcircle_name": "陆家嘴"
+                    } for i in range(10)]
+                }
+            }).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            pass
+
+    return _StubHandler
+
+
+async def _run(base_url: str, pages: int, concurrency: int) -> float:
+    urls = [f"{base_url}/loupan/pg{page}/" for page in range(1, pages + 1)]
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits) as client:
+        # Rate limiting is disabled so the numbers reflect the fetch strategy alone.
+        fetcher = PageFetcher(client, max_concurrency=concurrency, requests_per_second=0)
+
+        start = time.perf_counter()
+        responses = await fetcher.fetch_all(urls)
+        elapsed = time.perf_counter() - start
+
+    assert all(r is not None and r.status_code == 200 for r in responses)
+    return pages / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=20, help="Number of pages to fetch per run")
+    parser.add_argument("--latency", type=float, default=0.1, help="Simulated server latency in seconds")
+    parser.add_argument("--concurrency", type=int, default=8, help="Max in-flight requests for the concurrent run")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(args.latency))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        serial = asyncio.run(_run(base_url, args.pages, 1))
+        concurrent = asyncio.run(_run(base_url, args.pages, args.concurrency))
+    finally:
+        server.shutdown()
+
+    print(f"pages={args.pages} latency={args.latency:.3f}s")
+    print(f"serial:                {serial:8.2f} pages/sec")
+    print(f"concurrent (n={args.concurrency:<3d}):  {concurrent:8.2f} pages/sec")
+    print(f"speedup:               {concurrent / serial:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
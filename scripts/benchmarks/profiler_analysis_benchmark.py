@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measure the profiler's inference optimization analyses on synthetic ReAct-style traces of 1k, 10k and 100k steps.
+
+Every example is a ``FUNCTION`` span wrapping alternating LLM and tool calls whose prompts grow with the scratchpad.
+Examples start every few hundred milliseconds so their calls overlap and the concurrency timeline is non-trivial.
+
+The standardized DataFrame is built once per trace size and reported separately, the analysis columns only count
+the time spent after it has been created.
+
+Usage:
+    python scripts/benchmarks/profiler_analysis_benchmark.py --steps 1000 10000 100000
+"""
+
+import argparse
+import random
+import time
+from unittest import mock
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.data_models.intermediate_step import TokenUsageBaseModel
+from aiq.data_models.intermediate_step import UsageInfo
+from aiq.data_models.invocation_node import InvocationNode
+from aiq.profiler.inference_optimization import llm_metrics
+from aiq.profiler.inference_optimization import token_uniqueness
+from aiq.profiler.inference_optimization.bottleneck_analysis import nested_stack_analysis
+from aiq.profiler.inference_optimization.experimental import concurrency_spike_analysis
+from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
+from aiq.profiler.utils import create_standardized_dataframe
+
+_FUNCTIONS = [InvocationNode(function_id=f"fn-{i}", function_name=f"agent_{i}") for i in range(3)]
+_WORDS = ["浦东", "闵行", "均价", "新房", "listing", "price", "district", "area", "page", "city", "total", "median"]
+
+# Each example emits FUNCTION_START, ``_ITERATIONS`` x (LLM_START, LLM_END, TOOL_START, TOOL_END) and FUNCTION_END
+_ITERATIONS = 4
+_STEPS_PER_EXAMPLE = 2 + 4 * _ITERATIONS
+
+
+def _step(ancestry: InvocationNode,
+          uuid: str,
+          event_type: IntermediateStepType,
+          timestamp: float,
+          name: str,
+          data: StreamEventData | None = None,
+          completion_tokens: int = 0) -> IntermediateStep:
+    usage = UsageInfo(token_usage=TokenUsageBaseModel(
+        prompt_tokens=completion_tokens * 4, completion_tokens=completion_tokens, total_tokens=completion_tokens * 5))
+    payload = IntermediateStepPayload(UUID=uuid,
+                                      event_type=event_type,
+                                      event_timestamp=timestamp,
+                                      name=name,
+                                      data=data,
+                                      usage_info=usage)
+    return IntermediatePropertyAdaptor(parent_id="root", function_ancestry=ancestry, payload=payload)
+
+
+def _example(rng: random.Random, index: int) -> list[IntermediateStep]:
+    ancestry = _FUNCTIONS[index % len(_FUNCTIONS)]
+    ts = index * 0.3 + rng.random() * 0.1
+    steps = [_step(ancestry, f"fn-{index}", IntermediateStepType.FUNCTION_START, ts, ancestry.function_name)]
+
+    prompt = " ".join(rng.choices(_WORDS, k=200))
+    for i in range(_ITERATIONS):
+        uuid = f"{index}-{i}"
+        llm_name = f"llm_{index % 2}"
+        steps.append(
+            _step(ancestry, f"llm-{uuid}", IntermediateStepType.LLM_START, ts, llm_name, StreamEventData(input=prompt)))
+        ts += rng.uniform(0.2, 2.0)
+        steps.append(
+            _step(ancestry,
+                  f"llm-{uuid}",
+                  IntermediateStepType.LLM_END,
+                  ts,
+                  llm_name,
+                  StreamEventData(output="Action: listing_query"),
+                  completion_tokens=rng.randint(20, 200)))
+        steps.append(_step(ancestry, f"tool-{uuid}", IntermediateStepType.TOOL_START, ts, "listing_query"))
+        ts += rng.uniform(0.05, 0.5)
+        steps.append(_step(ancestry, f"tool-{uuid}", IntermediateStepType.TOOL_END, ts, "listing_query"))
+        # The observation appended to the scratchpad brings a varying number of new words into the next prompt
+        prompt += " " + " ".join(f"{word}{rng.randint(0, 99)}" for word in rng.choices(_WORDS, k=rng.randint(1, 40)))
+
+    steps.append(_step(ancestry, f"fn-{index}", IntermediateStepType.FUNCTION_END, ts, ancestry.function_name))
+    return steps
+
+
+def _trace(steps: int, seed: int = 0) -> list[list[IntermediateStep]]:
+    rng = random.Random(seed)
+    return [_example(rng, i) for i in range(max(1, steps // _STEPS_PER_EXAMPLE))]
+
+
+_ANALYSES = {
+    "llm_metrics": (llm_metrics, lambda all_steps: llm_metrics.LLMMetrics.compute_profiling_metrics(all_steps)),
+    "token_uniqueness": (token_uniqueness, token_uniqueness.compute_inter_query_token_uniqueness_by_llm),
+    "nested_stack": (nested_stack_analysis, nested_stack_analysis.multi_example_call_profiling),
+    "concurrency_spikes": (concurrency_spike_analysis, concurrency_spike_analysis.concurrency_spike_analysis),
+}
+
+
+def _time_analysis(module, analysis, all_steps, df, repeats: int) -> float:
+    # Hand every analysis the pre-built DataFrame so only the analysis itself is measured
+    with mock.patch.object(module, "create_standardized_dataframe", lambda _: df.copy()):
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            analysis(all_steps)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, nargs="+", default=[1000, 10000, 100000], help="Trace sizes in steps")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per measurement, the best one is reported")
+    args = parser.parse_args()
+
+    print(f"{'steps':>8} {'dataframe (s)':>14} " + " ".join(f"{name + ' (s)':>22}" for name in _ANALYSES))
+    for steps in args.steps:
+        all_steps = _trace(steps)
+
+        start = time.perf_counter()
+        df = create_standardized_dataframe(all_steps)
+        build = time.perf_counter() - start
+
+        timings = [
+            _time_analysis(module, analysis, all_steps, df, args.repeats) for module, analysis in _ANALYSES.values()
+        ]
+        print(f"{len(df):>8} {build:>14.3f} " + " ".join(f"{t:>22.3f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measure time and peak memory of the common-prefix analysis on ReAct-style prompts.
+
+Every prompt shares a long system prompt, then carries its own question and a scratchpad that grows with the number
+of tool calls, which is the shape of the prompts the ReAct agent sends.
+
+Usage:
+    python scripts/benchmarks/prompt_prefix_benchmark.py --prompts 1000 --chars 8000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from aiq.profiler.inference_optimization.prompt_caching import PrefixRadixTree
+from aiq.profiler.inference_optimization.prompt_caching import top_common_prefixes
+
+_WORDS = ["浦东", "闵行", "均价", "新房", "listing", "price", "district", "area", "page", "city", "total", "median"]
+
+
+def _prompts(count: int, chars: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    system_prompt = " ".join(rng.choices(_WORDS, k=chars // 10))[:chars // 2]
+    prompts = []
+    for i in range(count):
+        prompt = f"{system_prompt}\nQuestion: {i} "
+        while len(prompt) < chars:
+            prompt += "\nThought: " + " ".join(rng.choices(_WORDS, k=20)) + f"\nObservation: {rng.random()}"
+        prompts.append(prompt)
+    return prompts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--prompts", type=int, default=1000, help="Number of prompts")
+    parser.add_argument("--chars", type=int, default=8000, help="Length of every prompt in characters")
+    parser.add_argument("--top-k", type=int, default=10, help="Prefixes to report")
+    args = parser.parse_args()
+
+    prompts = _prompts(args.prompts, args.chars)
+
+    print(f"{'granularity':>12} {'build (s)':>10} {'top-k (s)':>10} {'peak memory (MB)':>17}")
+    for granularity in ("token", "character"):
+        start = time.perf_counter()
+        tree = PrefixRadixTree(granularity)
+        tree.extend(prompts)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        top_common_prefixes(tree, min_call_percentage=0.0, top_k=args.top_k)
+        query = time.perf_counter() - start
+
+        # Measured in a separate run, tracing every allocation slows the build down considerably
+        del tree
+        tracemalloc.start()
+        tree = PrefixRadixTree(granularity)
+        tree.extend(prompts)
+        top_common_prefixes(tree, min_call_percentage=0.0, top_k=args.top_k)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{granularity:>12} {build:>10.3f} {query:>10.3f} {peak / 2**20:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
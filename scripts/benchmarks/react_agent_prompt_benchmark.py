@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measure the per-iteration prompt construction overhead of the ReAct agent after 1, 10 and 50 tool calls.
+
+"rebuild" re-creates the scratchpad messages from ``agent_scratchpad``/``tool_responses`` and re-renders the system
+prompt with the tool schemas on every cycle (the previous behaviour). "incremental" uses the scratchpad messages kept
+in the graph state and the pre-rendered system prompt.
+
+Usage:
+    python scripts/benchmarks/react_agent_prompt_benchmark.py --tools 8 --repeats 200
+"""
+
+import argparse
+import time
+
+from langchain_core.agents import AgentAction
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.messages import HumanMessage
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import StructuredTool
+
+from aiq.agent.react_agent.agent import ReActAgentGraph
+from aiq.agent.react_agent.agent import ReActGraphState
+from aiq.agent.react_agent.agent import create_react_agent_prompt
+from aiq.agent.react_agent.register import ReActAgentWorkflowConfig
+
+
+def _make_tool(index: int) -> StructuredTool:
+
+    def _tool(city: str, page: int = 1, max_results: int = 10) -> str:
+        return city
+
+    return StructuredTool.from_function(_tool,
+                                        name=f"tool_{index}",
+                                        description=f"Benchmark tool number {index} returning listing data for a city")
+
+
+def _make_state(tool_calls: int) -> ReActGraphState:
+    state = ReActGraphState(messages=[HumanMessage(content="上海浦东新房的均价是多少？")])
+    for i in range(tool_calls):
+        log = f"Thought: step {i}\nAction: tool_0\nAction Input: {{\"city\": \"sh\", \"page\": {i}}}"
+        response = ToolMessage(name="tool_0", tool_call_id="tool_0", content="listing data " * 100)
+        state.agent_scratchpad.append(AgentAction("tool_0", "{}", log))
+        state.tool_responses.append(response)
+        state.scratchpad_messages.append(AIMessage(content=log))
+        state.scratchpad_messages.append(HumanMessage(content=str(response.content)))
+    return state
+
+
+def _rebuild_scratchpad(state: ReActGraphState) -> list:
+    agent_scratchpad = []
+    for index, intermediate_step in enumerate(state.agent_scratchpad):
+        agent_scratchpad.append(AIMessage(content=intermediate_step.log))
+        agent_scratchpad.append(HumanMessage(content=str(state.tool_responses[index].content)))
+    return agent_scratchpad
+
+
+def _time_per_call(fn, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tools", type=int, default=8, help="Number of tools rendered into the system prompt")
+    parser.add_argument("--repeats", type=int, default=200, help="Iterations to average over")
+    args = parser.parse_args()
+
+    tools = [_make_tool(i) for i in range(args.tools)]
+    config = ReActAgentWorkflowConfig(llm_name="benchmark_llm")
+    template = create_react_agent_prompt(config)
+    agent = ReActAgentGraph(llm=FakeListChatModel(responses=["Final Answer: done"]), prompt=template, tools=tools)
+    incremental_prompt = agent.agent.first
+
+    # The previous behaviour: tools are injected with ``partial`` and formatted into the system prompt on every call
+    tool_names = ",".join(tool.name for tool in tools)
+    tools_block = "\n".join(f"{tool.name}: {tool.description}. {tool.input_schema.model_fields}" for tool in tools)
+    rebuild_prompt = template.partial(tools=tools_block, tool_names=tool_names)
+
+    print(f"{'tool calls':>10} {'rebuild (us)':>14} {'incremental (us)':>18} {'speedup':>9}")
+    for tool_calls in (1, 10, 50):
+        state = _make_state(tool_calls)
+        question = str(state.messages[0].content)
+
+        rebuild = _time_per_call(
+            lambda: rebuild_prompt.invoke({
+                "question": question, "agent_scratchpad": _rebuild_scratchpad(state)
+            }),
+            args.repeats)
+        incremental = _time_per_call(
+            lambda: incremental_prompt.invoke({
+                "question": question, "agent_scratchpad": state.scratchpad_messages
+            }),
+            args.repeats)
+
+        print(f"{tool_calls:>10} {rebuild * 1e6:>14.1f} {incremental * 1e6:>18.1f} {rebuild / incremental:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measure ``SpanExporter`` throughput (spans/sec) for deep traces (every span nested in the previous one) and wide
+traces (one root span with many children).
+
+"hot path" only counts the time spent in ``export`` while the events are pushed, which is what the running workflow
+pays per intermediate step. "end to end" also waits for the export tasks, including payload serialization.
+
+Usage:
+    python scripts/benchmarks/span_exporter_benchmark.py --spans 2000 --repeats 5
+"""
+
+import argparse
+import asyncio
+import time
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.data_models.invocation_node import InvocationNode
+from aiq.data_models.span import Span
+from aiq.observability.exporter.span_exporter import SpanExporter
+
+_ANCESTRY = InvocationNode(function_id="benchmark", function_name="benchmark")
+_INPUT = {"messages": [{"role": "user", "content": "上海浦东新房的均价是多少？" * 20}] * 10, "temperature": 0.0}
+_OUTPUT = {"content": "浦东新房均价约为 8 万元/平。" * 50}
+
+
+class _NullSpanExporter(SpanExporter[Span, Span]):
+
+    def __init__(self):
+        super().__init__()
+        self.exported = 0
+
+    async def export_processed(self, item: Span) -> None:
+        self.exported += 1
+
+
+def _step(uuid: str, parent_id: str, event_type: IntermediateStepType, data: StreamEventData) -> IntermediateStep:
+    payload = IntermediateStepPayload(UUID=uuid, event_type=event_type, name="tool", data=data, metadata={"k": "v"})
+    return IntermediateStep(parent_id=parent_id, function_ancestry=_ANCESTRY, payload=payload)
+
+
+def _deep_trace(spans: int) -> list[IntermediateStep]:
+    starts, ends = [], []
+    parent_id = "root"
+    for i in range(spans):
+        uuid = f"deep-{i}"
+        starts.append(_step(uuid, parent_id, IntermediateStepType.TOOL_START, StreamEventData(input=_INPUT)))
+        ends.append(_step(uuid, parent_id, IntermediateStepType.TOOL_END, StreamEventData(output=_OUTPUT)))
+        parent_id = uuid
+    return starts + ends[::-1]
+
+
+def _wide_trace(spans: int) -> list[IntermediateStep]:
+    events = [_step("wide-root", "root", IntermediateStepType.WORKFLOW_START, StreamEventData(input=_INPUT))]
+    for i in range(spans - 1):
+        uuid = f"wide-{i}"
+        events.append(_step(uuid, "wide-root", IntermediateStepType.TOOL_START, StreamEventData(input=_INPUT)))
+        events.append(_step(uuid, "wide-root", IntermediateStepType.TOOL_END, StreamEventData(output=_OUTPUT)))
+    events.append(_step("wide-root", "root", IntermediateStepType.WORKFLOW_END, StreamEventData(output=_OUTPUT)))
+    return events
+
+
+async def _run(events: list[IntermediateStep], spans: int) -> tuple[float, float]:
+    exporter = _NullSpanExporter()
+    async with exporter.start():
+        start = time.perf_counter()
+        for event in events:
+            exporter.export(event)
+        hot_path = time.perf_counter() - start
+
+        await asyncio.gather(*exporter._tasks)
+        end_to_end = time.perf_counter() - start
+
+    assert exporter.exported == spans, exporter.exported
+    return spans / hot_path, spans / end_to_end
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--spans", type=int, default=2000, help="Spans per trace")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per trace shape, the best one is reported")
+    args = parser.parse_args()
+
+    print(f"{'trace':>6} {'hot path (spans/s)':>20} {'end to end (spans/s)':>22}")
+    for shape, build in (("deep", _deep_trace), ("wide", _wide_trace)):
+        events = build(args.spans)
+        results = [await _run(events, args.spans) for _ in range(args.repeats)]
+        hot_path = max(result[0] for result in results)
+        end_to_end = max(result[1] for result in results)
+        print(f"{shape:>6} {hot_path:>20,.0f} {end_to_end:>22,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
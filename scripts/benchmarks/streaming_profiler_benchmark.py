@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measure time and peak memory of the streaming profiler on a synthetic zstd compressed trace file.
+
+The trace holds ``--requests`` ReAct-style requests, ``--concurrency`` of them running at a time so their steps are
+interleaved in the file the way the file exporter writes them. Peak memory is the resident set size of the process,
+which stays flat as the trace grows.
+
+Usage:
+    python scripts/benchmarks/streaming_profiler_benchmark.py --requests 50000 --concurrency 64
+"""
+
+import argparse
+import heapq
+import json
+import random
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+from aiq.profiler.streaming_profiler import StreamingProfilerRunner
+from aiq.utils.optional_imports import optional_import
+
+_WORDS = ["浦东", "闵行", "均价", "新房", "listing", "price", "district", "area", "page", "city", "total", "median"]
+
+
+def _step(parent_id: str, uuid: str, event_type: str, timestamp: float, name: str, data: dict | None = None) -> dict:
+    return {
+        "parent_id": parent_id,
+        "function_ancestry": {
+            "function_id": "fn-agent", "function_name": "react_agent"
+        },
+        "payload": {
+            "event_type": event_type, "event_timestamp": timestamp, "name": name, "UUID": uuid, "data": data
+        },
+    }
+
+
+def _request(rng: random.Random, index: int, start: float) -> list[dict]:
+    root = f"fn-{index}"
+    ts = start
+    steps = [_step("root", root, "FUNCTION_START", ts, "react_agent")]
+    prompt = " ".join(rng.choices(_WORDS, k=200))
+    for i in range(4):
+        uuid = f"{index}-{i}"
+        steps.append(_step(root, f"llm-{uuid}", "LLM_START", ts, "llm", {"input": prompt}))
+        ts += rng.lognormvariate(0, 0.5)
+        steps.append(_step(root, f"llm-{uuid}", "LLM_END", ts, "llm", {"output": "Action: listing_query"}))
+        steps.append(_step(root, f"tool-{uuid}", "TOOL_START", ts, "listing_query"))
+        ts += rng.uniform(0.05, 0.5)
+        steps.append(_step(root, f"tool-{uuid}", "TOOL_END", ts, "listing_query"))
+        prompt += " " + " ".join(rng.choices(_WORDS, k=20))
+    steps.append(_step("root", root, "FUNCTION_END", ts, "react_agent"))
+    return steps
+
+
+def _write_trace(path: Path, requests: int, concurrency: int, seed: int = 0) -> int:
+    zstandard = optional_import("zstandard")
+    rng = random.Random(seed)
+    lines = 0
+    # Keep ``concurrency`` requests in flight and write their steps in timestamp order
+    pending = []
+    next_index = 0
+    with zstandard.open(path, "wt", encoding="utf-8") as f:
+        while next_index < requests or pending:
+            while next_index < requests and len(pending) < concurrency:
+                start = pending[0][0] if pending else 0.0
+                steps = _request(rng, next_index, start)
+                heapq.heappush(pending, (steps[0]["payload"]["event_timestamp"], next_index, 0, steps))
+                next_index += 1
+            _, index, position, steps = heapq.heappop(pending)
+            f.write(json.dumps(steps[position]) + "\n")
+            lines += 1
+            if position + 1 < len(steps):
+                heapq.heappush(pending, (steps[position + 1]["payload"]["event_timestamp"], index, position + 1, steps))
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50000, help="Number of requests in the trace")
+    parser.add_argument("--concurrency", type=int, default=64, help="Number of requests running at a time")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Steps read at a time")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trace_path = Path(tmp_dir) / "trace.log.zst"
+        steps = _write_trace(trace_path, args.requests, args.concurrency)
+
+        start = time.perf_counter()
+        metrics = StreamingProfilerRunner(Path(tmp_dir) / "profile", chunk_size=args.chunk_size).run(trace_path)
+        elapsed = time.perf_counter() - start
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(f"{'steps':>10} {'time (s)':>9} {'steps/s':>9} {'peak RSS (MB)':>14} {'p95 LLM latency (s)':>20}")
+    print(f"{steps:>10} {elapsed:>9.2f} {steps / elapsed:>9.0f} {peak / 1024:>14.1f} "
+          f"{metrics.llm_latency_confidence_intervals['p95']:>20.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measure the throughput of ``TypeConverter.convert``, cold and warm.
+
+``cold`` converts once with each of ``--iterations`` new converters, so every conversion resolves its converters.
+``warm`` converts ``--iterations`` times with one converter, so conversions after the first one use the resolved
+conversion. The converters mirror a function taking a chat request: a direct conversion from a string, an indirect one
+from a dictionary and data which already has the right type.
+
+Usage:
+    python scripts/benchmarks/type_converter_benchmark.py --iterations 20000
+"""
+
+import argparse
+import logging
+import time
+
+from aiq.data_models.api_server import AIQChatRequest
+from aiq.data_models.api_server import AIQChatResponse
+from aiq.data_models.api_server import Message
+from aiq.utils.type_converter import TypeConverter
+
+
+def _str_to_request(data: str) -> AIQChatRequest:
+    return AIQChatRequest.from_string(data)
+
+
+def _dict_to_message(data: dict) -> Message:
+    return Message(**data)
+
+
+def _message_to_request(data: Message) -> AIQChatRequest:
+    return AIQChatRequest(messages=[data])
+
+
+def _response_to_str(data: AIQChatResponse) -> str:
+    return data.choices[0].message.content or ""
+
+
+_CONVERTERS = [_str_to_request, _dict_to_message, _message_to_request, _response_to_str]
+
+
+def _throughput(converters: list[TypeConverter], data, to_type: type) -> float:
+    start = time.perf_counter()
+    for converter in converters:
+        converter.convert(data, to_type)
+    return len(converters) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000, help="Conversions per measurement")
+    args = parser.parse_args()
+
+    # The indirect conversion warns once per converter
+    logging.getLogger("aiq.utils.type_converter").setLevel(logging.ERROR)
+
+    cases = {
+        "str -> request (direct)": ("浦东新区二手房均价", AIQChatRequest),
+        "dict -> request (indirect)": ({
+            "role": "user", "content": "闵行 三房"
+        }, AIQChatRequest),
+        "request -> request": (AIQChatRequest.from_string("listing"), AIQChatRequest),
+    }
+
+    print(f"{'conversion':<28} {'cold (conv/s)':>14} {'warm (conv/s)':>14} {'speedup':>8}")
+    for name, (data, to_type) in cases.items():
+        cold = _throughput([TypeConverter(_CONVERTERS) for _ in range(args.iterations)], data, to_type)
+        warm = _throughput([TypeConverter(_CONVERTERS)] * args.iterations, data, to_type)
+        print(f"{name:<28} {cold:>14.0f} {warm:>14.0f} {warm / cold:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
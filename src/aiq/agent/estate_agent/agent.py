@@ -27,9 +27,11 @@ from langchain_core.language_models import LanguageModelInput
 from langchain_core.messages.ai import AIMessage
 from langchain_core.messages.base import BaseMessage
 from langchain_core.messages.human import HumanMessage
+from langchain_core.messages.system import SystemMessage
 from langchain_core.messages.tool import ToolMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.prompts import MessagesPlaceholder
+from langchain_core.prompts import SystemMessagePromptTemplate
 from langchain_core.runnables import Runnable
 from langchain_core.runnables.config import RunnableConfig
 from langchain_core.tools import BaseTool
@@ -59,6 +61,8 @@ class ReActGraphState(BaseModel):
     messages: list[BaseMessage] = Field(default_factory=list)  # input and output of the ReAct Agent
     agent_scratchpad: list[AgentAction] = Field(default_factory=list)  # agent thoughts / intermediate steps
     tool_responses: list[BaseMessage] = Field(default_factory=list)  # the responses from any tool calls
+    # agent thoughts and tool responses as prompt messages, appended to as the agent cycles so they are never rebuilt
+    scratchpad_messages: list[BaseMessage] = Field(default_factory=list)
 
 
 class ReActAgentGraph(DualNodeAgent):
@@ -104,7 +108,7 @@ class ReActAgentGraph(DualNodeAgent):
                 for tool in tools[:-1]
             ]) + "\n" + (f"{tools[-1].name}: {tools[-1].description}. "
                          f"{INPUT_SCHEMA_MESSAGE.format(schema=tools[-1].input_schema.model_fields)}")
-        prompt = prompt.partial(tools=tool_names_and_descriptions, tool_names=tool_names)
+        prompt = self._render_static_prompt(prompt, tools=tool_names_and_descriptions, tool_names=tool_names)
         # construct the ReAct Agent
         self.agent = prompt | self._maybe_bind_llm_and_yield()
         self.tools_dict = {tool.name: tool for tool in tools}
@@ -127,6 +131,24 @@ class ReActAgentGraph(DualNodeAgent):
         # add a stop sequence to the LLM
         return self.llm.bind(stop=["Observation:"])
 
+    @staticmethod
+    def _render_static_prompt(prompt: ChatPromptTemplate, **values: str) -> ChatPromptTemplate:
+        """
+        Render the system messages that only depend on ``values`` (the tools block) once, up front.
+
+        The rendered system prompt is then byte-for-byte identical on every agent cycle, which keeps the prompt prefix
+        cacheable by OpenAI compatible backends with prefix caching (vLLM, Ollama) and avoids re-formatting the tool
+        schemas on every call. System messages using any other variable are left as templates.
+        """
+        messages = []
+        for message in prompt.messages:
+            if isinstance(message, SystemMessagePromptTemplate) and set(message.input_variables) <= values.keys():
+                messages.append(SystemMessage(content=message.format(**values).content))
+            else:
+                messages.append(message)
+
+        return ChatPromptTemplate(messages).partial(**values)
+
     def _get_tool(self, tool_name: str):
         try:
             return self.tools_dict.get(tool_name)
@@ -170,14 +192,9 @@ class ReActAgentGraph(DualNodeAgent):
                     # ReAct Agents require agentic cycles
                     # in an agentic cycle, preserve the agent's thoughts from the previous cycles,
                     # and give the agent the response from the tool it called
-                    agent_scratchpad = []
-                    for index, intermediate_step in enumerate(state.agent_scratchpad):
-                        agent_thoughts = AIMessage(content=intermediate_step.log)
-                        agent_scratchpad.append(agent_thoughts)
-                        tool_response_content = str(state.tool_responses[index].content)
-                        tool_response = HumanMessage(content=tool_response_content)
-                        agent_scratchpad.append(tool_response)
-                    agent_scratchpad += working_state
+                    agent_scratchpad = state.scratchpad_messages
+                    if working_state:
+                        agent_scratchpad = agent_scratchpad + working_state
                     chat_history = self._get_chat_history(state.messages)
                     question = str(state.messages[-1].content)
                     logger.debug("%s Querying agent, attempt: %s", AGENT_LOG_PREFIX, attempt)
@@ -209,6 +226,7 @@ class ReActAgentGraph(DualNodeAgent):
                         agent_output.log = output_message.content
                         logger.debug("%s The agent wants to call a tool: %s", AGENT_LOG_PREFIX, agent_output.tool)
                         state.agent_scratchpad += [agent_output]
+                        state.scratchpad_messages += [AIMessage(content=agent_output.log)]
 
                     return state
                 except ReActOutputParserException as ex:
@@ -280,6 +298,7 @@ class ReActAgentGraph(DualNodeAgent):
                                         content=TOOL_NOT_FOUND_ERROR_MESSAGE.format(tool_name=agent_thoughts.tool,
                                                                                     tools=configured_tool_names))
             state.tool_responses += [tool_response]
+            state.scratchpad_messages += [HumanMessage(content=str(tool_response.content))]
             return state
 
         logger.debug("%s Calling tool %s with input: %s",
@@ -334,6 +353,7 @@ class ReActAgentGraph(DualNodeAgent):
                 raise RuntimeError("Tool call failed: " + str(tool_response.content))
 
         state.tool_responses += [tool_response]
+        state.scratchpad_messages += [HumanMessage(content=str(tool_response.content))]
         return state
 
     async def build_graph(self):
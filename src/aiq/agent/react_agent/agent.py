@@ -13,9 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 # pylint: disable=R0917
 import logging
+from collections import defaultdict
 from json import JSONDecodeError
 
 from langchain_core.agents import AgentAction
@@ -25,9 +27,11 @@ from langchain_core.language_models import BaseChatModel
 from langchain_core.messages.ai import AIMessage
 from langchain_core.messages.base import BaseMessage
 from langchain_core.messages.human import HumanMessage
+from langchain_core.messages.system import SystemMessage
 from langchain_core.messages.tool import ToolMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.prompts import MessagesPlaceholder
+from langchain_core.prompts import SystemMessagePromptTemplate
 from langchain_core.runnables.config import RunnableConfig
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel
@@ -42,6 +46,7 @@ from aiq.agent.base import AgentDecision
 from aiq.agent.dual_node import DualNodeAgent
 from aiq.agent.react_agent.output_parser import ReActOutputParser
 from aiq.agent.react_agent.output_parser import ReActOutputParserException
+from aiq.agent.react_agent.prompt import PARALLEL_TOOL_CALLS_PROMPT
 from aiq.agent.react_agent.prompt import SYSTEM_PROMPT
 from aiq.agent.react_agent.prompt import USER_PROMPT
 from aiq.agent.react_agent.register import ReActAgentWorkflowConfig
@@ -54,6 +59,8 @@ class ReActGraphState(BaseModel):
     messages: list[BaseMessage] = Field(default_factory=list)  # input and output of the ReAct Agent
     agent_scratchpad: list[AgentAction] = Field(default_factory=list)  # agent thoughts / intermediate steps
     tool_responses: list[BaseMessage] = Field(default_factory=list)  # the responses from any tool calls
+    # agent thoughts and tool responses as prompt messages, appended to as the agent cycles so they are never rebuilt
+    scratchpad_messages: list[BaseMessage] = Field(default_factory=list)
 
 
 class ReActAgentGraph(DualNodeAgent):
@@ -71,12 +78,18 @@ class ReActAgentGraph(DualNodeAgent):
                  retry_agent_response_parsing_errors: bool = True,
                  parse_agent_response_max_retries: int = 1,
                  tool_call_max_retries: int = 1,
-                 pass_tool_call_errors_to_agent: bool = True):
+                 pass_tool_call_errors_to_agent: bool = True,
+                 parallel_tool_calls: bool = False,
+                 max_concurrent_calls_per_tool: int = 4):
         super().__init__(llm=llm, tools=tools, callbacks=callbacks, detailed_logs=detailed_logs)
         self.parse_agent_response_max_retries = (parse_agent_response_max_retries
                                                  if retry_agent_response_parsing_errors else 1)
         self.tool_call_max_retries = tool_call_max_retries
         self.pass_tool_call_errors_to_agent = pass_tool_call_errors_to_agent
+        self.parallel_tool_calls = parallel_tool_calls
+        # one semaphore per tool name, so a turn asking for the same tool many times cannot flood its backend
+        self._tool_semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(max_concurrent_calls_per_tool))
         logger.debug(
             "%s Filling the prompt variables 'tools' and 'tool_names', using the tools provided in the config.",
             AGENT_LOG_PREFIX)
@@ -92,13 +105,31 @@ class ReActAgentGraph(DualNodeAgent):
                 for tool in tools[:-1]
             ]) + "\n" + (f"{tools[-1].name}: {tools[-1].description}. "
                          f"{INPUT_SCHEMA_MESSAGE.format(schema=tools[-1].input_schema.model_fields)}")
-        prompt = prompt.partial(tools=tool_names_and_descriptions, tool_names=tool_names)
+        prompt = self._render_static_prompt(prompt, tools=tool_names_and_descriptions, tool_names=tool_names)
         # construct the ReAct Agent
         bound_llm = llm.bind(stop=["Observation:"])  # type: ignore
         self.agent = prompt | bound_llm
         self.tools_dict = {tool.name: tool for tool in tools}
         logger.debug("%s Initialized ReAct Agent Graph", AGENT_LOG_PREFIX)
 
+    @staticmethod
+    def _render_static_prompt(prompt: ChatPromptTemplate, **values: str) -> ChatPromptTemplate:
+        """
+        Render the system messages that only depend on ``values`` (the tools block) once, up front.
+
+        The rendered system prompt is then byte-for-byte identical on every agent cycle, which keeps the prompt prefix
+        cacheable by OpenAI compatible backends with prefix caching (vLLM, Ollama) and avoids re-formatting the tool
+        schemas on every call. System messages using any other variable are left as templates.
+        """
+        messages = []
+        for message in prompt.messages:
+            if isinstance(message, SystemMessagePromptTemplate) and set(message.input_variables) <= values.keys():
+                messages.append(SystemMessage(content=message.format(**values).content))
+            else:
+                messages.append(message)
+
+        return ChatPromptTemplate(messages).partial(**values)
+
     def _get_tool(self, tool_name: str):
         try:
             return self.tools_dict.get(tool_name)
@@ -144,14 +175,9 @@ class ReActAgentGraph(DualNodeAgent):
                     # ReAct Agents require agentic cycles
                     # in an agentic cycle, preserve the agent's thoughts from the previous cycles,
                     # and give the agent the response from the tool it called
-                    agent_scratchpad = []
-                    for index, intermediate_step in enumerate(state.agent_scratchpad):
-                        agent_thoughts = AIMessage(content=intermediate_step.log)
-                        agent_scratchpad.append(agent_thoughts)
-                        tool_response_content = str(state.tool_responses[index].content)
-                        tool_response = HumanMessage(content=tool_response_content)
-                        agent_scratchpad.append(tool_response)
-                    agent_scratchpad += working_state
+                    agent_scratchpad = state.scratchpad_messages
+                    if working_state:
+                        agent_scratchpad = agent_scratchpad + working_state
                     question = str(state.messages[0].content)
                     logger.debug("%s Querying agent, attempt: %s", AGENT_LOG_PREFIX, attempt)
 
@@ -168,7 +194,8 @@ class ReActAgentGraph(DualNodeAgent):
                 try:
                     # check if the agent has the final answer yet
                     logger.debug("%s Successfully obtained agent response. Parsing agent's response", AGENT_LOG_PREFIX)
-                    agent_output = await ReActOutputParser().aparse(output_message.content)
+                    output_parser = ReActOutputParser(allow_multiple_actions=self.parallel_tool_calls)
+                    agent_output = await output_parser.aparse(output_message.content)
                     logger.debug("%s Successfully parsed agent response after %s attempts", AGENT_LOG_PREFIX, attempt)
                     if isinstance(agent_output, AgentFinish):
                         final_answer = agent_output.return_values.get('output', output_message.content)
@@ -176,11 +203,20 @@ class ReActAgentGraph(DualNodeAgent):
                         # this is where we handle the final output of the Agent, we can clean-up/format/postprocess here
                         # the final answer goes in the "messages" state channel
                         state.messages += [AIMessage(content=final_answer)]
+                    elif isinstance(agent_output, list):
+                        # the agent wants to call several independent tools, run them all in the next tool node
+                        for action in agent_output:
+                            action.log = output_message.content
+                        logger.debug("%s The agent wants to call the tools: %s",
+                                     AGENT_LOG_PREFIX, [action.tool for action in agent_output])
+                        state.agent_scratchpad += agent_output
+                        state.scratchpad_messages += [AIMessage(content=output_message.content)]
                     else:
                         # the agent wants to call a tool, ensure the thoughts are preserved for the next agentic cycle
                         agent_output.log = output_message.content
                         logger.debug("%s The agent wants to call a tool: %s", AGENT_LOG_PREFIX, agent_output.tool)
                         state.agent_scratchpad += [agent_output]
+                        state.scratchpad_messages += [AIMessage(content=agent_output.log)]
 
                     return state
                 except ReActOutputParserException as ex:
@@ -236,7 +272,35 @@ class ReActAgentGraph(DualNodeAgent):
         logger.debug("%s Starting the Tool Call Node", AGENT_LOG_PREFIX)
         if len(state.agent_scratchpad) == 0:
             raise RuntimeError('No tool input received in state: "agent_scratchpad"')
-        agent_thoughts = state.agent_scratchpad[-1]
+        # every agent action gets exactly one tool response, the actions of the last agent turn that have no
+        # response yet are the ones to run (a single action unless parallel_tool_calls is enabled)
+        pending_actions = state.agent_scratchpad[len(state.tool_responses):]
+        if not pending_actions:
+            # never re-run an action which already has a response, tools can have side effects
+            raise RuntimeError('No pending tool call in state: "agent_scratchpad"')
+
+        if len(pending_actions) == 1:
+            tool_response = await self._run_tool(pending_actions[0])
+            state.tool_responses += [tool_response]
+            state.scratchpad_messages += [HumanMessage(content=str(tool_response.content))]
+            return state
+
+        logger.debug("%s Running %d tool calls concurrently", AGENT_LOG_PREFIX, len(pending_actions))
+        tool_responses = await asyncio.gather(*(self._run_tool_limited(action) for action in pending_actions))
+
+        # a single observation listing every result, in the order the agent asked for the tools
+        observation = "\n\n".join(
+            f"Observation {index} ({action.tool}): {tool_response.content}"
+            for index, (action, tool_response) in enumerate(zip(pending_actions, tool_responses), start=1))
+        state.tool_responses += list(tool_responses)
+        state.scratchpad_messages += [HumanMessage(content=observation)]
+        return state
+
+    async def _run_tool_limited(self, agent_thoughts: AgentAction) -> ToolMessage:
+        async with self._tool_semaphores[agent_thoughts.tool]:
+            return await self._run_tool(agent_thoughts)
+
+    async def _run_tool(self, agent_thoughts: AgentAction) -> ToolMessage:
         # the agent can run any installed tool, simply install the tool and add it to the config file
         requested_tool = self._get_tool(agent_thoughts.tool)
         if not requested_tool:
@@ -247,12 +311,10 @@ class ReActAgentGraph(DualNodeAgent):
                 AGENT_LOG_PREFIX,
                 agent_thoughts.tool,
                 configured_tool_names)
-            tool_response = ToolMessage(name='agent_error',
-                                        tool_call_id='agent_error',
-                                        content=TOOL_NOT_FOUND_ERROR_MESSAGE.format(tool_name=agent_thoughts.tool,
-                                                                                    tools=configured_tool_names))
-            state.tool_responses += [tool_response]
-            return state
+            return ToolMessage(name='agent_error',
+                               tool_call_id='agent_error',
+                               content=TOOL_NOT_FOUND_ERROR_MESSAGE.format(tool_name=agent_thoughts.tool,
+                                                                           tools=configured_tool_names))
 
         logger.debug("%s Calling tool %s with input: %s",
                      AGENT_LOG_PREFIX,
@@ -295,8 +357,7 @@ class ReActAgentGraph(DualNodeAgent):
                 logger.error("%s Tool %s failed: %s", AGENT_LOG_PREFIX, requested_tool.name, tool_response.content)
                 raise RuntimeError("Tool call failed: " + str(tool_response.content))
 
-        state.tool_responses += [tool_response]
-        return state
+        return tool_response
 
     async def build_graph(self):
         try:
@@ -343,6 +404,9 @@ def create_react_agent_prompt(config: ReActAgentWorkflowConfig) -> ChatPromptTem
     else:
         prompt_str = SYSTEM_PROMPT
 
+    if config.parallel_tool_calls:
+        prompt_str += PARALLEL_TOOL_CALLS_PROMPT
+
     if config.additional_instructions:
         prompt_str += f" {config.additional_instructions}"
 
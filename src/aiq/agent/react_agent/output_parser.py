@@ -27,6 +27,9 @@ MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE = "Invalid Format: Missing 'Action:'
 MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE = "Invalid Format: Missing 'Action Input:' after 'Action:'"
 FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE = ("Parsing LLM output produced both a final answer and a parse-able "
                                                   "action:")
+# Same as the single action regex, except that an Action Input also ends where the next Action starts
+MULTI_ACTION_REGEX = (r"Action\s*\d*\s*:[\s]*(.*?)\s*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*?)"
+                      r"(?=\s*\n\s*Action\s*\d*\s*:|\s*[\n|\s]\s*Observation\b|$)")
 
 
 class ReActOutputParserException(ValueError, LangChainException):
@@ -43,7 +46,8 @@ class ReActOutputParserException(ValueError, LangChainException):
 
 
 class ReActOutputParser(AgentOutputParser):
-    """Parses ReAct-style LLM calls that have a single tool input.
+    """Parses ReAct-style LLM calls that have a single tool input, or several independent tool inputs when
+    ``allow_multiple_actions`` is set.
 
     Expects output to be in one of two formats.
 
@@ -67,12 +71,26 @@ class ReActOutputParser(AgentOutputParser):
     Final Answer: The temperature is 100 degrees
     ```
 
+    When ``allow_multiple_actions`` is set, several Action/Action Input pairs may follow each other before the
+    Observation. They are returned as a list of AgentActions which can be executed concurrently.
+
+    ```
+    Thought: agent thought here
+    Action: search
+    Action Input: what is the temperature in SF?
+    Action: search
+    Action Input: what is the temperature in NYC?
+    Observation: Waiting for the tool responses...
+    ```
+
     """
 
+    allow_multiple_actions: bool = False
+
     def get_format_instructions(self) -> str:
         return SYSTEM_PROMPT
 
-    def parse(self, text: str) -> AgentAction | AgentFinish:
+    def parse(self, text: str) -> AgentAction | AgentFinish | list[AgentAction]:
         includes_answer = FINAL_ANSWER_ACTION in text
         regex = r"Action\s*\d*\s*:[\s]*(.*?)\s*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*?)(?=\s*[\n|\s]\s*Observation\b|$)"
         action_match = re.search(regex, text, re.DOTALL)
@@ -81,6 +99,15 @@ class ReActOutputParser(AgentOutputParser):
                 raise ReActOutputParserException(
                     final_answer_and_action=True,
                     observation=f"{FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE}: {text}")
+
+            if self.allow_multiple_actions:
+                actions = [
+                    AgentAction(match.group(1).strip(), match.group(2).strip(" ").strip('"'), text)
+                    for match in re.finditer(MULTI_ACTION_REGEX, text, re.DOTALL)
+                ]
+                if len(actions) > 1:
+                    return actions
+
             action = action_match.group(1).strip()
             action_input = action_match.group(2)
             tool_input = action_input.strip(" ")
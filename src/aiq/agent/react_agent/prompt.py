@@ -39,3 +39,17 @@ Final Answer: the final answer to the original input question
 USER_PROMPT = """
 Question: {question}
 """
+
+PARALLEL_TOOL_CALLS_PROMPT = """
+If several tools can be used independently of each other, you may ask the human to use all of them at once by
+writing one Action/Action Input pair per tool before the Observation:
+
+Thought: you should always think about what to do
+Action: the first action to take
+Action Input: the input to the first action
+Action: the second action to take
+Action Input: the input to the second action
+Observation: wait for the human to respond with the results from all the tools, do not assume the responses
+
+Only do this when no Action Input depends on the result of another action in the same step.
+"""
@@ -59,6 +59,15 @@ class ReActAgentWorkflowConfig(FunctionBaseConfig, name="react_agent"):
     pass_tool_call_errors_to_agent: bool = Field(
         default=True,
         description="Whether to pass tool call errors to agent. If False, failed tool calls will raise an exception.")
+    parallel_tool_calls: bool = Field(
+        default=False,
+        description=("Allow the agent to request several independent tools in one step. The tools are run "
+                     "concurrently and all observations are returned to the agent in a single cycle."))
+    max_concurrent_calls_per_tool: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of concurrent calls to the same tool when parallel_tool_calls "
+        "is enabled.")
     include_tool_input_schema_in_tool_description: bool = Field(
         default=True, description="Specify inclusion of tool input schemas in the prompt.")
     description: str = Field(default="ReAct Agent Workflow", description="The description of this functions use.")
@@ -103,7 +112,9 @@ async def react_agent_workflow(config: ReActAgentWorkflowConfig, builder: Builde
         retry_agent_response_parsing_errors=config.retry_agent_response_parsing_errors,
         parse_agent_response_max_retries=config.parse_agent_response_max_retries,
         tool_call_max_retries=config.tool_call_max_retries,
-        pass_tool_call_errors_to_agent=config.pass_tool_call_errors_to_agent).build_graph()
+        pass_tool_call_errors_to_agent=config.pass_tool_call_errors_to_agent,
+        parallel_tool_calls=config.parallel_tool_calls,
+        max_concurrent_calls_per_tool=config.max_concurrent_calls_per_tool).build_graph()
 
     async def _response_fn(input_message: AIQChatRequest) -> AIQChatResponse:
         try:
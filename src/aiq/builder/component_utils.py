@@ -314,3 +314,54 @@ def build_dependency_sequence(config: "AIQConfig") -> list[ComponentInstanceData
     assert len(dependency_sequence) == total_node_count, "Dependency sequence generation failed. Report as bug."
 
     return dependency_sequence
+
+
+def build_dependency_levels(config: "AIQConfig") -> list[list[ComponentInstanceData]]:
+    """Groups the dependency sequence of an AIQ Toolkit configuration object into levels which can be instantiated
+    concurrently.
+
+    A component is placed in the level after the last level holding one of its references, so every level only
+    depends on the levels before it. Functions are also placed after every LLM, since the framework profiler wrappers
+    of a function see all the LLMs of the workflow. The root workflow is not part of any level.
+
+    Args:
+        config (AIQConfig): An AIQ Toolkit configuration object.
+
+    Returns:
+        list[list[ComponentInstanceData]]: The levels in instantiation order, each level in the order of the dependency
+            sequence.
+    """
+
+    dependency_graph: nx.DiGraph
+    _, dependency_graph = config_to_dependency_objects(config=config)
+
+    build_sequence = [x for x in build_dependency_sequence(config) if not x.is_root]
+    llm_ids = [x.instance_id for x in build_sequence if x.component_group == ComponentGroup.LLMS]
+    instance_ids = {x.instance_id for x in build_sequence}
+    groups = {x.instance_id: x.component_group for x in build_sequence}
+
+    instance_levels: dict[str, int] = {}
+
+    def instance_level(instance_id: str) -> int:
+        if (instance_id not in instance_levels):
+            dependency_ids = []
+            if (instance_id in dependency_graph):
+                # Edges go from an instance to the refs it holds and from a ref to the referenced instance
+                for ref_node in dependency_graph.successors(instance_id):
+                    dependency_ids.extend(dependency_graph.successors(ref_node))
+            if (groups[instance_id] == ComponentGroup.FUNCTIONS):
+                dependency_ids.extend(llm_ids)
+
+            instance_levels[instance_id] = 1 + max(
+                (instance_level(x) for x in dependency_ids if x in instance_ids and x != instance_id), default=-1)
+
+        return instance_levels[instance_id]
+
+    levels: list[list[ComponentInstanceData]] = []
+    for component_instance in build_sequence:
+        level = instance_level(component_instance.instance_id)
+        while (len(levels) <= level):
+            levels.append([])
+        levels[level].append(component_instance)
+
+    return levels
@@ -50,8 +50,16 @@ class Singleton(type):
 
 class ActiveFunctionContextManager:
 
-    def __init__(self):
+    def __init__(self, is_traced: bool = True):
         self._output: typing.Any | None = None
+        self._is_traced = is_traced
+
+    @property
+    def is_traced(self) -> bool:
+        """
+        Whether the function call is recorded as intermediate steps, the output is only used when it is.
+        """
+        return self._is_traced
 
     @property
     def output(self) -> typing.Any | None:
@@ -73,6 +81,8 @@ class AIQContextState(metaclass=Singleton):
                                                                       default=InvocationNode(function_id="root",
                                                                                              function_name="root"))
         self.active_span_id_stack: ContextVar[list[str]] = ContextVar("active_span_id_stack", default=["root"])
+        # Whether the current run records intermediate steps, see `TelemetryConfig.trace_sample_rate`
+        self.trace_sampled: ContextVar[bool] = ContextVar("trace_sampled", default=True)
 
         # Default is a lambda no-op which returns NoneType
         self.user_input_callback: ContextVar[Callable[[InteractionPrompt], Awaitable[HumanResponse | None]]
@@ -170,6 +180,10 @@ class AIQContext:
         """
         Set the 'active_function' in context, push an invocation node,
         AND create an OTel child span for that function call.
+
+        The start and end steps are only built when the run is sampled and something is subscribed to the event stream.
+        The decision is taken when the function starts, a subscriber added while it runs only
+        receives the steps of the functions started after it.
         """
         parent_function_node = self._context_state.active_function.get()
         current_function_id = str(uuid.uuid4())
@@ -183,26 +197,28 @@ class AIQContext:
 
         # 2) Optionally record function start as an intermediate step
         step_manager = self.intermediate_step_manager
-        step_manager.push_intermediate_step(
-            IntermediateStepPayload(UUID=current_function_id,
-                                    event_type=IntermediateStepType.FUNCTION_START,
-                                    name=function_name,
-                                    data=StreamEventData(input=input_data)))
+        is_traced = step_manager.is_recording
+        if (is_traced):
+            step_manager.push_intermediate_step(
+                IntermediateStepPayload(UUID=current_function_id,
+                                        event_type=IntermediateStepType.FUNCTION_START,
+                                        name=function_name,
+                                        data=StreamEventData(input=input_data)))
 
-        manager = ActiveFunctionContextManager()
+        manager = ActiveFunctionContextManager(is_traced=is_traced)
 
         try:
             yield manager  # run the function body
         finally:
             # 3) Record function end
-
-            data = StreamEventData(input=input_data, output=manager.output)
-
-            step_manager.push_intermediate_step(
-                IntermediateStepPayload(UUID=current_function_id,
-                                        event_type=IntermediateStepType.FUNCTION_END,
-                                        name=function_name,
-                                        data=data))
+            if (is_traced):
+                data = StreamEventData(input=input_data, output=manager.output)
+
+                step_manager.push_intermediate_step(
+                    IntermediateStepPayload(UUID=current_function_id,
+                                            event_type=IntermediateStepType.FUNCTION_END,
+                                            name=function_name,
+                                            data=data))
 
             # 4) Unset the function contextvar
             self._context_state.active_function.reset(fn_token)
@@ -221,17 +221,15 @@ class Function(FunctionBase[InputT, StreamingOutputT, SingleOutputT], ABC):
             try:
                 converted_input: InputT = self._convert_input(value)  # type: ignore
 
-                # Collect streaming outputs to capture the final result
+                # Collect streaming outputs to capture the final result, only needed when the call is traced
                 final_output: list[typing.Any] = []
 
                 async for data in self._astream(converted_input):
                     if to_type is not None and not isinstance(data, to_type):
-                        converted_data = self._converter.try_convert(data, to_type=to_type)
-                        final_output.append(converted_data)
-                        yield converted_data
-                    else:
+                        data = self._converter.try_convert(data, to_type=to_type)
+                    if manager.is_traced:
                         final_output.append(data)
-                        yield data
+                    yield data
 
                 # Set the final output for intermediate step tracking
                 manager.set_output(final_output)
@@ -23,6 +23,9 @@ from aiq.data_models.intermediate_step import IntermediateStepState
 from aiq.utils.reactive.observable import OnComplete
 from aiq.utils.reactive.observable import OnError
 from aiq.utils.reactive.observable import OnNext
+from aiq.utils.reactive.observer import Observer
+from aiq.utils.reactive.queued_observer import OverflowPolicy
+from aiq.utils.reactive.queued_observer import QueuedObserver
 from aiq.utils.reactive.subscription import Subscription
 
 if typing.TYPE_CHECKING:
@@ -51,6 +54,17 @@ class IntermediateStepManager:
 
         self._outstanding_start_steps: dict[str, OpenStep] = {}
 
+    @property
+    def is_recording(self) -> bool:
+        """
+        Whether the current run is sampled and anything is subscribed to the AIQ Toolkit Event Stream
+        """
+        if not self._context_state.trace_sampled.get():
+            return False
+
+        event_stream = self._context_state.event_stream.get()
+        return event_stream is not None and event_stream.has_observers
+
     def push_intermediate_step(self, payload: IntermediateStepPayload) -> None:
         """
         Pushes an intermediate step to the AIQ Toolkit Event Stream
@@ -59,6 +73,10 @@ class IntermediateStepManager:
         if not isinstance(payload, IntermediateStepPayload):
             raise TypeError(f"Payload must be of type IntermediateStepPayload, not {type(payload)}")
 
+        # The whole run is dropped when it is not sampled, see `TelemetryConfig.trace_sample_rate`
+        if not self._context_state.trace_sampled.get():
+            return
+
         active_span_id_stack = self._context_state.active_span_id_stack.get()
 
         if (payload.event_state == IntermediateStepState.START):
@@ -166,9 +184,20 @@ class IntermediateStepManager:
     def subscribe(self,
                   on_next: OnNext[IntermediateStep],
                   on_error: OnError = None,
-                  on_complete: OnComplete = None) -> Subscription:
+                  on_complete: OnComplete = None,
+                  max_queue_size: int | None = None,
+                  overflow: OverflowPolicy = "drop_oldest") -> Subscription:
         """
         Subscribes to the AIQ Toolkit Event Stream for intermediate steps
+
+        When ``max_queue_size`` is set, the callbacks run from a bounded per event loop queue instead of inside
+        ``push_intermediate_step``, see ``QueuedObserver`` for the ``overflow`` policies.
         """
 
-        return self._context_state.event_stream.get().subscribe(on_next, on_error, on_complete)
+        if max_queue_size is None:
+            return self._context_state.event_stream.get().subscribe(on_next, on_error, on_complete)
+
+        observer = QueuedObserver(Observer(on_next, on_error, on_complete),
+                                  max_queue_size=max_queue_size,
+                                  overflow=overflow)
+        return self._context_state.event_stream.get().subscribe(observer)
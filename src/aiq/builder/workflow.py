@@ -90,10 +90,13 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
         a new top-level workflow span here.
         """
 
+        sample_rate = self.config.general.telemetry.trace_sample_rate
+
         async with AIQRunner(input_message=message,
                              entry_fn=self._entry_fn,
                              context_state=self._context_state,
-                             exporter_manager=self._exporter_manager.get()) as runner:
+                             exporter_manager=self._exporter_manager.get(),
+                             trace_sample_rate=sample_rate) as runner:
 
             # The caller can `yield runner` so they can do `runner.result()` or `runner.result_stream()`
             yield runner
@@ -13,9 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import contextvars
 import dataclasses
 import inspect
 import logging
+import time
+import typing
 import warnings
 from contextlib import AbstractAsyncContextManager
 from contextlib import AsyncExitStack
@@ -25,7 +29,7 @@ from aiq.authentication.interfaces import AuthProviderBase
 from aiq.builder.builder import Builder
 from aiq.builder.builder import UserManagerHolder
 from aiq.builder.component_utils import ComponentInstanceData
-from aiq.builder.component_utils import build_dependency_sequence
+from aiq.builder.component_utils import build_dependency_levels
 from aiq.builder.context import AIQContext
 from aiq.builder.context import AIQContextState
 from aiq.builder.embedder import EmbedderProviderInfo
@@ -72,6 +76,9 @@ from aiq.utils.type_utils import override
 
 logger = logging.getLogger(__name__)
 
+# Sentinel telling a context variable which is not set from one set to None
+_UNSET = object()
+
 
 @dataclasses.dataclass
 class ConfiguredTelemetryExporter:
@@ -159,6 +166,8 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         self._context_state = AIQContextState.get()
 
         self._exit_stack: AsyncExitStack | None = None
+        # exit stacks of the tasks which own the components built concurrently, see `_own_component`
+        self._task_exit_stacks: dict[asyncio.Task, AsyncExitStack] = {}
 
         # Create a mapping to track function name -> other function names it depends on
         self.function_dependencies: dict[str, FunctionDependencies] = {}
@@ -302,6 +311,10 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
     def _get_exit_stack(self) -> AsyncExitStack:
 
+        task_exit_stack = self._task_exit_stacks.get(asyncio.current_task())
+        if task_exit_stack is not None:
+            return task_exit_stack
+
         if self._exit_stack is None:
             raise ValueError(
                 "Exit stack not initialized. Did you forget to call `async with WorkflowBuilder() as builder`?")
@@ -860,77 +873,161 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         """
         self._log_build_failure("<workflow>", "workflow", completed_components, remaining_components, original_error)
 
+    async def _build_component(self, component_instance: ComponentInstanceData):
+        """
+        Instantiate a single component of the dependency sequence and log how long it took.
+        """
+        start_time = time.perf_counter()
+
+        # Instantiate a the llm
+        if component_instance.component_group == ComponentGroup.LLMS:
+            await self.add_llm(component_instance.name, component_instance.config)
+        # Instantiate a the embedder
+        elif component_instance.component_group == ComponentGroup.EMBEDDERS:
+            await self.add_embedder(component_instance.name, component_instance.config)
+        # Instantiate a memory client
+        elif component_instance.component_group == ComponentGroup.MEMORY:
+            await self.add_memory_client(component_instance.name, component_instance.config)
+        # Instantiate a object store client
+        elif component_instance.component_group == ComponentGroup.OBJECT_STORES:
+            await self.add_object_store(component_instance.name, component_instance.config)
+        # Instantiate a retriever client
+        elif component_instance.component_group == ComponentGroup.RETRIEVERS:
+            await self.add_retriever(component_instance.name, component_instance.config)
+        # Instantiate a function
+        elif component_instance.component_group == ComponentGroup.FUNCTIONS:
+            await self.add_function(component_instance.name, component_instance.config)
+        elif component_instance.component_group == ComponentGroup.ITS_STRATEGIES:
+            await self.add_its_strategy(component_instance.name, component_instance.config)
+
+        elif component_instance.component_group == ComponentGroup.AUTHENTICATION:
+            await self.add_auth_provider(component_instance.name, component_instance.config)
+        else:
+            raise ValueError(f"Unknown component group {component_instance.component_group}")
+
+        logger.info("Built %s `%s` in %.3fs",
+                    component_instance.component_group.value,
+                    component_instance.name,
+                    time.perf_counter() - start_time)
+
+    async def _own_component(self, build: typing.Awaitable[None], built: asyncio.Future, release: asyncio.Event):
+        """
+        Build a component in the current task and keep its context managers open until ``release`` is set.
+
+        Context managers such as anyio cancel scopes and task groups, e.g. the ones of MCP clients, must be exited by
+        the task which entered them. A component built concurrently with others is therefore entered into an exit stack
+        owned by its own task, which also tears it down, rather than into the builder's exit stack.
+        """
+        task = asyncio.current_task()
+        try:
+            async with AsyncExitStack() as exit_stack:
+                self._task_exit_stacks[task] = exit_stack
+                try:
+                    await build
+                except asyncio.CancelledError:
+                    built.cancel()
+                    raise
+                except Exception as e:
+                    if not built.done():
+                        built.set_exception(e)
+                    return
+
+                if not built.done():
+                    built.set_result(None)
+                await release.wait()
+        finally:
+            del self._task_exit_stacks[task]
+
+    @staticmethod
+    async def _release_components(release: asyncio.Event, owner_tasks: list[asyncio.Task]):
+        release.set()
+        results = await asyncio.gather(*owner_tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
     async def populate_builder(self, config: AIQConfig, skip_workflow: bool = False):
         """
         Populate the builder with components and optionally set up the workflow.
 
+        The components are built level by level in their dependency graph, up to
+        `general.max_build_concurrency` components of a level at a time.
+
         Args:
             config (AIQConfig): The configuration object containing component definitions.
             skip_workflow (bool): If True, skips the workflow instantiation step. Defaults to False.
 
         """
-        # Generate the build sequence
-        build_sequence = build_dependency_sequence(config)
+        # Generate the build levels
+        build_levels = build_dependency_levels(config)
+        build_start_time = time.perf_counter()
 
         # Initialize progress tracking
         completed_components = []
-        remaining_components = [(str(comp.name), comp.component_group.value) for comp in build_sequence
-                                if not comp.is_root]
+        remaining_components = [(str(comp.name), comp.component_group.value) for level in build_levels
+                                for comp in level]
         if not skip_workflow:
             remaining_components.append(("<workflow>", "workflow"))
 
-        # Loop over all objects and add to the workflow builder
-        for component_instance in build_sequence:
-            try:
-                # Remove from remaining as we start building (if not root)
-                if not component_instance.is_root:
-                    remaining_components.remove(
-                        (str(component_instance.name), component_instance.component_group.value))
-
-                # Instantiate a the llm
-                if component_instance.component_group == ComponentGroup.LLMS:
-                    await self.add_llm(component_instance.name, component_instance.config)
-                # Instantiate a the embedder
-                elif component_instance.component_group == ComponentGroup.EMBEDDERS:
-                    await self.add_embedder(component_instance.name, component_instance.config)
-                # Instantiate a memory client
-                elif component_instance.component_group == ComponentGroup.MEMORY:
-                    await self.add_memory_client(component_instance.name, component_instance.config)
-            # Instantiate a object store client
-                elif component_instance.component_group == ComponentGroup.OBJECT_STORES:
-                    await self.add_object_store(component_instance.name, component_instance.config)
-                # Instantiate a retriever client
-                elif component_instance.component_group == ComponentGroup.RETRIEVERS:
-                    await self.add_retriever(component_instance.name, component_instance.config)
-                # Instantiate a function
-                elif component_instance.component_group == ComponentGroup.FUNCTIONS:
-                    # If the function is the root, set it as the workflow later
-                    if (not component_instance.is_root):
-                        await self.add_function(component_instance.name, component_instance.config)
-                elif component_instance.component_group == ComponentGroup.ITS_STRATEGIES:
-                    await self.add_its_strategy(component_instance.name, component_instance.config)
-
-                elif component_instance.component_group == ComponentGroup.AUTHENTICATION:
-                    await self.add_auth_provider(component_instance.name, component_instance.config)
-                else:
-                    raise ValueError(f"Unknown component group {component_instance.component_group}")
-
-                # Add to completed after successful build (if not root)
-                if not component_instance.is_root:
-                    completed_components.append(
-                        (str(component_instance.name), component_instance.component_group.value))
-
-            except Exception as e:
-                self._log_build_failure_component(component_instance, completed_components, remaining_components, e)
-                raise
+        semaphore = asyncio.Semaphore(self.general_config.max_build_concurrency)
+
+        async def build_one(component_instance: ComponentInstanceData):
+            async with semaphore:
+                # Remove from remaining as we start building
+                remaining_components.remove((str(component_instance.name), component_instance.component_group.value))
+                try:
+                    await self._build_component(component_instance)
+                except Exception as e:
+                    self._log_build_failure_component(component_instance, completed_components, remaining_components, e)
+                    raise
+
+                # Add to completed after successful build
+                completed_components.append((str(component_instance.name), component_instance.component_group.value))
+
+        for level in build_levels:
+            if len(level) == 1 or self.general_config.max_build_concurrency == 1:
+                for component_instance in level:
+                    await build_one(component_instance)
+                continue
+
+            # The components of a level share one context, and the context variables they set, e.g. the profiler
+            # callback handlers, are copied back so they are visible to the workflow as with a sequential build
+            context = contextvars.copy_context()
+            loop = asyncio.get_running_loop()
+            release = asyncio.Event()
+            built_futures = [loop.create_future() for _ in level]
+            owner_tasks = [
+                asyncio.create_task(self._own_component(build_one(x), built, release), context=context)
+                for x, built in zip(level, built_futures)
+            ]
+            # The components are torn down by their own tasks when the builder exits, in reverse order of the levels
+            self._get_exit_stack().push_async_callback(self._release_components, release, owner_tasks)
+
+            # Let every component of the level finish so the ones which were built are torn down on exit
+            results = await asyncio.gather(*built_futures, return_exceptions=True)
+
+            for var, value in context.items():
+                if var.get(_UNSET) is not value:
+                    var.set(value)
+
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+        logger.info("Built %d components in %d levels in %.3fs",
+                    len(completed_components),
+                    len(build_levels),
+                    time.perf_counter() - build_start_time)
 
         # Instantiate the workflow
         if not skip_workflow:
             try:
                 # Remove workflow from remaining as we start building
                 remaining_components.remove(("<workflow>", "workflow"))
+                workflow_start_time = time.perf_counter()
                 await self.set_workflow(config.workflow)
                 completed_components.append(("<workflow>", "workflow"))
+                logger.info("Built workflow in %.3fs", time.perf_counter() - workflow_start_time)
             except Exception as e:
                 self._log_build_failure_workflow(completed_components, remaining_components, e)
                 raise
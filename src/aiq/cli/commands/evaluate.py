@@ -15,12 +15,13 @@
 
 import asyncio
 import logging
+import typing
 from pathlib import Path
 
 import click
 
-from aiq.eval.evaluate import EvaluationRun
-from aiq.eval.evaluate import EvaluationRunConfig
+if typing.TYPE_CHECKING:
+    from aiq.eval.evaluate import EvaluationRunConfig
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +60,13 @@ logger = logging.getLogger(__name__)
     default=False,
     help="Skip the dataset entries that have a generated answer.",
 )
+@click.option(
+    "--checkpoint_file",
+    type=click.Path(file_okay=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Append the output of every completed entry to this JSONL file and skip the entries already in it. "
+    "Re-run with the same file to resume an interrupted evaluation.",
+)
 @click.option(
     "--endpoint",
     type=str,
@@ -89,7 +97,9 @@ def eval_command(ctx, **kwargs) -> None:
     pass
 
 
-async def run_and_evaluate(config: EvaluationRunConfig):
+async def run_and_evaluate(config: "EvaluationRunConfig"):
+    from aiq.eval.evaluate import EvaluationRun
+
     # Run evaluation
     eval_runner = EvaluationRun(config=config)
     await eval_runner.run_and_evaluate()
@@ -104,6 +114,7 @@ def process_aiq_eval(
     result_json_path: str,
     skip_workflow: bool,
     skip_completed_entries: bool,
+    checkpoint_file: Path | None,
     endpoint: str,
     endpoint_timeout: int,
     reps: int,
@@ -124,6 +135,8 @@ def process_aiq_eval(
                                "exclusive. You cannot run multiple repetitions if you are skipping the workflow or "
                                "have a partially completed dataset.")
 
+    from aiq.eval.evaluate import EvaluationRunConfig
+
     # Create the configuration object
     config = EvaluationRunConfig(
         config_file=config_file,
@@ -131,6 +144,7 @@ def process_aiq_eval(
         result_json_path=result_json_path,
         skip_workflow=skip_workflow,
         skip_completed_entries=skip_completed_entries,
+        checkpoint_file=checkpoint_file,
         endpoint=endpoint,
         endpoint_timeout=endpoint_timeout,
         reps=reps,
@@ -21,8 +21,6 @@ import anyio
 import click
 
 from aiq.tool.mcp.exceptions import MCPError
-from aiq.tool.mcp.mcp_client import MCPBuilder
-from aiq.utils.exception_handlers.mcp import format_mcp_error
 
 # Suppress verbose logs from mcp.client.sse and httpx
 logging.getLogger("mcp.client.sse").setLevel(logging.WARNING)
@@ -98,6 +96,9 @@ async def list_tools_and_schemas(url: str, tool_name: str | None = None) -> list
     Raises:
         MCPError: Caught internally and logged, returns empty list instead
     """
+    from aiq.tool.mcp.mcp_client import MCPBuilder
+    from aiq.utils.exception_handlers.mcp import format_mcp_error
+
     builder = MCPBuilder(url=url)
     try:
         if tool_name:
@@ -154,6 +155,7 @@ async def list_tools_direct(url: str, tool_name: str | None = None) -> list[dict
         # Convert raw exceptions to structured MCPError for consistency
         from aiq.utils.exception_handlers.mcp import convert_to_mcp_error
         from aiq.utils.exception_handlers.mcp import extract_primary_exception
+        from aiq.utils.exception_handlers.mcp import format_mcp_error
 
         if isinstance(e, ExceptionGroup):  # noqa: F821
             primary_exception = extract_primary_exception(list(e.exceptions))
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from pathlib import Path
+
+import click
+from tabulate import tabulate
+
+logger = logging.getLogger(__name__)
+
+
+@click.command(help="Profile intermediate step traces written by the file exporter, one chunk at a time.")
+@click.argument("trace_paths",
+                nargs=-1,
+                required=True,
+                type=click.Path(exists=True, file_okay=True, dir_okay=True, path_type=Path))
+@click.option("--output_dir",
+              type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+              required=True,
+              help="Directory to write the Parquet data and the confidence intervals to.")
+@click.option("--chunk_size",
+              type=int,
+              default=10_000,
+              show_default=True,
+              help="Number of intermediate steps read and written at a time.")
+@click.option("--exclude_io_text",
+              is_flag=True,
+              default=False,
+              help="Leave the LLM input, output and token text out of the Parquet data.")
+@click.option("--forecasting_model",
+              type=click.Path(file_okay=True, dir_okay=False, path_type=Path),
+              default=None,
+              help="Incremental forecasting model (.npz) to update with the requests in the traces. It is created when "
+              "the file does not exist.")
+@click.option("--forecasting_model_type",
+              type=click.Choice(["online_linear", "exponentially_weighted"]),
+              default="online_linear",
+              show_default=True,
+              help="Type of the forecasting model to create when --forecasting_model does not exist.")
+def profile_command(trace_paths: tuple[Path, ...],
+                    output_dir: Path,
+                    chunk_size: int,
+                    exclude_io_text: bool,
+                    forecasting_model: Path | None,
+                    forecasting_model_type: str):
+    """Profile trace files, or directories of rolled trace files, without loading them in memory"""
+    from aiq.profiler.forecasting.model_trainer import create_model
+    from aiq.profiler.forecasting.models import IncrementalForecastingModel
+    from aiq.profiler.streaming_profiler import StreamingProfilerRunner
+
+    model = None
+    if forecasting_model is not None:
+        if forecasting_model.exists():
+            model = IncrementalForecastingModel.load(forecasting_model)
+            logger.info("Updating %s trained on %d samples", forecasting_model, model.n_samples)
+        else:
+            model = create_model(forecasting_model_type)
+
+    runner = StreamingProfilerRunner(output_dir,
+                                     chunk_size=chunk_size,
+                                     exclude_io_text=exclude_io_text,
+                                     forecasting_model=model)
+    metrics = runner.run(list(trace_paths))
+
+    if model is not None:
+        model.save(forecasting_model)
+        logger.info("Saved forecasting model trained on %d samples to %s", model.n_samples, forecasting_model)
+
+    rows = []
+    for name, intervals in (("Workflow run time (s)", metrics.workflow_run_time_confidence_intervals),
+                            ("LLM latency (s)", metrics.llm_latency_confidence_intervals),
+                            ("Throughput (requests/s)", metrics.throughput_estimate_confidence_interval)):
+        lower, upper = intervals["ninety_fifth_interval"]
+        rows.append([
+            name,
+            intervals["n"],
+            intervals["mean"],
+            f"{lower:.4f} - {upper:.4f}",
+            intervals["p90"],
+            intervals["p95"],
+            intervals["p99"]
+        ])
+
+    click.echo(
+        tabulate(rows,
+                 headers=["Metric", "n", "Mean", "95% CI", "p90", "p95", "p99"],
+                 tablefmt="github",
+                 floatfmt=".4f"))
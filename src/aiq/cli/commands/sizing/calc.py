@@ -20,7 +20,6 @@ from pathlib import Path
 import click
 from tabulate import tabulate
 
-from aiq.profiler.calc.calc_runner import CalcRunner
 from aiq.profiler.calc.data_models import CalcRunnerConfig
 from aiq.profiler.calc.data_models import CalcRunnerOutput
 
@@ -113,6 +112,21 @@ logger = logging.getLogger(__name__)
     default=300,
     help="Timeout for the remote workflow endpoint in seconds (default: 300).",
 )
+@click.option(
+    "--max_parallel_runs",
+    type=int,
+    required=False,
+    default=1,
+    help="Number of concurrency values tested at the same time (default: 1). Runs sharing an LLM backend affect "
+    "each other's latencies, only use more than one run if every run has its own backend.",
+)
+@click.option(
+    "--checkpoint_dir",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    required=False,
+    default=None,
+    help="Checkpoint the completed items of every run to this directory and resume from it (optional).",
+)
 @click.pass_context
 def calc_command(ctx,
                  config_file,
@@ -126,7 +140,9 @@ def calc_command(ctx,
                  num_passes,
                  append_calc_outputs,
                  endpoint,
-                 endpoint_timeout):
+                 endpoint_timeout,
+                 max_parallel_runs,
+                 checkpoint_dir):
     """Estimate GPU count and plot metrics for a workflow profile."""
     # Only use CLI concurrencies, with default
     concurrencies_list = [int(x) for x in concurrencies.split(",") if x.strip()]
@@ -136,6 +152,10 @@ def calc_command(ctx,
         click.echo("Concurrency of 0 is not allowed.")
         return
 
+    if max_parallel_runs < 1:
+        click.echo("The number of parallel runs must be at least 1.")
+        return
+
     # Check if the parameters are valid in online and offline mode
     if offline_mode:
         # In offline mode target test parameters are needed to estimate the GPU count
@@ -181,9 +201,13 @@ def calc_command(ctx,
         append_job=append_calc_outputs,
         endpoint=endpoint,
         endpoint_timeout=endpoint_timeout,
+        max_parallel_runs=max_parallel_runs,
+        checkpoint_dir=checkpoint_dir,
     )
 
     async def run_calc() -> CalcRunnerOutput:
+        from aiq.profiler.calc.calc_runner import CalcRunner
+
         runner = CalcRunner(runner_config)
         result = await runner.run()
         return result
@@ -175,13 +175,13 @@ class StartCommandGroup(click.Group):
         if (config_file is None):
             raise click.ClickException("No config file provided.")
 
-        # Here we need to ensure all objects are loaded before we try to create the config object
-        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
-
         logger.info("Starting AIQ Toolkit from config file: '%s'", config_file)
 
         config_dict = load_and_override_config(config_file, override)
 
+        # Here we need to ensure the objects used by the config are loaded before we try to create the config object
+        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT, config_dict)
+
         # Get the front end for the command
         front_end: RegisteredFrontEndInfo = self._registered_front_ends[cmd_name]
 
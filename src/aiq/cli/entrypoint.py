@@ -33,6 +33,7 @@ import nest_asyncio
 from .commands.configure.configure import configure_command
 from .commands.evaluate import eval_command
 from .commands.info.info import info_command
+from .commands.profile import profile_command
 from .commands.registry.registry import registry_command
 from .commands.sizing.sizing import sizing
 from .commands.start import start_command
@@ -101,6 +102,7 @@ def cli(ctx: click.Context, log_level: str):
 cli.add_command(configure_command, name="configure")
 cli.add_command(eval_command, name="eval")
 cli.add_command(info_command, name="info")
+cli.add_command(profile_command, name="profile")
 cli.add_command(registry_command, name="registry")
 cli.add_command(start_command, name="start")
 cli.add_command(uninstall_command, name="uninstall")
@@ -17,6 +17,7 @@ import logging
 import typing
 from collections.abc import AsyncIterator
 from collections.abc import Callable
+from collections.abc import Iterator
 from contextlib import AbstractAsyncContextManager
 from contextlib import contextmanager
 from copy import deepcopy
@@ -362,6 +363,9 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
         self._registration_changed_hooks: list[Callable[[], None]] = []
         self._registration_changed_hooks_active: bool = True
 
+        # Loads the plugins which were skipped by a lazy discovery, called once when a lookup misses
+        self._missing_registrations_loader: Callable[[], None] | None = None
+
         self._registered_channel_map = {}
 
     def _registration_changed(self):
@@ -391,6 +395,50 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
             # Ensure that the registration changed hooks are called
             self._registration_changed()
 
+    def set_missing_registrations_loader(self, loader: Callable[[], None] | None) -> None:
+        """
+        Set a callback loading the plugins which were not discovered yet. It is called the first time a framework
+        client or tool wrapper lookup misses, before the lookup is retried.
+        """
+        self._missing_registrations_loader = loader
+
+    def _load_missing_registrations(self) -> None:
+
+        loader = self._missing_registrations_loader
+
+        if (loader is None):
+            return
+
+        self._missing_registrations_loader = None
+
+        with self.pause_registration_changed_hooks():
+            loader()
+
+    def iter_registrations(self) -> Iterator[tuple[str, RegisteredInfo | RegisteredToolWrapper]]:
+        """
+        Iterate over every registration as (kind, registration) tuples.
+        """
+        yield from (("telemetry_exporter", x) for x in self._registered_telemetry_exporters.values())
+        yield from (("logging_method", x) for x in self._registered_logging_methods.values())
+        yield from (("front_end", x) for x in self._registered_front_end_infos.values())
+        yield from (("function", x) for x in self._registered_functions.values())
+        yield from (("llm_provider", x) for x in self._registered_llm_provider_infos.values())
+        yield from (("llm_client", x) for clients in self._llm_client_provider_to_framework.values()
+                    for x in clients.values())
+        yield from (("auth_provider", x) for x in self._registered_auth_provider_infos.values())
+        yield from (("embedder_provider", x) for x in self._registered_embedder_provider_infos.values())
+        yield from (("embedder_client", x) for clients in self._embedder_client_provider_to_framework.values()
+                    for x in clients.values())
+        yield from (("evaluator", x) for x in self._registered_evaluator_infos.values())
+        yield from (("memory", x) for x in self._registered_memory_infos.values())
+        yield from (("object_store", x) for x in self._registered_object_store_infos.values())
+        yield from (("retriever_provider", x) for x in self._registered_retriever_provider_infos.values())
+        yield from (("retriever_client", x) for clients in self._retriever_client_provider_to_framework.values()
+                    for x in clients.values())
+        yield from (("registry_handler", x) for x in self._registered_registry_handler_infos.values())
+        yield from (("tool_wrapper", x) for x in self._registered_tool_wrappers.values())
+        yield from (("its_strategy", x) for x in self._registered_its_strategies.values())
+
     def register_telemetry_exporter(self, registration: RegisteredTelemetryExporter):
 
         if (registration.config_type in self._registered_telemetry_exporters):
@@ -534,6 +582,9 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
     def get_llm_client(self, config_type: type[LLMBaseConfig], wrapper_type: str) -> RegisteredLLMClientInfo:
 
+        if (wrapper_type not in self._llm_client_provider_to_framework.get(config_type, {})):
+            self._load_missing_registrations()
+
         try:
             client_info = self._llm_client_provider_to_framework[config_type][wrapper_type]
         except KeyError as err:
@@ -583,6 +634,9 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
     def get_embedder_client(self, config_type: type[EmbedderBaseConfig],
                             wrapper_type: str) -> RegisteredEmbedderClientInfo:
 
+        if (wrapper_type not in self._embedder_client_provider_to_framework.get(config_type, {})):
+            self._load_missing_registrations()
+
         try:
             client_info = self._embedder_client_provider_to_framework[config_type][wrapper_type]
         except KeyError as err:
@@ -698,6 +752,9 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
     def get_retriever_client(self, config_type: type[RetrieverBaseConfig],
                              wrapper_type: str | None) -> RegisteredRetrieverClientInfo:
 
+        if (wrapper_type not in self._retriever_client_provider_to_framework.get(config_type, {})):
+            self._load_missing_registrations()
+
         try:
             client_info = self._retriever_client_provider_to_framework[config_type][wrapper_type]
         except KeyError as err:
@@ -722,6 +779,9 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
     def get_tool_wrapper(self, llm_framework: str) -> RegisteredToolWrapper:
 
+        if (llm_framework not in self._registered_tool_wrappers):
+            self._load_missing_registrations()
+
         try:
             return self._registered_tool_wrappers[llm_framework]
         except KeyError as err:
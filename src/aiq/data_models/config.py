@@ -20,6 +20,8 @@ import typing
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Discriminator
+from pydantic import Field
+from pydantic import PositiveInt
 from pydantic import ValidationError
 from pydantic import ValidationInfo
 from pydantic import ValidatorFunctionWrapHandler
@@ -138,6 +140,12 @@ class TelemetryConfig(BaseModel):
     logging: dict[str, LoggingBaseConfig] = {}
     tracing: dict[str, TelemetryExporterBaseConfig] = {}
 
+    trace_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+    """
+    Fraction of the workflow runs which are traced. The decision is taken once per run: a sampled run records all of its
+    intermediate steps, a run which is not sampled records none, so no trace is left with missing parents.
+    """
+
     @field_validator("logging", "tracing", mode="wrap")
     @classmethod
     def validate_components(cls, value: typing.Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo):
@@ -191,6 +199,13 @@ class GeneralConfig(BaseModel):
     better error messages when debugging.
     """
 
+    max_build_concurrency: PositiveInt = 8
+    """
+    Maximum number of components the workflow builder instantiates at a time. Components are built level by level in
+    their dependency graph, the components of a level concurrently, so references between components must use the
+    component ref types (e.g. `FunctionRef`, `LLMRef`). Set to 1 to build them one at a time in dependency order.
+    """
+
     telemetry: TelemetryConfig = TelemetryConfig()
 
     # FrontEnd Configuration
@@ -18,7 +18,6 @@ import typing
 from collections.abc import Callable
 from pathlib import Path
 
-import pandas as pd
 from pydantic import BaseModel
 from pydantic import Discriminator
 from pydantic import FilePath
@@ -75,10 +74,14 @@ class EvalDatasetJsonConfig(EvalDatasetBaseConfig, name="json"):
 
     @staticmethod
     def parser() -> tuple[Callable, dict]:
+        import pandas as pd
+
         return pd.read_json, {}
 
 
 def read_jsonl(file_path: FilePath, **kwargs):
+    import pandas as pd
+
     with open(file_path, 'r', encoding='utf-8') as f:
         data = [json.loads(line) for line in f]
     return pd.DataFrame(data)
@@ -95,6 +98,8 @@ class EvalDatasetCsvConfig(EvalDatasetBaseConfig, name="csv"):
 
     @staticmethod
     def parser() -> tuple[Callable, dict]:
+        import pandas as pd
+
         return pd.read_csv, {}
 
 
@@ -102,6 +107,8 @@ class EvalDatasetParquetConfig(EvalDatasetBaseConfig, name="parquet"):
 
     @staticmethod
     def parser() -> tuple[Callable, dict]:
+        import pandas as pd
+
         return pd.read_parquet, {}
 
 
@@ -109,6 +116,8 @@ class EvalDatasetXlsConfig(EvalDatasetBaseConfig, name="xls"):
 
     @staticmethod
     def parser() -> tuple[Callable, dict]:
+        import pandas as pd
+
         return pd.read_excel, {"engine": "openpyxl"}
 
 
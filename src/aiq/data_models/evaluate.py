@@ -69,6 +69,12 @@ class EvalOutputConfig(BaseModel):
     workflow_output_step_filter: list[IntermediateStepType] | None = None
 
 
+class EvaluatorCacheConfig(BaseModel):
+    # Directory the evaluator scores are cached in. Keep it outside of the output directory, which may be cleaned up
+    # before every run.
+    dir: Path = Path("/tmp/aiq/eval_cache/")
+
+
 class EvalGeneralConfig(BaseModel):
     max_concurrency: int = 8
 
@@ -88,6 +94,9 @@ class EvalGeneralConfig(BaseModel):
     # Inference profiler
     profiler: ProfilerConfig | None = None
 
+    # If present, evaluator scores are cached across runs and an evaluator is only run again when an item changed
+    evaluator_cache: EvaluatorCacheConfig | None = None
+
     # overwrite the output_dir with the output config if present
     @model_validator(mode="before")
     @classmethod
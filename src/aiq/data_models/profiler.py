@@ -13,12 +13,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import typing
+
 from pydantic import BaseModel
 
 
 class PromptCachingConfig(BaseModel):
     enable: bool = False
     min_frequency: float = 0.5
+    top_k: int | None = None
+    granularity: typing.Literal["token", "character"] = "token"
 
 
 class BottleneckConfig(BaseModel):
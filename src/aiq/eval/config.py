@@ -44,6 +44,12 @@ class EvaluationRunConfig(BaseModel):
     # number of passes at each concurrency, if 0 the dataset is adjusted to a multiple of the
     # concurrency. The is only used if adjust_dataset_size is true
     num_passes: int = 0
+    # JSONL file the output of every completed item is appended to when the workflow is run locally. Items found in
+    # the file are not run again, so an interrupted run resumes where it stopped.
+    checkpoint_file: Path | None = None
+    # If set, the outputs are written to this subdirectory of the output directory of the config file, which keeps
+    # runs sharing a config file from cleaning up and overwriting each other's outputs.
+    output_subdir: str | None = None
 
 
 class EvaluationRunOutput(BaseModel):
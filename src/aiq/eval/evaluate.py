@@ -16,6 +16,7 @@
 import asyncio
 import logging
 import shutil
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
@@ -25,6 +26,7 @@ from tqdm import tqdm
 
 from aiq.data_models.evaluate import EvalConfig
 from aiq.data_models.evaluate import JobEvictionPolicy
+from aiq.data_models.evaluate import ProfilerConfig
 from aiq.eval.config import EvaluationRunConfig
 from aiq.eval.config import EvaluationRunOutput
 from aiq.eval.dataset_handler.dataset_handler import DatasetHandler
@@ -34,6 +36,8 @@ from aiq.eval.evaluator.evaluator_model import EvalOutput
 from aiq.eval.usage_stats import UsageStats
 from aiq.eval.usage_stats import UsageStatsItem
 from aiq.eval.usage_stats import UsageStatsLLM
+from aiq.eval.utils.eval_checkpoint import EvalCheckpoint
+from aiq.eval.utils.evaluator_cache import EvaluatorCache
 from aiq.eval.utils.output_uploader import OutputUploader
 from aiq.eval.utils.weave_eval import WeaveEvaluationIntegration
 from aiq.profiler.data_models import ProfilerResults
@@ -42,14 +46,32 @@ from aiq.runtime.session import AIQSessionManager
 logger = logging.getLogger(__name__)
 
 
+def _run_profiler(profiler_config: ProfilerConfig, output_dir: Path, write_output: bool,
+                  all_stats: list) -> ProfilerResults:
+    """Run the profiler in a worker process, it is CPU bound and would otherwise block the other runs' workflows"""
+    from aiq.profiler.profile_runner import ProfilerRunner
+
+    profiler_runner = ProfilerRunner(profiler_config, output_dir, write_output=write_output)
+    return asyncio.run(profiler_runner.run(all_stats))
+
+
 class EvaluationRun:  # pylint: disable=too-many-public-methods
     """
     Instantiated for each evaluation run and used to store data for that single run.
     """
 
-    def __init__(self, config: EvaluationRunConfig):
+    def __init__(self,
+                 config: EvaluationRunConfig,
+                 concurrency_limiter: asyncio.Semaphore | None = None,
+                 profiler_executor: Executor | None = None):
         """
         Initialize an EvaluationRun with configuration.
+
+        Args:
+            config (EvaluationRunConfig): The run configuration.
+            concurrency_limiter (asyncio.Semaphore | None): Limits the number of dataset items running at a time,
+                shared by the runs of a MultiEvaluationRunner to enforce a global concurrency budget.
+            profiler_executor (Executor | None): Executor, typically a process pool, the profiler is run in.
         """
         from aiq.eval.intermediate_step_adapter import IntermediateStepAdapter
 
@@ -76,6 +98,15 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         # evaluation output files
         self.evaluator_output_files: list[Path] = []
 
+        self.concurrency_limiter: asyncio.Semaphore | None = concurrency_limiter
+        self.profiler_executor: Executor | None = profiler_executor
+
+        # evaluator score cache, set up from the eval config
+        self.evaluator_cache: EvaluatorCache | None = None
+
+        # fingerprint of the workflow and dataset configuration, checkpoints of other configurations are not restored
+        self.checkpoint_fingerprint: str | None = None
+
     def _compute_usage_stats(self, item: EvalInputItem):
         """Compute usage stats for a single item using the intermediate steps"""
         # get the prompt and completion tokens from the intermediate steps
@@ -200,24 +231,55 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                 item.trajectory = self.intermediate_step_adapter.validate_intermediate_steps(intermediate_steps)
                 usage_stats_item = self._compute_usage_stats(item)
 
+                if checkpoint:
+                    checkpoint.write(item)
+
                 self.weave_eval.log_prediction(item, output)
                 await self.weave_eval.log_usage_stats(item, usage_stats_item)
 
         async def wrapped_run(item: EvalInputItem) -> None:
-            await run_one(item)
+            if self.concurrency_limiter:
+                async with self.concurrency_limiter:
+                    await run_one(item)
+            else:
+                await run_one(item)
             pbar.update(1)
 
+        eval_input_items = self.eval_input.eval_input_items
+
+        checkpoint = None
+        if self.config.checkpoint_file:
+            checkpoint = EvalCheckpoint(self.config.checkpoint_file, fingerprint=self.checkpoint_fingerprint)
+        if checkpoint:
+            restored_items = checkpoint.restore(self.eval_input)
+            if restored_items:
+                logger.info("Restored %d of %d items from checkpoint %s",
+                            len(restored_items),
+                            len(eval_input_items),
+                            self.config.checkpoint_file)
+            for item in restored_items:
+                usage_stats_item = self._compute_usage_stats(item)
+                self.weave_eval.log_prediction(item, item.output_obj)
+                await self.weave_eval.log_usage_stats(item, usage_stats_item)
+
+            restored_ids = {id(item) for item in restored_items}
+            eval_input_items = [item for item in eval_input_items if id(item) not in restored_ids]
+
         # if self.config.skip_complete is set skip eval_input_items with a non-empty output_obj
         if self.config.skip_completed_entries:
-            eval_input_items = [item for item in self.eval_input.eval_input_items if not item.output_obj]
-            if not eval_input_items:
-                logger.warning("All items have a non-empty output. Skipping workflow pass altogether.")
-                return
-        else:
-            eval_input_items = self.eval_input.eval_input_items
+            eval_input_items = [item for item in eval_input_items if not item.output_obj]
+
+        if not eval_input_items:
+            logger.warning("All items already have an output. Skipping workflow pass altogether.")
+            return
+
         pbar = tqdm(total=len(eval_input_items), desc="Running workflow")
-        await asyncio.gather(*[wrapped_run(item) for item in eval_input_items])
-        pbar.close()
+        try:
+            await asyncio.gather(*[wrapped_run(item) for item in eval_input_items])
+        finally:
+            pbar.close()
+            if checkpoint:
+                checkpoint.close()
 
     async def run_workflow_remote(self):
         from aiq.eval.remote_workflow import EvaluationRemoteWorkflowHandler
@@ -237,12 +299,20 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
             logger.info("Profiler is not enabled. Skipping profiling.")
             return ProfilerResults()
 
-        from aiq.profiler.profile_runner import ProfilerRunner
-
         all_stats = []
         for input_item in self.eval_input.eval_input_items:
             all_stats.append(input_item.trajectory)
 
+        if self.profiler_executor:
+            return await asyncio.get_running_loop().run_in_executor(self.profiler_executor,
+                                                                    _run_profiler,
+                                                                    self.eval_config.general.profiler,
+                                                                    self.eval_config.general.output_dir,
+                                                                    self.config.write_output,
+                                                                    all_stats)
+
+        from aiq.profiler.profile_runner import ProfilerRunner
+
         profiler_runner = ProfilerRunner(self.eval_config.general.profiler,
                                          self.eval_config.general.output_dir,
                                          write_output=self.config.write_output)
@@ -349,7 +419,10 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
     async def run_single_evaluator(self, evaluator_name: str, evaluator: Any):
         """Run a single evaluator and store its results."""
         try:
-            eval_output = await evaluator.evaluate_fn(self.eval_input)
+            if self.evaluator_cache:
+                eval_output = await self.evaluator_cache.evaluate(evaluator_name, evaluator, self.eval_input)
+            else:
+                eval_output = await evaluator.evaluate_fn(self.eval_input)
             self.evaluation_results.append((evaluator_name, eval_output))
 
             await self.weave_eval.alog_score(eval_output, evaluator_name)
@@ -380,10 +453,10 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         from aiq.runtime.loader import discover_and_register_plugins
         from aiq.utils.data_models.schema_validator import validate_schema
 
-        # Register plugins before validation
-        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
-
         config_dict = load_and_override_config(self.config.config_file, self.config.override)
+
+        # Register the plugins used by the config before validation
+        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT, config_dict)
         config = validate_schema(config_dict, AIQConfig)
         return config
 
@@ -414,9 +487,15 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         else:
             config = load_config(self.config.config_file)
         self.eval_config = config.eval
+        self.checkpoint_fingerprint = EvalCheckpoint.fingerprint_config(config)
         workflow_alias = self._get_workflow_alias(config.workflow.type)
         logger.debug("Loaded %s evaluation configuration: %s", workflow_alias, self.eval_config)
 
+        if self.config.output_subdir:
+            self.eval_config.general.output_dir = self.eval_config.general.output_dir / self.config.output_subdir
+            if self.eval_config.general.output:
+                self.eval_config.general.output.dir = self.eval_config.general.output_dir
+
         # Cleanup the output directory
         if self.eval_config.general.output:
             self.cleanup_output_directory()
@@ -474,6 +553,9 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                     await self.run_workflow_local(session_manager)
 
             # Evaluate
+            if self.eval_config.general.evaluator_cache:
+                self.evaluator_cache = EvaluatorCache(self.eval_config.general.evaluator_cache.dir,
+                                                      builder=eval_workflow)
             evaluators = {name: eval_workflow.get_evaluator(name) for name in self.eval_config.evaluators}
             await self.run_evaluators(evaluators)
 
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import typing
+from pathlib import Path
 
 from pydantic import BaseModel
 
@@ -25,10 +26,18 @@ class MultiEvaluationRunConfig(BaseModel):
     """
     Parameters used for a multi-evaluation run.
     This includes a dict of configs. The key is an id of any type.
-    Each pass loads the config, applies the overrides and runs to completion
-    before the next pass starts.
+    Each pass loads the config, applies the overrides and runs to completion.
+    Up to max_parallel_runs passes run at the same time.
     """
     configs: dict[typing.Any, EvaluationRunConfig]
+    # Number of passes that run at the same time. Passes that share an LLM backend affect each other's latencies, only
+    # raise this for runs whose timings are not compared, or that use separate backends. Passes running in parallel
+    # write their outputs to <output_dir>/<id>.
+    max_parallel_runs: int = 1
+    # Maximum number of dataset items in flight across all passes, in addition to each pass's own max_concurrency.
+    max_concurrency: int | None = None
+    # If set, each pass checkpoints its completed items to <checkpoint_dir>/<id>/checkpoint.jsonl and resumes from it
+    checkpoint_dir: Path | None = None
 
 
 class MultiEvaluationRunOutput(BaseModel):
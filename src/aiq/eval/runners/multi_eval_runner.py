@@ -13,14 +13,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import copy
+import logging
+import multiprocessing
 import typing
+from concurrent.futures import ProcessPoolExecutor
 
 from aiq.eval.config import EvaluationRunConfig
 from aiq.eval.config import EvaluationRunOutput
 from aiq.eval.evaluate import EvaluationRun
 from aiq.eval.runners.config import MultiEvaluationRunConfig
 
+logger = logging.getLogger(__name__)
+
 
 class MultiEvaluationRunner:
     """
@@ -34,13 +40,39 @@ class MultiEvaluationRunner:
         self.config = config
         self.evaluation_run_outputs: dict[typing.Any, EvaluationRunOutput] = {}
 
+        self._concurrency_limiter: asyncio.Semaphore | None = None
+        self._profiler_executor: ProcessPoolExecutor | None = None
+
     async def run_all(self):
         """
-        Run all evaluations defined by the overrides.
+        Run all evaluations defined by the overrides, up to `max_parallel_runs` of them at a time.
         """
-        for id, config in self.config.configs.items():
-            output = await self.run_single_evaluation(id, config)
-            self.evaluation_run_outputs[id] = output
+        if self.config.max_concurrency:
+            self._concurrency_limiter = asyncio.Semaphore(self.config.max_concurrency)
+
+        if self.config.max_parallel_runs > 1:
+            # Spawn rather than fork, the parent has a running event loop and threads
+            self._profiler_executor = ProcessPoolExecutor(max_workers=self.config.max_parallel_runs,
+                                                          mp_context=multiprocessing.get_context("spawn"))
+
+        run_limiter = asyncio.Semaphore(self.config.max_parallel_runs)
+        outputs: dict[typing.Any, EvaluationRunOutput] = {}
+
+        async def run_one(id: typing.Any, config: EvaluationRunConfig):
+            async with run_limiter:
+                logger.info("Starting evaluation run %s", id)
+                outputs[id] = await self.run_single_evaluation(id, config)
+
+        try:
+            await asyncio.gather(*[run_one(id, config) for id, config in self.config.configs.items()])
+        finally:
+            if self._profiler_executor:
+                self._profiler_executor.shutdown()
+                self._profiler_executor = None
+
+        # Keep the order of the configs regardless of the order in which the runs completed
+        for id in self.config.configs:
+            self.evaluation_run_outputs[id] = outputs[id]
 
         return self.evaluation_run_outputs
 
@@ -50,5 +82,13 @@ class MultiEvaluationRunner:
         """
         # copy the config in case the caller is using the same config for multiple evaluations
         config_copy = copy.deepcopy(config)
-        evaluation_run = EvaluationRun(config_copy)
+        if self.config.max_parallel_runs > 1 and not config_copy.output_subdir:
+            # Passes running at the same time would clean up and overwrite each other's output directory
+            config_copy.output_subdir = str(id)
+        if self.config.checkpoint_dir and not config_copy.checkpoint_file:
+            config_copy.checkpoint_file = self.config.checkpoint_dir / str(id) / "checkpoint.jsonl"
+
+        evaluation_run = EvaluationRun(config_copy,
+                                       concurrency_limiter=self._concurrency_limiter,
+                                       profiler_executor=self._profiler_executor)
         return await evaluation_run.run_and_evaluate()
@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+
+from aiq.data_models.config import AIQConfig
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.eval.evaluator.evaluator_model import EvalInput
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
+
+logger = logging.getLogger(__name__)
+
+_TRAJECTORY_ADAPTER = TypeAdapter(list[IntermediateStep])
+
+
+class EvalCheckpoint:
+    """
+    Append-only JSONL file of the workflow output and trajectory of every completed dataset item.
+
+    Each line is written and flushed as soon as its item completes, so an interrupted run loses at most the items that
+    were still running. When the run is started again with the same checkpoint file the completed items are restored
+    into the dataset and the workflow only runs the remaining ones.
+
+    The first line holds the fingerprint of the configuration which produced the outputs, see `fingerprint`. A
+    checkpoint written with another configuration is ignored and replaced.
+    """
+
+    def __init__(self, path: Path, fingerprint: str | None = None):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self._file = None
+        # Whether the existing file holds outputs of the current configuration, set by `restore`
+        self._resume = False
+
+    @staticmethod
+    def fingerprint_config(config: AIQConfig) -> str:
+        """
+        Fingerprint of the parts of a configuration which determine the workflow outputs: the workflow and its
+        components, and the dataset. Evaluators, output and general settings are left out, changing them keeps the
+        checkpoint.
+        """
+        workflow = config.model_dump(mode="json", exclude={"general", "eval"})
+        dataset = config.eval.general.dataset.model_dump(mode="json") if config.eval.general.dataset else None
+        data = json.dumps({"workflow": workflow, "dataset": dataset}, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def restore(self, eval_input: EvalInput) -> list[EvalInputItem]:
+        """
+        Restore the output and trajectory of the items found in the checkpoint file and return them. Lines which cannot
+        be parsed, e.g. one that was being written when the run was interrupted, are ignored.
+        """
+        if not self.path.exists():
+            return []
+
+        header = None
+        records = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    if "fingerprint" in record:
+                        header = record
+                    else:
+                        records[record["id"]] = record
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    logger.warning("Ignoring an incomplete line in checkpoint file %s", self.path)
+
+        checkpoint_fingerprint = header["fingerprint"] if header is not None else None
+        if self.fingerprint is not None and checkpoint_fingerprint != self.fingerprint:
+            logger.warning(
+                "Ignoring checkpoint file %s, it was written with a different workflow or dataset configuration. "
+                "It will be replaced by the checkpoint of this run.",
+                self.path)
+            return []
+
+        self._resume = True
+
+        restored = []
+        for item in eval_input.eval_input_items:
+            record = records.get(str(item.id))
+            if record is None:
+                continue
+            try:
+                item.trajectory = _TRAJECTORY_ADAPTER.validate_python(record["trajectory"])
+            except ValidationError as e:
+                logger.warning("Ignoring the checkpoint of item %s: %s", item.id, e)
+                continue
+            item.output_obj = record["output_obj"]
+            restored.append(item)
+
+        return restored
+
+    def write(self, item: EvalInputItem) -> None:
+        """
+        Append a completed item to the checkpoint file. The file is only appended to when `restore` found outputs of the
+        same configuration in it, otherwise it is started anew.
+        """
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            mode = "a" if self._resume else "w"
+            self._file = open(self.path, mode, encoding="utf-8")  # pylint: disable=consider-using-with
+            if not self._resume:
+                self._file.write(json.dumps({"fingerprint": self.fingerprint}) + "\n")
+
+        record = {
+            "id": str(item.id),
+            "output_obj": item.output_obj,
+            "trajectory": _TRAJECTORY_ADAPTER.dump_python(item.trajectory, mode="json"),
+        }
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,192 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import typing
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import packages_distributions
+from importlib.metadata import version
+from pathlib import Path
+
+from pydantic import BaseModel
+from pydantic import TypeAdapter
+
+from aiq.builder.builder import Builder
+from aiq.builder.evaluator import EvaluatorInfo
+from aiq.data_models.component_ref import LLMRef
+from aiq.data_models.evaluator import EvaluatorBaseConfig
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.eval.evaluator.evaluator_model import EvalInput
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
+from aiq.eval.evaluator.evaluator_model import EvalOutput
+from aiq.eval.evaluator.evaluator_model import EvalOutputItem
+
+logger = logging.getLogger(__name__)
+
+_TRAJECTORY_ADAPTER = TypeAdapter(list[IntermediateStep])
+
+
+class EvaluatorCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@functools.cache
+def _package_version(module: str) -> str:
+    """Version of the distribution providing ``module``, evaluators are invalidated when it is upgraded"""
+    for distribution in packages_distributions().get(module.split(".")[0], []):
+        try:
+            return version(distribution)
+        except PackageNotFoundError:
+            continue
+    return "unknown"
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class EvaluatorCache:
+    """
+    Content-addressed on-disk cache of evaluator scores.
+
+    An item's score is stored under the hash of the evaluator (its config type, the version of the package providing
+    it, its config and the config of the judge LLMs it references) and of the item's input, expected output, generated
+    output and trajectories. The evaluator's average score is stored under the hash of the evaluator and of the items
+    it was computed over. Re-scoring an unchanged dataset, e.g. with ``skip_completed_entries`` or after changing a
+    different evaluator, returns the cached scores and costs no evaluator calls.
+
+    When any item is new or changed the evaluator scores all items again, the average is the evaluator's own aggregate
+    and cannot be rebuilt from cached item scores.
+
+    Items the evaluator failed on, whose reasoning has an ``error`` key, are not cached.
+    """
+
+    def __init__(self, cache_dir: Path, builder: Builder | None = None):
+        self.cache_dir = Path(cache_dir)
+        self.stats: dict[str, EvaluatorCacheStats] = {}
+        # Resolves the LLMs referenced by the evaluators, a judge LLM whose config changed invalidates their scores
+        self._builder = builder
+
+    def _llm_configs(self, config: EvaluatorBaseConfig) -> dict[str, dict]:
+        if self._builder is None:
+            return {}
+
+        llm_names = {value for value in dict(config).values() if isinstance(value, LLMRef)}
+        # Some evaluators reference their judge LLM by a plain string
+        if isinstance(getattr(config, "llm_name", None), str):
+            llm_names.add(config.llm_name)
+
+        return {str(name): self._builder.get_llm_config(name).model_dump(mode="json") for name in llm_names}
+
+    def _evaluator_digest(self, config: EvaluatorBaseConfig) -> str:
+        config_type = type(config)
+        return _digest({
+            "type": f"{config_type.__module__}.{config_type.__qualname__}",
+            "version": _package_version(config_type.__module__),
+            "config": config.model_dump(mode="json"),
+            "llms": self._llm_configs(config),
+        })
+
+    @staticmethod
+    def _item_digest(item: EvalInputItem) -> str:
+        return _digest({
+            "input": item.input_obj,
+            "expected_output": item.expected_output_obj,
+            "output": item.output_obj,
+            "trajectory": _TRAJECTORY_ADAPTER.dump_python(item.trajectory, mode="json"),
+            "expected_trajectory": _TRAJECTORY_ADAPTER.dump_python(item.expected_trajectory, mode="json"),
+        })
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _write(self, key: str, data: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent runs never read a partially written entry
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False, encoding="utf-8") as f:
+            f.write(data)
+        os.replace(f.name, path)
+
+    def _load(self, keys: list[str], average_key: str) -> tuple[list[EvalOutputItem], typing.Any] | None:
+        """Load the cached output items and average score, or return None when any of them is missing."""
+        try:
+            average_score = json.loads(self._path(average_key).read_bytes())["average_score"]
+            return [EvalOutputItem.model_validate_json(self._path(key).read_bytes()) for key in keys], average_score
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store(self, keys: list[str], items: list[EvalInputItem], eval_output: EvalOutput, average_key: str) -> None:
+        key_by_id = {str(item.id): key for key, item in zip(keys, items)}
+        stored = set()
+        for output_item in eval_output.eval_output_items:
+            key = key_by_id.get(str(output_item.id))
+            if key is None or (isinstance(output_item.reasoning, dict) and "error" in output_item.reasoning):
+                continue
+            try:
+                self._write(key, output_item.model_dump_json())
+            except ValueError:
+                logger.debug("Output item %s is not JSON serializable, not caching it", output_item.id)
+                continue
+            stored.add(key)
+
+        # The average is only of use when every item it was computed over can be served from the cache
+        if stored != set(keys):
+            return
+        try:
+            self._write(average_key, json.dumps({"average_score": eval_output.average_score}))
+        except (TypeError, ValueError):
+            logger.debug("Average score %r is not JSON serializable, not caching it", eval_output.average_score)
+
+    async def evaluate(self, evaluator_name: str, evaluator: EvaluatorInfo, eval_input: EvalInput) -> EvalOutput:
+        """
+        Return the cached scores of ``eval_input`` when all of them are in the cache, otherwise evaluate it with the
+        evaluator and cache the scores.
+        """
+        items = eval_input.eval_input_items
+        evaluator_digest = self._evaluator_digest(evaluator.config)
+        keys = [_digest([evaluator_digest, self._item_digest(item)]) for item in items]
+        average_key = _digest([evaluator_digest, "average", sorted(keys)])
+        cached = await asyncio.to_thread(self._load, keys, average_key)
+
+        stats = self.stats.setdefault(evaluator_name, EvaluatorCacheStats())
+        if cached is not None:
+            output_items, average_score = cached
+            stats.hits += len(items)
+            logger.info("Evaluator cache for %s: all %d items cached", evaluator_name, len(items))
+            # Items with the same content share an entry, each one gets the id of its own dataset item
+            return EvalOutput(average_score=average_score,
+                              eval_output_items=[
+                                  output_item.model_copy(update={"id": item.id})
+                                  for item, output_item in zip(items, output_items)
+                              ])
+
+        stats.misses += len(items)
+        logger.info("Evaluator cache for %s: evaluating %d items", evaluator_name, len(items))
+        eval_output = await evaluator.evaluate_fn(eval_input)
+        await asyncio.to_thread(self._store, keys, items, eval_output, average_key)
+        return eval_output
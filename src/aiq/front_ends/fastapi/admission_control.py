@@ -0,0 +1,257 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import functools
+import logging
+import math
+import time
+import typing
+import weakref
+from collections.abc import Awaitable
+from collections.abc import Callable
+from dataclasses import asdict
+from dataclasses import dataclass
+
+from fastapi.exceptions import HTTPException
+from starlette.responses import StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+
+async def _release_when_done(body_iterator: typing.AsyncIterable, release: Callable[[], None]) -> typing.AsyncIterator:
+    """Stream ``body_iterator`` and release the admission slot once it is exhausted, fails or is closed."""
+    try:
+        async for chunk in body_iterator:
+            yield chunk
+    finally:
+        release()
+
+
+@dataclass
+class AdmissionStats:
+    in_flight: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    admitted: int = 0
+    rejected_queue_full: int = 0
+    rejected_timeout: int = 0
+    rejected_forecast: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+class AdmissionController:
+    """
+    Bounds the number of requests a route serves concurrently.
+
+    Requests over ``max_concurrency`` wait in a FIFO queue of at most ``max_queue_size`` entries for up to
+    ``queue_timeout`` seconds. Requests arriving to a full queue, or still waiting when the timeout expires, are
+    rejected with ``429 Too Many Requests`` and a ``Retry-After`` header.
+
+    Given ``service_time``, the predicted seconds a request holds its slot, a request is also rejected at once when its
+    predicted wait exceeds ``queue_timeout``, rather than after waiting for nothing, and ``Retry-After`` is the
+    predicted wait.
+    """
+
+    def __init__(self,
+                 route: str,
+                 max_concurrency: int,
+                 max_queue_size: int = 0,
+                 queue_timeout: float = 30.0,
+                 retry_after: int = 5,
+                 service_time: float | None = None):
+        self.route = route
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.service_time = service_time
+        self.stats = AdmissionStats()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def _predicted_wait(self) -> float | None:
+        """Predicted seconds until a request joining the queue now is admitted, None without a ``service_time``."""
+        if not self.service_time:
+            return None
+        # The queued requests and this one are admitted as the slots free up, one every service_time / slots seconds
+        return (self.stats.queue_depth + 1) * self.service_time / self.max_concurrency
+
+    def _reject(self, reason: str) -> HTTPException:
+        logger.warning("Rejecting request to %s: %s (in flight: %d, queued: %d)",
+                       self.route,
+                       reason,
+                       self.stats.in_flight,
+                       self.stats.queue_depth)
+        predicted_wait = self._predicted_wait()
+        retry_after = math.ceil(predicted_wait) if predicted_wait is not None else self.retry_after
+        return HTTPException(status_code=429, detail=reason, headers={"Retry-After": str(retry_after)})
+
+    async def acquire(self):
+        """Wait for a slot on the route, raises an ``HTTPException`` with status 429 when the request is rejected."""
+        # Only take the fast path when nobody is queued, so queued requests are served first
+        if self.stats.queue_depth == 0 and not self._semaphore.locked():
+            await self._semaphore.acquire()
+            self.stats.in_flight += 1
+            self.stats.admitted += 1
+            return
+
+        if self.stats.queue_depth >= self.max_queue_size:
+            self.stats.rejected_queue_full += 1
+            raise self._reject("Server is at capacity, please retry later")
+
+        predicted_wait = self._predicted_wait()
+        if predicted_wait is not None and predicted_wait > self.queue_timeout:
+            self.stats.rejected_forecast += 1
+            raise self._reject(f"Request is not expected to be admitted within {self.queue_timeout} seconds, "
+                               "please retry later")
+
+        self.stats.queue_depth += 1
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.stats.queue_depth)
+        start = time.monotonic()
+        try:
+            if not await self._acquire_within(self.queue_timeout):
+                self.stats.rejected_timeout += 1
+                raise self._reject(f"Request was not admitted within {self.queue_timeout} seconds, please retry later")
+        finally:
+            self.stats.queue_depth -= 1
+            waited = time.monotonic() - start
+            self.stats.total_wait_seconds += waited
+            self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, waited)
+
+        self.stats.in_flight += 1
+        self.stats.admitted += 1
+
+    async def _acquire_within(self, timeout: float) -> bool:
+        """
+        Acquire the semaphore within ``timeout`` seconds, returns False when it could not.
+
+        ``asyncio.wait_for`` can raise ``TimeoutError`` after the semaphore was acquired before Python 3.12, losing the
+        permit, so the acquisition runs in a task whose outcome is checked once it is cancelled.
+        """
+        acquire = asyncio.ensure_future(self._semaphore.acquire())
+        try:
+            await asyncio.wait({acquire}, timeout=timeout)
+            if not acquire.done():
+                acquire.cancel()
+                await asyncio.wait({acquire})
+        except BaseException:
+            # The request was cancelled while queued, give the permit back if the acquisition still succeeds
+            acquire.cancel()
+            acquire.add_done_callback(self._release_if_acquired)
+            raise
+
+        return not acquire.cancelled()
+
+    def _release_if_acquired(self, acquire: asyncio.Future):
+        if not acquire.cancelled() and acquire.exception() is None:
+            self._semaphore.release()
+
+    def release(self):
+        self.stats.in_flight -= 1
+        self._semaphore.release()
+
+    def _releaser(self) -> Callable[[], None]:
+        """A ``release`` which only releases the slot the first time it is called."""
+        released = False
+
+        def _release_once():
+            nonlocal released
+            if not released:
+                released = True
+                self.release()
+
+        return _release_once
+
+    def _admit_streaming_response(self, response: StreamingResponse) -> StreamingResponse:
+        release = self._releaser()
+        response.body_iterator = _release_when_done(response.body_iterator, release)
+        # A response which is never streamed, e.g. because the request was cancelled first or sending the headers failed,
+        # releases its slot when it is collected
+        weakref.finalize(response, release)
+        return response
+
+    def wrap(self, endpoint: Callable[..., Awaitable[typing.Any]]) -> Callable[..., Awaitable[typing.Any]]:
+        """
+        Wrap a route endpoint so it only runs once admitted. Streaming responses keep their slot until the response has
+        been sent, the stream exhausted or the client disconnected, not just until the endpoint returns.
+        """
+
+        # functools.wraps exposes the endpoint signature, FastAPI uses it to resolve the request parameters
+        @functools.wraps(endpoint)
+        async def _admitted_endpoint(*args, **kwargs):
+            await self.acquire()
+            try:
+                result = await endpoint(*args, **kwargs)
+            except BaseException:
+                self.release()
+                raise
+
+            if isinstance(result, StreamingResponse):
+                result = self._admit_streaming_response(result)
+            else:
+                self.release()
+            return result
+
+        return _admitted_endpoint
+
+    def metrics(self) -> dict[str, typing.Any]:
+        stats = asdict(self.stats)
+        waits = self.stats.admitted + self.stats.rejected_timeout
+        stats["mean_wait_seconds"] = self.stats.total_wait_seconds / waits if waits else 0.0
+        stats["max_concurrency"] = self.max_concurrency
+        stats["max_queue_size"] = self.max_queue_size
+        stats["service_time"] = self.service_time
+        return stats
+
+
+class AdmissionControlRegistry:
+    """Creates the admission controllers of the routes and gathers their metrics."""
+
+    def __init__(self,
+                 max_concurrency: int | None,
+                 route_max_concurrency: dict[str, int],
+                 max_queue_size: int,
+                 queue_timeout: float,
+                 retry_after: int,
+                 service_time: float | None = None):
+        self._max_concurrency = max_concurrency
+        self._route_max_concurrency = route_max_concurrency
+        self._max_queue_size = max_queue_size
+        self._queue_timeout = queue_timeout
+        self._retry_after = retry_after
+        self._service_time = service_time
+        self._controllers: dict[str, AdmissionController] = {}
+
+    def limit(self, route: str, endpoint: Callable[..., Awaitable[typing.Any]]) -> Callable[..., Awaitable[typing.Any]]:
+        """Wrap ``endpoint`` with the admission controller of ``route``, unchanged when the route is unlimited."""
+        max_concurrency = self._route_max_concurrency.get(route, self._max_concurrency)
+        if max_concurrency is None:
+            return endpoint
+
+        controller = self._controllers.get(route)
+        if controller is None:
+            controller = AdmissionController(route,
+                                             max_concurrency=max_concurrency,
+                                             max_queue_size=self._max_queue_size,
+                                             queue_timeout=self._queue_timeout,
+                                             retry_after=self._retry_after,
+                                             service_time=self._service_time)
+            self._controllers[route] = controller
+
+        return controller.wrap(endpoint)
+
+    def metrics(self) -> dict[str, dict[str, typing.Any]]:
+        return {route: controller.metrics() for route, controller in self._controllers.items()}
@@ -176,6 +176,50 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
             description="Sets a maximum time in seconds for browsers to cache CORS responses.",
         )
 
+    class JobStoreSettings(BaseModel):
+        backend: typing.Literal["auto", "memory", "sqlite"] = Field(
+            default="auto",
+            description=("Where async generation and evaluation jobs are tracked. 'memory' keeps them in the worker "
+                         "process, 'sqlite' stores them in a database shared by all workers and kept across restarts. "
+                         "'auto' uses 'sqlite' when running more than one worker and 'memory' otherwise."))
+        path: str = Field(default=".tmp/aiq/jobs.sqlite", description="Database file used by the 'sqlite' backend.")
+
+    class SharedStateSettings(BaseModel):
+        backend: typing.Literal["auto", "memory", "sqlite"] = Field(
+            default="auto",
+            description=("Where state that must be visible to every worker is kept: outstanding OAuth2 flows and the "
+                         "evaluation lock. 'auto' uses 'sqlite' when running more than one worker and 'memory' "
+                         "otherwise."))
+        path: str = Field(default=".tmp/aiq/shared_state.sqlite",
+                          description="Database file used by the 'sqlite' backend.")
+
+    class AdmissionControl(BaseModel):
+        max_concurrency: int | None = Field(
+            default=None,
+            ge=1,
+            description=("Maximum number of requests each generate and chat route serves at the same time, per worker. "
+                         "Unlimited when not set."))
+        route_max_concurrency: dict[str, int] = Field(
+            default_factory=dict,
+            description="Per route overrides of max_concurrency, keyed by the route path (e.g. '/generate/stream').")
+        max_queue_size: int = Field(default=32,
+                                    ge=0,
+                                    description="Maximum number of requests waiting for a slot on each route.")
+        queue_timeout: float = Field(default=30.0,
+                                     gt=0,
+                                     description="Seconds a request may wait for a slot before being rejected.")
+        retry_after: int = Field(default=5,
+                                 ge=0,
+                                 description="Value of the Retry-After header sent with 429 responses, in seconds.")
+        forecasting_model: str | None = Field(
+            default=None,
+            description=("Forecasting model saved by 'aiq profile --forecasting_model'. Its predicted LLM latency of a "
+                         "request is used as the time a request holds its slot: requests predicted to wait longer "
+                         "than queue_timeout are rejected at once, with the predicted wait as Retry-After."))
+        metrics_path: str | None = Field(
+            default="/metrics/admission",
+            description="Path serving the queue depth and wait time metrics of every route. None disables it.")
+
     root_path: str = Field(default="", description="The root path for the API")
     host: str = Field(default="localhost", description="Host to bind the server to")
     port: int = Field(default=8000, description="Port to bind the server to", ge=0, le=65535)
@@ -185,6 +229,13 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
                                         description="Maximum number of async jobs to run concurrently",
                                         ge=1)
     step_adaptor: StepAdaptorConfig = StepAdaptorConfig()
+    admission_control: AdmissionControl = Field(
+        default_factory=AdmissionControl,
+        description="Limits on concurrent generate and chat requests, excess requests are queued then rejected.")
+    job_store: JobStoreSettings = Field(default_factory=JobStoreSettings,
+                                        description="Storage for the async generation and evaluation jobs.")
+    shared_state: SharedStateSettings = Field(default_factory=SharedStateSettings,
+                                              description="Storage for the state shared between workers.")
 
     workflow: typing.Annotated[EndpointBase, Field(description="Endpoint for the default workflow.")] = EndpointBase(
         method="POST",
@@ -232,3 +283,9 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
             "Object store reference for the FastAPI app. If present, static files can be uploaded via a POST "
             "request to '/static' and files will be served from the object store. The files will be served from the "
             "object store at '/static/{file_name}'."))
+
+    def resolve_backend(self, backend: str) -> typing.Literal["memory", "sqlite"]:
+        """Resolve an 'auto' storage backend, state must be shared as soon as requests can hit different workers."""
+        if backend != "auto":
+            return backend
+        return "sqlite" if self.workers > 1 else "memory"
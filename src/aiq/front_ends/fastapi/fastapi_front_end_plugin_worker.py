@@ -49,6 +49,7 @@ from aiq.data_models.object_store import NoSuchKeyError
 from aiq.eval.config import EvaluationRunOutput
 from aiq.eval.evaluate import EvaluationRun
 from aiq.eval.evaluate import EvaluationRunConfig
+from aiq.front_ends.fastapi.admission_control import AdmissionControlRegistry
 from aiq.front_ends.fastapi.auth_flow_handlers.http_flow_handler import HTTPAuthenticationFlowHandler
 from aiq.front_ends.fastapi.auth_flow_handlers.websocket_flow_handler import FlowState
 from aiq.front_ends.fastapi.auth_flow_handlers.websocket_flow_handler import WebSocketAuthenticationFlowHandler
@@ -59,8 +60,12 @@ from aiq.front_ends.fastapi.fastapi_front_end_config import AIQEvaluateResponse
 from aiq.front_ends.fastapi.fastapi_front_end_config import AIQEvaluateStatusResponse
 from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
 from aiq.front_ends.fastapi.job_store import JobInfo
-from aiq.front_ends.fastapi.job_store import JobStore
+from aiq.front_ends.fastapi.job_store import JobStoreBase
+from aiq.front_ends.fastapi.job_store import create_job_store
 from aiq.front_ends.fastapi.message_handler import WebSocketMessageHandler
+from aiq.front_ends.fastapi.shared_state import InMemorySharedState
+from aiq.front_ends.fastapi.shared_state import SharedStateBase
+from aiq.front_ends.fastapi.shared_state import create_shared_state
 from aiq.front_ends.fastapi.response_helpers import generate_single_response
 from aiq.front_ends.fastapi.response_helpers import generate_streaming_response_as_str
 from aiq.front_ends.fastapi.response_helpers import generate_streaming_response_full_as_str
@@ -121,6 +126,8 @@ class FastApiFrontEndPluginWorkerBase(ABC):
 
                     self._cleanup_tasks.clear()
 
+                await self.shutdown(starting_app)
+
             logger.debug("Closing AIQ Toolkit server from process %s", os.getpid())
 
         aiq_app = FastAPI(lifespan=lifespan)
@@ -190,6 +197,10 @@ class FastApiFrontEndPluginWorkerBase(ABC):
     async def configure(self, app: FastAPI, builder: WorkflowBuilder):
         pass
 
+    async def shutdown(self, app: FastAPI):
+        """Release what `configure` acquired, called when the app shuts down after the cleanup tasks are cancelled."""
+        pass
+
     @abstractmethod
     def get_step_adaptor(self) -> StepAdaptor:
         pass
@@ -202,23 +213,85 @@ class RouteInfo(BaseModel):
 
 class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
+    # matches the time the websocket flow handler waits for the user to complete the flow
+    _OAUTH2_FLOW_TIMEOUT = 300
+
     def __init__(self, config: AIQConfig):
         super().__init__(config)
 
         self._outstanding_flows: dict[str, FlowState] = {}
         self._outstanding_flows_lock = asyncio.Lock()
+        # tasks waiting for OAuth2 redirects received by other workers, keyed by the flow state
+        self._remote_redirect_tasks: dict[str, asyncio.Task] = {}
+        self._job_stores: list[JobStoreBase] = []
+
+        # replaced in `configure`, which runs in every worker process after it was started
+        self._shared_state: SharedStateBase = InMemorySharedState()
+        self._admission_control = self._create_admission_control()
+
+    def _create_job_store(self, namespace: str) -> JobStoreBase:
+        settings = self.front_end_config.job_store
+        job_store = create_job_store(self.front_end_config.resolve_backend(settings.backend),
+                                     settings.path,
+                                     namespace=namespace)
+        self._job_stores.append(job_store)
+        return job_store
+
+    def _create_admission_control(self) -> AdmissionControlRegistry:
+        settings = self.front_end_config.admission_control
+
+        service_time = None
+        if settings.forecasting_model:
+            from aiq.profiler.forecasting.models.incremental_model import IncrementalForecastingModel
+
+            model = IncrementalForecastingModel.load(Path(settings.forecasting_model))
+            # Only the LLM calls are forecast, so the wait is underestimated and rejections stay on the safe side
+            service_time = model.predict_new_request()["remaining_llm_latency"]
+            logger.info("Admission control predicts %.2f seconds per request from %s",
+                        service_time,
+                        settings.forecasting_model)
+
+        return AdmissionControlRegistry(max_concurrency=settings.max_concurrency,
+                                        route_max_concurrency=settings.route_max_concurrency,
+                                        max_queue_size=settings.max_queue_size,
+                                        queue_timeout=settings.queue_timeout,
+                                        retry_after=settings.retry_after,
+                                        service_time=service_time)
+
+    def _create_shared_state(self) -> SharedStateBase:
+        settings = self.front_end_config.shared_state
+        return create_shared_state(self.front_end_config.resolve_backend(settings.backend), settings.path)
 
     @staticmethod
-    async def _periodic_cleanup(name: str, job_store: JobStore, sleep_time_sec: int = 300):
+    async def _periodic_cleanup(name: str, job_store: JobStoreBase, sleep_time_sec: int = 300):
         while True:
             try:
-                job_store.cleanup_expired_jobs()
+                await job_store.cleanup_expired_jobs()
                 logger.debug("Expired %s jobs cleaned up", name)
             except Exception as e:
                 logger.error("Error during %s job cleanup: %s", name, e)
             await asyncio.sleep(sleep_time_sec)
 
-    async def create_cleanup_task(self, app: FastAPI, name: str, job_store: JobStore, sleep_time_sec: int = 300):
+    @staticmethod
+    @asynccontextmanager
+    async def _job_heartbeat(job_store: JobStoreBase, job_id: str):
+        """Send the heartbeats of an active job while the context is open."""
+
+        async def _beat():
+            while True:
+                await asyncio.sleep(job_store.HEARTBEAT_INTERVAL)
+                try:
+                    await job_store.heartbeat(job_id)
+                except Exception as e:
+                    logger.error("Error sending the heartbeat of job %s: %s", job_id, e)
+
+        beat_task = asyncio.create_task(_beat())
+        try:
+            yield
+        finally:
+            beat_task.cancel()
+
+    async def create_cleanup_task(self, app: FastAPI, name: str, job_store: JobStoreBase, sleep_time_sec: int = 300):
         # Schedule periodic cleanup of expired jobs on first job creation
         attr_name = f"{name}_cleanup_task"
 
@@ -243,14 +316,37 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         # Do things like setting the base URL and global configuration options
         app.root_path = self.front_end_config.root_path
 
+        self._shared_state = self._create_shared_state()
+        if self._shared_state.is_shared:
+            logger.info("Sharing async jobs, OAuth2 flows and the evaluation lock with the other workers")
+
         await self.add_routes(app, builder)
 
+    async def shutdown(self, app: FastAPI):
+
+        # Stop waiting for OAuth2 redirects, the flows cannot complete anymore
+        redirect_tasks = list(self._remote_redirect_tasks.values())
+        self._remote_redirect_tasks.clear()
+        for task in redirect_tasks:
+            task.cancel()
+        await asyncio.gather(*redirect_tasks, return_exceptions=True)
+
+        for job_store in self._job_stores:
+            try:
+                await job_store.close()
+            except Exception as e:
+                logger.error("Error closing job store: %s", e)
+        self._job_stores.clear()
+
+        await self._shared_state.close()
+
     async def add_routes(self, app: FastAPI, builder: WorkflowBuilder):
 
         await self.add_default_route(app, AIQSessionManager(builder.build()))
         await self.add_evaluate_route(app, AIQSessionManager(builder.build()))
         await self.add_static_files_route(app, builder)
         await self.add_authorization_route(app)
+        await self.add_admission_metrics_route(app)
 
         for ep in self.front_end_config.endpoints:
 
@@ -262,6 +358,21 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
         await self.add_route(app, self.front_end_config.workflow, session_manager)
 
+    async def add_admission_metrics_route(self, app: FastAPI):
+        """Add the endpoint reporting the in flight requests, queue depth and wait times of the limited routes."""
+
+        metrics_path = self.front_end_config.admission_control.metrics_path
+        if not metrics_path:
+            return
+
+        async def get_admission_metrics() -> dict[str, dict[str, typing.Any]]:
+            return self._admission_control.metrics()
+
+        app.add_api_route(path=metrics_path,
+                          endpoint=get_admission_metrics,
+                          methods=["GET"],
+                          description="Admission control metrics of the generate and chat routes of this worker.")
+
     async def add_evaluate_route(self, app: FastAPI, session_manager: AIQSessionManager):
         """Add the evaluate endpoint to the FastAPI app."""
 
@@ -277,32 +388,31 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         }
 
         # Create job store for tracking evaluation jobs
-        job_store = JobStore()
-        # Don't run multiple evaluations at the same time
-        evaluation_lock = asyncio.Lock()
+        job_store = self._create_job_store(namespace="async_evaluation")
 
         async def run_evaluation(job_id: str, config_file: str, reps: int, session_manager: AIQSessionManager):
             """Background task to run the evaluation."""
-            async with evaluation_lock:
+            # Don't run multiple evaluations at the same time, on any of the workers
+            async with self._job_heartbeat(job_store, job_id), self._shared_state.lock("async_evaluation"):
                 try:
                     # Create EvaluationRunConfig using the CLI defaults
                     eval_config = EvaluationRunConfig(config_file=Path(config_file), dataset=None, reps=reps)
 
                     # Create a new EvaluationRun with the evaluation-specific config
-                    job_store.update_status(job_id, "running")
+                    await job_store.update_status(job_id, "running")
                     eval_runner = EvaluationRun(eval_config)
                     output: EvaluationRunOutput = await eval_runner.run_and_evaluate(session_manager=session_manager,
                                                                                      job_id=job_id)
                     if output.workflow_interrupted:
-                        job_store.update_status(job_id, "interrupted")
+                        await job_store.update_status(job_id, "interrupted")
                     else:
                         parent_dir = os.path.dirname(
                             output.workflow_output_file) if output.workflow_output_file else None
 
-                        job_store.update_status(job_id, "success", output_path=str(parent_dir))
+                        await job_store.update_status(job_id, "success", output_path=str(parent_dir))
                 except Exception as e:
                     logger.error("Error in evaluation job %s: %s", job_id, str(e))
-                    job_store.update_status(job_id, "failure", error=str(e))
+                    await job_store.update_status(job_id, "failure", error=str(e))
 
         async def start_evaluation(request: AIQEvaluateRequest,
                                    background_tasks: BackgroundTasks,
@@ -313,11 +423,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 # if job_id is present and already exists return the job info
                 if request.job_id:
-                    job = job_store.get_job(request.job_id)
+                    job = await job_store.get_job(request.job_id)
                     if job:
                         return AIQEvaluateResponse(job_id=job.job_id, status=job.status)
 
-                job_id = job_store.create_job(request.config_file, request.job_id, request.expiry_seconds)
+                job_id = await job_store.create_job(request.config_file, request.job_id, request.expiry_seconds)
                 await self.create_cleanup_task(app=app, name="async_evaluation", job_store=job_store)
                 background_tasks.add_task(run_evaluation, job_id, request.config_file, request.reps, session_manager)
 
@@ -340,7 +450,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_job(job_id)
+                job = await job_store.get_job(job_id)
                 if not job:
                     logger.warning("Job %s not found", job_id)
                     raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
@@ -353,7 +463,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_last_job()
+                job = await job_store.get_last_job()
                 if not job:
                     logger.warning("No jobs found when requesting last job status")
                     raise HTTPException(status_code=404, detail="No jobs found")
@@ -367,10 +477,10 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 if status is None:
                     logger.info("Getting all jobs")
-                    jobs = job_store.get_all_jobs()
+                    jobs = await job_store.get_all_jobs()
                 else:
                     logger.info("Getting jobs with status %s", status)
-                    jobs = job_store.get_jobs_by_status(status)
+                    jobs = await job_store.get_jobs_by_status(status)
                 logger.info("Found %d jobs", len(jobs))
                 return [translate_job_to_response(job) for job in jobs]
 
@@ -538,9 +648,9 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 le=300,
                 description="Attempt to perform the job synchronously up until `sync_timeout` sectonds, "
                 "if the job hasn't been completed by then a job_id will be returned with a status code of 202.")
-            expiry_seconds: int = Field(default=JobStore.DEFAULT_EXPIRY,
-                                        ge=JobStore.MIN_EXPIRY,
-                                        le=JobStore.MAX_EXPIRY,
+            expiry_seconds: int = Field(default=JobStoreBase.DEFAULT_EXPIRY,
+                                        ge=JobStoreBase.MIN_EXPIRY,
+                                        le=JobStoreBase.MAX_EXPIRY,
                                         description="Optional time (in seconds) before the job expires. "
                                         "Clamped between 600 (10 min) and 86400 (24h).")
 
@@ -563,7 +673,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         }
 
         # Create job store for tracking async generation jobs
-        job_store = JobStore()
+        job_store = self._create_job_store(namespace=f"async_generation:{endpoint.path}")
 
         # Run up to max_running_async_jobs jobs at the same time
         async_job_concurrency = asyncio.Semaphore(self._front_end_config.max_running_async_jobs)
@@ -734,15 +844,15 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                                  session_manager: AIQSessionManager,
                                  result_type: type):
             """Background task to run the evaluation."""
-            async with async_job_concurrency:
+            async with self._job_heartbeat(job_store, job_id), async_job_concurrency:
                 try:
                     result = await generate_single_response(payload=payload,
                                                             session_manager=session_manager,
                                                             result_type=result_type)
-                    job_store.update_status(job_id, "success", output=result)
+                    await job_store.update_status(job_id, "success", output=result)
                 except Exception as e:
                     logger.error("Error in evaluation job %s: %s", job_id, e)
-                    job_store.update_status(job_id, "failure", error=str(e))
+                    await job_store.update_status(job_id, "failure", error=str(e))
 
         def _job_status_to_response(job: JobInfo) -> AIQAsyncGenerationStatusResponse:
             job_output = job.output
@@ -767,11 +877,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                     # if job_id is present and already exists return the job info
                     if request.job_id:
-                        job = job_store.get_job(request.job_id)
+                        job = await job_store.get_job(request.job_id)
                         if job:
                             return AIQAsyncGenerateResponse(job_id=job.job_id, status=job.status)
 
-                    job_id = job_store.create_job(job_id=request.job_id, expiry_seconds=request.expiry_seconds)
+                    job_id = await job_store.create_job(job_id=request.job_id, expiry_seconds=request.expiry_seconds)
                     await self.create_cleanup_task(app=app, name="async_generation", job_store=job_store)
 
                     # The fastapi/starlette background tasks won't begin executing until after the response is sent
@@ -791,7 +901,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     now = time.time()
                     sync_timeout = now + request.sync_timeout
                     while time.time() < sync_timeout:
-                        job = job_store.get_job(job_id)
+                        job = await job_store.get_job(job_id)
                         if job is not None and job.status not in job_store.ACTIVE_STATUS:
                             # If the job is done, return the result
                             response.status_code = 200
@@ -811,7 +921,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_job(job_id)
+                job = await job_store.get_job(job_id)
                 if not job:
                     logger.warning("Job %s not found", job_id)
                     raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
@@ -873,7 +983,8 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 app.add_api_route(
                     path=endpoint.path,
-                    endpoint=get_single_endpoint(result_type=GenerateSingleResponseType),
+                    endpoint=self._admission_control.limit(endpoint.path,
+                                                           get_single_endpoint(result_type=GenerateSingleResponseType)),
                     methods=[endpoint.method],
                     response_model=GenerateSingleResponseType,
                     description=endpoint.description,
@@ -882,9 +993,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 app.add_api_route(
                     path=f"{endpoint.path}/stream",
-                    endpoint=get_streaming_endpoint(streaming=True,
-                                                    result_type=GenerateStreamResponseType,
-                                                    output_type=GenerateStreamResponseType),
+                    endpoint=self._admission_control.limit(
+                        f"{endpoint.path}/stream",
+                        get_streaming_endpoint(streaming=True,
+                                               result_type=GenerateStreamResponseType,
+                                               output_type=GenerateStreamResponseType)),
                     methods=[endpoint.method],
                     response_model=GenerateStreamResponseType,
                     description=endpoint.description,
@@ -893,9 +1006,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 app.add_api_route(
                     path=f"{endpoint.path}/full",
-                    endpoint=get_streaming_raw_endpoint(streaming=True,
-                                                        result_type=GenerateStreamResponseType,
-                                                        output_type=GenerateStreamResponseType),
+                    endpoint=self._admission_control.limit(
+                        f"{endpoint.path}/full",
+                        get_streaming_raw_endpoint(streaming=True,
+                                                   result_type=GenerateStreamResponseType,
+                                                   output_type=GenerateStreamResponseType)),
                     methods=[endpoint.method],
                     description="Stream raw intermediate steps without any step adaptor translations.\n"
                     "Use filter_steps query parameter to filter steps by type (comma-separated list) or\
@@ -906,8 +1021,9 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 app.add_api_route(
                     path=endpoint.path,
-                    endpoint=post_single_endpoint(request_type=GenerateBodyType,
-                                                  result_type=GenerateSingleResponseType),
+                    endpoint=self._admission_control.limit(
+                        endpoint.path,
+                        post_single_endpoint(request_type=GenerateBodyType, result_type=GenerateSingleResponseType)),
                     methods=[endpoint.method],
                     response_model=GenerateSingleResponseType,
                     description=endpoint.description,
@@ -916,10 +1032,12 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 app.add_api_route(
                     path=f"{endpoint.path}/stream",
-                    endpoint=post_streaming_endpoint(request_type=GenerateBodyType,
-                                                     streaming=True,
-                                                     result_type=GenerateStreamResponseType,
-                                                     output_type=GenerateStreamResponseType),
+                    endpoint=self._admission_control.limit(
+                        f"{endpoint.path}/stream",
+                        post_streaming_endpoint(request_type=GenerateBodyType,
+                                                streaming=True,
+                                                result_type=GenerateStreamResponseType,
+                                                output_type=GenerateStreamResponseType)),
                     methods=[endpoint.method],
                     response_model=GenerateStreamResponseType,
                     description=endpoint.description,
@@ -928,10 +1046,12 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 app.add_api_route(
                     path=f"{endpoint.path}/full",
-                    endpoint=post_streaming_raw_endpoint(request_type=GenerateBodyType,
-                                                         streaming=True,
-                                                         result_type=GenerateStreamResponseType,
-                                                         output_type=GenerateStreamResponseType),
+                    endpoint=self._admission_control.limit(
+                        f"{endpoint.path}/full",
+                        post_streaming_raw_endpoint(request_type=GenerateBodyType,
+                                                    streaming=True,
+                                                    result_type=GenerateStreamResponseType,
+                                                    output_type=GenerateStreamResponseType)),
                     methods=[endpoint.method],
                     response_model=GenerateStreamResponseType,
                     description="Stream raw intermediate steps without any step adaptor translations.\n"
@@ -970,7 +1090,8 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 app.add_api_route(
                     path=endpoint.openai_api_path,
-                    endpoint=get_single_endpoint(result_type=AIQChatResponse),
+                    endpoint=self._admission_control.limit(endpoint.openai_api_path,
+                                                           get_single_endpoint(result_type=AIQChatResponse)),
                     methods=[endpoint.method],
                     response_model=AIQChatResponse,
                     description=endpoint.description,
@@ -979,9 +1100,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 app.add_api_route(
                     path=f"{endpoint.openai_api_path}/stream",
-                    endpoint=get_streaming_endpoint(streaming=True,
-                                                    result_type=AIQChatResponseChunk,
-                                                    output_type=AIQChatResponseChunk),
+                    endpoint=self._admission_control.limit(
+                        f"{endpoint.openai_api_path}/stream",
+                        get_streaming_endpoint(streaming=True,
+                                               result_type=AIQChatResponseChunk,
+                                               output_type=AIQChatResponseChunk)),
                     methods=[endpoint.method],
                     response_model=AIQChatResponseChunk,
                     description=endpoint.description,
@@ -998,7 +1121,9 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     # <openai_api_path> = non-streaming (legacy behavior)
                     app.add_api_route(
                         path=endpoint.openai_api_path,
-                        endpoint=post_single_endpoint(request_type=AIQChatRequest, result_type=AIQChatResponse),
+                        endpoint=self._admission_control.limit(
+                            endpoint.openai_api_path,
+                            post_single_endpoint(request_type=AIQChatRequest, result_type=AIQChatResponse)),
                         methods=[endpoint.method],
                         response_model=AIQChatResponse,
                         description=endpoint.description,
@@ -1008,10 +1133,12 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     # <openai_api_path>/stream = streaming (legacy behavior)
                     app.add_api_route(
                         path=f"{endpoint.openai_api_path}/stream",
-                        endpoint=post_streaming_endpoint(request_type=AIQChatRequest,
-                                                         streaming=True,
-                                                         result_type=AIQChatResponseChunk,
-                                                         output_type=AIQChatResponseChunk),
+                        endpoint=self._admission_control.limit(
+                            f"{endpoint.openai_api_path}/stream",
+                            post_streaming_endpoint(request_type=AIQChatRequest,
+                                                    streaming=True,
+                                                    result_type=AIQChatResponseChunk,
+                                                    output_type=AIQChatResponseChunk)),
                         methods=[endpoint.method],
                         response_model=AIQChatResponseChunk | AIQResponseIntermediateStep,
                         description=endpoint.description,
@@ -1023,7 +1150,8 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     # OpenAI v1 Compatible Mode: Create single endpoint that handles both streaming and non-streaming
                     app.add_api_route(
                         path=openai_v1_path,
-                        endpoint=post_openai_api_compatible_endpoint(request_type=AIQChatRequest),
+                        endpoint=self._admission_control.limit(
+                            openai_v1_path, post_openai_api_compatible_endpoint(request_type=AIQChatRequest)),
                         methods=[endpoint.method],
                         response_model=AIQChatResponse | AIQChatResponseChunk,
                         description=f"{endpoint.description} (OpenAI Chat Completions API compatible)",
@@ -1051,23 +1179,17 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
             state = request.query_params.get("state")
 
             async with self._outstanding_flows_lock:
-                if not state or state not in self._outstanding_flows:
-                    return "Invalid state. Please restart the authentication process."
-
-                flow_state = self._outstanding_flows[state]
-
-            config = flow_state.config
-            verifier = flow_state.verifier
-            client = flow_state.client
-
-            try:
-                res = await client.fetch_token(url=config.token_url,
-                                               authorization_response=str(request.url),
-                                               code_verifier=verifier,
-                                               state=state)
-                flow_state.future.set_result(res)
-            except Exception as e:
-                flow_state.future.set_exception(e)
+                flow_state = self._outstanding_flows.get(state) if state else None
+
+            if flow_state is not None:
+                await self._complete_flow(state, flow_state, str(request.url))
+            elif state and await self._shared_state.get("oauth2_flows", state) is not None:
+                # the flow was started on another worker, hand it the redirect, it owns the client and the verifier
+                await self._shared_state.set("oauth2_redirects",
+                                             state, {"authorization_response": str(request.url)},
+                                             ttl_seconds=self._OAUTH2_FLOW_TIMEOUT)
+            else:
+                return "Invalid state. Please restart the authentication process."
 
             return HTMLResponse(content=AUTH_REDIRECT_SUCCESS_HTML,
                                 status_code=200,
@@ -1083,10 +1205,42 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 methods=["GET"],
                 description="Handles the authorization code and state returned from the Authorization Code Grant Flow.")
 
+    @staticmethod
+    async def _complete_flow(state: str, flow_state: FlowState, authorization_response: str):
+        try:
+            res = await flow_state.client.fetch_token(url=flow_state.config.token_url,
+                                                      authorization_response=authorization_response,
+                                                      code_verifier=flow_state.verifier,
+                                                      state=state)
+            flow_state.future.set_result(res)
+        except Exception as e:
+            flow_state.future.set_exception(e)
+
+    async def _wait_for_remote_redirect(self, state: str, flow_state: FlowState, poll_interval: float = 0.5):
+        while not flow_state.future.done():
+            redirect = await self._shared_state.get("oauth2_redirects", state)
+            if redirect is not None:
+                await self._complete_flow(state, flow_state, redirect["authorization_response"])
+                return
+            await asyncio.sleep(poll_interval)
+
     async def _add_flow(self, state: str, flow_state: FlowState):
         async with self._outstanding_flows_lock:
             self._outstanding_flows[state] = flow_state
 
+        if self._shared_state.is_shared:
+            # the OAuth2 provider may redirect the user to any of the workers
+            await self._shared_state.set("oauth2_flows",
+                                         state, {"pid": os.getpid()},
+                                         ttl_seconds=self._OAUTH2_FLOW_TIMEOUT)
+            self._remote_redirect_tasks[state] = asyncio.create_task(self._wait_for_remote_redirect(state, flow_state))
+
     async def _remove_flow(self, state: str):
         async with self._outstanding_flows_lock:
             del self._outstanding_flows[state]
+
+        task = self._remote_redirect_tasks.pop(state, None)
+        if task is not None:
+            task.cancel()
+            await self._shared_state.delete("oauth2_flows", state)
+            await self._shared_state.delete("oauth2_redirects", state)
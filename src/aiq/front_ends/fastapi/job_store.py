@@ -13,17 +13,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import heapq
+import json
 import logging
 import os
 import shutil
+import sqlite3
 import threading
+import typing
+from abc import ABC
+from abc import abstractmethod
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
 from enum import Enum
+from pathlib import Path
 from uuid import uuid4
 
 from pydantic import BaseModel
+from pydantic import RootModel
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +59,16 @@ class JobInfo(BaseModel):
     output: BaseModel | None = None
 
 
-class JobStore:
+class JobStoreBase(ABC):
+    """
+    Interface for the stores tracking async generation and evaluation jobs.
+
+    Implementations must keep ``get_job``, ``get_last_job`` and status updates independent of the number of stored jobs,
+    the status endpoints call them on every poll.
+
+    While a job is active the worker running it calls ``heartbeat`` every ``HEARTBEAT_INTERVAL`` seconds, stores shared
+    by several processes use it to interrupt the jobs of a worker which died.
+    """
 
     MIN_EXPIRY = 600  # 10 minutes
     MAX_EXPIRY = 86400  # 24 hours
@@ -59,14 +77,9 @@ class JobStore:
     # active jobs are exempt from expiry
     ACTIVE_STATUS = {"running", "submitted"}
 
-    def __init__(self):
-        self._jobs = {}
-        self._lock = threading.Lock()  # Ensure thread safety for job operations
+    HEARTBEAT_INTERVAL = 60
 
-    def create_job(self,
-                   config_file: str | None = None,
-                   job_id: str | None = None,
-                   expiry_seconds: int = DEFAULT_EXPIRY) -> str:
+    def _new_job(self, config_file: str | None, job_id: str | None, expiry_seconds: int) -> JobInfo:
         if job_id is None:
             job_id = str(uuid4())
 
@@ -74,110 +87,427 @@ class JobStore:
         if expiry_seconds != clamped_expiry:
             logger.info("Clamped expiry_seconds from %d to %d for job %s", expiry_seconds, clamped_expiry, job_id)
 
-        job = JobInfo(job_id=job_id,
-                      status=JobStatus.SUBMITTED,
-                      config_file=config_file,
-                      created_at=datetime.now(UTC),
-                      updated_at=datetime.now(UTC),
-                      error=None,
-                      output_path=None,
-                      expiry_seconds=clamped_expiry)
+        now = datetime.now(UTC)
+        return JobInfo(job_id=job_id,
+                       status=JobStatus.SUBMITTED,
+                       config_file=config_file,
+                       created_at=now,
+                       updated_at=now,
+                       error=None,
+                       output_path=None,
+                       expiry_seconds=clamped_expiry)
+
+    @abstractmethod
+    async def create_job(self,
+                         config_file: str | None = None,
+                         job_id: str | None = None,
+                         expiry_seconds: int = DEFAULT_EXPIRY) -> str:
+        pass
+
+    @abstractmethod
+    async def update_status(self,
+                            job_id: str,
+                            status: str,
+                            error: str | None = None,
+                            output_path: str | None = None,
+                            output: BaseModel | None = None):
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> JobInfo | None:
+        """Get a job by its ID."""
+        pass
 
-        with self._lock:
-            self._jobs[job_id] = job
-
-        logger.info("Created new job %s with config %s", job_id, config_file)
-        return job_id
-
-    def update_status(self,
-                      job_id: str,
-                      status: str,
-                      error: str | None = None,
-                      output_path: str | None = None,
-                      output: BaseModel | None = None):
-        if job_id not in self._jobs:
-            raise ValueError(f"Job {job_id} not found")
+    @abstractmethod
+    async def get_last_job(self) -> JobInfo | None:
+        """Get the last created job."""
+        pass
+
+    @abstractmethod
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
+        """Get all jobs with the specified status."""
+        pass
+
+    @abstractmethod
+    async def get_all_jobs(self) -> list[JobInfo]:
+        """Get all jobs in the store."""
+        pass
+
+    @abstractmethod
+    async def cleanup_expired_jobs(self):
+        """
+        Cleanup expired jobs, keeping the most recent one.
+        Updated_at is used instead of created_at to determine the most recent job.
+        This is because jobs may not be processed in the order they are created.
+        """
+        pass
+
+    async def heartbeat(self, job_id: str):
+        """Record that the worker running an active job is still alive."""
+        pass
+
+    async def close(self):
+        pass
+
+    async def get_status(self, job_id: str) -> JobInfo | None:
+        return await self.get_job(job_id)
 
+    async def list_jobs(self) -> dict[str, JobInfo]:
+        return {job.job_id: job for job in await self.get_all_jobs()}
+
+    def get_expires_at(self, job: JobInfo) -> datetime | None:
+        """Get the time for a job to expire."""
+        if job.status in self.ACTIVE_STATUS:
+            return None
+        return job.updated_at + timedelta(seconds=job.expiry_seconds)
+
+    @staticmethod
+    def _remove_output(job: JobInfo):
+        if not job.output_path:
+            return
+
+        logger.info("Cleaning up output directory for job %s at %s", job.job_id, job.output_path)
+        # If it is a file remove it
+        if os.path.isfile(job.output_path):
+            os.remove(job.output_path)
+        # If it is a directory remove it
+        elif os.path.isdir(job.output_path):
+            shutil.rmtree(job.output_path)
+
+
+class InMemoryJobStore(JobStoreBase):
+    """
+    Job store local to the process.
+
+    Jobs are kept in creation order with a per-status index, and finished jobs are pushed onto a heap ordered by
+    expiry time, so lookups are O(1) and cleanup only touches the jobs that actually expired.
+    """
+
+    def __init__(self):
+        self._jobs: dict[str, JobInfo] = {}  # insertion ordered, the last entry is the last created job
+        self._by_status: dict[str, dict[str, None]] = {}
+        # finished jobs ordered by the time they finished, the last entry is exempt from cleanup
+        self._finished: dict[str, None] = {}
+        self._expiry_heap: list[tuple[datetime, str]] = []
+        self._lock = threading.Lock()  # Ensure thread safety for job operations
+
+    def _index(self, job: JobInfo):
+        self._by_status.setdefault(job.status, {})[job.job_id] = None
+        if job.status not in self.ACTIVE_STATUS:
+            self._finished.pop(job.job_id, None)
+            self._finished[job.job_id] = None
+            heapq.heappush(self._expiry_heap, (self.get_expires_at(job), job.job_id))
+
+    def _unindex(self, job: JobInfo):
+        self._by_status.get(job.status, {}).pop(job.job_id, None)
+        self._finished.pop(job.job_id, None)
+        # stale heap entries are skipped when they are popped
+
+    async def create_job(self,
+                         config_file: str | None = None,
+                         job_id: str | None = None,
+                         expiry_seconds: int = JobStoreBase.DEFAULT_EXPIRY) -> str:
+        job = self._new_job(config_file, job_id, expiry_seconds)
+
+        with self._lock:
+            previous = self._jobs.pop(job.job_id, None)
+            if previous is not None:
+                self._unindex(previous)
+            self._jobs[job.job_id] = job
+            self._index(job)
+
+        logger.info("Created new job %s with config %s", job.job_id, config_file)
+        return job.job_id
+
+    async def update_status(self,
+                            job_id: str,
+                            status: str,
+                            error: str | None = None,
+                            output_path: str | None = None,
+                            output: BaseModel | None = None):
         with self._lock:
-            job = self._jobs[job_id]
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise ValueError(f"Job {job_id} not found")
+
+            self._unindex(job)
             job.status = status
             job.error = error
             job.output_path = output_path
             job.updated_at = datetime.now(UTC)
             job.output = output
+            self._index(job)
 
-    def get_status(self, job_id: str) -> JobInfo | None:
-        with self._lock:
-            return self._jobs.get(job_id)
-
-    def list_jobs(self):
-        with self._lock:
-            return self._jobs
-
-    def get_job(self, job_id: str) -> JobInfo | None:
-        """Get a job by its ID."""
+    async def get_job(self, job_id: str) -> JobInfo | None:
         with self._lock:
             return self._jobs.get(job_id)
 
-    def get_last_job(self) -> JobInfo | None:
-        """Get the last created job."""
+    async def get_last_job(self) -> JobInfo | None:
         with self._lock:
             if not self._jobs:
                 logger.info("No jobs found in job store")
                 return None
-            last_job = max(self._jobs.values(), key=lambda job: job.created_at)
-            logger.info("Retrieved last job %s created at %s", last_job.job_id, last_job.created_at)
-            return last_job
+            last_job = self._jobs[next(reversed(self._jobs))]
+        logger.info("Retrieved last job %s created at %s", last_job.job_id, last_job.created_at)
+        return last_job
 
-    def get_jobs_by_status(self, status: str) -> list[JobInfo]:
-        """Get all jobs with the specified status."""
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
         with self._lock:
-            return [job for job in self._jobs.values() if job.status == status]
+            return [self._jobs[job_id] for job_id in self._by_status.get(status, {})]
 
-    def get_all_jobs(self) -> list[JobInfo]:
-        """Get all jobs in the store."""
+    async def get_all_jobs(self) -> list[JobInfo]:
         with self._lock:
             return list(self._jobs.values())
 
-    def get_expires_at(self, job: JobInfo) -> datetime | None:
-        """Get the time for a job to expire."""
-        if job.status in self.ACTIVE_STATUS:
-            return None
-        return job.updated_at + timedelta(seconds=job.expiry_seconds)
-
-    def cleanup_expired_jobs(self):
-        """
-        Cleanup expired jobs, keeping the most recent one.
-        Updated_at is used instead of created_at to determine the most recent job.
-        This is because jobs may not be processed in the order they are created.
-        """
+    async def cleanup_expired_jobs(self):
         now = datetime.now(UTC)
+        expired: list[JobInfo] = []
+        kept: list[tuple[datetime, str]] = []
 
-        # Filter out active jobs
         with self._lock:
-            finished_jobs = {job_id: job for job_id, job in self._jobs.items() if job.status not in self.ACTIVE_STATUS}
-
-        # Sort finished jobs by updated_at descending
-        sorted_finished = sorted(finished_jobs.items(), key=lambda item: item[1].updated_at, reverse=True)
-
-        # Always keep the most recent finished job
-        jobs_to_check = sorted_finished[1:]
-
-        expired_ids = []
-        for job_id, job in jobs_to_check:
-            expires_at = self.get_expires_at(job)
-            if expires_at and now > expires_at:
-                expired_ids.append(job_id)
-                # cleanup output dir if present
-                if job.output_path:
-                    logger.info("Cleaning up output directory for job %s at %s", job_id, job.output_path)
-                    # If it is a file remove it
-                    if os.path.isfile(job.output_path):
-                        os.remove(job.output_path)
-                    # If it is a directory remove it
-                    elif os.path.isdir(job.output_path):
-                        shutil.rmtree(job.output_path)
+            most_recent = next(reversed(self._finished), None)
+            while self._expiry_heap and self._expiry_heap[0][0] < now:
+                entry = heapq.heappop(self._expiry_heap)
+                expires_at, job_id = entry
+                job = self._jobs.get(job_id)
+                # the job was removed, restarted or updated after this entry was pushed
+                if job is None or job_id not in self._finished or self.get_expires_at(job) != expires_at:
+                    continue
+                # Always keep the most recent finished job
+                if job_id == most_recent:
+                    kept.append(entry)
+                    continue
 
-        with self._lock:
-            for job_id in expired_ids:
                 del self._jobs[job_id]
+                self._unindex(job)
+                expired.append(job)
+
+            for entry in kept:
+                heapq.heappush(self._expiry_heap, entry)
+
+        # cleanup output dirs outside of the lock
+        for job in expired:
+            self._remove_output(job)
+
+
+# Job outputs are stored as JSON, they are handed back wrapped in a root model so ``output.model_dump()`` still works
+_StoredOutput = RootModel[typing.Any]
+
+
+class SQLiteJobStore(JobStoreBase):
+    """
+    Job store backed by a SQLite database, shared by every process (e.g. uvicorn or gunicorn workers) opening the same
+    file and persisted across restarts.
+
+    Several stores can share one database, each one uses its own ``namespace``. Lookups by ID, status and creation time
+    and the expiry sweep are all served by indexes. The database is accessed from a worker thread, waiting on a write
+    lock held by another process never blocks the event loop.
+
+    Active jobs without a heartbeat for ``stale_after_seconds`` belong to a worker which died, the expiry sweep marks
+    them as interrupted so they expire like any other finished job.
+    """
+
+    def __init__(self,
+                 path: str | Path,
+                 namespace: str = "default",
+                 stale_after_seconds: float = 5 * JobStoreBase.HEARTBEAT_INTERVAL):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._namespace = namespace
+        self._stale_after_seconds = stale_after_seconds
+        self._lock = threading.Lock()
+
+        # autocommit mode, every statement is its own transaction unless wrapped in BEGIN/COMMIT
+        self._conn = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None, timeout=30.0)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    namespace TEXT NOT NULL,
+                    job_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    config_file TEXT,
+                    error TEXT,
+                    output_path TEXT,
+                    output TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    heartbeat_at REAL NOT NULL,
+                    expiry_seconds INTEGER NOT NULL,
+                    expires_at REAL,
+                    PRIMARY KEY (namespace, job_id)
+                );
+                CREATE INDEX IF NOT EXISTS jobs_status ON jobs (namespace, status);
+                CREATE INDEX IF NOT EXISTS jobs_created_at ON jobs (namespace, created_at);
+                CREATE INDEX IF NOT EXISTS jobs_expires_at ON jobs (namespace, expires_at)
+                    WHERE expires_at IS NOT NULL;
+                CREATE INDEX IF NOT EXISTS jobs_finished_updated_at ON jobs (namespace, updated_at)
+                    WHERE expires_at IS NOT NULL;
+                CREATE INDEX IF NOT EXISTS jobs_active_heartbeat_at ON jobs (namespace, heartbeat_at)
+                    WHERE expires_at IS NULL;
+                """)
+
+    def _close(self):
+        with self._lock:
+            self._conn.close()
+
+    async def close(self):
+        await asyncio.to_thread(self._close)
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> JobInfo:
+        output = _StoredOutput(json.loads(row["output"])) if row["output"] is not None else None
+        return JobInfo(job_id=row["job_id"],
+                       status=row["status"],
+                       config_file=row["config_file"],
+                       error=row["error"],
+                       output_path=row["output_path"],
+                       output=output,
+                       created_at=datetime.fromtimestamp(row["created_at"], UTC),
+                       updated_at=datetime.fromtimestamp(row["updated_at"], UTC),
+                       expiry_seconds=row["expiry_seconds"])
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        with self._lock:
+            return self._conn.execute(sql, params).rowcount
+
+    def _fetch(self, sql: str, *params) -> list[JobInfo]:
+        with self._lock:
+            rows = self._conn.execute(sql, (self._namespace, *params)).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    async def _query(self, sql: str, *params) -> list[JobInfo]:
+        return await asyncio.to_thread(self._fetch, sql, *params)
+
+    async def create_job(self,
+                         config_file: str | None = None,
+                         job_id: str | None = None,
+                         expiry_seconds: int = JobStoreBase.DEFAULT_EXPIRY) -> str:
+        job = self._new_job(config_file, job_id, expiry_seconds)
+
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT OR REPLACE INTO jobs (namespace, job_id, status, config_file, created_at, updated_at, "
+            "heartbeat_at, expiry_seconds) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (self._namespace,
+             job.job_id,
+             job.status.value,
+             config_file,
+             job.created_at.timestamp(),
+             job.updated_at.timestamp(),
+             job.updated_at.timestamp(),
+             job.expiry_seconds))
+
+        logger.info("Created new job %s with config %s", job.job_id, config_file)
+        return job.job_id
+
+    async def update_status(self,
+                            job_id: str,
+                            status: str,
+                            error: str | None = None,
+                            output_path: str | None = None,
+                            output: BaseModel | None = None):
+        status = JobStatus(status).value
+        updated_at = datetime.now(UTC).timestamp()
+        output_json = output.model_dump_json() if output is not None else None
+
+        rowcount = await asyncio.to_thread(
+            self._execute,
+            "UPDATE jobs SET status = ?, error = ?, output_path = ?, output = ?, updated_at = ?, heartbeat_at = ?, "
+            "expires_at = CASE WHEN ? THEN NULL ELSE ? + expiry_seconds END "
+            "WHERE namespace = ? AND job_id = ?",
+            (status,
+             error,
+             output_path,
+             output_json,
+             updated_at,
+             updated_at,
+             status in self.ACTIVE_STATUS,
+             updated_at,
+             self._namespace,
+             job_id))
+
+        if rowcount == 0:
+            raise ValueError(f"Job {job_id} not found")
+
+    async def heartbeat(self, job_id: str):
+        await asyncio.to_thread(self._execute,
+                                "UPDATE jobs SET heartbeat_at = ? WHERE namespace = ? AND job_id = ?",
+                                (datetime.now(UTC).timestamp(), self._namespace, job_id))
+
+    async def get_job(self, job_id: str) -> JobInfo | None:
+        jobs = await self._query("SELECT * FROM jobs WHERE namespace = ? AND job_id = ?", job_id)
+        return jobs[0] if jobs else None
+
+    async def get_last_job(self) -> JobInfo | None:
+        jobs = await self._query("SELECT * FROM jobs WHERE namespace = ? ORDER BY created_at DESC LIMIT 1")
+        if not jobs:
+            logger.info("No jobs found in job store")
+            return None
+        logger.info("Retrieved last job %s created at %s", jobs[0].job_id, jobs[0].created_at)
+        return jobs[0]
+
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
+        return await self._query("SELECT * FROM jobs WHERE namespace = ? AND status = ? ORDER BY created_at",
+                                 JobStatus(status).value)
+
+    async def get_all_jobs(self) -> list[JobInfo]:
+        return await self._query("SELECT * FROM jobs WHERE namespace = ? ORDER BY created_at")
+
+    def _sweep(self):
+        now = datetime.now(UTC).timestamp()
+
+        with self._lock:
+            # the expired rows are selected and deleted in one write transaction, so two workers sweeping at the same
+            # time never both remove the same output directory
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                interrupted = self._conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, updated_at = ?, expires_at = ? + expiry_seconds "
+                    "WHERE namespace = ? AND expires_at IS NULL AND heartbeat_at < ?",
+                    (JobStatus.INTERRUPTED.value,
+                     "The worker running the job stopped responding",
+                     now,
+                     now,
+                     self._namespace,
+                     now - self._stale_after_seconds)).rowcount
+                rows = self._conn.execute(
+                    "SELECT * FROM jobs WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at < ? "
+                    "AND job_id IS NOT (SELECT job_id FROM jobs WHERE namespace = ? AND expires_at IS NOT NULL "
+                    "ORDER BY updated_at DESC LIMIT 1)", (self._namespace, now, self._namespace)).fetchall()
+                self._conn.executemany("DELETE FROM jobs WHERE namespace = ? AND job_id = ?",
+                                       [(self._namespace, row["job_id"]) for row in rows])
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        if interrupted:
+            logger.warning("Interrupted %d jobs of namespace %s without a heartbeat for %s seconds",
+                           interrupted,
+                           self._namespace,
+                           self._stale_after_seconds)
+
+        for row in rows:
+            self._remove_output(self._to_job(row))
+
+    async def cleanup_expired_jobs(self):
+        await asyncio.to_thread(self._sweep)
+
+
+# The process local store is the default, kept under its original name
+JobStore = InMemoryJobStore
+
+
+def create_job_store(backend: typing.Literal["memory", "sqlite"] = "memory",
+                     path: str | Path | None = None,
+                     namespace: str = "default") -> JobStoreBase:
+    """Create the job store configured for the FastAPI front end."""
+    if backend == "sqlite":
+        if path is None:
+            raise ValueError("A database path is required for the sqlite job store")
+        return SQLiteJobStore(path, namespace=namespace)
+
+    return InMemoryJobStore()
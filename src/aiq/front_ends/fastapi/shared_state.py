@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import typing
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+
+class SharedStateBase(ABC):
+    """
+    State shared by every worker process serving the same FastAPI app: short lived key/value records (e.g. outstanding
+    OAuth flows) and named locks (e.g. the evaluation lock).
+    """
+
+    @abstractmethod
+    async def set(self, namespace: str, key: str, value: dict, ttl_seconds: float | None = None):
+        pass
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> dict | None:
+        pass
+
+    @abstractmethod
+    async def delete(self, namespace: str, key: str):
+        pass
+
+    @abstractmethod
+    def lock(self, name: str) -> typing.AsyncContextManager[None]:
+        """Lock held by at most one task across all the workers sharing this state."""
+        pass
+
+    @property
+    def is_shared(self) -> bool:
+        """Whether other processes can see this state."""
+        return True
+
+    async def close(self):
+        pass
+
+
+class InMemorySharedState(SharedStateBase):
+    """Shared state local to the process, for single worker deployments."""
+
+    def __init__(self):
+        self._values: dict[tuple[str, str], tuple[dict, float | None]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    @property
+    def is_shared(self) -> bool:
+        return False
+
+    async def set(self, namespace: str, key: str, value: dict, ttl_seconds: float | None = None):
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+        self._values[(namespace, key)] = (value, expires_at)
+
+    async def get(self, namespace: str, key: str) -> dict | None:
+        entry = self._values.get((namespace, key))
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._values[(namespace, key)]
+            return None
+        return value
+
+    async def delete(self, namespace: str, key: str):
+        self._values.pop((namespace, key), None)
+
+    def lock(self, name: str) -> asyncio.Lock:
+        return self._locks.setdefault(name, asyncio.Lock())
+
+
+class SQLiteSharedState(SharedStateBase):
+    """
+    Shared state kept in a SQLite database, visible to every worker process opening the same file.
+
+    Locks are leases: the holder renews its lease in the background, so the lock of a worker that died is released once
+    ``lock_lease_seconds`` have passed.
+    """
+
+    def __init__(self, path: str | Path, lock_lease_seconds: float = 30.0, lock_poll_interval: float = 0.25):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_lease_seconds = lock_lease_seconds
+        self._lock_poll_interval = lock_poll_interval
+        self._owner = f"{os.getpid()}-{uuid4().hex}"
+        self._db_lock = threading.Lock()
+
+        self._conn = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None, timeout=30.0)
+        with self._db_lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS shared_values (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires_at REAL,
+                    PRIMARY KEY (namespace, key)
+                );
+                CREATE TABLE IF NOT EXISTS shared_locks (
+                    name TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                );
+                """)
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        with self._db_lock:
+            return self._conn.execute(sql, params)
+
+    def _fetchone(self, sql: str, params: tuple = ()) -> tuple | None:
+        # the connection is shared by the worker threads, so the rows are read while holding the lock as well
+        with self._db_lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    async def close(self):
+        await asyncio.to_thread(self._conn.close)
+
+    async def set(self, namespace: str, key: str, value: dict, ttl_seconds: float | None = None):
+        expires_at = time.time() + ttl_seconds if ttl_seconds is not None else None
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT OR REPLACE INTO shared_values (namespace, key, value, expires_at) "
+            "VALUES (?, ?, ?, ?)", (namespace, key, json.dumps(value), expires_at))
+
+    async def get(self, namespace: str, key: str) -> dict | None:
+        row = await asyncio.to_thread(
+            self._fetchone,
+            "SELECT value FROM shared_values WHERE namespace = ? AND key = ? "
+            "AND (expires_at IS NULL OR expires_at >= ?)", (namespace, key, time.time()))
+        return json.loads(row[0]) if row is not None else None
+
+    async def delete(self, namespace: str, key: str):
+        await asyncio.to_thread(self._execute,
+                                "DELETE FROM shared_values WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def _try_acquire(self, name: str, owner: str) -> bool:
+        now = time.time()
+        cursor = self._execute(
+            "INSERT INTO shared_locks (name, owner, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+            "WHERE shared_locks.expires_at < ?", (name, owner, now + self._lock_lease_seconds, now))
+        return cursor.rowcount == 1
+
+    def _renew(self, name: str, owner: str):
+        self._execute("UPDATE shared_locks SET expires_at = ? WHERE name = ? AND owner = ?",
+                      (time.time() + self._lock_lease_seconds, name, owner))
+
+    def _release(self, name: str, owner: str):
+        self._execute("DELETE FROM shared_locks WHERE name = ? AND owner = ?", (name, owner))
+
+    @asynccontextmanager
+    async def lock(self, name: str) -> AsyncIterator[None]:
+        # every acquisition gets its own owner id, so two tasks of the same worker also exclude each other
+        owner = f"{self._owner}-{uuid4().hex}"
+        while not await asyncio.to_thread(self._try_acquire, name, owner):
+            await asyncio.sleep(self._lock_poll_interval)
+
+        async def _keep_alive():
+            while True:
+                await asyncio.sleep(self._lock_lease_seconds / 3)
+                await asyncio.to_thread(self._renew, name, owner)
+
+        keep_alive = asyncio.create_task(_keep_alive())
+        try:
+            yield
+        finally:
+            keep_alive.cancel()
+            await asyncio.to_thread(self._release, name, owner)
+
+
+def create_shared_state(backend: typing.Literal["memory", "sqlite"] = "memory",
+                        path: str | Path | None = None) -> SharedStateBase:
+    """Create the shared state configured for the FastAPI front end."""
+    if backend == "sqlite":
+        if path is None:
+            raise ValueError("A database path is required for the sqlite shared state")
+        return SQLiteSharedState(path)
+
+    return InMemorySharedState()
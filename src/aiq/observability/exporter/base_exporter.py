@@ -29,6 +29,9 @@ from typing import overload
 from aiq.builder.context import AIQContextState
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.observability.exporter.exporter import Exporter
+from aiq.utils.reactive.observer import Observer
+from aiq.utils.reactive.queued_observer import OverflowPolicy
+from aiq.utils.reactive.queued_observer import QueuedObserver
 from aiq.utils.reactive.subject import Subject
 from aiq.utils.type_utils import override
 
@@ -118,6 +121,10 @@ class BaseExporter(Exporter):
 
     Args:
         context_state (AIQContextState, optional): The context state to use for the exporter. Defaults to None.
+        event_queue_size (int, optional): When set, events are handed to ``export`` from a bounded queue on the event
+            loop instead of inside the producer's call. Defaults to None.
+        overflow_policy (OverflowPolicy, optional): What to do with events arriving to a full queue, see
+            ``QueuedObserver``. Defaults to "drop_oldest".
     """
 
     # Class-level tracking for debugging and monitoring
@@ -130,12 +137,17 @@ class BaseExporter(Exporter):
     _ready_event: IsolatedAttribute[asyncio.Event] = IsolatedAttribute(asyncio.Event)
     _shutdown_event: IsolatedAttribute[asyncio.Event] = IsolatedAttribute(asyncio.Event)
 
-    def __init__(self, context_state: AIQContextState | None = None):
+    def __init__(self,
+                 context_state: AIQContextState | None = None,
+                 event_queue_size: int | None = None,
+                 overflow_policy: OverflowPolicy = "drop_oldest"):
         """Initialize the BaseExporter."""
         if context_state is None:
             context_state = AIQContextState.get()
 
         self._context_state = context_state
+        self._event_queue_size = event_queue_size
+        self._overflow_policy: OverflowPolicy = overflow_policy
         self._subscription = None
         self._running = False
         # Get the event loop (set to None if not available, will be set later)
@@ -299,11 +311,12 @@ class BaseExporter(Exporter):
         def on_next_wrapper(event: IntermediateStep) -> None:
             self.export(event)
 
-        self._subscription = subject.subscribe(
-            on_next=on_next_wrapper,
-            on_error=self.on_error,
-            on_complete=self.on_complete,
-        )
+        observer = Observer(on_next_wrapper, self.on_error, self.on_complete)
+        if self._event_queue_size is not None:
+            # keep a slow export off the producer's hot path
+            observer = QueuedObserver(observer, max_queue_size=self._event_queue_size, overflow=self._overflow_policy)
+
+        self._subscription = subject.subscribe(observer)
 
         self._running = True
         self._ready_event.set()
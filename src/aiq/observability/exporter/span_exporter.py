@@ -16,6 +16,7 @@
 import logging
 import re
 from abc import abstractmethod
+from typing import Any
 from typing import TypeVar
 
 from aiq.data_models.intermediate_step import IntermediateStep
@@ -38,6 +39,8 @@ logger = logging.getLogger(__name__)
 InputSpanT = TypeVar("InputSpanT")
 OutputSpanT = TypeVar("OutputSpanT")
 
+_HUMAN_QUESTION_RE = re.compile(r"Human:\s*Question:\s*(.*)")
+
 
 class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
     """Abstract base class for span exporters with processing pipeline support.
@@ -67,6 +70,9 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
     1. IntermediateStep (START) → Create Span → Add to tracking
     2. IntermediateStep (END) → Complete Span → Process through pipeline → Export
 
+    Spans reference their parent span instead of copying it. Input, output and metadata payloads are kept as-is and
+    only serialized in the export task, so the ``push_intermediate_step`` call path only pays for bookkeeping.
+
     Args:
         context_state (AIQContextState, optional): The context state to use for the exporter. Defaults to None.
     """
@@ -75,6 +81,7 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
     _outstanding_spans: IsolatedAttribute[dict] = IsolatedAttribute(dict)
     _span_stack: IsolatedAttribute[dict] = IsolatedAttribute(dict)
     _metadata_stack: IsolatedAttribute[dict] = IsolatedAttribute(dict)
+    _input_stack: IsolatedAttribute[dict] = IsolatedAttribute(dict)
 
     @abstractmethod
     async def export_processed(self, item: OutputSpanT) -> None:
@@ -121,8 +128,10 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
                 logger.warning("No parent span found for step %s", event.UUID)
                 return
 
-            parent_span = parent_span.model_copy() if isinstance(parent_span, Span) else None
-            if parent_span and parent_span.context:
+            # The parent is only read by exporters (trace and span ids), so it is referenced rather than copied
+            if not isinstance(parent_span, Span):
+                parent_span = None
+            elif parent_span.context:
                 span_ctx = SpanContext(trace_id=parent_span.context.trace_id)
 
         # Extract start/end times from the step
@@ -148,23 +157,10 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
                 "aiq.subspan.name": event.payload.name or "",
                 "aiq.event_timestamp": event.event_timestamp,
                 "aiq.framework": event.payload.framework.value if event.payload.framework else "unknown",
+                SpanAttributes.AIQ_SPAN_KIND.value: event_type_to_span_kind(event.event_type).value,
             },
             start_time=start_ns)
 
-        span_kind = event_type_to_span_kind(event.event_type)
-        sub_span.set_attribute("aiq.span.kind", span_kind.value)
-
-        if event.payload.data and event.payload.data.input:
-            match = re.search(r"Human:\s*Question:\s*(.*)", str(event.payload.data.input))
-            if match:
-                human_question = match.group(1).strip()
-                sub_span.set_attribute(SpanAttributes.INPUT_VALUE.value, human_question)
-            else:
-                serialized_input, is_json = self._serialize_payload(event.payload.data.input)
-                sub_span.set_attribute(SpanAttributes.INPUT_VALUE.value, serialized_input)
-                sub_span.set_attribute(SpanAttributes.INPUT_MIME_TYPE.value,
-                                       MimeTypes.JSON.value if is_json else MimeTypes.TEXT.value)
-
         # Add metadata to the metadata stack
         start_metadata = event.payload.metadata or {}
 
@@ -179,6 +175,10 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
         self._span_stack[event.UUID] = sub_span  # type: ignore
         self._outstanding_spans[event.UUID] = sub_span  # type: ignore
 
+        # Serialized together with the output once the span ends
+        if event.payload.data and event.payload.data.input:
+            self._input_stack[event.UUID] = event.payload.data.input  # type: ignore
+
         logger.debug(
             "Added span to tracking (outstanding: %d, stack: %d, event_id: %s)",
             len(self._outstanding_spans),  # type: ignore
@@ -200,6 +200,7 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
             return
 
         self._span_stack.pop(event.UUID, None)  # type: ignore
+        span_input = self._input_stack.pop(event.UUID, None)  # type: ignore
 
         # Optionally add more attributes from usage_info or data
         usage_info = event.payload.usage_info
@@ -215,11 +216,7 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
             sub_span.set_attribute(SpanAttributes.LLM_TOKEN_COUNT_TOTAL.value,
                                    usage_info.token_usage.total_tokens if usage_info.token_usage else 0)
 
-        if event.payload.data and event.payload.data.output is not None:
-            serialized_output, is_json = self._serialize_payload(event.payload.data.output)
-            sub_span.set_attribute(SpanAttributes.OUTPUT_VALUE.value, serialized_output)
-            sub_span.set_attribute(SpanAttributes.OUTPUT_MIME_TYPE.value,
-                                   MimeTypes.JSON.value if is_json else MimeTypes.TEXT.value)
+        span_output = event.payload.data.output if event.payload.data else None
 
         # Merge metadata from start event with end event metadata
         start_metadata = self._metadata_stack.pop(event.UUID)  # type: ignore
@@ -238,9 +235,6 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
             end_metadata = end_metadata.model_dump()
 
         merged_metadata = merge_dicts(start_metadata, end_metadata)
-        serialized_metadata, is_json = self._serialize_payload(merged_metadata)
-        sub_span.set_attribute("aiq.metadata", serialized_metadata)
-        sub_span.set_attribute("aiq.metadata.mime_type", MimeTypes.JSON.value if is_json else MimeTypes.TEXT.value)
 
         end_ns = ns_timestamp(event.payload.event_timestamp)
 
@@ -248,7 +242,42 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
         sub_span.end(end_time=end_ns)
 
         # Export the span with processing pipeline
-        self._create_export_task(self._export_with_processing(sub_span))  # type: ignore
+        self._create_export_task(self._serialize_and_export(sub_span, span_input, span_output,
+                                                            merged_metadata))  # type: ignore
+
+    def _set_payload_attributes(self, span: Span, span_input: Any, span_output: Any, metadata: dict) -> None:
+        """Serialize the input, output and metadata payloads of a span into its attributes.
+
+        Args:
+            span (Span): The span to update.
+            span_input (Any): The input of the step, or None.
+            span_output (Any): The output of the step, or None.
+            metadata (dict): The merged start and end metadata of the step.
+        """
+        if span_input:
+            match = _HUMAN_QUESTION_RE.search(span_input if isinstance(span_input, str) else str(span_input))
+            if match:
+                span.set_attribute(SpanAttributes.INPUT_VALUE.value, match.group(1).strip())
+            else:
+                serialized_input, is_json = self._serialize_payload(span_input)
+                span.set_attribute(SpanAttributes.INPUT_VALUE.value, serialized_input)
+                span.set_attribute(SpanAttributes.INPUT_MIME_TYPE.value,
+                                   MimeTypes.JSON.value if is_json else MimeTypes.TEXT.value)
+
+        if span_output is not None:
+            serialized_output, is_json = self._serialize_payload(span_output)
+            span.set_attribute(SpanAttributes.OUTPUT_VALUE.value, serialized_output)
+            span.set_attribute(SpanAttributes.OUTPUT_MIME_TYPE.value,
+                               MimeTypes.JSON.value if is_json else MimeTypes.TEXT.value)
+
+        serialized_metadata, is_json = self._serialize_payload(metadata)
+        span.set_attribute("aiq.metadata", serialized_metadata)
+        span.set_attribute("aiq.metadata.mime_type", MimeTypes.JSON.value if is_json else MimeTypes.TEXT.value)
+
+    async def _serialize_and_export(self, span: Span, span_input: Any, span_output: Any, metadata: dict) -> None:
+        """Serialize the span payloads and export the span through the processing pipeline."""
+        self._set_payload_attributes(span, span_input, span_output, metadata)
+        await self._export_with_processing(span)  # type: ignore
 
     @override
     async def _cleanup(self):
@@ -262,3 +291,4 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
         self._outstanding_spans.clear()  # type: ignore
         self._span_stack.clear()  # type: ignore
         self._metadata_stack.clear()  # type: ignore
+        self._input_stack.clear()  # type: ignore
@@ -24,3 +24,16 @@ class BatchConfigMixin(BaseModel):
     max_queue_size: int = Field(default=1000, description="The maximum queue size for the telemetry exporter.")
     drop_on_overflow: bool = Field(default=False, description="Whether to drop on overflow for the telemetry exporter.")
     shutdown_timeout: float = Field(default=10.0, description="The shutdown timeout for the telemetry exporter.")
+    adaptive_batching: bool = Field(
+        default=False,
+        description="Export batches concurrently and adapt the batch size to the observed export latency.")
+    max_batch_bytes: int | None = Field(default=None,
+                                        description="Flush a batch once its estimated payload size reaches this "
+                                        "many bytes.")
+    target_export_latency: float | None = Field(
+        default=None,
+        description="Export latency in seconds that adaptive batching aims for by shrinking or growing batches.")
+    max_concurrent_exports: int = Field(default=1,
+                                        description="Maximum number of batches exported at once with adaptive "
+                                        "batching. Spans of the same trace are still exported in order.",
+                                        ge=1)
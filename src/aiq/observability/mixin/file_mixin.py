@@ -14,13 +14,17 @@
 # limitations under the License.
 
 import asyncio
+import gzip
 import logging
+import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from aiq.observability.mixin.file_mode import FileCompression
 from aiq.observability.mixin.file_mode import FileMode
 from aiq.observability.mixin.resource_conflict_mixin import ResourceConflictMixin
+from aiq.observability.utils.file_writer import BufferedFileWriter
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +35,10 @@ class FileExportMixin(ResourceConflictMixin):
     This mixin provides file I/O functionality for exporters that need to write
     serialized data to local files, with support for file overwriting and rolling logs.
 
+    Writes never touch the file from the event loop: lines are handed to a BufferedFileWriter whose thread writes
+    them in batches, tracks the file size in memory and rolls (and optionally compresses) files. Buffered lines are
+    flushed when the exporter stops.
+
     Automatically detects and prevents file path conflicts between multiple instances
     by raising ResourceConflictError during initialization.
     """
@@ -45,6 +53,8 @@ class FileExportMixin(ResourceConflictMixin):
             max_file_size: int = 10 * 1024 * 1024,  # 10MB default
             max_files: int = 5,
             cleanup_on_init: bool = False,
+            compression: FileCompression = FileCompression.NONE,
+            buffer_size: int = 10000,
             **kwargs):
         """Initialize the file exporter with the specified output_path and project.
 
@@ -56,6 +66,8 @@ class FileExportMixin(ResourceConflictMixin):
             max_file_size (int): Maximum file size in bytes before rolling. Defaults to 10MB.
             max_files (int): Maximum number of rolled files to keep. Defaults to 5.
             cleanup_on_init (bool): Clean up old files during initialization. Defaults to False.
+            compression (FileCompression): Compression applied to rolled files. Defaults to no compression.
+            buffer_size (int): Maximum number of lines buffered for the writer thread. Defaults to 10000.
 
         Raises:
             ResourceConflictError: If another FileExportMixin instance is already using
@@ -68,12 +80,23 @@ class FileExportMixin(ResourceConflictMixin):
         self._max_file_size = max_file_size
         self._max_files = max_files
         self._cleanup_on_init = cleanup_on_init
-        self._lock = asyncio.Lock()
-        self._first_write = True
+        self._compression = FileCompression(compression)
+
+        if self._compression == FileCompression.ZSTD:
+            from aiq.utils.optional_imports import optional_import
+
+            # Fail at configuration time rather than on the first roll
+            optional_import("zstandard")
 
         # Initialize file paths first, then check for conflicts via ResourceConflictMixin
         self._setup_file_paths()
 
+        self._writer = BufferedFileWriter(self._current_file_path,
+                                          overwrite=self._mode == FileMode.OVERWRITE,
+                                          max_file_size=self._max_file_size if self._enable_rolling else None,
+                                          on_roll=self._roll_file,
+                                          buffer_size=buffer_size)
+
         # This calls _register_resources() which will check for conflicts
         super().__init__(*args, **kwargs)
 
@@ -88,6 +111,7 @@ class FileExportMixin(ResourceConflictMixin):
             self._file_extension = self._filepath.suffix or ".log"
             self._base_dir.mkdir(parents=True, exist_ok=True)
             self._current_file_path = self._base_dir / f"{self._base_filename}{self._file_extension}"
+            self._rolled_pattern = f"{self._base_filename}_*{self._file_extension}{self._compressed_suffix()}"
 
             # Perform initial cleanup if requested
             if self._cleanup_on_init:
@@ -115,8 +139,7 @@ class FileExportMixin(ResourceConflictMixin):
 
         # Add cleanup pattern for rolling files
         if self._enable_rolling:
-            cleanup_pattern = f"{self._base_filename}_*{self._file_extension}"
-            pattern_key = f"{self._base_dir.resolve()}:{cleanup_pattern}"
+            pattern_key = f"{self._base_dir.resolve()}:{self._rolled_pattern}"
             identifiers["cleanup_pattern"] = pattern_key
 
         return identifiers
@@ -130,7 +153,7 @@ class FileExportMixin(ResourceConflictMixin):
                         f"Use different project names or output paths to avoid conflicts.")
             case "cleanup_pattern":
                 return (f"Rolling file cleanup conflict detected: Both instances would use pattern "
-                        f"'{self._base_filename}_*{self._file_extension}' in directory '{self._base_dir}', "
+                        f"'{self._rolled_pattern}' in directory '{self._base_dir}', "
                         f"causing one to delete the other's files. "
                         f"Current instance (project: '{self._project}'), "
                         f"existing instance (project: '{existing_instance._project}'). "
@@ -138,12 +161,20 @@ class FileExportMixin(ResourceConflictMixin):
             case _:
                 return f"Unknown file resource conflict: {resource_type} = {identifier}"
 
+    def _compressed_suffix(self) -> str:
+        match self._compression:
+            case FileCompression.GZIP:
+                return ".gz"
+            case FileCompression.ZSTD:
+                return ".zst"
+            case _:
+                return ""
+
     def _cleanup_old_files_sync(self) -> None:
-        """Synchronous version of cleanup for use during initialization."""
+        """Remove old rolled files beyond the maximum count."""
         try:
             # Find all rolled files matching our pattern
-            pattern = f"{self._base_filename}_*{self._file_extension}"
-            rolled_files = list(self._base_dir.glob(pattern))
+            rolled_files = list(self._base_dir.glob(self._rolled_pattern))
 
             # Sort by modification time (newest first)
             rolled_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
@@ -152,67 +183,49 @@ class FileExportMixin(ResourceConflictMixin):
             for old_file in rolled_files[self._max_files:]:
                 try:
                     old_file.unlink()
-                    logger.info("Cleaned up old log file during init: %s", old_file)
+                    logger.info("Cleaned up old log file: %s", old_file)
                 except OSError as e:
                     logger.error("Error removing old file %s: %s", old_file, e)
 
         except Exception as e:
             logger.error("Error during initialization cleanup: %s", e)
 
-    async def _should_roll_file(self) -> bool:
-        """Check if the current file should be rolled based on size."""
-        if not self._enable_rolling:
-            return False
+    def _roll_file(self, path: Path) -> None:
+        """Roll the current file by renaming it with a timestamp and cleaning up old files.
 
-        try:
-            if self._current_file_path.exists():
-                stat = self._current_file_path.stat()
-                return stat.st_size >= self._max_file_size
-        except OSError:
-            pass
-        return False
-
-    async def _roll_file(self) -> None:
-        """Roll the current file by renaming it with a timestamp and cleaning up old files."""
-        if not self._current_file_path.exists():
+        Called from the writer thread once the file it just closed reached ``max_file_size``.
+        """
+        if not path.exists():
             return
 
         # Generate timestamped filename with microsecond precision
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        rolled_filename = f"{self._base_filename}_{timestamp}{self._file_extension}"
-        rolled_path = self._base_dir / rolled_filename
+        rolled_path = self._base_dir / f"{self._base_filename}_{timestamp}{self._file_extension}"
 
-        try:
-            # Rename current file
-            self._current_file_path.rename(rolled_path)
-            logger.info("Rolled log file to: %s", rolled_path)
+        path.rename(rolled_path)
+        if self._compression != FileCompression.NONE:
+            rolled_path = self._compress_file(rolled_path)
+        logger.info("Rolled log file to: %s", rolled_path)
 
-            # Clean up old files
-            await self._cleanup_old_files()
+        self._cleanup_old_files_sync()
 
-        except OSError as e:
-            logger.error("Error rolling file %s: %s", self._current_file_path, e)
+    def _compress_file(self, path: Path) -> Path:
+        """Compress a rolled file next to itself and remove the uncompressed copy."""
+        compressed_path = path.with_name(path.name + self._compressed_suffix())
 
-    async def _cleanup_old_files(self) -> None:
-        """Remove old rolled files beyond the maximum count."""
-        try:
-            # Find all rolled files matching our pattern
-            pattern = f"{self._base_filename}_*{self._file_extension}"
-            rolled_files = list(self._base_dir.glob(pattern))
+        with path.open("rb") as source:
+            if self._compression == FileCompression.GZIP:
+                with gzip.open(compressed_path, "wb") as target:
+                    shutil.copyfileobj(source, target)
+            else:
+                from aiq.utils.optional_imports import optional_import
 
-            # Sort by modification time (newest first)
-            rolled_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-
-            # Remove files beyond max_files limit
-            for old_file in rolled_files[self._max_files:]:
-                try:
-                    old_file.unlink()
-                    logger.info("Cleaned up old log file: %s", old_file)
-                except OSError as e:
-                    logger.error("Error removing old file %s: %s", old_file, e)
+                zstandard = optional_import("zstandard")
+                with compressed_path.open("wb") as target:
+                    zstandard.ZstdCompressor().copy_stream(source, target)
 
-        except Exception as e:
-            logger.error("Error during cleanup: %s", e)
+        path.unlink()
+        return compressed_path
 
     async def export_processed(self, item: str | list[str]) -> None:
         """Export a processed string or list of strings.
@@ -220,36 +233,24 @@ class FileExportMixin(ResourceConflictMixin):
         Args:
             item (str | list[str]): The string or list of strings to export.
         """
+        lines = item if isinstance(item, list) else [item]
+
         try:
-            # Lazy import to avoid slow startup times
-            import aiofiles
-
-            async with self._lock:
-                # Check if we need to roll the file
-                if await self._should_roll_file():
-                    await self._roll_file()
-
-                # Determine file mode
-                if self._first_write and self._mode == FileMode.OVERWRITE:
-                    file_mode = "w"
-                    self._first_write = False
-                else:
-                    file_mode = "a"
-
-                async with aiofiles.open(self._current_file_path, mode=file_mode) as f:
-                    if isinstance(item, list):
-                        # Handle list of strings
-                        for single_item in item:
-                            await f.write(single_item)
-                            await f.write("\n")
-                    else:
-                        # Handle single string
-                        await f.write(item)
-                        await f.write("\n")
+            if not self._writer.put_nowait(lines):
+                # The writer thread is behind, wait for room off the event loop instead of dropping traces
+                await asyncio.to_thread(self._writer.put, lines)
 
         except Exception as e:
             logger.error("Error exporting event: %s", e, exc_info=True)
 
+    async def _cleanup(self):
+        """Write every pending line to the file before the exporter stops."""
+        await super()._cleanup()  # type: ignore
+
+        # Export tasks still in flight would otherwise lose their lines
+        await self._wait_for_tasks()  # type: ignore
+        await asyncio.to_thread(self._writer.close)
+
     def get_current_file_path(self) -> Path:
         """Get the current file path being written to.
 
@@ -270,6 +271,7 @@ class FileExportMixin(ResourceConflictMixin):
             "mode": self._mode,
             "rolling_enabled": self._enable_rolling,
             "cleanup_on_init": self._cleanup_on_init,
+            "compression": self._compression,
             "project": self._project,
             "effective_project": self._project,
         }
@@ -281,8 +283,8 @@ class FileExportMixin(ResourceConflictMixin):
                 "base_directory": str(self._base_dir),
             })
 
-            # Add current file size if it exists
+            # Tracked by the writer thread, lines still buffered are not included
             if self._current_file_path.exists():
-                info["current_file_size"] = self._current_file_path.stat().st_size
+                info["current_file_size"] = self._writer.size or self._current_file_path.stat().st_size
 
         return info
@@ -21,3 +21,11 @@ class FileMode(StrEnum):
 
     APPEND = "append"
     OVERWRITE = "overwrite"
+
+
+class FileCompression(StrEnum):
+    """Compression applied to rolled files by FileExportMixin."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
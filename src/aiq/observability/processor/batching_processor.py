@@ -14,11 +14,16 @@
 # limitations under the License.
 
 import asyncio
+import bisect
 import logging
+import sys
 import time
 from collections import deque
 from collections.abc import Awaitable
 from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Mapping
+from functools import partial
 from typing import Any
 from typing import Generic
 from typing import TypeVar
@@ -29,6 +34,23 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Upper bounds in seconds of the export latency histogram buckets, the last bucket counts everything slower
+EXPORT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def estimate_item_size(item: Any) -> int:
+    """Cheap estimate of the serialized size of an item in bytes, used for ``max_batch_bytes``."""
+    if isinstance(item, (str, bytes)):
+        return len(item)
+
+    # Spans are dominated by their attribute values (inputs, outputs and metadata)
+    attributes = getattr(item, "attributes", None)
+    if isinstance(attributes, Mapping):
+        return 64 + sum(
+            len(key) + len(value if isinstance(value, str) else str(value)) for key, value in attributes.items())
+
+    return sys.getsizeof(item)
+
 
 class BatchingProcessor(Processor[T, list[T]], Generic[T]):
     """Pass-through batching processor that accumulates items and outputs batched lists.
@@ -49,6 +71,7 @@ class BatchingProcessor(Processor[T, list[T]], Generic[T]):
     - Proper cleanup and shutdown handling
     - High-performance async implementation
     - Back-pressure handling with queue limits
+    - Optional adaptive mode with byte and latency targets and concurrent exports
 
     Cleanup Guarantee:
         When ProcessingExporter._cleanup() calls shutdown(), this processor:
@@ -64,12 +87,28 @@ class BatchingProcessor(Processor[T, list[T]], Generic[T]):
         exporter.add_processor(BatchedSpanProcessor())  # Processes List[Span]
         ```
 
+    Adaptive Mode:
+        With ``adaptive=True`` and a ``done_callback``, the processor exports batches itself instead of returning
+        them down the pipeline (``process`` always returns an empty list). Up to ``max_concurrent_exports`` batches
+        are exported at once; batches sharing an ``ordering_key`` (e.g. the trace id) are exported in the order they
+        were created. When ``target_export_latency`` is set, the batch size is halved while the observed export
+        latency is above the target and grown back towards ``batch_size`` while it is well below it. Items waiting
+        for an export count against ``max_queue_size``, a full queue either drops items or makes ``process`` wait.
+
     Args:
         batch_size: Maximum items per batch (default: 100)
         flush_interval: Max seconds to wait before flushing (default: 5.0)
         max_queue_size: Maximum items to queue before blocking (default: 1000)
         drop_on_overflow: If True, drop items when queue is full (default: False)
         shutdown_timeout: Max seconds to wait for final batch processing (default: 10.0)
+        done_callback: Exports batches created by scheduled flushes, and every batch in adaptive mode
+        adaptive: Export batches from the processor with concurrency and latency control (default: False)
+        max_batch_bytes: Flush once the queued items reach this estimated size in bytes (default: None)
+        target_export_latency: Export latency in seconds the adaptive batch size aims for (default: None)
+        min_batch_size: Smallest batch size the adaptive mode shrinks to (default: 1)
+        max_concurrent_exports: Maximum in-flight exports in adaptive mode (default: 1)
+        ordering_key: Returns the key whose items must be exported in order, e.g. a trace id (default: None)
+        size_estimator: Returns the size of an item in bytes (default: ``estimate_item_size``)
     """
 
     def __init__(self,
@@ -78,7 +117,17 @@ class BatchingProcessor(Processor[T, list[T]], Generic[T]):
                  max_queue_size: int = 1000,
                  drop_on_overflow: bool = False,
                  shutdown_timeout: float = 10.0,
-                 done_callback: Callable[[list[T]], Awaitable[None]] | None = None):
+                 done_callback: Callable[[list[T]], Awaitable[None]] | None = None,
+                 adaptive: bool = False,
+                 max_batch_bytes: int | None = None,
+                 target_export_latency: float | None = None,
+                 min_batch_size: int = 1,
+                 max_concurrent_exports: int = 1,
+                 ordering_key: Callable[[T], Hashable] | None = None,
+                 size_estimator: Callable[[T], int] | None = None):
+        if max_concurrent_exports < 1:
+            raise ValueError("max_concurrent_exports must be at least 1")
+
         self._batch_size = batch_size
         self._flush_interval = flush_interval
         self._max_queue_size = max_queue_size
@@ -86,14 +135,32 @@ class BatchingProcessor(Processor[T, list[T]], Generic[T]):
         self._shutdown_timeout = shutdown_timeout
         self._done_callback = done_callback
 
+        # Adaptive mode configuration
+        self._adaptive = adaptive
+        self._max_batch_bytes = max_batch_bytes
+        self._target_export_latency = target_export_latency
+        self._min_batch_size = max(1, min(min_batch_size, batch_size))
+        self._max_concurrent_exports = max_concurrent_exports
+        self._ordering_key = ordering_key
+        self._size_estimator = size_estimator or estimate_item_size
+
         # Batching state
         self._batch_queue: deque[T] = deque()
+        self._queue_bytes = 0
+        self._current_batch_size = batch_size
         self._last_flush_time = time.time()
         self._flush_task: asyncio.Task | None = None
-        self._batch_lock = asyncio.Lock()
         self._shutdown_requested = False
         self._shutdown_complete = False
-        self._shutdown_complete_event: asyncio.Event | None = None
+        self._shutdown_complete_event = asyncio.Event()
+
+        # Batches exported by the processor itself (scheduled flushes, every batch in adaptive mode)
+        self._export_semaphore = asyncio.Semaphore(max_concurrent_exports)
+        self._export_tasks: set[asyncio.Task] = set()
+        # Last export task of every ordering key, later batches with the same key wait for it
+        self._ordering_tails: dict[Hashable, asyncio.Task] = {}
+        self._pending_export_items = 0
+        self._queue_space: asyncio.Condition | None = None
 
         # Final batch handling for cleanup
         self._final_batch: list[T] | None = None
@@ -108,6 +175,11 @@ class BatchingProcessor(Processor[T, list[T]], Generic[T]):
         self._items_dropped = 0
         self._queue_overflows = 0
         self._shutdown_batches = 0
+        self._exports = 0
+        self._export_errors = 0
+        self._export_latency_sum = 0.0
+        self._export_latency_ewma: float | None = None
+        self._export_latency_buckets = [0] * (len(EXPORT_LATENCY_BUCKETS) + 1)
 
     async def process(self, item: T) -> list[T]:
         """Process an item by adding it to the batch queue.
@@ -132,39 +204,149 @@ class BatchingProcessor(Processor[T, list[T]], Generic[T]):
             logger.debug("Shutdown mode: returning single-item batch for item %s", item)
             return [item]
 
-        async with self._batch_lock:
-            # Handle queue overflow
-            if len(self._batch_queue) >= self._max_queue_size:
-                self._queue_overflows += 1
-
-                if self._drop_on_overflow:
-                    # Drop the item and return empty
-                    self._items_dropped += 1
-                    logger.warning("Dropping item due to queue overflow (dropped: %d)", self._items_dropped)
-                    return []
-                # Force flush to make space, then add item
-                logger.warning("Queue overflow, forcing flush of %d items", len(self._batch_queue))
-                forced_batch = await self._create_batch()
-                if forced_batch:
-                    # Add current item to queue and return the forced batch
-                    self._batch_queue.append(item)
-                    self._items_processed += 1
-                    return forced_batch
-
-            # Add item to batch queue
-            self._batch_queue.append(item)
-            self._items_processed += 1
+        if self._adaptive and self._done_callback is not None:
+            return await self._process_adaptive(item)
+
+        # No awaits below, the event loop cannot interleave another process() call
+        # Handle queue overflow
+        if len(self._batch_queue) >= self._max_queue_size:
+            self._queue_overflows += 1
+
+            if self._drop_on_overflow:
+                # Drop the item and return empty
+                self._items_dropped += 1
+                logger.warning("Dropping item due to queue overflow (dropped: %d)", self._items_dropped)
+                return []
+            # Force flush to make space, then add item
+            logger.warning("Queue overflow, forcing flush of %d items", len(self._batch_queue))
+            forced_batch = self._take_batch()
+            if forced_batch:
+                # Add current item to queue and return the forced batch
+                self._enqueue(item)
+                return forced_batch
+
+        # Add item to batch queue
+        self._enqueue(item)
+
+        if self._should_flush():
+            return self._take_batch()
+        # Schedule a time-based flush if not already scheduled
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._schedule_flush())
+        return []
+
+    async def _process_adaptive(self, item: T) -> list[T]:
+        """Queue an item and hand full batches to concurrent export tasks."""
+        if not self._has_queue_space():
+            self._queue_overflows += 1
+
+            if self._drop_on_overflow:
+                self._items_dropped += 1
+                logger.warning("Dropping item due to queue overflow (dropped: %d)", self._items_dropped)
+                return []
+
+            # Wait for in-flight exports to make room instead of growing the backlog
+            if self._queue_space is None:
+                self._queue_space = asyncio.Condition()
+            async with self._queue_space:
+                await self._queue_space.wait_for(lambda: self._shutdown_requested or self._has_queue_space())
+
+            if self._shutdown_requested:
+                self._items_processed += 1
+                self._shutdown_batches += 1
+                return [item]
+
+        self._enqueue(item)
+
+        if self._should_flush():
+            self._start_export(self._take_batch())
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._schedule_flush())
+        return []
 
-            # Check flush conditions
-            should_flush = (len(self._batch_queue) >= self._batch_size
-                            or (time.time() - self._last_flush_time) >= self._flush_interval)
+    def _has_queue_space(self) -> bool:
+        return len(self._batch_queue) + self._pending_export_items < self._max_queue_size
 
-            if should_flush:
-                return await self._create_batch()
-            # Schedule a time-based flush if not already scheduled
-            if self._flush_task is None or self._flush_task.done():
-                self._flush_task = asyncio.create_task(self._schedule_flush())
-            return []
+    def _enqueue(self, item: T) -> None:
+        self._batch_queue.append(item)
+        self._items_processed += 1
+        if self._max_batch_bytes is not None:
+            self._queue_bytes += self._size_estimator(item)
+
+    def _should_flush(self) -> bool:
+        return (len(self._batch_queue) >= self._current_batch_size
+                or (self._max_batch_bytes is not None and self._queue_bytes >= self._max_batch_bytes)
+                or (time.time() - self._last_flush_time) >= self._flush_interval)
+
+    def _start_export(self, batch: list[T]) -> None:
+        """Export a batch in its own task once earlier batches with the same ordering keys are exported."""
+        if not batch:
+            return
+
+        keys = {self._ordering_key(item) for item in batch} if self._ordering_key is not None else set()
+        predecessors = {self._ordering_tails[key] for key in keys if key in self._ordering_tails}
+
+        self._pending_export_items += len(batch)
+        task = asyncio.create_task(self._export_batch(batch, predecessors))
+        self._export_tasks.add(task)
+        for key in keys:
+            self._ordering_tails[key] = task
+        task.add_done_callback(partial(self._export_done, keys))
+
+    def _export_done(self, keys: set[Hashable], task: asyncio.Task) -> None:
+        self._export_tasks.discard(task)
+        for key in keys:
+            if self._ordering_tails.get(key) is task:
+                del self._ordering_tails[key]
+
+    async def _export_batch(self, batch: list[T], predecessors: set[asyncio.Task]) -> None:
+        try:
+            if predecessors:
+                await asyncio.wait(predecessors)
+
+            async with self._export_semaphore:
+                start = time.perf_counter()
+                try:
+                    await self._done_callback(batch)  # type: ignore
+                except Exception as e:
+                    self._export_errors += 1
+                    logger.error("Error exporting batch of %d items: %s", len(batch), e, exc_info=True)
+                finally:
+                    self._record_export_latency(time.perf_counter() - start)
+        finally:
+            self._pending_export_items -= len(batch)
+            if self._queue_space is not None:
+                async with self._queue_space:
+                    self._queue_space.notify_all()
+
+    def _record_export_latency(self, latency: float) -> None:
+        self._exports += 1
+        self._export_latency_sum += latency
+        self._export_latency_buckets[bisect.bisect_left(EXPORT_LATENCY_BUCKETS, latency)] += 1
+
+        if self._export_latency_ewma is None:
+            self._export_latency_ewma = latency
+        else:
+            self._export_latency_ewma = 0.8 * self._export_latency_ewma + 0.2 * latency
+
+        if self._target_export_latency is None:
+            return
+
+        # Multiplicative decrease when over the target, additive increase when comfortably under it
+        if self._export_latency_ewma > self._target_export_latency:
+            new_size = max(self._min_batch_size, self._current_batch_size // 2)
+        elif self._export_latency_ewma < self._target_export_latency / 2:
+            new_size = min(self._batch_size, self._current_batch_size + max(1, self._current_batch_size // 4))
+        else:
+            return
+
+        if new_size != self._current_batch_size:
+            logger.debug("Adjusting batch size from %d to %d (export latency %.3fs, target %.3fs)",
+                         self._current_batch_size,
+                         new_size,
+                         self._export_latency_ewma,
+                         self._target_export_latency)
+            self._current_batch_size = new_size
 
     def set_done_callback(self, callback: Callable[[list[T]], Awaitable[None]]):
         """Set callback function for immediate export of scheduled batches."""
@@ -174,20 +356,15 @@ class BatchingProcessor(Processor[T, list[T]], Generic[T]):
         """Schedule a flush after the flush interval."""
         try:
             await asyncio.sleep(self._flush_interval)
-            async with self._batch_lock:
-                if not self._shutdown_requested and self._batch_queue:
-                    batch = await self._create_batch()
-                    if batch:
-                        # Immediately export scheduled batches via callback
-                        if self._done_callback is not None:
-                            try:
-                                await self._done_callback(batch)
-                                logger.debug("Scheduled flush exported batch of %d items", len(batch))
-                            except Exception as e:
-                                logger.error("Error exporting scheduled batch: %s", e, exc_info=True)
-                        else:
-                            logger.warning("Scheduled flush created batch of %d items but no export callback set",
-                                           len(batch))
+            if self._shutdown_requested or not self._batch_queue:
+                return
+
+            batch = self._take_batch()
+            if self._done_callback is not None:
+                # Exported in its own task so shutdown can wait for it instead of cancelling it midway
+                self._start_export(batch)
+            else:
+                logger.warning("Scheduled flush created batch of %d items but no export callback set", len(batch))
         except asyncio.CancelledError:
             pass
         except Exception as e:
@@ -195,11 +372,16 @@ class BatchingProcessor(Processor[T, list[T]], Generic[T]):
 
     async def _create_batch(self) -> list[T]:
         """Create a batch from the current queue."""
+        return self._take_batch()
+
+    def _take_batch(self) -> list[T]:
+        """Take every queued item as a batch."""
         if not self._batch_queue:
             return []
 
         batch = list(self._batch_queue)
         self._batch_queue.clear()
+        self._queue_bytes = 0
         self._last_flush_time = time.time()
         self._batches_created += 1
 
@@ -216,8 +398,7 @@ class BatchingProcessor(Processor[T, list[T]], Generic[T]):
         Returns:
             List[T]: The current batch, empty list if no items queued
         """
-        async with self._batch_lock:
-            return await self._create_batch()
+        return self._take_batch()
 
     async def shutdown(self) -> None:
         """Shutdown the processor and ensure all items are processed.
@@ -251,14 +432,24 @@ class BatchingProcessor(Processor[T, list[T]], Generic[T]):
                 except asyncio.CancelledError:
                     pass
 
+            # Release process() calls waiting for queue space, they return their item as a single-item batch
+            if self._queue_space is not None:
+                async with self._queue_space:
+                    self._queue_space.notify_all()
+
+            # Let in-flight exports finish so their items are not lost
+            if self._export_tasks:
+                _, pending = await asyncio.wait(set(self._export_tasks), timeout=self._shutdown_timeout)
+                if pending:
+                    logger.warning("%d exports still running after %s seconds", len(pending), self._shutdown_timeout)
+
             # Create final batch from remaining items
-            async with self._batch_lock:
-                if self._batch_queue:
-                    self._final_batch = await self._create_batch()
-                    logger.info("Created final batch of %d items during shutdown", len(self._final_batch))
-                else:
-                    self._final_batch = []
-                    logger.info("No items remaining during shutdown")
+            if self._batch_queue:
+                self._final_batch = self._take_batch()
+                logger.info("Created final batch of %d items during shutdown", len(self._final_batch))
+            else:
+                self._final_batch = []
+                logger.info("No items remaining during shutdown")
 
             self._shutdown_complete = True
             self._shutdown_complete_event.set()
@@ -312,5 +503,24 @@ class BatchingProcessor(Processor[T, list[T]], Generic[T]):
             "final_batch_size": len(self._final_batch) if self._final_batch else 0,
             "final_batch_processed": self._final_batch_processed,
             "avg_items_per_batch": self._items_processed / max(1, self._batches_created),
-            "drop_rate": self._items_dropped / max(1, self._items_processed) * 100 if self._items_processed > 0 else 0
+            "drop_rate": self._items_dropped / max(1, self._items_processed) * 100 if self._items_processed > 0 else 0,
+            "adaptive": self._adaptive,
+            "current_batch_size": self._current_batch_size,
+            "queue_bytes": self._queue_bytes,
+            "max_batch_bytes": self._max_batch_bytes,
+            "target_export_latency": self._target_export_latency,
+            "max_concurrent_exports": self._max_concurrent_exports,
+            "in_flight_exports": len(self._export_tasks),
+            "pending_export_items": self._pending_export_items,
+            "exports": self._exports,
+            "export_errors": self._export_errors,
+            "export_latency_avg": self._export_latency_sum / self._exports if self._exports else 0.0,
+            "export_latency_ewma": self._export_latency_ewma or 0.0,
+            "export_latency_histogram": self._export_latency_histogram()
         }
+
+    def _export_latency_histogram(self) -> dict[str, int]:
+        """Number of exports per latency bucket, keyed by the bucket's upper bound in seconds."""
+        histogram = {f"le_{bound}": count for bound, count in zip(EXPORT_LATENCY_BUCKETS, self._export_latency_buckets)}
+        histogram["le_inf"] = self._export_latency_buckets[-1]
+        return histogram
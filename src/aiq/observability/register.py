@@ -22,6 +22,7 @@ from aiq.cli.register_workflow import register_logging_method
 from aiq.cli.register_workflow import register_telemetry_exporter
 from aiq.data_models.logging import LoggingBaseConfig
 from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
+from aiq.observability.mixin.file_mode import FileCompression
 from aiq.observability.mixin.file_mode import FileMode
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,12 @@ class FileTelemetryExporterConfig(TelemetryExporterBaseConfig, name="file"):
         description="Maximum file size in bytes before rolling to a new file.")
     max_files: int = Field(default=5, description="Maximum number of rolled files to keep.")
     cleanup_on_init: bool = Field(default=False, description="Clean up old files during initialization.")
+    compression: FileCompression = Field(
+        default=FileCompression.NONE,
+        description="Compression applied to rolled files: 'none', 'gzip' or 'zstd' (requires `zstandard`).")
+    buffer_size: int = Field(default=10000,
+                             description="Maximum number of lines buffered in memory for the file writer thread.",
+                             ge=1)
 
 
 @register_telemetry_exporter(config_type=FileTelemetryExporterConfig)
@@ -58,7 +65,9 @@ async def file_telemetry_exporter(config: FileTelemetryExporterConfig, builder:
                        enable_rolling=config.enable_rolling,
                        max_file_size=config.max_file_size,
                        max_files=config.max_files,
-                       cleanup_on_init=config.cleanup_on_init)
+                       cleanup_on_init=config.cleanup_on_init,
+                       compression=config.compression,
+                       buffer_size=config.buffer_size)
 
 
 class ConsoleLoggingMethodConfig(LoggingBaseConfig, name="console"):
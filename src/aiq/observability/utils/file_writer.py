@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import logging
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+from typing import BinaryIO
+
+logger = logging.getLogger(__name__)
+
+# Writers still holding buffered lines when the interpreter exits are flushed by ``_close_all_writers``
+_open_writers: "weakref.WeakSet[BufferedFileWriter]" = weakref.WeakSet()
+
+
+class BufferedFileWriter:
+    """Append lines to a file from a dedicated writer thread.
+
+    Producers hand lines to a bounded in-memory buffer and return immediately. The writer thread drains the whole
+    buffer at once and writes it with a single ``writelines`` call, keeping track of the file size itself so rolling
+    never needs a ``stat`` call. The thread starts on the first write and stops on ``close``; writing again after
+    ``close`` starts a new one.
+
+    Args:
+        path (Path): The file to write to.
+        overwrite (bool): Truncate the file the first time it is opened instead of appending to it.
+        max_file_size (int | None): Size in bytes at which the file is rolled. None disables rolling.
+        on_roll (Callable[[Path], None] | None): Called from the writer thread with the closed file once it reaches
+            ``max_file_size``. It is expected to move the file away, a new file is started at ``path`` afterwards.
+        buffer_size (int): Maximum number of lines waiting to be written.
+    """
+
+    def __init__(self,
+                 path: Path,
+                 *,
+                 overwrite: bool = False,
+                 max_file_size: int | None = None,
+                 on_roll: Callable[[Path], None] | None = None,
+                 buffer_size: int = 10000):
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+
+        self._path = path
+        self._overwrite = overwrite
+        self._max_file_size = max_file_size
+        self._on_roll = on_roll
+        self._buffer_size = buffer_size
+
+        self._condition = threading.Condition()
+        self._pending: list[str] = []
+        self._enqueued = 0
+        self._written = 0
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+        # Only touched by the writer thread
+        self._file: BinaryIO | None = None
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Size in bytes of the current file as tracked by the writer, without the lines still buffered."""
+        return self._size
+
+    @property
+    def pending(self) -> int:
+        """Number of lines waiting to be written."""
+        return len(self._pending)
+
+    def put_nowait(self, lines: list[str]) -> bool:
+        """Queue lines for writing without blocking.
+
+        Returns:
+            bool: False if the buffer does not have room for the lines, nothing is queued in that case.
+        """
+        with self._condition:
+            # A batch larger than the whole buffer is accepted when the buffer is empty so it can never block forever
+            if self._pending and len(self._pending) + len(lines) > self._buffer_size:
+                return False
+            self._enqueue(lines)
+            return True
+
+    def put(self, lines: list[str], timeout: float | None = None) -> bool:
+        """Queue lines for writing, waiting for the writer thread to make room if the buffer is full.
+
+        Returns:
+            bool: False if there was still no room after ``timeout`` seconds.
+        """
+        with self._condition:
+            has_room = self._condition.wait_for(
+                lambda: not self._pending or len(self._pending) + len(lines) <= self._buffer_size, timeout)
+            if not has_room:
+                return False
+            self._enqueue(lines)
+            return True
+
+    def _enqueue(self, lines: list[str]) -> None:
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name=f"file-writer-{self._path.name}", daemon=True)
+            self._thread.start()
+            _open_writers.add(self)
+
+        self._pending.extend(lines)
+        self._enqueued += len(lines)
+        self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every line queued so far has been written to the file.
+
+        Returns:
+            bool: False if the lines were not written within ``timeout`` seconds.
+        """
+        with self._condition:
+            target = self._enqueued
+            return self._condition.wait_for(lambda: self._written >= target or self._thread is None, timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Write every buffered line, then stop the writer thread and close the file."""
+        with self._condition:
+            thread = self._thread
+            if thread is None:
+                return
+            self._stopping = True
+            self._condition.notify_all()
+
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("Writer thread for %s did not finish within %s seconds", self._path, timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._stopping)
+                batch, self._pending = self._pending, []
+                if not batch and self._stopping:
+                    self._close_file()
+                    self._thread = None
+                    _open_writers.discard(self)
+                    self._condition.notify_all()
+                    return
+                # Producers blocked on a full buffer can go ahead while this batch is written
+                self._condition.notify_all()
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error("Error writing %d lines to %s: %s", len(batch), self._path, e, exc_info=True)
+                self._close_file()
+
+            with self._condition:
+                self._written += len(batch)
+                self._condition.notify_all()
+
+    def _open_file(self) -> BinaryIO:
+        if self._file is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._path, "wb" if self._overwrite else "ab")  # pylint: disable=consider-using-with
+            # Only the first open may truncate, later opens (after a roll or an error) append
+            self._overwrite = False
+            self._size = os.fstat(self._file.fileno()).st_size
+        return self._file
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError as e:
+                logger.error("Error closing %s: %s", self._path, e)
+            self._file = None
+
+    def _write_batch(self, batch: list[str]) -> None:
+        file = self._open_file()
+        chunk: list[bytes] = []
+
+        for line in batch:
+            if self._max_file_size is not None and self._size >= self._max_file_size:
+                file.writelines(chunk)
+                chunk = []
+                file = self._roll()
+
+            data = f"{line}\n".encode("utf-8")
+            chunk.append(data)
+            self._size += len(data)
+
+        file.writelines(chunk)
+        file.flush()
+
+    def _roll(self) -> BinaryIO:
+        self._close_file()
+        try:
+            if self._on_roll is not None:
+                self._on_roll(self._path)
+            return self._open_file()
+        except Exception as e:
+            logger.error("Error rolling %s: %s", self._path, e, exc_info=True)
+            file = self._open_file()
+            # Keep writing to the oversized file rather than retrying the roll for every line
+            self._size = 0
+            return file
+
+
+@atexit.register
+def _close_all_writers() -> None:
+    for writer in list(_open_writers):
+        writer.close(timeout=10.0)
@@ -562,7 +562,9 @@ class CalcRunner:
             configs[concurrency] = config
 
         # Instantiate the multi-evaluation run config with the overrides for each concurrency
-        config = MultiEvaluationRunConfig(configs=configs)
+        config = MultiEvaluationRunConfig(configs=configs,
+                                          max_parallel_runs=self.config.max_parallel_runs,
+                                          checkpoint_dir=self.config.checkpoint_dir)
 
         # Instantiate and run multi-evaluation runner
         runner = MultiEvaluationRunner(config)
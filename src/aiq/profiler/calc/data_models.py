@@ -59,6 +59,10 @@ class CalcRunnerConfig(BaseModel):
     num_passes: int = 0
     # concurrency values to test
     concurrencies: list[int] = [1, 2, 4, 8]
+    # number of concurrency values tested at the same time, runs sharing an LLM backend affect each other's latencies
+    max_parallel_runs: int = 1
+    # if set, the completed items of every run are checkpointed to this directory and an interrupted run resumes
+    checkpoint_dir: Path | None = None
 
     # Targets for GPU estimation
     target_llm_latency_p95: float = 0
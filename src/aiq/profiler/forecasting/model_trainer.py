@@ -18,9 +18,11 @@
 import logging
 
 from aiq.profiler.forecasting.config import DEFAULT_MODEL_TYPE
+from aiq.profiler.forecasting.models import ExponentiallyWeightedModel
 from aiq.profiler.forecasting.models import ForecastingBaseModel
 from aiq.profiler.forecasting.models import LinearModel
 from aiq.profiler.forecasting.models import RandomForestModel
+from aiq.profiler.forecasting.models import RecursiveLeastSquaresModel
 from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
 
 logger = logging.getLogger(__name__)
@@ -36,6 +38,10 @@ def create_model(model_type: str) -> ForecastingBaseModel:
         return LinearModel()
     if model_type == "randomforest":
         return RandomForestModel()
+    if model_type == "online_linear":
+        return RecursiveLeastSquaresModel()
+    if model_type == "exponentially_weighted":
+        return ExponentiallyWeightedModel()
 
     raise ValueError(f"Unsupported model_type: {model_type}")
 
@@ -48,7 +54,8 @@ class ModelTrainer:
     Parameters
     ----------
     model_type: str, default = "randomforest"
-        The type of model to train. Options include "linear" and "randomforest".
+        The type of model to train. Options include "linear", "randomforest" and the
+        incremental "online_linear" and "exponentially_weighted", which do not need scikit-learn.
     """
 
     def __init__(self, model_type: str = DEFAULT_MODEL_TYPE):
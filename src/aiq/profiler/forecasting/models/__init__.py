@@ -15,8 +15,18 @@
 
 # forecasting/models/__init__.py
 
+from .exponentially_weighted_model import ExponentiallyWeightedModel
 from .forecasting_base_model import ForecastingBaseModel
+from .incremental_model import IncrementalForecastingModel
 from .linear_model import LinearModel
 from .random_forest_regressor import RandomForestModel
+from .recursive_least_squares_model import RecursiveLeastSquaresModel
 
-__all__ = ["ForecastingBaseModel", "LinearModel", "RandomForestModel"]
+__all__ = [
+    "ExponentiallyWeightedModel",
+    "ForecastingBaseModel",
+    "IncrementalForecastingModel",
+    "LinearModel",
+    "RandomForestModel",
+    "RecursiveLeastSquaresModel",
+]
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+import numpy as np
+
+from aiq.profiler.forecasting.config import DEFAULT_MATRIX_LENGTH
+from aiq.profiler.forecasting.models.incremental_model import TARGET_COLUMNS
+from aiq.profiler.forecasting.models.incremental_model import IncrementalForecastingModel
+
+logger = logging.getLogger(__name__)
+
+
+class ExponentiallyWeightedModel(IncrementalForecastingModel):
+    """
+    Exponentially weighted mean and variance of the work left in a request, given how many LLM calls it has completed.
+
+    There is one estimator per number of completed calls, from 0 to ``matrix_length`` (requests with more calls share
+    the last one), so the state is a few dozen numbers, and each update costs O(1). Recent requests weigh more than old
+    ones, which makes the model follow workloads that drift. The variance gives an upper bound to admit requests on,
+    see ``predict_upper_bound``.
+
+    Parameters
+    ----------
+    matrix_length: int
+        Number of completed calls after which requests share the same estimator.
+    alpha: float, default = 0.05
+        Weight of each new sample, roughly the inverse of the number of requests remembered.
+    """
+
+    def __init__(self, matrix_length: int = DEFAULT_MATRIX_LENGTH, alpha: float = 0.05):
+        super().__init__(matrix_length)
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+
+        self.alpha = alpha
+        self.reset()
+
+    def reset(self) -> None:
+        shape = (self.matrix_length + 1, len(TARGET_COLUMNS))
+        self.counts = np.zeros(self.matrix_length + 1, dtype=np.int64)
+        self.means = np.zeros(shape)
+        self.variances = np.zeros(shape)
+        self.n_samples = 0
+
+    def update(self, requests_calls: list[np.ndarray]) -> None:
+        alpha = self.alpha
+        for calls in requests_calls:
+            if len(calls) == 0:
+                continue
+            _, targets = self.request_samples(calls)
+            positions = np.minimum(np.arange(len(targets)), self.matrix_length)
+            for position, y in zip(positions, targets):
+                if self.counts[position] == 0:
+                    self.means[position] = y
+                else:
+                    diff = y - self.means[position]
+                    self.means[position] += alpha * diff
+                    self.variances[position] = (1.0 - alpha) * (self.variances[position] + alpha * diff * diff)
+                self.counts[position] += 1
+            self.n_samples += len(targets)
+
+    def _position(self, calls: np.ndarray) -> int:
+        # Fall back to the closest position with fewer completed calls that has seen samples
+        position = min(len(calls), self.matrix_length)
+        seen = np.flatnonzero(self.counts[:position + 1])
+        return int(seen[-1]) if len(seen) else position
+
+    def predict_calls(self, calls: np.ndarray) -> np.ndarray:
+        return self.means[self._position(calls)].reshape(1, len(TARGET_COLUMNS)).copy()
+
+    def predict_upper_bound(self, calls: np.ndarray, z: float = 1.645) -> np.ndarray:
+        """
+        Mean plus ``z`` standard deviations of the work left in a running request, by default the one-sided 95% bound.
+        """
+        position = self._position(calls)
+        bound = self.means[position] + z * np.sqrt(self.variances[position])
+        return bound.reshape(1, len(TARGET_COLUMNS))
+
+    def _params(self) -> dict:
+        return {"matrix_length": self.matrix_length, "alpha": self.alpha}
+
+    def _state(self) -> dict[str, np.ndarray]:
+        return {"counts": self.counts, "means": self.means, "variances": self.variances}
+
+    def _set_state(self, state: dict[str, np.ndarray]) -> None:
+        if state["means"].shape != self.means.shape:
+            raise ValueError(f"Expected means of shape {self.means.shape} for matrix_length {self.matrix_length}, "
+                             f"got {state['means'].shape}")
+
+        self.counts = state["counts"].astype(np.int64)
+        self.means = state["means"].astype(np.float64)
+        self.variances = state["variances"].astype(np.float64)
@@ -0,0 +1,193 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+from abc import abstractmethod
+from pathlib import Path
+
+import numpy as np
+
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.profiler.forecasting.config import DEFAULT_MATRIX_LENGTH
+from aiq.profiler.forecasting.models.forecasting_base_model import ForecastingBaseModel
+from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
+
+logger = logging.getLogger(__name__)
+
+# Columns of an LLM call row
+CALL_COLUMNS = ("seconds_between_calls", "prompt_tokens", "completion_tokens", "llm_latency")
+
+# Columns of a prediction, the work a request still has to do
+TARGET_COLUMNS = ("remaining_llm_calls",
+                  "remaining_prompt_tokens",
+                  "remaining_completion_tokens",
+                  "remaining_llm_latency")
+
+
+def extract_llm_calls(steps: list[IntermediatePropertyAdaptor]) -> np.ndarray:
+    """
+    Turn the steps of one request into one row per completed LLM call, in the order the calls ended, with the columns
+    of ``CALL_COLUMNS``.
+    """
+    starts = {}
+    rows = []
+    for step in steps:
+        if step.event_type == IntermediateStepType.LLM_START:
+            starts[step.UUID] = (step.event_timestamp, step.seconds_between_calls)
+        elif step.event_type == IntermediateStepType.LLM_END and step.UUID in starts:
+            start_time, seconds_between_calls = starts.pop(step.UUID)
+            usage = step.token_usage
+            rows.append([
+                seconds_between_calls,
+                usage.prompt_tokens,
+                usage.completion_tokens,
+                step.event_timestamp - start_time,
+            ])
+
+    return np.asarray(rows, dtype=np.float64).reshape(-1, len(CALL_COLUMNS))
+
+
+class IncrementalForecastingModel(ForecastingBaseModel):
+    """
+    Base class of the forecasting models that learn one request at a time.
+
+    A request with ``T`` LLM calls gives ``T`` samples, one before each call. The features of a sample are the
+    ``matrix_length`` previous calls (zero padded at the top, so the first sample of every request has all-zero
+    features and teaches the model what a new request costs) and the target is the work left in the request, the
+    columns of ``TARGET_COLUMNS``.
+
+    Updates cost O(new calls), the state has a fixed size that does not depend on the amount of data seen, and is saved
+    as a compressed ``.npz`` file so it can be loaded at serve time to take admission decisions.
+    """
+
+    def __init__(self, matrix_length: int = DEFAULT_MATRIX_LENGTH):
+        super().__init__()
+        self.matrix_length = matrix_length
+        self.n_samples = 0
+
+    @property
+    def n_features(self) -> int:
+        return self.matrix_length * len(CALL_COLUMNS)
+
+    def request_samples(self, calls: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Features and targets of every sample of one request, given its LLM call rows.
+        """
+        n_calls = len(calls)
+        padded = np.vstack((np.zeros((self.matrix_length, len(CALL_COLUMNS))), calls))
+        # Window i holds the calls before call i
+        windows = np.lib.stride_tricks.sliding_window_view(padded, self.matrix_length, axis=0)[:n_calls]
+        features = windows.transpose(0, 2, 1).reshape(n_calls, self.n_features)
+
+        remaining = np.column_stack((np.ones(n_calls), calls[:, 1:]))
+        targets = np.flip(np.cumsum(np.flip(remaining, axis=0), axis=0), axis=0)
+        return features, targets
+
+    def features(self, calls: np.ndarray) -> np.ndarray:
+        """
+        Features of a running request, given the LLM calls it has completed so far.
+        """
+        calls = np.asarray(calls, dtype=np.float64).reshape(-1, len(CALL_COLUMNS))[-self.matrix_length:]
+        padded = np.vstack((np.zeros((self.matrix_length - len(calls), len(CALL_COLUMNS))), calls))
+        return padded.reshape(1, self.n_features)
+
+    @abstractmethod
+    def reset(self) -> None:
+        """
+        Forget everything the model has learned.
+        """
+        pass
+
+    @abstractmethod
+    def update(self, requests_calls: list[np.ndarray]) -> None:
+        """
+        Learn from completed requests, each given as its LLM call rows.
+        """
+        pass
+
+    @abstractmethod
+    def predict_calls(self, calls: np.ndarray) -> np.ndarray:
+        """
+        Predict the work left in a running request from the LLM calls it has completed so far, an empty array for a
+        request that has not started. Returns shape (1, 4), the columns of ``TARGET_COLUMNS``.
+        """
+        pass
+
+    def predict_new_request(self) -> dict[str, float]:
+        """
+        Predict the work of a request that has not started, keyed by the columns of ``TARGET_COLUMNS``.
+        """
+        prediction = self.predict_calls(np.empty((0, len(CALL_COLUMNS))))[0]
+        return dict(zip(TARGET_COLUMNS, prediction.tolist()))
+
+    def partial_fit(self, raw_stats: list[list[IntermediatePropertyAdaptor]]):
+        """
+        Update the model with new completed requests.
+        """
+        self.update([extract_llm_calls(steps) for steps in raw_stats])
+
+    def fit(self, raw_stats: list[list[IntermediatePropertyAdaptor]]):
+        self.reset()
+        self.partial_fit(raw_stats)
+        logger.info("Trained %s on %d samples", type(self).__name__, self.n_samples)
+
+    def predict(self, raw_stats: list[list[IntermediatePropertyAdaptor]]) -> np.ndarray:
+        """
+        Predict the work left in the running request ``raw_stats[0]``. Returns shape (1, 4).
+        """
+        return self.predict_calls(extract_llm_calls(raw_stats[0]) if raw_stats else np.empty((0, len(CALL_COLUMNS))))
+
+    @abstractmethod
+    def _params(self) -> dict:
+        pass
+
+    @abstractmethod
+    def _state(self) -> dict[str, np.ndarray]:
+        pass
+
+    @abstractmethod
+    def _set_state(self, state: dict[str, np.ndarray]) -> None:
+        pass
+
+    def save(self, path: Path) -> None:
+        """
+        Save the model to a compressed ``.npz`` file.
+        """
+        meta = {"type": type(self).__name__, "params": self._params(), "n_samples": self.n_samples}
+        with open(path, "wb") as f:
+            np.savez_compressed(f, meta=np.array(json.dumps(meta)), **self._state())
+
+    @classmethod
+    def load(cls, path: Path) -> "IncrementalForecastingModel":
+        """
+        Load a model saved with ``save``. Called on the base class, it returns an instance of the saved model's class.
+        """
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            state = {key: data[key] for key in data.files if key != "meta"}
+
+        model_cls = next((c for c in _subclasses(IncrementalForecastingModel) if c.__name__ == meta["type"]), None)
+        if model_cls is None or not issubclass(model_cls, cls):
+            raise ValueError(f"{path} holds a {meta['type']} model, which is not a {cls.__name__}")
+
+        model = model_cls(**meta["params"])
+        model._set_state(state)
+        model.n_samples = meta["n_samples"]
+        return model
+
+
+def _subclasses(cls: type) -> list[type]:
+    return [sub for direct in cls.__subclasses__() for sub in (direct, *_subclasses(direct))]
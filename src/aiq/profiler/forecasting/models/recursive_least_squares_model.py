@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+import numpy as np
+
+from aiq.profiler.forecasting.config import DEFAULT_MATRIX_LENGTH
+from aiq.profiler.forecasting.models.incremental_model import CALL_COLUMNS
+from aiq.profiler.forecasting.models.incremental_model import TARGET_COLUMNS
+from aiq.profiler.forecasting.models.incremental_model import IncrementalForecastingModel
+
+logger = logging.getLogger(__name__)
+
+
+class RecursiveLeastSquaresModel(IncrementalForecastingModel):
+    """
+    Online linear regression fitted with recursive least squares.
+
+    The model keeps the weights and the inverse of the (regularized, exponentially forgotten) feature covariance, both
+    of size ``matrix_length * 4 + 1``, and updates them one sample at a time, so learning from new requests costs
+    O(new samples) and gives the same weights as refitting a ridge regression on all the data seen so far.
+
+    Parameters
+    ----------
+    matrix_length: int
+        Number of previous LLM calls in the features.
+    forgetting_factor: float, default = 1.0
+        Weight of the past at each sample, lower than 1 to track workloads that drift.
+    regularization: float, default = 1e-3
+        Ridge penalty the inverse covariance starts from.
+    """
+
+    def __init__(self,
+                 matrix_length: int = DEFAULT_MATRIX_LENGTH,
+                 forgetting_factor: float = 1.0,
+                 regularization: float = 1e-3):
+        super().__init__(matrix_length)
+        if not 0.0 < forgetting_factor <= 1.0:
+            raise ValueError("forgetting_factor must be in (0, 1]")
+        if regularization <= 0.0:
+            raise ValueError("regularization must be positive")
+
+        self.forgetting_factor = forgetting_factor
+        self.regularization = regularization
+        self.reset()
+
+    def reset(self) -> None:
+        n_inputs = self.n_features + 1
+        self.weights = np.zeros((n_inputs, len(TARGET_COLUMNS)))
+        self.inverse_covariance = np.eye(n_inputs) / self.regularization
+        self.n_samples = 0
+
+    def update(self, requests_calls: list[np.ndarray]) -> None:
+        forgetting_factor = self.forgetting_factor
+        weights = self.weights
+        inverse_covariance = self.inverse_covariance
+
+        for calls in requests_calls:
+            if len(calls) == 0:
+                continue
+            features, targets = self.request_samples(calls)
+            features = np.column_stack((features, np.ones(len(features))))
+            for x, y in zip(features, targets):
+                px = inverse_covariance @ x
+                gain = px / (forgetting_factor + x @ px)
+                weights += np.outer(gain, y - x @ weights)
+                inverse_covariance -= np.outer(gain, px)
+                if forgetting_factor != 1.0:
+                    inverse_covariance /= forgetting_factor
+            self.n_samples += len(features)
+
+        # Keep the inverse covariance symmetric despite rounding errors
+        inverse_covariance += inverse_covariance.T
+        inverse_covariance /= 2.0
+
+    def predict_calls(self, calls: np.ndarray) -> np.ndarray:
+        x = np.append(self.features(calls), 1.0)
+        return np.maximum(x @ self.weights, 0.0).reshape(1, len(TARGET_COLUMNS))
+
+    def _params(self) -> dict:
+        return {
+            "matrix_length": self.matrix_length,
+            "forgetting_factor": self.forgetting_factor,
+            "regularization": self.regularization,
+        }
+
+    def _state(self) -> dict[str, np.ndarray]:
+        # The inverse covariance is symmetric, only its upper triangle is stored
+        return {
+            "weights": self.weights,
+            "inverse_covariance": self.inverse_covariance[np.triu_indices(self.n_features + 1)],
+        }
+
+    def _set_state(self, state: dict[str, np.ndarray]) -> None:
+        n_inputs = self.n_features + 1
+        expected = (n_inputs, len(TARGET_COLUMNS))
+        if state["weights"].shape != expected:
+            raise ValueError(f"Expected weights of shape {expected} for {len(CALL_COLUMNS)} columns and "
+                             f"matrix_length {self.matrix_length}, got {state['weights'].shape}")
+
+        self.weights = state["weights"].astype(np.float64)
+        upper = np.zeros((n_inputs, n_inputs))
+        upper[np.triu_indices(n_inputs)] = state["inverse_covariance"]
+        self.inverse_covariance = upper + np.triu(upper, 1).T
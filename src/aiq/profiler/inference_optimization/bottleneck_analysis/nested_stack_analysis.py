@@ -32,9 +32,12 @@ An enhanced script that:
 import logging
 import os
 
+import numpy as np
 import pandas as pd
 
 from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.profiler.inference_optimization.concurrency_timeline import ConcurrencyTimeline
 from aiq.profiler.inference_optimization.data_models import CallNode
 from aiq.profiler.inference_optimization.data_models import ConcurrencyDistribution
 from aiq.profiler.inference_optimization.data_models import NestedCallProfilingResult
@@ -48,102 +51,131 @@ logger = logging.getLogger(__name__)
 # --------------------------------------------------------------------------------
 
 
-def build_call_tree_for_example(example_df: pd.DataFrame) -> list[CallNode]:
-    """
-    Stack-based approach for a single example:
+def _parse_op_type(evt: str) -> str | None:
+    evt = evt.upper()
+    if evt.startswith("LLM_"):
+        return "LLM"
+    if evt.startswith("TOOL_"):
+        return "TOOL"
+    if evt.startswith("FUNCTION_"):
+        return "FUNCTION"
+    if evt.startswith("SPAN_"):
+        return "FUNCTION"
+    return None
 
-    1. Sort events by timestamp ascending.
-    2. On `*_START` => push a new node, attach to parent's children if stack not empty.
-    3. On `*_END` => pop from stack if matches the top's UUID, finalize end_time/duration.
 
-    Returns:
-      A list of top-level calls for this example.
+# event_type -> (operation type, is START) for every START/END event the call tree is built from. IntermediateStepType
+# is a str enum, so the mapping matches both enum members and their plain string values.
+_TREE_EVENTS: dict[str, tuple[str, bool]] = {
+    evt.value: (_parse_op_type(evt.value), evt.value.endswith("_START"))
+    for evt in IntermediateStepType if _parse_op_type(evt.value) and evt.value.endswith(("_START", "_END"))
+}
+
+_NAME_COLUMNS = {"LLM": "llm_name", "FUNCTION": "function_name", "TOOL": "tool_name"}
+_DEFAULT_NAMES = {"LLM": "unknown_llm", "FUNCTION": "unknown_function", "TOOL": "unknown_tool"}
+
+
+def _build_call_trees(df: pd.DataFrame) -> list[CallNode]:
     """
-    stack: list[CallNode] = []
-    top_level_dict: dict[str, CallNode] = {}
-    partial_map: dict[str, CallNode] = {}
-
-    def parse_op_type(evt: str) -> str | None:
-        evt = evt.upper()
-        if evt.startswith("LLM_"):
-            return "LLM"
-        if evt.startswith("TOOL_"):
-            return "TOOL"
-        if evt.startswith("FUNCTION_"):
-            return "FUNCTION"
-        if evt.startswith("SPAN_"):
-            return "FUNCTION"
-        return None
-
-    def get_op_name(row: pd.Series, op_type: str) -> str:
-        if op_type == "LLM":
-            return row.get("llm_name") or "unknown_llm"
-        if op_type == "FUNCTION":
-            return row.get("function_name") or "unknown_function"
-        if op_type == "TOOL":
-            return row.get("tool_name") or "unknown_tool"
-
-        return "unknown_op"
-
-    for _, row in example_df.iterrows():
-        et = row["event_type"].value.upper()
-        uuid = str(row["UUID"])
-        ts = float(row["event_timestamp"])
-
-        op_type = parse_op_type(et)
-        if not op_type:
-            # not an LLM_/TOOL_ event => skip
-            continue
-
-        if et.endswith("_START"):
-            name = get_op_name(row, op_type)
-            node = CallNode(uuid=uuid,
-                            operation_type=op_type,
-                            operation_name=name,
-                            start_time=ts,
-                            end_time=ts,
-                            duration=0.0,
-                            children=[],
-                            parent=None)
-            if stack:
-                parent = stack[-1]
-                node.parent = parent
-                parent.children.append(node)
-            else:
+    Walk events sorted by (example_number, event_timestamp) once, keeping a separate stack for each example.
+
+    The columns are pulled out of the DataFrame up front and events the tree ignores are dropped with a vectorized
+    lookup, so the loop only touches plain Python values. Calls are recorded as lists first and turned into
+    ``CallNode`` objects once their end time is known, which avoids pydantic's slow attribute assignment.
+    """
+    kinds = df["event_type"].map(_TREE_EVENTS)
+    keep = kinds.notna().to_numpy()
+    df = df[keep]
+
+    def column(name: str) -> list:
+        # Missing values come back as None rather than nan so they pass the node field validation
+        if name not in df.columns:
+            return [None] * len(df)
+        return df[name].astype(object).where(df[name].notna(), None).tolist()
+
+    names = {op_type: column(col) for op_type, col in _NAME_COLUMNS.items()}
+
+    # [uuid, operation_type, operation_name, start_time, end_time, duration, parent index]
+    calls: list[list] = []
+    root_indices: list[int] = []
+    stack: list[int] = []
+    top_level_dict: dict[str, int] = {}
+    partial_map: dict[str, int] = {}
+    current_example = None
+
+    rows = zip(column("example_number"), kinds[keep].tolist(), column("UUID"), column("event_timestamp"))
+    for i, (example_number, (op_type, is_start), uuid, ts) in enumerate(rows):
+        if example_number != current_example:
+            root_indices.extend(top_level_dict.values())
+            stack, top_level_dict, partial_map = [], {}, {}
+            current_example = example_number
+
+        uuid = str(uuid)
+        ts = float(ts)
+
+        if is_start:
+            name = names[op_type][i] or _DEFAULT_NAMES[op_type]
+            if not stack:
                 # top-level
-                top_level_dict[uuid] = node
+                top_level_dict[uuid] = len(calls)
 
-            stack.append(node)
-            partial_map[uuid] = node
+            stack.append(len(calls))
+            partial_map[uuid] = len(calls)
+            calls.append([uuid, op_type, name, ts, ts, 0.0, stack[-2] if len(stack) > 1 else -1])
 
-        elif et.endswith("_END"):
-            if uuid not in partial_map:
+        else:
+            index = partial_map.pop(uuid, None)
+            if index is None:
                 # no known start => skip
                 continue
-            node = partial_map[uuid]
-            if stack and stack[-1].uuid == uuid:
+            if stack and calls[stack[-1]][0] == uuid:
                 stack.pop()
 
-            node.end_time = ts
-            node.duration = max(0.0, ts - node.start_time)
-            del partial_map[uuid]
+            call = calls[index]
+            call[4] = ts
+            call[5] = max(0.0, ts - call[3])
 
     # partial calls remain in stack => they have no final end_time
     # we won't forcibly remove them
+    root_indices.extend(top_level_dict.values())
+
+    # Parents always start before their children, so they already exist when a child is created
+    nodes: list[CallNode] = []
+    for uuid, op_type, name, start_time, end_time, duration, parent_index in calls:
+        parent = nodes[parent_index] if parent_index >= 0 else None
+        node = CallNode(uuid=uuid,
+                        operation_type=op_type,
+                        operation_name=name,
+                        start_time=start_time,
+                        end_time=end_time,
+                        duration=duration,
+                        children=[],
+                        parent=parent)
+        if parent is not None:
+            parent.children.append(node)
+        nodes.append(node)
+
+    return [nodes[i] for i in root_indices]
 
-    # collect top-level nodes
-    roots = []
-    for _, node in top_level_dict.items():
-        if node.parent is None:
-            roots.append(node)
 
-    return roots
+def build_call_tree_for_example(example_df: pd.DataFrame) -> list[CallNode]:
+    """
+    Stack-based approach for a single example:
+
+    1. Sort events by timestamp ascending.
+    2. On `*_START` => push a new node, attach to parent's children if stack not empty.
+    3. On `*_END` => pop from stack if matches the top's UUID, finalize end_time/duration.
+
+    Returns:
+      A list of top-level calls for this example.
+    """
+    return _build_call_trees(example_df)
 
 
 def build_call_tree_per_example(all_steps: list[list[IntermediateStep]]) -> list[CallNode]:
     """
-    1) Group the DataFrame by example_number.
-    2) For each example, build a separate stack-based call tree.
+    1) Sort the DataFrame by example_number, then event_timestamp.
+    2) Walk it once, starting a new stack-based call tree whenever the example changes.
     3) Return a combined list of all top-level calls from all examples.
 
     This ensures no cross-example nesting.
@@ -155,19 +187,9 @@ def build_call_tree_per_example(all_steps: list[list[IntermediateStep]]) -> list
         raise ValueError(f"DataFrame missing required columns: {missing}")
 
     # Sort globally first (so each example is also in ascending time)
-    dfc = df.copy()
-    dfc.sort_values(["example_number", "event_timestamp"], inplace=True)
+    dfc = df.sort_values(["example_number", "event_timestamp"])
 
-    # We'll collect top-level calls for each example
-    all_roots: list[CallNode] = []
-
-    for _, group_df in dfc.groupby("example_number"):
-        # Build the call tree for this single example
-        # group_df is already sorted within this example
-        roots_for_example = build_call_tree_for_example(group_df)
-        all_roots.extend(roots_for_example)
-
-    return all_roots
+    return _build_call_trees(dfc)
 
 
 # --------------------------------------------------------------------------------
@@ -188,8 +210,11 @@ def compute_time_based_concurrency(roots: list[CallNode]) -> ConcurrencyDistribu
     ConcurrencyDistribution
         with the piecewise segments + concurrency percentiles.
     """
-    # Flatten
-    all_nodes = []
+    return _concurrency_distribution(ConcurrencyTimeline.from_nodes(_flatten(roots)))
+
+
+def _flatten(roots: list[CallNode]) -> list[CallNode]:
+    all_nodes: list[CallNode] = []
 
     def dfs(n: CallNode):
         all_nodes.append(n)
@@ -199,69 +224,15 @@ def compute_time_based_concurrency(roots: list[CallNode]) -> ConcurrencyDistribu
     for r in roots:
         dfs(r)
 
-    if not all_nodes:
-        return ConcurrencyDistribution(timeline_segments=[], p50=0, p90=0, p95=0, p99=0)
-
-    events = []
-    for n in all_nodes:
-        st = n.start_time
-        et = n.end_time
-        if st > et:
-            # partial or invalid => skip
-            continue
-        events.append((st, +1))
-        events.append((et, -1))
-
-    events.sort(key=lambda x: x[0])
-    timeline_segments: list[tuple[float, float, int]] = []
-    curr_concurrency = 0
-    prev_time = events[0][0]
-
-    for _, (t, delta) in enumerate(events):
-        if t > prev_time:
-            # segment is [prev_time, t) at concurrency=curr_concurrency
-            timeline_segments.append((prev_time, t, curr_concurrency))
-        curr_concurrency += delta
-        prev_time = t
-
-    # Summaries
-    total_time = 0.0
-    concurrency_durations: dict[int, float] = {}
-
-    for (seg_start, seg_end, c_val) in timeline_segments:
-        length = seg_end - seg_start
-        if length <= 0:
-            continue
-        total_time += length
-        concurrency_durations[c_val] = concurrency_durations.get(c_val, 0) + length
-
-    if total_time <= 0:
-        return ConcurrencyDistribution(timeline_segments=timeline_segments, p50=0, p90=0, p95=0, p99=0)
-
-    # Build concurrency-level distribution
-    sorted_levels = sorted(concurrency_durations.items(), key=lambda x: x[0])  # ascending concurrency
-
-    def concurrency_at_percentile(p: float) -> float:
-        threshold = total_time * (p / 100.0)
-        accum = 0.0
-        last_c = 0
-        for c_val, c_dur in sorted_levels:
-            accum += c_dur
-            if accum >= threshold:
-                return float(c_val)
-            last_c = c_val
-        return float(last_c)
-
-    p50_val = concurrency_at_percentile(50)
-    p90_val = concurrency_at_percentile(90)
-    p95_val = concurrency_at_percentile(95)
-    p99_val = concurrency_at_percentile(99)
-
-    return ConcurrencyDistribution(timeline_segments=timeline_segments,
-                                   p50=p50_val,
-                                   p90=p90_val,
-                                   p95=p95_val,
-                                   p99=p99_val)
+    return all_nodes
+
+
+def _concurrency_distribution(timeline: ConcurrencyTimeline) -> ConcurrencyDistribution:
+    return ConcurrencyDistribution(timeline_segments=timeline.segments(),
+                                   p50=timeline.percentile(50),
+                                   p90=timeline.percentile(90),
+                                   p95=timeline.percentile(95),
+                                   p99=timeline.percentile(99))
 
 
 def find_midpoint_concurrency(node: CallNode, segments: list[tuple[float, float, int]]) -> float:
@@ -365,26 +336,34 @@ def analyze_calls_and_build_result(roots: list[CallNode], output_dir: str | None
                                          textual_report="No calls found.")
 
     # Flatten all calls
-    all_nodes: list[CallNode] = []
-
-    def dfs(n: CallNode):
-        all_nodes.append(n)
-        for c in n.children:
-            dfs(c)
-
-    for r in roots:
-        dfs(r)
+    all_nodes = _flatten(roots)
 
     # 1) concurrency across all calls
-    concurrency_info = compute_time_based_concurrency(roots)
+    timeline = ConcurrencyTimeline.from_nodes(all_nodes)
+    concurrency_info = _concurrency_distribution(timeline)
 
     # 2) build NodeMetrics
-    node_metrics_map: dict[str, NodeMetrics] = {}
-    for node in all_nodes:
+    starts = np.fromiter((n.start_time for n in all_nodes), dtype=np.float64, count=len(all_nodes))
+    ends = np.fromiter((n.end_time for n in all_nodes), dtype=np.float64, count=len(all_nodes))
+    midpoints = np.where(starts >= ends, starts, 0.5 * (starts + ends))
+    mid_concurrency = timeline.concurrency_at(midpoints).astype(np.float64).tolist()
+
+    # all_nodes is in DFS pre-order, so walking it backwards visits every child before its parent and each
+    # subtree_time is computed once instead of once per ancestor
+    self_times: dict[int, float] = {}
+    subtree_times: dict[int, float] = {}
+    for node in reversed(all_nodes):
         self_t = node.compute_self_time()
-        subtree_t = node.compute_subtree_time()
+        subtree_t = self_t
+        for c in node.children:
+            subtree_t += subtree_times[id(c)]
+        self_times[id(node)] = self_t
+        subtree_times[id(node)] = subtree_t
+
+    node_metrics_map: dict[str, NodeMetrics] = {}
+    for node, mid_conc in zip(all_nodes, mid_concurrency):
+        subtree_t = subtree_times[id(node)]
         bscore = subtree_t
-        mid_conc = find_midpoint_concurrency(node, concurrency_info.timeline_segments)
 
         m = NodeMetrics(uuid=node.uuid,
                         operation_type=node.operation_type,
@@ -392,7 +371,7 @@ def analyze_calls_and_build_result(roots: list[CallNode], output_dir: str | None
                         start_time=node.start_time,
                         end_time=node.end_time,
                         duration=node.duration,
-                        self_time=self_t,
+                        self_time=self_times[id(node)],
                         subtree_time=subtree_t,
                         concurrency_midpoint=mid_conc,
                         bottleneck_score=bscore)
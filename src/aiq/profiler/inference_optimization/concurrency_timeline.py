@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Vectorized concurrency timeline shared by the bottleneck and concurrency spike analyses.
+
+Calls are given as parallel arrays of start and end times. The timeline is built with a single sorted sweep over the
+``(time, +1/-1)`` events: a cumulative sum gives the concurrency after every event, and the value after the last
+event at each distinct time is the concurrency of the segment that starts there.
+"""
+
+import numpy as np
+
+from aiq.profiler.inference_optimization.data_models import CallNode
+
+
+class ConcurrencyTimeline:
+    """
+    Piecewise-constant concurrency over time, stored as three parallel arrays of segment start, segment end and
+    number of calls in flight. Segments are contiguous, sorted and never empty.
+    """
+
+    def __init__(self, seg_starts: np.ndarray, seg_ends: np.ndarray, levels: np.ndarray):
+        self.seg_starts = seg_starts
+        self.seg_ends = seg_ends
+        self.levels = levels
+
+    @classmethod
+    def from_intervals(cls, starts: np.ndarray, ends: np.ndarray) -> "ConcurrencyTimeline":
+        """
+        Build the timeline from call start and end times. Calls ending before they start are ignored.
+        """
+        starts = np.asarray(starts, dtype=np.float64)
+        ends = np.asarray(ends, dtype=np.float64)
+        valid = starts <= ends
+        starts = starts[valid]
+        ends = ends[valid]
+
+        if len(starts) == 0:
+            empty = np.empty(0, dtype=np.float64)
+            return cls(empty, empty, np.empty(0, dtype=np.int64))
+
+        times = np.concatenate((starts, ends))
+        deltas = np.concatenate((np.ones(len(starts), dtype=np.int64), np.full(len(ends), -1, dtype=np.int64)))
+
+        order = np.argsort(times, kind="stable")
+        times = times[order]
+        concurrency = np.cumsum(deltas[order])
+
+        # The concurrency of a segment is the one after *all* events at its start time have been applied
+        last_at_time = np.flatnonzero(np.append(times[1:] != times[:-1], True))
+        unique_times = times[last_at_time]
+
+        return cls(unique_times[:-1], unique_times[1:], concurrency[last_at_time][:-1])
+
+    @classmethod
+    def from_nodes(cls, nodes: list[CallNode]) -> "ConcurrencyTimeline":
+        starts = np.fromiter((n.start_time for n in nodes), dtype=np.float64, count=len(nodes))
+        ends = np.fromiter((n.end_time for n in nodes), dtype=np.float64, count=len(nodes))
+        return cls.from_intervals(starts, ends)
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def segments(self) -> list[tuple[float, float, int]]:
+        """
+        Return the timeline as a list of ``(start, end, concurrency)`` tuples.
+        """
+        return list(zip(self.seg_starts.tolist(), self.seg_ends.tolist(), self.levels.tolist()))
+
+    def distribution(self) -> dict[int, float]:
+        """
+        Total time spent at each concurrency level that occurs on the timeline.
+        """
+        if len(self.levels) == 0:
+            return {}
+
+        durations = np.bincount(self.levels, weights=self.seg_ends - self.seg_starts)
+        present = np.unique(self.levels)
+        return dict(zip(present.tolist(), durations[present].tolist()))
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Lowest concurrency level at which at least ``percentile`` percent of the observed time is covered.
+        """
+        if len(self.levels) == 0:
+            return 0.0
+
+        durations = np.bincount(self.levels, weights=self.seg_ends - self.seg_starts)
+        accumulated = np.cumsum(durations)
+        total_time = accumulated[-1]
+        if total_time <= 0:
+            return 0.0
+
+        index = np.searchsorted(accumulated, total_time * (percentile / 100.0), side="left")
+        return float(min(index, len(durations) - 1))
+
+    def concurrency_at(self, times: np.ndarray) -> np.ndarray:
+        """
+        Concurrency at each of ``times``, ``0`` for times outside of the timeline.
+        """
+        times = np.asarray(times, dtype=np.float64)
+        if len(self.levels) == 0:
+            return np.zeros(len(times), dtype=np.int64)
+
+        index = np.searchsorted(self.seg_starts, times, side="right") - 1
+        clipped = np.clip(index, 0, None)
+        inside = (index >= 0) & (times < self.seg_ends[clipped])
+        return np.where(inside, self.levels[clipped], 0)
@@ -35,6 +35,8 @@ import numpy as np
 import pandas as pd
 
 from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.profiler.inference_optimization.concurrency_timeline import ConcurrencyTimeline
 from aiq.profiler.inference_optimization.data_models import ConcurrencyAnalysisResult
 from aiq.profiler.inference_optimization.data_models import ConcurrencyCallNode
 from aiq.profiler.inference_optimization.data_models import ConcurrencyCorrelationStats
@@ -46,101 +48,134 @@ from aiq.profiler.utils import create_standardized_dataframe
 # --------------------------------------------------------------------------------
 
 
-def build_call_tree_for_example(example_df: pd.DataFrame) -> list[ConcurrencyCallNode]:
+def _parse_op_type(et: str) -> str | None:
+    et = et.upper()
+    if et.startswith("LLM_"):
+        return "LLM"
+    if et.startswith("TOOL_"):
+        return "TOOL"
+    return None
+
+
+# event_type -> (operation type, is START) for the LLM/TOOL START and END events, matches both IntermediateStepType
+# members and their string values
+_CALL_EVENTS: dict[str, tuple[str, bool]] = {
+    evt.value: (_parse_op_type(evt.value), evt.value.endswith("_START"))
+    for evt in IntermediateStepType if _parse_op_type(evt.value) and evt.value.endswith(("_START", "_END"))
+}
+
+_NAME_COLUMNS = {"LLM": "llm_name", "TOOL": "tool_name"}
+_DEFAULT_NAMES = {"LLM": "unknown_llm", "TOOL": "unknown_tool"}
+
+
+def _build_call_trees(df: pd.DataFrame) -> list[ConcurrencyCallNode]:
     """
-    Sort events by time, push on `*_START`, pop on `*_END`, build stack-based calls for a single example.
+    Walk events sorted by (example_number, event_timestamp) once over plain column lists, starting a new stack
+    whenever the example changes. Calls are recorded as dicts of field values and only turned into
+    ``ConcurrencyCallNode`` objects at the end, which avoids pydantic's slow attribute assignment.
     """
-    stack: list[ConcurrencyCallNode] = []
-    top_level: dict[str, ConcurrencyCallNode] = {}
-    partial_map: dict[str, ConcurrencyCallNode] = {}
-
-    def parse_op_type(et: str) -> str | None:
-        et = et.upper()
-        if et.startswith("LLM_"):
-            return "LLM"
-        if et.startswith("TOOL_"):
-            return "TOOL"
-        return None
-
-    def get_op_name(row: pd.Series, op_type: str) -> str:
-        if op_type == "LLM":
-            return row.get("llm_name") or "unknown_llm"
-        if op_type == "TOOL":
-            return row.get("tool_name") or "unknown_tool"
-        return "unknown_op"
-
-    example_num = int(example_df["example_number"].iloc[0])
-
-    for _, row in example_df.iterrows():
-        et = row["event_type"].value.upper()
-        uuid = str(row["UUID"])
-        ts = float(row["event_timestamp"])
-        op_type = parse_op_type(et)
-        if not op_type:
-            continue
-
-        if et.endswith("_START"):
-            op_name = get_op_name(row, op_type)
-            node = ConcurrencyCallNode(
-                uuid=uuid,
-                example_number=example_num,
-                operation_type=op_type,
-                operation_name=op_name,
-                start_time=ts,
-                end_time=ts,  # updated on END
-                duration=0.0)
-            if stack:
-                parent = stack[-1]
-                node.parent = parent
-                parent.children.append(node)
-            else:
-                top_level[uuid] = node
-
-            stack.append(node)
-            partial_map[uuid] = node
-
-        elif et.endswith("_END"):
-            if uuid not in partial_map:
+    kinds = df["event_type"].map(_CALL_EVENTS)
+    keep = kinds.notna().to_numpy()
+    df = df[keep]
+
+    def column(name: str) -> list:
+        # Missing values come back as None rather than nan so they pass the node field validation
+        if name not in df.columns:
+            return [None] * len(df)
+        return df[name].astype(object).where(df[name].notna(), None).tolist()
+
+    names = {op_type: column(col) for op_type, col in _NAME_COLUMNS.items()}
+    prompt_tokens = column("prompt_tokens")
+    completion_tokens = column("completion_tokens")
+    total_tokens = column("total_tokens")
+    metadata = column("metadata")
+    llm_text_output = column("llm_text_output")
+
+    calls: list[dict] = []
+    parents: list[int] = []
+    root_indices: list[int] = []
+    stack: list[int] = []
+    top_level: dict[str, int] = {}
+    partial_map: dict[str, int] = {}
+    current_example = None
+
+    rows = zip(column("example_number"), kinds[keep].tolist(), column("UUID"), column("event_timestamp"))
+    for i, (example_number, (op_type, is_start), uuid, ts) in enumerate(rows):
+        if example_number != current_example:
+            root_indices.extend(top_level.values())
+            stack, top_level, partial_map = [], {}, {}
+            current_example = example_number
+
+        uuid = str(uuid)
+        ts = float(ts)
+
+        if is_start:
+            if not stack:
+                top_level[uuid] = len(calls)
+
+            parents.append(stack[-1] if stack else -1)
+            stack.append(len(calls))
+            partial_map[uuid] = len(calls)
+            calls.append({
+                "uuid": uuid,
+                "example_number": int(example_number),
+                "operation_type": op_type,
+                "operation_name": names[op_type][i] or _DEFAULT_NAMES[op_type],
+                "start_time": ts,
+                "end_time": ts,  # updated on END
+                "duration": 0.0
+            })
+
+        else:
+            index = partial_map.pop(uuid, None)
+            if index is None:
                 continue
-            node = partial_map[uuid]
-            node.end_time = ts
-            node.duration = max(0.0, node.end_time - node.start_time)
-            node.prompt_tokens = row.get("prompt_tokens")
-            node.completion_tokens = row.get("completion_tokens")
-            node.total_tokens = row.get("total_tokens")
-            node.tool_outputs = row.get("metadata").get("tool_outputs") if (
-                row.get("metadata") and row.get("metadata").get("tool_outputs")) else None
-            node.llm_text_output = row.get("llm_text_output")
-
-            if stack and stack[-1].uuid == uuid:
+            call = calls[index]
+            call["end_time"] = ts
+            call["duration"] = max(0.0, ts - call["start_time"])
+            call["prompt_tokens"] = prompt_tokens[i]
+            call["completion_tokens"] = completion_tokens[i]
+            call["total_tokens"] = total_tokens[i]
+            call["tool_outputs"] = metadata[i].get("tool_outputs") if (metadata[i]
+                                                                       and metadata[i].get("tool_outputs")) else None
+            call["llm_text_output"] = llm_text_output[i]
+
+            if stack and calls[stack[-1]]["uuid"] == uuid:
                 stack.pop()
-            del partial_map[uuid]
 
     # gather top-level
-    roots = []
-    for _, nd in top_level.items():
-        if nd.parent is None:
-            roots.append(nd)
-    return roots
+    root_indices.extend(top_level.values())
+
+    # Parents always start before their children, so they already exist when a child is created
+    nodes: list[ConcurrencyCallNode] = []
+    for call, parent_index in zip(calls, parents):
+        parent = nodes[parent_index] if parent_index >= 0 else None
+        node = ConcurrencyCallNode(**call, parent=parent)
+        if parent is not None:
+            parent.children.append(node)
+        nodes.append(node)
+
+    return [nodes[i] for i in root_indices]
+
+
+def build_call_tree_for_example(example_df: pd.DataFrame) -> list[ConcurrencyCallNode]:
+    """
+    Sort events by time, push on `*_START`, pop on `*_END`, build stack-based calls for a single example.
+    """
+    return _build_call_trees(example_df)
 
 
 def build_call_tree_per_example(df: pd.DataFrame) -> list[ConcurrencyCallNode]:
     """
-    Groups by example_number, builds separate call trees, returns combined list of top-level calls.
+    Sorts by example_number and time, builds separate call trees per example, returns combined list of top-level calls.
     """
     req_cols = {"example_number", "event_type", "UUID", "event_timestamp"}
     missing = req_cols - set(df.columns)
     if missing:
         raise ValueError(f"DataFrame missing required columns: {missing}")
 
-    dfc = df.copy()
-    dfc.sort_values(["example_number", "event_timestamp"], inplace=True)
-
-    all_roots: list[ConcurrencyCallNode] = []
-    for _, grp in dfc.groupby("example_number"):
-        r = build_call_tree_for_example(grp)
-        all_roots.extend(r)
-    return all_roots
+    dfc = df.sort_values(["example_number", "event_timestamp"])
+    return _build_call_trees(dfc)
 
 
 def flatten_calls(roots: list[ConcurrencyCallNode]) -> list[ConcurrencyCallNode]:
@@ -168,57 +203,14 @@ def compute_concurrency_distribution(roots: list[ConcurrencyCallNode]) -> dict[i
     """
     Flatten calls, produce (start, +1)/(end, -1), accumulate total time at each concurrency level.
     """
-    all_nodes = flatten_calls(roots)
-    if not all_nodes:
-        return {}
-
-    events = []
-    for n in all_nodes:
-        if n.start_time <= n.end_time:
-            events.append((n.start_time, +1))
-            events.append((n.end_time, -1))
-
-    events.sort(key=lambda x: x[0])
-    dist_map: dict[int, float] = {}
-    curr_conc = 0
-    prev_time = events[0][0]
-
-    for (time_val, delta) in events:
-        if time_val > prev_time:
-            length = time_val - prev_time
-            dist_map[curr_conc] = dist_map.get(curr_conc, 0.0) + length
-        curr_conc += delta
-        prev_time = time_val
-
-    return dist_map
+    return ConcurrencyTimeline.from_nodes(flatten_calls(roots)).distribution()
 
 
 def build_concurrency_segments(roots: list[ConcurrencyCallNode]) -> list[tuple[float, float, int]]:
     """
     Return piecewise segments of (start, end, concurrency) across all calls.
     """
-    all_nodes = flatten_calls(roots)
-    if not all_nodes:
-        return []
-
-    events = []
-    for n in all_nodes:
-        if n.start_time <= n.end_time:
-            events.append((n.start_time, +1))
-            events.append((n.end_time, -1))
-
-    events.sort(key=lambda x: x[0])
-    segments: list[tuple[float, float, int]] = []
-    curr_conc = 0
-    prev_time = events[0][0]
-
-    for (t, delta) in events:
-        if t > prev_time:
-            segments.append((prev_time, t, curr_conc))
-        curr_conc += delta
-        prev_time = t
-
-    return segments
+    return ConcurrencyTimeline.from_nodes(flatten_calls(roots)).segments()
 
 
 def find_percentile_concurrency(dist_map: dict[int, float], percentile: float) -> float:
@@ -282,22 +274,29 @@ def correlate_spike_calls(spikes: list[ConcurrencySpikeInfo], roots: list[Concur
     """
     For each spike, gather calls that overlap, compute average prompt_tokens, total_tokens across them.
     """
-    p_tokens = []
-    t_tokens = []
+    all_nodes = flatten_calls(roots)
+    starts = np.fromiter((c.start_time for c in all_nodes), dtype=np.float64, count=len(all_nodes))
+    ends = np.fromiter((c.end_time for c in all_nodes), dtype=np.float64, count=len(all_nodes))
+    spike_starts = np.fromiter((sp.start_time for sp in spikes), dtype=np.float64, count=len(spikes))
+    spike_ends = np.fromiter((sp.end_time for sp in spikes), dtype=np.float64, count=len(spikes))
+
+    # (spike, call) pairs for every call overlapping a spike, grouped by spike and in call order within a spike
+    spike_idx, call_idx = _overlapping_pairs(spike_starts, spike_ends, starts, ends)
+    pairs_per_spike = np.split(call_idx, np.cumsum(np.bincount(spike_idx, minlength=len(spikes)))[:-1])
 
-    for sp in spikes:
-        active = find_calls_active_in_interval(roots, sp.start_time, sp.end_time)
+    uuids = [c.uuid for c in all_nodes]
+    for sp, active in zip(spikes, pairs_per_spike):
         # record the active call uuids for each spike
-        sp.active_uuids = list({c.uuid for c in active})
+        sp.active_uuids = list({uuids[i] for i in active.tolist()})
 
-        for c in active:
-            if c.prompt_tokens and c.prompt_tokens > 0:
-                p_tokens.append(c.prompt_tokens)
-            if c.total_tokens and c.total_tokens > 0:
-                t_tokens.append(c.total_tokens)
+    # None becomes nan, which fails the > 0 check just like missing token counts did
+    prompt_tokens = np.array([c.prompt_tokens for c in all_nodes], dtype=np.float64)[call_idx]
+    total_tokens = np.array([c.total_tokens for c in all_nodes], dtype=np.float64)[call_idx]
+    p_tokens = prompt_tokens[prompt_tokens > 0]
+    t_tokens = total_tokens[total_tokens > 0]
 
-    def safe_avg(lst):
-        return float(np.mean(lst)) if lst else 0.0
+    def safe_avg(arr):
+        return float(np.mean(arr)) if len(arr) else 0.0
 
     return ConcurrencyCorrelationStats(
         avg_prompt_tokens=safe_avg(p_tokens),
@@ -305,6 +304,36 @@ def correlate_spike_calls(spikes: list[ConcurrencySpikeInfo], roots: list[Concur
     )
 
 
+def _overlapping_pairs(spike_starts: np.ndarray, spike_ends: np.ndarray, starts: np.ndarray,
+                       ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return ``(spike_idx, call_idx)`` for every call overlapping a spike, sorted by spike then call.
+    Overlap => not (call.end_time <= spike.start_time or call.start_time >= spike.end_time).
+    """
+    if len(spike_starts) == 0 or len(starts) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    if np.all(spike_starts[1:] >= spike_ends[:-1]):
+        # Spikes come from the timeline segments, so they are sorted and disjoint and every call overlaps one
+        # contiguous run of them: the first spike ending after the call starts up to the last one starting before
+        # the call ends.
+        first = np.searchsorted(spike_ends, starts, side="right")
+        last = np.searchsorted(spike_starts, ends, side="left")
+        counts = np.clip(last - first, 0, None)
+
+        call_idx = np.repeat(np.arange(len(starts)), counts)
+        offsets = np.arange(len(call_idx)) - np.repeat(np.cumsum(counts) - counts, counts)
+        spike_idx = np.repeat(first, counts) + offsets
+    else:
+        overlaps = [np.flatnonzero((ends > s) & (starts < e)) for s, e in zip(spike_starts, spike_ends)]
+        call_idx = np.concatenate(overlaps)
+        spike_idx = np.repeat(np.arange(len(overlaps)), [len(o) for o in overlaps])
+
+    order = np.argsort(spike_idx, kind="stable")
+    return spike_idx[order], call_idx[order]
+
+
 def compute_midpoint_concurrency(n: ConcurrencyCallNode, segments: list[tuple[float, float, int]]) -> float:
     """
     Approx concurrency at the midpoint of this call.
@@ -331,26 +360,25 @@ def average_latency_by_midpoint_concurrency(roots: list[ConcurrencyCallNode]) ->
     """
     For each call, find concurrency at midpoint, then bucket durations by concurrency, compute avg.
     """
-    segs = build_concurrency_segments(roots)
     all_nodes = flatten_calls(roots)
+    return _average_latency_by_concurrency(all_nodes, ConcurrencyTimeline.from_nodes(all_nodes))
 
-    # concurrency => list of durations
-    from collections import defaultdict
-    calls_by_conc = defaultdict(list)
 
-    for c in all_nodes:
-        mc = compute_midpoint_concurrency(c, segs)
-        # round or cast to int
-        c_level = int(mc)
-        calls_by_conc[c_level].append(c.duration)
+def _average_latency_by_concurrency(all_nodes: list[ConcurrencyCallNode],
+                                    timeline: ConcurrencyTimeline) -> dict[int, float]:
+    if not all_nodes:
+        return {}
 
-    result = {}
-    for c_level, durations in calls_by_conc.items():
-        if durations:
-            result[c_level] = float(np.mean(durations))
-        else:
-            result[c_level] = 0.0
-    return result
+    starts = np.fromiter((c.start_time for c in all_nodes), dtype=np.float64, count=len(all_nodes))
+    ends = np.fromiter((c.end_time for c in all_nodes), dtype=np.float64, count=len(all_nodes))
+    durations = np.fromiter((c.duration for c in all_nodes), dtype=np.float64, count=len(all_nodes))
+
+    # Zero-length calls have no midpoint and are bucketed at concurrency 0
+    levels = np.where(starts >= ends, 0, timeline.concurrency_at(0.5 * (starts + ends)))
+
+    sums = np.bincount(levels, weights=durations)
+    counts = np.bincount(levels)
+    return {c_level: float(sums[c_level] / counts[c_level]) for c_level in np.flatnonzero(counts).tolist()}
 
 
 # --------------------------------------------------------------------------------
@@ -395,7 +423,8 @@ def concurrency_spike_analysis(
     num_calls = len(all_calls)
 
     # Concurrency distribution
-    dist_map = compute_concurrency_distribution(roots)
+    timeline = ConcurrencyTimeline.from_nodes(all_calls)
+    dist_map = timeline.distribution()
     total_time = sum(dist_map.values())
 
     p50_c = find_percentile_concurrency(dist_map, 50)
@@ -407,15 +436,14 @@ def concurrency_spike_analysis(
     if concurrency_spike_threshold is None:
         concurrency_spike_threshold = max(1, int(np.ceil(p90_c)))
 
-    # Build concurrency segments, detect spikes
-    segments = build_concurrency_segments(roots)
-    spike_intervals = detect_concurrency_spikes(segments, concurrency_spike_threshold)
+    # Detect spikes on the same segments the distribution was computed from
+    spike_intervals = detect_concurrency_spikes(timeline.segments(), concurrency_spike_threshold)
 
     # Correlate
     corr_stats = correlate_spike_calls(spike_intervals, roots)
 
     # Average latency by concurrency
-    avg_lat_by_conc = average_latency_by_midpoint_concurrency(roots)
+    avg_lat_by_conc = _average_latency_by_concurrency(all_calls, timeline)
 
     # Build textual report
     lines = []
@@ -91,93 +91,25 @@ class LLMMetrics:
         # 3. NOVA-Time-To-Next-Event,
         # 4. NOVA-Time-To-Event-End
         #
-        # We'll compute these by grouping on (example_number, function_name),
-        # sorting by event_timestamp, and for each row calculating:
+        # Within each (example_number, function_name) group, for each row:
         #
         #  - how many LLM_START events lie strictly in the future,
         #  - the time to the next LLM_START event in the future,
         #  - the time to the last LLM_START event in the future.
         #
+        # All groups are handled at once: the LLM_START events and the rows are
+        # merged into one array sorted by (group, timestamp), with LLM_START events
+        # placed before rows at the same timestamp so those don't count as 'in the
+        # future'. A running count of LLM_START events then gives, for every row,
+        # the index of the next LLM_START in its group.
+        #
         # For times, we convert to milliseconds by multiplying by 1000,
         # assuming event_timestamp is in seconds.
         # ---------------------------------------------------------------------
-
-        # Initialize columns with default values.
-        df['NOVA-Requests-Remaining-In-Event'] = -1
-        df['NOVA-Time-To-Next-Event'] = -1.0
-        df['NOVA-Time-To-Event-End'] = -1.0
-
-        def _compute_group_metrics(subdf: pd.DataFrame) -> pd.DataFrame:
-            """
-            For a sub-DataFrame with a unique (example_number, function_name),
-            compute the requested columns for each row.
-            """
-            # Sort by time to ensure chronological order.
-            subdf = subdf.sort_values('event_timestamp').copy()
-
-            # Collect all LLM_START timestamps in this group as a sorted array.
-            llm_start_mask = (subdf['event_type'] == 'LLM_START')
-            llm_start_ts = subdf.loc[llm_start_mask, 'event_timestamp'].values
-
-            # If no LLM_START events present, we can return immediately.
-            if len(llm_start_ts) == 0:
-                # No future LLM_START events to compute; everything stays default -1.
-                return subdf
-
-            def _rowwise_calc(row):
-                """
-                For each row, compute:
-                  - how many LLM_START events lie strictly in the future,
-                  - time to the next LLM_START event,
-                  - time to the last LLM_START event (in the future).
-                """
-                row_ts = row['event_timestamp']
-
-                # Use searchsorted to find how many LLM_START events lie after this row's timestamp.
-                # side='right' means we treat any LLM_START at exactly row_ts as not 'in the future'.
-                insertion_idx = np.searchsorted(llm_start_ts, row_ts, side='right')
-
-                # (A) Requests remaining = how many LLM_START events are strictly after row_ts
-                requests_remaining = len(llm_start_ts) - insertion_idx
-
-                # (B) Time to next LLM_START (if any)
-                if insertion_idx < len(llm_start_ts):
-                    next_event_time = llm_start_ts[insertion_idx]
-                    time_to_next_event = (next_event_time - row_ts) * 1000.0
-                else:
-                    time_to_next_event = -1.0
-
-                # (C) Time to the last LLM_START in the future (if any).
-                # The last LLM_START in the future is simply the last entry of llm_start_ts
-                # if there's at least one future LLM_START. We'll check that it is strictly > row_ts.
-                if requests_remaining > 0:
-                    last_future_llm_start = llm_start_ts[-1]
-                    # double-check that it's truly in the future
-                    if last_future_llm_start > row_ts:
-                        time_to_event_end = (last_future_llm_start - row_ts) * 1000.0
-                    else:
-                        time_to_event_end = -1.0
-                else:
-                    time_to_event_end = -1.0
-
-                return pd.Series({
-                    'NOVA-Requests-Remaining-In-Event': requests_remaining,
-                    'NOVA-Time-To-Next-Event': time_to_next_event,
-                    'NOVA-Time-To-Event-End': time_to_event_end
-                })
-
-            # Apply row-wise calculations
-            metrics_df = subdf.apply(_rowwise_calc, axis=1)
-
-            # Merge back into subdf
-            subdf[['NOVA-Requests-Remaining-In-Event', 'NOVA-Time-To-Next-Event',
-                   'NOVA-Time-To-Event-End']] = metrics_df
-
-            return subdf
-
-        # Apply the group metrics
-        df_group = df.groupby(['example_number', 'function_name'], group_keys=False)
-        df = df_group[df.columns].apply(_compute_group_metrics).sort_index()
+        requests_remaining, time_to_next, time_to_end = _future_llm_start_metrics(df)
+        df['NOVA-Requests-Remaining-In-Event'] = requests_remaining
+        df['NOVA-Time-To-Next-Event'] = time_to_next
+        df['NOVA-Time-To-Event-End'] = time_to_end
 
         # ---------------------------------------------------------------------
         # 5. NOVA-Predicted-OSL
@@ -210,3 +142,54 @@ class LLMMetrics:
 
         # Return the updated DataFrame
         return df
+
+
+def _future_llm_start_metrics(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized computation of the requests remaining, time to next event and time to event end columns. Rows in groups
+    without any LLM_START event get -1 for all three.
+    """
+    ts = df['event_timestamp'].to_numpy(dtype=np.float64)
+    group = df.groupby(['example_number', 'function_name'], sort=False).ngroup().to_numpy()
+    # Rows with a missing key (ngroup == -1) go to an extra group that never has LLM_START events
+    n_groups = int(group.max()) + 2
+    group = np.where(group < 0, n_groups - 1, group)
+
+    is_start = (df['event_type'] == 'LLM_START').to_numpy()
+    if not is_start.any():
+        return np.full(len(ts), -1), np.full(len(ts), -1.0), np.full(len(ts), -1.0)
+
+    start_group = group[is_start]
+    start_ts = ts[is_start]
+    order = np.lexsort((start_ts, start_group))
+    start_group = start_group[order]
+    start_ts = start_ts[order]
+
+    counts = np.bincount(start_group, minlength=n_groups)
+    offsets = np.cumsum(counts) - counts
+
+    # Merge LLM_START events (kind 0) with all rows (kind 1), sorted by group, timestamp, then kind
+    merged_group = np.concatenate((start_group, group))
+    merged_ts = np.concatenate((start_ts, ts))
+    merged_kind = np.concatenate((np.zeros(len(start_ts), dtype=np.int8), np.ones(len(ts), dtype=np.int8)))
+    merged_order = np.lexsort((merged_kind, merged_ts, merged_group))
+
+    starts_seen = np.cumsum(merged_kind[merged_order] == 0)
+    sorted_position = np.empty(len(merged_order), dtype=np.int64)
+    sorted_position[merged_order] = np.arange(len(merged_order))
+    row_positions = sorted_position[len(start_ts):]
+
+    # Number of LLM_START events in the row's group at or before the row's timestamp
+    row_counts = counts[group]
+    insertion_idx = starts_seen[row_positions] - offsets[group]
+    remaining = row_counts - insertion_idx
+    has_future = remaining > 0
+
+    # Indices are clamped for rows without a future LLM_START, their values are masked out below
+    next_idx = np.minimum(offsets[group] + insertion_idx, len(start_ts) - 1)
+    last_idx = np.maximum(offsets[group] + row_counts - 1, 0)
+    time_to_next = np.where(has_future, (start_ts[next_idx] - ts) * 1000.0, -1.0)
+    time_to_end = np.where(has_future, (start_ts[last_idx] - ts) * 1000.0, -1.0)
+
+    requests_remaining = np.where(row_counts > 0, remaining, -1)
+    return requests_remaining, time_to_next, time_to_end
@@ -13,73 +13,185 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
+import typing
+from collections.abc import Iterable
+
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import CommonPrefixesOutput
 from aiq.profiler.inference_optimization.data_models import FrameworkLLMPrefixData
 from aiq.profiler.inference_optimization.data_models import PrefixInfo
 from aiq.profiler.utils import create_standardized_dataframe
 
+# Words, runs of whitespace and single punctuation characters. Lossless, joining the tokens gives back the text.
+_TOKEN_RE = re.compile(r"\w+|\s+|[^\w\s]")
+
+Granularity = typing.Literal["token", "character"]
+
 
 # -----------------------------------------------------------
-# 1. Helper: Build a prefix trie
+# 1. Helper: Compressed prefix (radix) tree
 # -----------------------------------------------------------
-def build_prefix_trie(strings: list[str]) -> dict:
-    """
-    Build a trie from a list of strings.
+class _RadixNode:
+    __slots__ = ("label", "count", "children")
 
-    Returns a nested dictionary with::
+    def __init__(self, label: tuple[int, ...], count: int):
+        # Token ids on the edge leading into this node
+        self.label = label
+        # Number of strings passing through this node
+        self.count = count
+        # First token id of the child's label -> child
+        self.children: dict[int, _RadixNode] = {}
 
-        {
-            'count': int,         # number of strings passing through this node
-            'children': dict[str, TrieNode]
-        }
 
+class PrefixRadixTree:
     """
-    root = {'count': 0, 'children': {}}
-    for s in strings:
-        node = root
-        node['count'] += 1  # every string passes through the root
-        for ch in s:
-            if ch not in node['children']:
-                node['children'][ch] = {'count': 0, 'children': {}}
-            node = node['children'][ch]
-            node['count'] += 1
-    return root
+    Radix tree over tokenized strings, built one string at a time.
+
+    Unlike a per-character trie, chains of nodes with a single child are collapsed into one edge, so shared prompt
+    prefixes are stored once and the tree only has a node where prompts diverge or end. Tokens are interned to integer
+    ids, labels are tuples of those ids.
+    """
+
+    def __init__(self, granularity: Granularity = "token"):
+        self.granularity = granularity
+        self._root = _RadixNode((), 0)
+        self._token_ids: dict[str, int] = {}
+        self._tokens: list[str] = []
+
+    @property
+    def total(self) -> int:
+        """Number of strings inserted."""
+        return self._root.count
+
+    def _tokenize(self, text: str) -> list[int]:
+        pieces = _TOKEN_RE.findall(text) if self.granularity == "token" else text
+        # New tokens get the next id, ``len`` is evaluated before ``setdefault`` inserts
+        token_ids = self._token_ids
+        return [token_ids.setdefault(piece, len(token_ids)) for piece in pieces]
+
+    def _token_text(self) -> list[str]:
+        # Dicts keep insertion order, so the keys are the tokens ordered by id
+        if len(self._tokens) != len(self._token_ids):
+            self._tokens = list(self._token_ids)
+        return self._tokens
+
+    def insert(self, text: str) -> None:
+        ids = self._tokenize(text)
+        node = self._root
+        node.count += 1  # every string passes through the root
+
+        i = 0
+        while i < len(ids):
+            child = node.children.get(ids[i])
+            if child is None:
+                node.children[ids[i]] = _RadixNode(tuple(ids[i:]), 1)
+                return
+
+            label = child.label
+            if tuple(ids[i:i + len(label)]) == label:
+                # Common case for shared system prompts, the whole edge matches
+                j = len(label)
+            else:
+                limit = min(len(label), len(ids) - i)
+                j = 1
+                while j < limit and label[j] == ids[i + j]:
+                    j += 1
+
+            if j < len(label):
+                # Diverges (or ends) inside the edge, split it
+                split = _RadixNode(label[:j], child.count)
+                child.label = label[j:]
+                split.children[child.label[0]] = child
+                node.children[ids[i]] = split
+                child = split
+
+            child.count += 1
+            node = child
+            i += j
+
+    def extend(self, texts: Iterable[str]) -> None:
+        for text in texts:
+            self.insert(text)
+
+    def _maximal_prefixes(self, min_count: int) -> list[tuple[int, int, list[_RadixNode]]]:
+        """
+        Every prefix shared by at least ``min_count`` strings that cannot be extended by another token without
+        dropping below ``min_count``, as ``(char length, count, path of nodes from the root)``.
+
+        Shorter prefixes are left out since each of them is a prefix of one of these.
+        """
+        min_count = max(min_count, 1)
+        tokens = self._token_text()
+        results = []
+        # stack holds (node, char length of the prefix ending at node, path)
+        stack = [(child, 0, []) for child in self._root.children.values()]
+        while stack:
+            node, length, path = stack.pop()
+            if node.count < min_count:
+                continue
+
+            length += sum(len(tokens[token_id]) for token_id in node.label)
+            path = path + [node]
+
+            extended = False
+            for child in node.children.values():
+                if child.count >= min_count:
+                    stack.append((child, length, path))
+                    extended = True
+
+            if not extended:
+                results.append((length, node.count, path))
+
+        return results
+
+    def _text(self, path: list[_RadixNode]) -> str:
+        tokens = self._token_text()
+        return "".join(tokens[token_id] for node in path for token_id in node.label)
 
 
 # -----------------------------------------------------------
-# 2. Helper: Iterative traversal of the trie
+# 2. Helper: Top common prefixes from a tree
 # -----------------------------------------------------------
-def collect_prefixes_iterative(root: dict, total_calls: int) -> list[dict]:
+def top_common_prefixes(tree: PrefixRadixTree,
+                        min_call_percentage: float = 0.0,
+                        top_k: int | None = None) -> list[PrefixInfo]:
     """
-    Iteratively traverse the trie to collect prefix statistics,
-    avoiding recursion depth limits.
+    Return the longest prefixes shared by at least ``min_call_percentage`` of the strings in ``tree``.
 
-    :param root: Trie node with 'count' and 'children'
-    :param total_calls: Number of total calls in this group (denominator for percentages)
-    :return: A list of dicts, each dict containing prefix info
+    Sorted by prefix length (descending), then frequency (descending). A prefix that is a substring of a longer prefix
+    already returned is skipped. At most ``top_k`` prefixes are returned when it is set.
     """
-    results = []
-    # stack holds (node, prefix_so_far)
-    stack = [(root, "")]
-
-    while stack:
-        node, prefix = stack.pop()
-
-        # Skip storing the empty root prefix
-        if prefix:
-            calls_count = node['count']
-            calls_percentage = calls_count / total_calls
-            results.append({
-                'prefix': prefix,
-                'prefix_length': len(prefix),
-                'calls_count': calls_count,
-                'calls_percentage': calls_percentage
-            })
-
-        # Add children to the stack
-        for ch, child_node in node['children'].items():
-            stack.append((child_node, prefix + ch))
+    total_calls = tree.total
+    if total_calls == 0:
+        return []
+
+    # Smallest count satisfying count / total_calls >= min_call_percentage, checked with the same float division as
+    # the percentages reported below
+    min_count = max(int(min_call_percentage * total_calls), 1)
+    while min_count <= total_calls and min_count / total_calls < min_call_percentage:
+        min_count += 1
+
+    candidates = tree._maximal_prefixes(min_count)
+    candidates.sort(key=lambda candidate: (candidate[0], candidate[1]), reverse=True)
+
+    kept: list[str] = []
+    results: list[PrefixInfo] = []
+    for length, calls_count, path in candidates:
+        if top_k is not None and len(results) >= top_k:
+            break
+
+        prefix = tree._text(path)
+        # Check if this prefix is contained in any longer prefix we have kept
+        if any(prefix in longer for longer in kept):
+            continue
+
+        kept.append(prefix)
+        results.append(
+            PrefixInfo(prefix=prefix,
+                       prefix_length=length,
+                       calls_count=calls_count,
+                       calls_percentage=calls_count / total_calls))
 
     return results
 
@@ -88,7 +200,9 @@ def collect_prefixes_iterative(root: dict, total_calls: int) -> list[dict]:
 # 3. Main Function
 # -----------------------------------------------------------
 def get_common_prefixes(all_steps: list[list[IntermediateStep]],
-                        min_call_percentage: float = 0.0) -> CommonPrefixesOutput:
+                        min_call_percentage: float = 0.0,
+                        top_k: int | None = None,
+                        granularity: Granularity = "token") -> CommonPrefixesOutput:
     """
     Given a pandas DataFrame with columns 'framework', 'llm_name',
     and 'llm_text_input', return a Pydantic-validated RootModel
@@ -96,13 +210,19 @@ def get_common_prefixes(all_steps: list[list[IntermediateStep]],
     common prefix statistics.
 
     1) Only includes prefixes with calls_percentage >= `min_call_percentage`.
-    2) Excludes any prefix that is a substring of another (longer) prefix
+    2) Only includes the longest such prefixes, a prefix is dropped when
+       adding the next token keeps it above the threshold.
+    3) Excludes any prefix that is a substring of another (longer) prefix
        that already meets the threshold and is retained.
-    3) Optionally writes the resulting dictionary to JSON if `output_path` is provided.
+
+    Prefixes end on token boundaries (words, whitespace runs and punctuation)
+    unless `granularity` is "character".
 
     :param all_steps: Intermediate Steps
     :param min_call_percentage: Exclude prefixes that appear in fewer than this fraction
                                 of total calls. (Default 0.0 = no filtering)
+    :param top_k: Return at most this many prefixes per LLM. (Default None = all)
+    :param granularity: "token" or "character", the unit prefixes are made of.
 
     Sorting: primarily by prefix length (descending),
              secondarily by frequency (descending).
@@ -123,40 +243,17 @@ def get_common_prefixes(all_steps: list[list[IntermediateStep]],
         # Unpack llm_name Tuple
         llm_name = llm_name[0]
 
-        text_inputs = group_df['llm_text_input'].astype(str).tolist()
-        total_calls = len(text_inputs)
-
-        # Build trie for all text inputs
-        trie = build_prefix_trie(text_inputs)
-
-        # Collect prefix info using iterative traversal
-        results = collect_prefixes_iterative(trie, total_calls=total_calls)
-
-        # 1) Filter out prefixes below min_call_percentage
-        results_filtered = [r for r in results if r['calls_percentage'] >= min_call_percentage]
-
-        # 2) Sort results: prefix_length desc, then calls_count desc
-        results_sorted = sorted(results_filtered, key=lambda x: (x['prefix_length'], x['calls_count']), reverse=True)
-
-        # 3) Substring filtering:
-        #    Because results_sorted is in descending length order,
-        #    if we keep a prefix, we exclude any shorter prefix that
-        #    is a substring of that already-kept prefix.
-        final_results = []
-        for r in results_sorted:
-            pfx = r['prefix']
-            # Check if this prefix is contained in any longer prefix we have kept
-            if not any(pfx in kept['prefix'] for kept in final_results):
-                final_results.append(r)
+        # Insert the prompts one at a time, the tree only keeps the parts that differ
+        tree = PrefixRadixTree(granularity)
+        tree.extend(group_df['llm_text_input'].astype(str))
 
-        # Convert each dict to a PrefixInfo model
-        prefix_info_list = [PrefixInfo(**res) for res in final_results]
+        prefix_info_list = top_common_prefixes(tree, min_call_percentage=min_call_percentage, top_k=top_k)
 
         # Construct the dictionary key
         framework_llm_key = f"{llm_name}"
 
         # Save the data for this group
-        output_data[framework_llm_key] = FrameworkLLMPrefixData(total_calls=total_calls, prefix_info=prefix_info_list)
+        output_data[framework_llm_key] = FrameworkLLMPrefixData(total_calls=tree.total, prefix_info=prefix_info_list)
 
     # Package the final result in a validated RootModel
     result_model = CommonPrefixesOutput(root=output_data)
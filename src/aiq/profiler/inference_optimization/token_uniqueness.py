@@ -22,6 +22,8 @@ from aiq.profiler.inference_optimization.data_models import LLMUniquenessMetrics
 from aiq.profiler.inference_optimization.data_models import LLMUniquenessMetricsByLLM
 from aiq.profiler.utils import create_standardized_dataframe
 
+_WORD_RE = re.compile(r"\w+")
+
 
 # ----------------------------------------------------------------
 # 1. Main Function
@@ -54,43 +56,37 @@ def compute_inter_query_token_uniqueness_by_llm(all_steps: list[list[Intermediat
         # Return an empty dictionary if no llm_start events
         return LLMUniquenessMetricsByLLM(root={})
 
-    # Helper to tokenize text into a set of words
-    def tokenize_to_set(text: str) -> set:
-        if not isinstance(text, str):
-            return set()
-        return set(re.findall(r"\w+", text.lower()))
+    # Helper to tokenize text into a set of words. Every prompt is compared against both its predecessor and its
+    # successor, so the token sets are cached to tokenize each prompt only once.
+    token_cache: dict[str, frozenset] = {}
 
-    # We'll store new_words counts for each llm_name
+    def tokenize_to_set(text: str) -> frozenset:
+        if not isinstance(text, str):
+            return frozenset()
+        tokens = token_cache.get(text)
+        if tokens is None:
+            tokens = token_cache[text] = frozenset(_WORD_RE.findall(text.lower()))
+        return tokens
+
+    # 2) Sort by (llm_name, example_number, event_timestamp) and shift the llm_text_input within each
+    #    (llm_name, example_number) group to compare consecutive calls
+    cdf = cdf.sort_values(['llm_name', 'example_number', 'event_timestamp'], kind='stable')
+    prev_llm_text_input = cdf.groupby(['llm_name', 'example_number'])['llm_text_input'].shift(1)
+
+    # Drop rows where there's no 'previous' call
+    valid = prev_llm_text_input.notna().to_numpy()
+
+    # 3) Compute new words for each remaining row
+    current_texts = cdf['llm_text_input'].to_numpy()[valid]
+    prev_texts = prev_llm_text_input.to_numpy()[valid]
+    new_words_count = [
+        len(tokenize_to_set(cur) - tokenize_to_set(prev)) for cur, prev in zip(current_texts, prev_texts)
+    ]
+
+    # Gather the new_words_count for each llm_name
     llm_to_counts: dict[str, list[int]] = {}
-
-    # 2) Group by (llm_name, example_number), then sort each group
-    grouped = cdf.groupby(['llm_name', 'example_number'], as_index=False, group_keys=True)
-
-    for (llm, ex_num), group_df in grouped:  # pylint: disable=unused-variable
-        # Sort by event_timestamp
-        group_df = group_df.sort_values('event_timestamp', ascending=True)
-
-        # Shift the llm_text_input to compare consecutive calls
-        group_df['prev_llm_text_input'] = group_df['llm_text_input'].shift(1)
-
-        # Compute new words for each row (excluding the first in the group)
-        def compute_new_words(row):
-            current_tokens = tokenize_to_set(row['llm_text_input'])
-            prev_tokens = tokenize_to_set(row['prev_llm_text_input'])
-            return len(current_tokens - prev_tokens)
-
-        group_df['new_words_count'] = group_df.apply(compute_new_words, axis=1)
-
-        # Drop rows where there's no 'previous' call
-        valid_rows = group_df.dropna(subset=['prev_llm_text_input'])
-
-        # Gather the new_words_count
-        counts = valid_rows['new_words_count'].tolist()
-        if counts:
-            # Accumulate them in llm_to_counts
-            if llm not in llm_to_counts:
-                llm_to_counts[llm] = []
-            llm_to_counts[llm].extend(counts)
+    for llm, count in zip(cdf['llm_name'].to_numpy()[valid].tolist(), new_words_count):
+        llm_to_counts.setdefault(llm, []).append(count)
 
     # 4) For each llm_name, compute p90, p95, p99
     output_dict = {}
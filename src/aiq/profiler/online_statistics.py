@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Online (single pass, bounded memory) estimators for the profiler's confidence intervals and percentiles.
+
+``OnlineMetric`` keeps the running mean and variance with Chan's parallel variant of Welford's algorithm, so values
+can be added in batches, and the percentiles in a merging t-digest.
+"""
+
+import math
+
+import numpy as np
+
+from aiq.profiler.inference_metrics_model import InferenceMetricsModel
+
+
+class TDigest:
+    """
+    Merging t-digest with the ``k1`` (arcsine) scale function.
+
+    Values are buffered and merged into the centroids once the buffer is full. A merge sorts the centroids and the
+    buffer together and groups neighbours whose mid-point quantiles fall in the same unit of the scale function, which
+    keeps at most about ``compression / 2`` centroids, small ones in the tails and large ones around the median.
+
+    Until the first merge the digest holds every value, and quantiles are exact.
+    """
+
+    def __init__(self, compression: float = 200.0, buffer_size: int | None = None):
+        self.compression = compression
+        self._buffer_size = buffer_size or int(10 * compression)
+        self._buffer: list[float] = []
+        self._means = np.empty(0, dtype=np.float64)
+        self._weights = np.empty(0, dtype=np.float64)
+        self._min = math.inf
+        self._max = -math.inf
+
+    def __len__(self) -> int:
+        return int(self._weights.sum()) + len(self._buffer)
+
+    def update(self, values) -> None:
+        self._buffer.extend(np.asarray(values, dtype=np.float64).ravel().tolist())
+        if len(self._buffer) >= self._buffer_size:
+            self._merge()
+
+    def _merge(self) -> None:
+        if not self._buffer:
+            return
+
+        buffer = np.asarray(self._buffer, dtype=np.float64)
+        self._buffer = []
+        self._min = min(self._min, float(buffer.min()))
+        self._max = max(self._max, float(buffer.max()))
+
+        values = np.concatenate((self._means, buffer))
+        weights = np.concatenate((self._weights, np.ones(len(buffer), dtype=np.float64)))
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        weights = weights[order]
+
+        cumulative = np.cumsum(weights)
+        mid_quantiles = (cumulative - weights / 2) / cumulative[-1]
+        scale = self.compression / (2 * math.pi) * np.arcsin(2 * mid_quantiles - 1)
+
+        # Sorted quantiles map to non-decreasing scale values, so every group is a contiguous run of points
+        group_starts = np.flatnonzero(np.diff(np.floor(scale), prepend=-np.inf))
+        self._weights = np.add.reduceat(weights, group_starts)
+        self._means = np.add.reduceat(values * weights, group_starts) / self._weights
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the ``q`` quantile, ``q`` in ``[0, 1]``. Returns ``0.0`` for an empty digest.
+        """
+        if len(self._weights) == 0:
+            if not self._buffer:
+                return 0.0
+            # Same linear interpolation between closest ranks as ``ProfilerRunner``
+            return float(np.percentile(self._buffer, q * 100))
+
+        self._merge()
+
+        # Every centroid sits at the middle of its weight, the extremes anchor both ends of the distribution
+        total = self._weights.sum()
+        centers = np.concatenate(([0.0], np.cumsum(self._weights) - self._weights / 2, [total]))
+        means = np.concatenate(([self._min], self._means, [self._max]))
+        return float(np.interp(q * total, centers, means))
+
+
+class OnlineMetric:
+    """
+    Running count, mean, population variance and percentiles of a metric.
+    """
+
+    def __init__(self, compression: float = 200.0):
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._digest = TDigest(compression)
+
+    def update(self, values) -> None:
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if len(values) == 0:
+            return
+
+        batch_n = len(values)
+        batch_mean = float(values.mean())
+        batch_m2 = float(((values - batch_mean)**2).sum())
+
+        n = self.n + batch_n
+        delta = batch_mean - self.mean
+        self.mean += delta * batch_n / n
+        self._m2 += batch_m2 + delta**2 * self.n * batch_n / n
+        self.n = n
+
+        self._digest.update(values)
+
+    @property
+    def pstdev(self) -> float:
+        return math.sqrt(self._m2 / self.n) if self.n else 0.0
+
+    def quantile(self, q: float) -> float:
+        return self._digest.quantile(q)
+
+    def to_inference_metrics(self) -> InferenceMetricsModel:
+        """
+        Confidence intervals of the mean and p90/p95/p99, computed the same way as
+        ``ProfilerRunner._compute_confidence_intervals``.
+        """
+        if self.n == 0:
+            return InferenceMetricsModel()
+
+        if self.n == 1:
+            return InferenceMetricsModel(n=1,
+                                         mean=self.mean,
+                                         ninetieth_interval=(self.mean, self.mean),
+                                         ninety_fifth_interval=(self.mean, self.mean),
+                                         ninety_ninth_interval=(self.mean, self.mean),
+                                         p90=self.mean,
+                                         p95=self.mean,
+                                         p99=self.mean)
+
+        se = self.pstdev / math.sqrt(self.n)
+
+        intervals = {"n": self.n, "mean": self.mean}
+        for confidence, zvalue in \
+                [("ninetieth_interval", 1.645), ("ninety_fifth_interval", 1.96), ("ninety_ninth_interval", 2.576)]:
+            intervals[confidence] = (self.mean - zvalue * se, self.mean + zvalue * se)
+
+        intervals["p90"] = self.quantile(0.90)
+        intervals["p95"] = self.quantile(0.95)
+        intervals["p99"] = self.quantile(0.99)
+
+        return InferenceMetricsModel(**intervals)
@@ -163,7 +163,11 @@ class ProfilerRunner:
             # Compute and save common prefixes
             # ------------------------------------------------------------
 
-            prefixes = get_common_prefixes(all_steps, self.profile_config.prompt_caching_prefixes.min_frequency)
+            prompt_caching_config = self.profile_config.prompt_caching_prefixes
+            prefixes = get_common_prefixes(all_steps,
+                                           prompt_caching_config.min_frequency,
+                                           top_k=prompt_caching_config.top_k,
+                                           granularity=prompt_caching_config.granularity)
             common_prefix_results = prefixes
 
         if self.profile_config.token_uniqueness_forecast:
@@ -0,0 +1,389 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Profile intermediate steps exported by the file exporter without loading them all in memory.
+
+The trace files hold one serialized ``IntermediateStep`` per line, steps of concurrent requests interleaved. They are
+read in chunks of ``chunk_size`` steps, and every step is attributed to its request by following ``parent_id`` up to a
+step whose parent is ``root``. Only the spans still open are kept in memory: once every span of a request has ended,
+the request's run time and LLM latencies go into online estimators and its state is dropped.
+
+Each chunk is appended to ``standardized_data_all.parquet`` as a row group with the columns of
+``create_standardized_dataframe``, and the confidence intervals of ``ProfilerRunner`` are written to
+``inference_optimization.json``. When given an incremental forecasting model, the LLM calls of every completed request
+are fed to it after each chunk.
+"""
+
+import gzip
+import io
+import json
+import logging
+import math
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+from pydantic import ValidationError
+
+from aiq.data_models.intermediate_step import IntermediateStepState
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.profiler.forecasting.models import IncrementalForecastingModel
+from aiq.profiler.inference_metrics_model import InferenceMetricsModel
+from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
+from aiq.profiler.online_statistics import OnlineMetric
+from aiq.profiler.profile_runner import InferenceOptimizationHolder
+from aiq.profiler.profile_runner import SimpleMetricsHolder
+from aiq.utils.optional_imports import optional_import
+
+logger = logging.getLogger(__name__)
+
+_ROOT_PARENT_ID = "root"
+
+# Columns of ``DataFrameRow`` with their Parquet types, in the order of ``create_standardized_dataframe``
+_COLUMN_TYPES = {
+    "event_type": "string",
+    "event_timestamp": "float64",
+    "example_number": "int64",
+    "prompt_tokens": "int64",
+    "completion_tokens": "int64",
+    "total_tokens": "int64",
+    "llm_text_input": "string",
+    "llm_text_output": "string",
+    "llm_new_token": "string",
+    "llm_name": "string",
+    "tool_name": "string",
+    "function_name": "string",
+    "function_id": "string",
+    "parent_function_name": "string",
+    "parent_function_id": "string",
+    "UUID": "string",
+    "framework": "string",
+}
+
+_TEXT_COLUMNS = ("llm_text_input", "llm_text_output", "llm_new_token")
+
+
+def _open_trace_file(path: Path) -> io.TextIOBase:
+    match path.suffix:
+        case ".gz":
+            return gzip.open(path, "rt", encoding="utf-8")
+        case ".zst":
+            zstandard = optional_import("zstandard")
+            return zstandard.open(path, "rt", encoding="utf-8")
+        case _:
+            return path.open("r", encoding="utf-8")
+
+
+def _trace_files(paths: Path | list[Path]) -> list[Path]:
+    """
+    Expand directories into the files they contain, oldest first so rolled files come before the active one.
+    """
+    files = []
+    for path in [paths] if isinstance(paths, (str, Path)) else paths:
+        path = Path(path)
+        if path.is_dir():
+            files.extend(sorted((f for f in path.iterdir() if f.is_file()), key=lambda f: f.stat().st_mtime))
+        else:
+            files.append(path)
+    return files
+
+
+def iter_intermediate_steps(paths: Path | list[Path],
+                            chunk_size: int = 10_000) -> Iterator[list[IntermediatePropertyAdaptor]]:
+    """
+    Yield the intermediate steps of the given trace files (or directories of rolled trace files) in chunks of at most
+    ``chunk_size`` steps. Gzip (``.gz``) and zstd (``.zst``) compressed files are decompressed on the fly, lines which
+    are not a valid intermediate step, e.g. the truncated last line of a file still being written, are skipped.
+    """
+    chunk = []
+    for path in _trace_files(paths):
+        skipped = 0
+        with _open_trace_file(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    chunk.append(IntermediatePropertyAdaptor.model_validate_json(line))
+                except ValidationError:
+                    skipped += 1
+                    continue
+
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+
+        if skipped:
+            logger.warning("Skipped %d lines of %s which are not intermediate steps", skipped, path)
+
+    if chunk:
+        yield chunk
+
+
+class _RequestState:
+    __slots__ = ("number",
+                 "orphan_parent",
+                 "first_timestamp",
+                 "last_timestamp",
+                 "open_spans",
+                 "llm_starts",
+                 "llm_calls")
+
+    def __init__(self, number: int, orphan_parent: str | None, timestamp: float):
+        self.number = number
+        # Parent of the first step when it is not a root span, the request started before the traces did
+        self.orphan_parent = orphan_parent
+        self.first_timestamp = timestamp
+        self.last_timestamp = timestamp
+        self.open_spans = 0
+        # LLM call UUID -> (start timestamp, seconds between calls)
+        self.llm_starts: dict[str, tuple[float, int]] = {}
+        # Rows of ``extract_llm_calls``, kept only when feeding a forecasting model
+        self.llm_calls: list[list[float]] = []
+
+
+class StreamingProfilerRunner:
+    """
+    Computes the workflow run time, LLM latency and throughput confidence intervals of ``ProfilerRunner`` from trace
+    files in a single pass with bounded memory, and writes the standardized rows as Parquet.
+
+    Differences from ``ProfilerRunner``:
+
+    - Requests are delimited by their root spans rather than by the evaluation dataset, a request is numbered in the
+      order its first step appears.
+    - LLM latency pairs every ``LLM_END`` with the ``LLM_START`` of the same UUID, so concurrent LLM calls of one
+      request are measured correctly.
+    - p90/p95/p99 are t-digest estimates once a metric has more than a few thousand samples, exact below that.
+
+    ``forecasting_model`` is updated in place with the completed requests, saving it is left to the caller.
+    """
+
+    def __init__(self,
+                 output_dir: Path,
+                 chunk_size: int = 10_000,
+                 exclude_io_text: bool = False,
+                 write_output: bool = True,
+                 compression: float = 200.0,
+                 forecasting_model: IncrementalForecastingModel | None = None):
+        self.output_dir = Path(output_dir)
+        self.chunk_size = chunk_size
+        self.exclude_io_text = exclude_io_text
+        self.write_output = write_output
+        self.forecasting_model = forecasting_model
+
+        self._workflow_run_times = OnlineMetric(compression)
+        self._llm_latencies = OnlineMetric(compression)
+        self._requests: dict[int, _RequestState] = {}
+        # Open span UUID -> number of the request it belongs to
+        self._open_spans: dict[str, int] = {}
+        self._request_count = 0
+        self._root_request_count = 0
+        # LLM calls of the requests completed since the forecasting model was last updated
+        self._completed_llm_calls: list[list[list[float]]] = []
+        self._min_timestamp = math.inf
+        self._max_timestamp = -math.inf
+
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    def run(self, paths: Path | list[Path]) -> SimpleMetricsHolder:
+        """
+        Profile the given trace files, or directories of rolled trace files, and return the confidence intervals.
+        """
+        writer = None
+        steps = 0
+        try:
+            for chunk in iter_intermediate_steps(paths, self.chunk_size):
+                columns, run_times, latencies = self._process_chunk(chunk)
+                self._workflow_run_times.update(run_times)
+                self._llm_latencies.update(latencies)
+                self._update_forecasting_model()
+                steps += len(chunk)
+
+                if self.write_output:
+                    writer = self._write_chunk(writer, columns)
+
+                logger.debug("Profiled %d steps of %d requests", steps, self._request_count)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if self._requests:
+            logger.warning("%d requests have spans which never ended, using their last step as the end",
+                           len(self._requests))
+            run_times = []
+            for request in list(self._requests.values()):
+                self._close_request(request, run_times)
+            self._workflow_run_times.update(run_times)
+            self._open_spans.clear()
+            self._update_forecasting_model()
+
+        simple_metrics = SimpleMetricsHolder(
+            workflow_run_time_confidence_intervals=self._workflow_run_times.to_inference_metrics().model_dump(),
+            llm_latency_confidence_intervals=self._llm_latencies.to_inference_metrics().model_dump(),
+            throughput_estimate_confidence_interval=self._compute_throughput_estimates().model_dump())
+
+        if self.write_output:
+            results = InferenceOptimizationHolder(confidence_intervals=simple_metrics,
+                                                  common_prefixes=None,
+                                                  token_uniqueness=None,
+                                                  workflow_runtimes=None)
+            optimization_results_path = os.path.join(self.output_dir, "inference_optimization.json")
+            with open(optimization_results_path, 'w', encoding='utf-8') as f:
+                json.dump(results.model_dump(), f, indent=2)
+            logger.info("Profiled %d steps of %d requests, wrote results to: %s",
+                        steps,
+                        self._request_count,
+                        optimization_results_path)
+
+        return simple_metrics
+
+    def _request_for(self, step: IntermediatePropertyAdaptor) -> _RequestState:
+        """
+        Find the request of a step, starting a new one for root spans and for steps whose ancestors are not in the
+        traces, e.g. because the oldest rolled files have been cleaned up.
+        """
+        number = self._open_spans.get(step.UUID)
+        if number is None and step.parent_id != _ROOT_PARENT_ID:
+            number = self._open_spans.get(step.parent_id)
+
+        if number is None:
+            number = self._request_count
+            self._request_count += 1
+            if step.parent_id == _ROOT_PARENT_ID:
+                self._requests[number] = _RequestState(number, None, step.event_timestamp)
+                self._root_request_count += 1
+            else:
+                # Attribute the siblings of the orphaned step to the same request
+                self._requests[number] = _RequestState(number, step.parent_id, step.event_timestamp)
+                self._open_spans[step.parent_id] = number
+
+        return self._requests[number]
+
+    def _process_chunk(self,
+                       chunk: list[IntermediatePropertyAdaptor]) -> tuple[dict[str, list], list[float], list[float]]:
+        columns = {name: [] for name in _COLUMN_TYPES}
+        run_times = []
+        latencies = []
+
+        for step in chunk:
+            request = self._request_for(step)
+            timestamp = step.event_timestamp
+            request.first_timestamp = min(request.first_timestamp, timestamp)
+            request.last_timestamp = max(request.last_timestamp, timestamp)
+            self._min_timestamp = min(self._min_timestamp, timestamp)
+            self._max_timestamp = max(self._max_timestamp, timestamp)
+
+            event_type = step.event_type
+            if event_type == IntermediateStepType.LLM_START:
+                request.llm_starts[step.UUID] = (timestamp, step.seconds_between_calls)
+            elif event_type == IntermediateStepType.LLM_END:
+                start = request.llm_starts.pop(step.UUID, None)
+                if start is not None:
+                    start_time, seconds_between_calls = start
+                    latencies.append(timestamp - start_time)
+                    if self.forecasting_model is not None:
+                        usage = step.token_usage
+                        request.llm_calls.append([
+                            seconds_between_calls,
+                            usage.prompt_tokens,
+                            usage.completion_tokens,
+                            timestamp - start_time,
+                        ])
+
+            match step.event_state:
+                case IntermediateStepState.START:
+                    if step.UUID not in self._open_spans:
+                        self._open_spans[step.UUID] = request.number
+                        request.open_spans += 1
+                case IntermediateStepState.END:
+                    if self._open_spans.pop(step.UUID, None) is not None:
+                        request.open_spans -= 1
+                    if request.open_spans <= 0:
+                        self._close_request(request, run_times)
+
+            token_usage = step.token_usage
+            columns["event_type"].append(event_type.value)
+            columns["event_timestamp"].append(timestamp)
+            columns["example_number"].append(request.number)
+            columns["prompt_tokens"].append(token_usage.prompt_tokens)
+            columns["completion_tokens"].append(token_usage.completion_tokens)
+            columns["total_tokens"].append(token_usage.total_tokens)
+            columns["llm_text_input"].append(step.llm_text_input)
+            columns["llm_text_output"].append(step.llm_text_output)
+            columns["llm_new_token"].append(step.llm_text_chunk)
+            columns["llm_name"].append(step.llm_name)
+            columns["tool_name"].append(step.tool_name)
+            columns["function_name"].append(step.function_name)
+            columns["function_id"].append(step.function_id)
+            columns["parent_function_name"].append(step.parent_function_name)
+            columns["parent_function_id"].append(step.parent_function_id)
+            columns["UUID"].append(step.UUID)
+            columns["framework"].append(step.framework.value if step.framework else None)
+
+        return columns, run_times, latencies
+
+    def _close_request(self, request: _RequestState, run_times: list[float]) -> None:
+        del self._requests[request.number]
+        if request.orphan_parent is None:
+            run_times.append(request.last_timestamp - request.first_timestamp)
+            if request.llm_calls:
+                self._completed_llm_calls.append(request.llm_calls)
+        else:
+            # Only part of the request is in the traces, its run time would be underestimated
+            self._open_spans.pop(request.orphan_parent, None)
+
+    def _update_forecasting_model(self) -> None:
+        if self.forecasting_model is None or not self._completed_llm_calls:
+            return
+
+        self.forecasting_model.update([np.asarray(calls, dtype=np.float64) for calls in self._completed_llm_calls])
+        self._completed_llm_calls.clear()
+
+    def _write_chunk(self, writer, columns: dict[str, list]):
+        pa = optional_import("pyarrow")
+
+        if writer is None:
+            pq = optional_import("pyarrow.parquet")
+            schema = pa.schema([(name, column_type) for name, column_type in _COLUMN_TYPES.items()
+                                if not (self.exclude_io_text and name in _TEXT_COLUMNS)])
+            parquet_path = os.path.join(self.output_dir, "standardized_data_all.parquet")
+            writer = pq.ParquetWriter(parquet_path, schema, compression="zstd")
+            logger.info("Writing standardized data to %s", parquet_path)
+
+        writer.write_table(pa.table({name: columns[name] for name in writer.schema.names}, schema=writer.schema))
+        return writer
+
+    def _compute_throughput_estimates(self) -> InferenceMetricsModel:
+        """
+        Same estimate as ``ProfilerRunner._compute_throughput_estimates``: the number of requests over the time window
+        between the first and the last step, with a standard error of ``throughput / sqrt(n)``. Requests whose root span
+        is not in the traces are not counted.
+        """
+        total_time = self._max_timestamp - self._min_timestamp
+        n = self._root_request_count
+        if total_time <= 0 or n <= 1:
+            return InferenceMetricsModel()
+
+        throughput_value = n / total_time
+        standard_error = throughput_value / math.sqrt(n)
+
+        intervals = {'n': n, 'mean': throughput_value}
+        for confidence, zvalue in \
+                [("ninetieth_interval", 1.645), ("ninety_fifth_interval", 1.96), ("ninety_ninth_interval", 2.576)]:
+            ci_lower = throughput_value - zvalue * standard_error
+            ci_upper = throughput_value + zvalue * standard_error
+            intervals[confidence] = (max(ci_lower, 0.0), ci_upper)
+
+        return InferenceMetricsModel(**intervals)
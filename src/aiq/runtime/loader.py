@@ -15,8 +15,11 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
 import importlib.metadata
 import logging
+import sys
 import time
 from contextlib import asynccontextmanager
 from enum import IntFlag
@@ -26,6 +29,11 @@ from functools import reduce
 from aiq.builder.workflow_builder import WorkflowBuilder
 from aiq.cli.type_registry import GlobalTypeRegistry
 from aiq.data_models.config import AIQConfig
+from aiq.runtime.plugin_index import PluginIndex
+from aiq.runtime.plugin_index import PluginIndexEntry
+from aiq.runtime.plugin_index import compute_fingerprint
+from aiq.runtime.plugin_index import config_types
+from aiq.runtime.plugin_index import entry_point_key
 from aiq.runtime.session import AIQSessionManager
 from aiq.utils.data_models.schema_validator import validate_schema
 from aiq.utils.debugging_utils import is_debugger_attached
@@ -81,11 +89,11 @@ def load_config(config_file: StrPath) -> AIQConfig:
         The validated AIQConfig object
     """
 
-    # Ensure all of the plugins are loaded
-    discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
-
     config_yaml = yaml_load(config_file)
 
+    # Ensure the plugins used by the configuration file are loaded
+    discover_and_register_plugins(PluginTypes.CONFIG_OBJECT, config_yaml)
+
     # Validate configuration adheres to AIQ Toolkit schemas
     validated_aiq_config = validate_schema(config_yaml, AIQConfig)
 
@@ -143,52 +151,141 @@ def discover_entrypoints(plugin_type: PluginTypes):
     return aiq_plugins
 
 
-def discover_and_register_plugins(plugin_type: PluginTypes):
+def _load_plugin(load_fn, description: str, count: int) -> None:
+    try:
+        logger.debug("Loading %s...", description)
+
+        start_time = time.time()
+
+        load_fn()
+
+        elapsed_time = (time.time() - start_time) * 1000
+
+        logger.debug("Loading %s...Complete (%f ms)", description, elapsed_time)
+
+        # Log a warning if the plugin took a long time to load. This can be useful for debugging slow imports.
+        # The threshold is 300 ms if no plugins have been loaded yet, and 100 ms otherwise. Triple the threshold
+        # if a debugger is attached.
+        if (elapsed_time > (300.0 if count == 0 else 100.0) * (3 if is_debugger_attached() else 1)):
+            logger.warning(
+                "Loading %s took a long time (%f ms). "
+                "Ensure all imports are inside your registered functions.",
+                description,
+                elapsed_time)
+
+    except ImportError:
+        logger.warning("Failed to import plugin %s", description, exc_info=True)
+        # Optionally, you can mark the plugin as unavailable or take other actions
+
+    except Exception:
+        logger.exception("An error occurred while loading plugin %s", description, exc_info=True)
+
+
+def _load_entry_points(entry_points: list[importlib.metadata.EntryPoint]) -> None:
+
+    for count, entry_point in enumerate(entry_points):
+        _load_plugin(entry_point.load, f"module '{entry_point.module}' from entry point '{entry_point.name}'", count)
+
+
+def _build_plugin_index(entry_points: list[importlib.metadata.EntryPoint], fingerprint: str) -> PluginIndex:
+    """
+    Load the entry points one at a time, recording the registrations each of them adds.
+    """
+    registry = GlobalTypeRegistry.get()
+    index = PluginIndex(fingerprint=fingerprint)
+    seen = set()
+
+    def add_new_registrations(entry_point: importlib.metadata.EntryPoint | None) -> bool:
+        added = False
+        for kind, registration in registry.iter_registrations():
+            if (id(registration) in seen):
+                continue
+
+            seen.add(id(registration))
+            module = getattr(registration.build_fn, "__module__", None)
+            if (module is None or module == "__main__"):
+                if (entry_point is None):
+                    continue
+                module = entry_point.module
+
+            added = True
+            index.entries.append(
+                PluginIndexEntry(kind=kind,
+                                 full_type=getattr(registration, "full_type", None),
+                                 framework=getattr(registration, "llm_framework", None),
+                                 module=module,
+                                 entry_point=entry_point_key(entry_point) if entry_point is not None else None,
+                                 framework_wrappers=getattr(registration, "framework_wrappers", [])))
+        return added
+
+    # Plugins loaded earlier in this process, e.g. the front ends by the CLI
+    add_new_registrations(None)
+
+    for count, entry_point in enumerate(entry_points):
+        already_imported = entry_point.module in sys.modules
+
+        _load_plugin(entry_point.load, f"module '{entry_point.module}' from entry point '{entry_point.name}'", count)
+
+        if (not add_new_registrations(entry_point) and not already_imported):
+            index.unindexed_entry_points.append(entry_point_key(entry_point))
+
+    return index
+
+
+def _registered_type_names() -> set[str]:
+
+    names = set()
+    for _, registration in GlobalTypeRegistry.get().iter_registrations():
+        full_type = getattr(registration, "full_type", None)
+        if (full_type is not None):
+            names.update((full_type, full_type.split("/")[-1]))
+
+    return names
+
+
+def discover_and_register_plugins(plugin_type: PluginTypes, config_dict: dict | None = None):
     """
     Discover all the requested plugin types which were registered via an entry point group and register them into the
     GlobalTypeRegistry.
+
+    When the configuration file contents are given, only the modules registering the types referenced by it are
+    imported, using a persisted index of the plugins (see `aiq.runtime.plugin_index`). The remaining plugins are loaded
+    the first time a framework client or tool wrapper lookup misses. The index is built on the first run, and rebuilt
+    whenever the configuration references a type it does not know.
     """
 
     # Get the entry points for the specified groups
     aiq_plugins = discover_entrypoints(plugin_type)
 
-    count = 0
+    registry = GlobalTypeRegistry.get()
 
     # Pause registration hooks for performance. This is useful when loading a large number of plugins.
-    with GlobalTypeRegistry.get().pause_registration_changed_hooks():
-
-        for entry_point in aiq_plugins:
-            try:
-                logger.debug("Loading module '%s' from entry point '%s'...", entry_point.module, entry_point.name)
+    with registry.pause_registration_changed_hooks():
 
-                start_time = time.time()
+        if (config_dict is None):
+            _load_entry_points(aiq_plugins)
+            return
 
-                entry_point.load()
+        fingerprint = compute_fingerprint(aiq_plugins)
+        required_types, referenced_types = config_types(config_dict)
 
-                elapsed_time = (time.time() - start_time) * 1000
+        index = PluginIndex.load(fingerprint)
+        modules = index.modules_for(required_types, referenced_types) if index is not None else None
 
-                logger.debug("Loading module '%s' from entry point '%s'...Complete (%f ms)",
-                             entry_point.module,
-                             entry_point.name,
-                             elapsed_time)
+        if (modules is not None):
+            always_loaded = set(index.unindexed_entry_points)
+            _load_entry_points([x for x in aiq_plugins if entry_point_key(x) in always_loaded])
 
-                # Log a warning if the plugin took a long time to load. This can be useful for debugging slow imports.
-                # The threshold is 300 ms if no plugins have been loaded yet, and 100 ms otherwise. Triple the threshold
-                # if a debugger is attached.
-                if (elapsed_time > (300.0 if count == 0 else 100.0) * (3 if is_debugger_attached() else 1)):
-                    logger.warning(
-                        "Loading module '%s' from entry point '%s' took a long time (%f ms). "
-                        "Ensure all imports are inside your registered functions.",
-                        entry_point.module,
-                        entry_point.name,
-                        elapsed_time)
+            for count, module in enumerate(modules):
+                _load_plugin(functools.partial(importlib.import_module, module), f"module '{module}'", count)
 
-            except ImportError:
-                logger.warning("Failed to import plugin '%s'", entry_point.name, exc_info=True)
-                # Optionally, you can mark the plugin as unavailable or take other actions
+            if (required_types.issubset(_registered_type_names())):
+                logger.debug("Loaded %d plugin modules from the plugin index", len(modules))
+                registry.set_missing_registrations_loader(functools.partial(_load_entry_points, aiq_plugins))
+                return
 
-            except Exception:
-                logger.exception("An error occurred while loading plugin '%s': {e}", entry_point.name, exc_info=True)
+            logger.debug("The plugin index is out of date, rebuilding it")
 
-            finally:
-                count += 1
+        logger.debug("Building the plugin index")
+        index = _build_plugin_index(aiq_plugins, fingerprint)
+        index.save()
@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Persisted index of the component types registered by each plugin, used to import only the plugins a configuration
+file needs.
+
+The index is built the first time the plugins are discovered by loading every entry point, one at a time, and recording
+which registrations each of them adds along with the module defining them. It is stored in the user cache directory
+under a fingerprint of the entry points, the versions of the distributions providing them and the Python environment,
+so installing, upgrading or removing a plugin starts a new index.
+"""
+
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import sys
+import tempfile
+import typing
+from pathlib import Path
+
+from platformdirs import user_cache_dir
+from pydantic import BaseModel
+from pydantic import ValidationError
+
+logger = logging.getLogger(__name__)
+
+_INDEX_FORMAT_VERSION = 1
+
+# Sections of the configuration file holding a dictionary of components
+_COMPONENT_SECTIONS = ("authentication",
+                       "embedders",
+                       "functions",
+                       "its_strategies",
+                       "llms",
+                       "memory",
+                       "object_stores",
+                       "retrievers")
+
+# Kinds of registration which are looked up by framework rather than referenced in the configuration file
+_CLIENT_KINDS = {
+    "llm_client": "llm_provider",
+    "embedder_client": "embedder_provider",
+    "retriever_client": "retriever_provider",
+}
+
+
+class PluginIndexEntry(BaseModel):
+    kind: str
+    full_type: str | None = None
+    framework: str | None = None
+    module: str
+    # Entry point which added the registration, None when it was loaded before the index was built
+    entry_point: str | None = None
+    framework_wrappers: list[str] = []
+
+    @property
+    def local_name(self) -> str | None:
+        return self.full_type.split("/")[-1] if self.full_type else None
+
+
+class PluginIndex(BaseModel):
+    fingerprint: str
+    entries: list[PluginIndexEntry] = []
+    # Entry points which registered nothing when the index was built, they are always loaded
+    unindexed_entry_points: list[str] = []
+
+    @staticmethod
+    def path(fingerprint: str) -> Path:
+        return Path(user_cache_dir(appname="aiq")) / "plugin_index" / f"{fingerprint}.json"
+
+    @classmethod
+    def load(cls, fingerprint: str) -> "PluginIndex | None":
+        try:
+            index = cls.model_validate_json(cls.path(fingerprint).read_bytes())
+        except (OSError, ValidationError):
+            return None
+
+        return index if index.fingerprint == fingerprint else None
+
+    def save(self) -> None:
+        path = self.path(self.fingerprint)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so concurrent processes never read a partially written index
+            with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False, encoding="utf-8") as f:
+                f.write(self.model_dump_json())
+            os.replace(f.name, path)
+        except OSError:
+            logger.debug("Could not write the plugin index to %s", path, exc_info=True)
+
+    def modules_for(self, required_types: set[str], referenced_types: set[str]) -> list[str] | None:
+        """
+        Modules to import for a configuration file, in index order, or None when one of the required types is not in
+        the index.
+
+        Besides the modules registering the referenced types, the modules registering the tool wrappers of the
+        frameworks the referenced functions are wrapped for, and the clients of the referenced providers for those
+        frameworks are imported.
+        """
+        by_name: dict[str, list[PluginIndexEntry]] = {}
+        for entry in self.entries:
+            if entry.full_type is not None and entry.kind not in _CLIENT_KINDS:
+                by_name.setdefault(entry.full_type, []).append(entry)
+                by_name.setdefault(entry.local_name, []).append(entry)
+
+        missing = required_types.difference(by_name)
+        if missing:
+            logger.debug("Types %s are not in the plugin index", sorted(missing))
+            return None
+
+        selected = [entry for name in required_types | referenced_types for entry in by_name.get(name, [])]
+        frameworks = {framework for entry in selected for framework in entry.framework_wrappers}
+        providers = {(entry.kind, entry.full_type) for entry in selected}
+
+        for entry in self.entries:
+            if entry.kind == "tool_wrapper":
+                if entry.framework in frameworks:
+                    selected.append(entry)
+            elif entry.kind in _CLIENT_KINDS:
+                if (_CLIENT_KINDS[entry.kind], entry.full_type) in providers and (entry.framework is None
+                                                                                  or entry.framework in frameworks):
+                    selected.append(entry)
+
+        return list(dict.fromkeys(entry.module for entry in selected))
+
+
+def entry_point_key(entry_point: importlib.metadata.EntryPoint) -> str:
+    return f"{entry_point.group}:{entry_point.name}"
+
+
+def compute_fingerprint(entry_points: list[importlib.metadata.EntryPoint]) -> str:
+    """
+    Fingerprint of the plugins installed in the current Python environment.
+    """
+    plugins = sorted((entry_point.group,
+                      entry_point.name,
+                      entry_point.value,
+                      entry_point.dist.name if entry_point.dist else "",
+                      entry_point.dist.version if entry_point.dist else "") for entry_point in entry_points)
+
+    return hashlib.sha256(json.dumps([_INDEX_FORMAT_VERSION, sys.prefix, sys.version,
+                                      plugins]).encode("utf-8")).hexdigest()[:32]
+
+
+def _collect_types(value: typing.Any, types: set[str]) -> None:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key in ("_type", "type") and isinstance(item, str):
+                types.add(item)
+            else:
+                _collect_types(item, types)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_types(item, types)
+
+
+def config_types(config_dict: dict) -> tuple[set[str], set[str]]:
+    """
+    Types referenced by a configuration file, as (required, referenced).
+
+    Required types are those of the components, the workflow, the front end, the telemetry exporters and the
+    evaluators, which must be provided by a plugin. Referenced types include every ``_type`` found anywhere in the
+    configuration, some of which, e.g. the dataset types, are not provided by plugins.
+    """
+    required: set[str] = set()
+
+    def add_required(component: typing.Any):
+        if isinstance(component, dict):
+            component_type = component.get("_type", component.get("type"))
+            if isinstance(component_type, str):
+                required.add(component_type)
+
+    for section in _COMPONENT_SECTIONS:
+        for component in (config_dict.get(section) or {}).values():
+            add_required(component)
+
+    add_required(config_dict.get("workflow"))
+
+    general = config_dict.get("general") or {}
+    add_required(general.get("front_end"))
+    telemetry = general.get("telemetry") or {}
+    for section in ("logging", "tracing"):
+        for component in (telemetry.get(section) or {}).values():
+            add_required(component)
+
+    for component in ((config_dict.get("eval") or {}).get("evaluators") or {}).values():
+        add_required(component)
+
+    referenced: set[str] = set()
+    _collect_types(config_dict, referenced)
+
+    return required, referenced
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import logging
+import random
 import typing
 from enum import Enum
 
@@ -48,7 +49,8 @@ class AIQRunner:
                  input_message: typing.Any,
                  entry_fn: Function,
                  context_state: AIQContextState,
-                 exporter_manager: ExporterManager):
+                 exporter_manager: ExporterManager,
+                 trace_sample_rate: float = 1.0):
         """
         The AIQRunner class is used to run a workflow. It handles converting input and output data types and running the
         workflow with the specified concurrency.
@@ -63,6 +65,9 @@ class AIQRunner:
             The context state to use
         exporter_manager : ExporterManager
             The exporter manager to use
+        trace_sample_rate : float, optional
+            Probability that this run is traced. Every intermediate step of a run that is not sampled is dropped, by
+            default 1.0
         """
 
         if (entry_fn is None):
@@ -80,6 +85,7 @@ class AIQRunner:
         self._input_message = input_message
 
         self._exporter_manager = exporter_manager
+        self._trace_sample_rate = trace_sample_rate
 
     @property
     def context(self) -> AIQContext:
@@ -99,6 +105,8 @@ class AIQRunner:
             function_name="root",
             function_id="root",
         ))
+        self._context_state.trace_sampled.set(self._trace_sample_rate >= 1.0
+                                              or random.random() < self._trace_sample_rate)
 
         if (self._state == AIQRunnerState.UNINITIALIZED):
             self._state = AIQRunnerState.INITIALIZED
@@ -13,17 +13,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import aiohttp
 import asyncio
 import json
 import os
+import typing
+from collections.abc import AsyncGenerator
 from datetime import datetime
 from typing import List, Dict
 
+import httpx
+from pydantic import Field
+
 from aiq.builder.builder import Builder
 from aiq.builder.function_info import FunctionInfo
 from aiq.cli.register_workflow import register_function
 from aiq.data_models.function import FunctionBaseConfig
+from aiq.tool.lianjia_cache import LianjiaCacheConfig
+from aiq.tool.lianjia_cache import LianjiaPageCache
+from aiq.tool.lianjia_cache import city_from_url
+from aiq.tool.lianjia_cache import fetch_page
+from aiq.tool.lianjia_fetcher import LIANJIA_HEADERS
+from aiq.tool.lianjia_fetcher import PageFetcher
+from aiq.tool.listing_store import get_listing_store
+from aiq.utils.optional_imports import optional_import
+
+CHART_MAX_ITEMS = 20
+PREVIEW_MAX_ITEMS = 2
 
 
 class JsonFetchToolConfig(FunctionBaseConfig, name="json_fetch_tool"):
@@ -34,6 +49,146 @@ class JsonFetchToolConfig(FunctionBaseConfig, name="json_fetch_tool"):
     max_pages: int = 5               # 最大采集页数
     delay_seconds: float = 1.0       # 每页采集间隔（秒）
     export_dir: str = "./data"       # 导出 JSON 文件目录
+    export_format: typing.Literal["json", "ndjson", "parquet"] = Field(
+        default="json",
+        description="原始数据导出格式：json（JSON 数组）、ndjson（每行一条记录）或 parquet（需要安装 pyarrow）。"
+        "所有格式都会在每页采集完成后立即写入文件")
+    cache: LianjiaCacheConfig = Field(default_factory=LianjiaCacheConfig, description="页面缓存配置")
+
+
+class _JsonArrayWriter:
+    """Writes items as a pretty-printed JSON array, one element at a time."""
+
+    extension = "json"
+
+    def __init__(self, path: str):
+        self._file = open(path, "w", encoding="utf-8")
+        self._count = 0
+        self._file.write("[")
+
+    def write_page(self, items: list[dict]) -> None:
+        for item in items:
+            self._file.write(",\n  " if self._count else "\n  ")
+            self._file.write(json.dumps(item, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+            self._count += 1
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.write("\n]" if self._count else "]")
+        self._file.close()
+
+
+class _NdjsonWriter:
+    """Writes one JSON document per line."""
+
+    extension = "ndjson"
+
+    def __init__(self, path: str):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write_page(self, items: list[dict]) -> None:
+        self._file.writelines(json.dumps(item, ensure_ascii=False) + "\n" for item in items)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    """
+    Writes each page as a Parquet row group.
+
+    Every value is stored as a string (nested values as JSON) since the listing API does not return consistently typed
+    fields. A Parquet file has a single schema, so when a page brings columns the previous pages did not have the
+    following pages go to a new part file with the extended column set. On close the parts are merged one at a time into
+    the export file, the columns a part lacks are filled with nulls.
+    """
+
+    extension = "parquet"
+
+    def __init__(self, path: str):
+        self._pa = optional_import("pyarrow")
+        self._pq = optional_import("pyarrow.parquet")
+        self._path = path
+        self._schema = None
+        self._writer = None
+        self._parts: list[str] = []
+
+    @staticmethod
+    def _to_str(value) -> str | None:
+        if value is None or isinstance(value, str):
+            return value
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False)
+        return str(value)
+
+    def _open_part(self, columns: list[str]) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+        self._schema = self._pa.schema([(column, self._pa.string()) for column in columns])
+        part = f"{self._path}.part{len(self._parts)}"
+        self._parts.append(part)
+        self._writer = self._pq.ParquetWriter(part, self._schema)
+
+    def write_page(self, items: list[dict]) -> None:
+        if not items:
+            return
+
+        known = self._schema.names if self._schema is not None else []
+        names = list(dict.fromkeys([*known, *(key for item in items for key in item)]))
+        if len(names) > len(known):
+            self._open_part(names)
+
+        columns = {name: [self._to_str(item.get(name)) for item in items] for name in self._schema.names}
+        self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self._schema))
+
+    def close(self) -> None:
+        if self._writer is None:
+            return
+        self._writer.close()
+
+        if len(self._parts) == 1:
+            os.replace(self._parts[0], self._path)
+            return
+
+        # The last part has every column, earlier parts only lack the columns added after them
+        with self._pq.ParquetWriter(self._path, self._schema) as writer:
+            for part in self._parts:
+                part_file = self._pq.ParquetFile(part)
+                for index in range(part_file.num_row_groups):
+                    table = part_file.read_row_group(index)
+                    columns = [
+                        table.column(name) if name in table.column_names else self._pa.nulls(
+                            table.num_rows, self._pa.string()) for name in self._schema.names
+                    ]
+                    writer.write_table(self._pa.Table.from_arrays(columns, schema=self._schema))
+                os.remove(part)
+
+
+_WRITERS = {"json": _JsonArrayWriter, "ndjson": _NdjsonWriter, "parquet": _ParquetWriter}
+
+
+def _chart_point(index: int, item: dict) -> dict:
+    # Extract relevant fields for charting
+    title = item.get("title", f"Item {index + 1}")
+    # 修复价格字段提取逻辑，使用正确的字段名
+    price = item.get("avg_unit_price", item.get("average_price", item.get("price", "0")))
+
+    try:
+        value = int(price)
+    except (ValueError, TypeError):
+        value = 0
+
+    # Add group based on price ranges
+    if value < 30000:
+        group = "低价位"
+    elif value < 50000:
+        group = "中价位"
+    else:
+        group = "高价位"
+
+    return {"category": title, "value": value, "group": group}
 
 
 @register_function(config_type=JsonFetchToolConfig)
@@ -41,87 +196,81 @@ async def json_fetch_tool(config: JsonFetchToolConfig, builder: Builder):
     """
     采集链家新房数据并导出为 JSON 文件
     """
+    client = httpx.AsyncClient(timeout=15.0, follow_redirects=True, headers=LIANJIA_HEADERS)
+    cache = LianjiaPageCache.from_config(config.cache)
+    # Pages are fetched one at a time with ``delay_seconds`` between network requests, retries still back off
+    fetcher = PageFetcher(client, max_concurrency=1, requests_per_second=0)
+    store = get_listing_store()
 
-    async def _fetch_and_export(unused: str) -> Dict:
-        all_data: List[Dict] = []
+    async def _fetch_and_export_stream(unused: str) -> AsyncGenerator[Dict]:
+        """
+        Fetches the pages one by one and appends each page to the export file as soon as it arrives. Only the current
+        page, the chart points and the preview are kept in memory. A progress update is yielded after every page
+        and the final summary is yielded last.
+        """
         os.makedirs(config.export_dir, exist_ok=True)
-        
-        # Add headers to make request look more like a browser request
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive"
-        }
 
-        timeout = aiohttp.ClientTimeout(total=15)
-        async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
+        # Generate timestamp for files
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        writer_cls = _WRITERS[config.export_format]
+        raw_data_file_path = os.path.join(config.export_dir, f"lianjia_data_{timestamp}.{writer_cls.extension}")
+        writer = writer_cls(raw_data_file_path)
+
+        total_items = 0
+        preview: List[Dict] = []
+        chart_data: List[Dict] = []
+        group_stats: Dict[str, Dict[str, int]] = {}
+
+        try:
             for page in range(1, config.max_pages + 1):
                 url = config.base_url.format(page=page)
-                try:
-                    async with session.get(url, allow_redirects=True) as resp:
-                        resp.raise_for_status()
-                        
-                        # Check content type before trying to parse as JSON
-                        content_type = resp.headers.get('content-type', '')
-                        if 'application/json' in content_type:
-                            data = await resp.json()
-                            # Fixed data parsing - the correct path is data["data"]["list"]
-                            if "data" in data and "list" in data["data"]:
-                                all_data.extend(data["data"]["list"])
-                        else:
-                            # Log warning when receiving non-JSON content
-                            print(f"[WARNING] Page {page} returned non-JSON content: {content_type}")
-                            # Try to parse as JSON anyway in case content-type is incorrect
-                            try:
-                                data = await resp.json()
-                                if "data" in data and "list" in data["data"]:
-                                    all_data.extend(data["data"]["list"])
-                            except Exception as json_error:
-                                print(f"[ERROR] Failed to parse JSON from page {page}: {json_error}")
-                                # Log response info for debugging
-                                text = await resp.text()
-                                print(f"[DEBUG] Response preview: {text[:200]}...")
-                except Exception as e:
-                    print(f"[ERROR] Failed to fetch page {page}: {e}")
-                await asyncio.sleep(config.delay_seconds)
+                cached_page, from_network = await fetch_page(fetcher, cache, url)
+
+                items: List[Dict] = []
+                if cached_page is not None:
+                    try:
+                        data = cached_page.json()
+                        # Fixed data parsing - the correct path is data["data"]["list"]
+                        if "data" in data and "list" in data["data"]:
+                            items = data["data"]["list"]
+                    except Exception as json_error:
+                        print(f"[ERROR] Failed to parse JSON from page {page}: {json_error}")
+                        # Log response info for debugging
+                        print(f"[DEBUG] Response preview: {cached_page.body[:200]!r}...")
+                else:
+                    print(f"[ERROR] Failed to fetch page {page}")
+
+                writer.write_page(items)
+                store.add_items(city_from_url(url), items)
+
+                for item in items:
+                    point = _chart_point(total_items, item)
+                    stats = group_stats.setdefault(point["group"], {"count": 0, "value_sum": 0})
+                    stats["count"] += 1
+                    stats["value_sum"] += point["value"]
+
+                    if len(chart_data) < CHART_MAX_ITEMS:
+                        chart_data.append(point)
+                    if len(preview) < PREVIEW_MAX_ITEMS:
+                        preview.append(item)
+                    total_items += 1
+
+                yield {
+                    "status": "in_progress",
+                    "page": page,
+                    "max_pages": config.max_pages,
+                    "page_items": len(items),
+                    "total_items": total_items,
+                    "preview": preview
+                }
+
+                # Only pace requests that actually hit the site, cache hits are served immediately
+                if from_network and page < config.max_pages:
+                    await asyncio.sleep(config.delay_seconds)
+        finally:
+            writer.close()
 
-        # Generate timestamp for files
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Save raw data to JSON file
-        raw_data_file_path = os.path.join(config.export_dir, f"lianjia_data_{timestamp}.json")
-        with open(raw_data_file_path, "w", encoding="utf-8") as f:
-            json.dump(all_data, f, ensure_ascii=False, indent=2)
-
-        # Convert to chart format
-        chart_data = []
-        for i, item in enumerate(all_data[:20]):  # Limit to first 20 items for chart
-            # Extract relevant fields for charting
-            title = item.get("title", f"Item {i+1}")
-            # 修复价格字段提取逻辑，使用正确的字段名
-            price = item.get("avg_unit_price", item.get("average_price", item.get("price", "0")))
-            
-            try:
-                value = int(price)
-            except (ValueError, TypeError):
-                value = 0
-                
-            # Add group based on price ranges
-            if value < 30000:
-                group = "低价位"
-            elif value < 50000:
-                group = "中价位"
-            else:
-                group = "高价位"
-                
-            chart_data.append({
-                "category": title,
-                "value": value,
-                "group": group
-            })
-        
         # Save chart data to JSON file
         chart_result = {
             "data": chart_data,
@@ -130,20 +279,36 @@ async def json_fetch_tool(config: JsonFetchToolConfig, builder: Builder):
             "axisXTitle": "楼盘名称",
             "axisYTitle": "均价(元/平)"
         }
-        
+
         chart_file_path = os.path.join(config.export_dir, f"lianjia_chart_data_{timestamp}.json")
         with open(chart_file_path, "w", encoding="utf-8") as f:
             json.dump(chart_result, f, ensure_ascii=False, indent=2)
-        
-        return {
+
+        yield {
             "status": "success",
             "raw_data_file_path": raw_data_file_path,
             "chart_data_file_path": chart_file_path,
-            "total_items": len(all_data),
-            "preview": all_data[:2]  # 返回部分数据预览
+            "total_items": total_items,
+            "price_groups": {
+                group: {"count": stats["count"], "average_price": stats["value_sum"] // stats["count"]}
+                for group, stats in group_stats.items()
+            },
+            "preview": preview  # 返回部分数据预览
         }
 
-    yield FunctionInfo.from_fn(
-        _fetch_and_export,
-        description="采集链家新房数据并导出为 JSON 文件，同时生成原始数据和图表格式数据"
-    )
\ No newline at end of file
+    async def _fetch_and_export(unused: str) -> Dict:
+        result: Dict = {}
+        async for result in _fetch_and_export_stream(unused):
+            pass
+        return result
+
+    try:
+        yield FunctionInfo.create(
+            single_fn=_fetch_and_export,
+            stream_fn=_fetch_and_export_stream,
+            description="采集链家新房数据并导出为 JSON 文件，同时生成原始数据和图表格式数据"
+        )
+    finally:
+        await client.aclose()
+        if cache is not None:
+            cache.close()
@@ -0,0 +1,248 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
+
+from platformdirs import user_cache_dir
+from pydantic import BaseModel
+from pydantic import Field
+
+from aiq.tool.lianjia_fetcher import PageFetcher
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_accessed_at ON pages (accessed_at);
+"""
+
+
+class LianjiaCacheConfig(BaseModel):
+    """
+    Configuration of the on-disk Lianjia page cache shared by the Lianjia tools.
+    """
+    enabled: bool = Field(default=True, description="是否启用页面缓存")
+    path: str | None = Field(default=None, description="SQLite 缓存文件路径，默认位于用户缓存目录下的 aiq/lianjia_pages.sqlite")
+    ttl_seconds: float = Field(default=6 * 60 * 60, description="缓存有效期（秒），过期后使用 ETag/Last-Modified 向服务器重新验证", ge=0)
+    max_entries: int = Field(default=2000, description="缓存的最大页面数，超出后按 LRU 淘汰", ge=1)
+    max_size_bytes: int = Field(default=256 * 1024 * 1024, description="缓存的最大总字节数，超出后按 LRU 淘汰", ge=1)
+
+
+@dataclasses.dataclass
+class CachedPage:
+    key: str
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+    def json(self):
+        return json.loads(self.body)
+
+
+def city_from_url(url: str) -> str:
+    """
+    Return the Lianjia city code for ``url`` (``sh`` for ``https://sh.fang.lianjia.com/...``), falling back to the
+    full host name for other sites.
+    """
+    host = urlsplit(url).hostname or ""
+    if host.endswith(".fang.lianjia.com"):
+        return host.split(".", 1)[0]
+    return host
+
+
+class LianjiaPageCache:
+    """
+    SQLite-backed cache of Lianjia listing pages keyed by their normalized request URL.
+
+    Entries younger than ``ttl_seconds`` are served without touching the network. Older entries are revalidated
+    with ``If-None-Match``/``If-Modified-Since`` and refreshed in place on a ``304 Not Modified``. The cache is
+    trimmed in least-recently-used order to ``max_entries`` pages and ``max_size_bytes`` bytes.
+
+    The database runs in WAL mode so several tools, and several processes, can share one cache file.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int, max_size_bytes: int):
+        self._path = path
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def from_config(cls, config: LianjiaCacheConfig) -> "LianjiaPageCache | None":
+        if not config.enabled:
+            return None
+
+        path = config.path or os.path.join(user_cache_dir(appname="aiq"), "lianjia_pages.sqlite")
+
+        return cls(path,
+                   ttl_seconds=config.ttl_seconds,
+                   max_entries=config.max_entries,
+                   max_size_bytes=config.max_size_bytes)
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        """
+        Normalize ``url`` into a cache key: the scheme and host are lower-cased, the query parameters are sorted and
+        the fragment is dropped, so only requests for the same resource share an entry.
+        """
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _get(self, key: str) -> CachedPage | None:
+        with self._lock:
+            row = self._conn.execute("SELECT body, etag, last_modified, fetched_at FROM pages WHERE key = ?",
+                                     (key, )).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute("UPDATE pages SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+
+        return CachedPage(key=key, body=row[0], etag=row[1], last_modified=row[2], fetched_at=row[3])
+
+    def _put(self, page: CachedPage) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (key, body, size, etag, last_modified, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (page.key, page.body, len(page.body), page.etag, page.last_modified, page.fetched_at, time.time()))
+            self._evict()
+            self._conn.commit()
+
+    def _touch(self, key: str, fetched_at: float) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE pages SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                               (fetched_at, time.time(), key))
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        # Keep the most recently used pages that fit both the entry count and the byte budget.
+        self._conn.execute(
+            "DELETE FROM pages WHERE key IN ("
+            "  SELECT key FROM ("
+            "    SELECT key, ROW_NUMBER() OVER w AS rank, SUM(size) OVER w AS running_size FROM pages"
+            "    WINDOW w AS (ORDER BY accessed_at DESC ROWS UNBOUNDED PRECEDING)"
+            "  ) WHERE rank > ? OR running_size > ?"
+            ")", (self._max_entries, self._max_size_bytes))
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        return (time.time() - page.fetched_at) < self._ttl_seconds
+
+    async def fetch(self, fetcher: PageFetcher, url: str) -> tuple[CachedPage | None, bool]:
+        """
+        Return the page for ``url``, fetching it only if the cached copy is missing or stale.
+
+        Returns a tuple of the page (or ``None`` if it could not be loaded) and whether the network was used.
+        """
+        key = self.make_key(url)
+        cached = await asyncio.to_thread(self._get, key)
+
+        if cached is not None and self.is_fresh(cached):
+            return cached, False
+
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = await fetcher.fetch(url, headers=headers or None)
+
+        if response is None:
+            # Serve stale data rather than nothing when the site is unreachable
+            return cached, True
+
+        if response.status_code == 304 and cached is not None:
+            cached.fetched_at = time.time()
+            await asyncio.to_thread(self._touch, key, cached.fetched_at)
+            return cached, True
+
+        if not response.is_success:
+            logger.error("HTTP %d when fetching %s", response.status_code, url)
+            return cached, True
+
+        fresh = CachedPage(key=key,
+                           body=response.content,
+                           etag=response.headers.get("ETag"),
+                           last_modified=response.headers.get("Last-Modified"),
+                           fetched_at=time.time())
+
+        # Anti-crawler and error pages come back as HTML with a 200 status, only keep real listing payloads
+        try:
+            fresh.json()
+        except ValueError:
+            logger.warning("Not caching non-JSON response from %s", url)
+            return fresh, True
+
+        await asyncio.to_thread(self._put, fresh)
+        return fresh, True
+
+
+async def fetch_page(fetcher: PageFetcher, cache: LianjiaPageCache | None, url: str) -> tuple[CachedPage | None, bool]:
+    """
+    Load a listing page through ``cache`` when one is configured, otherwise straight from the network.
+
+    Returns a tuple of the page (or ``None`` if it could not be loaded) and whether the network was used.
+    """
+    if cache is not None:
+        return await cache.fetch(fetcher, url)
+
+    response = await fetcher.fetch(url)
+    if response is None:
+        return None, True
+
+    if not response.is_success:
+        logger.error("HTTP %d when fetching %s", response.status_code, url)
+        return None, True
+
+    return CachedPage(key=LianjiaPageCache.make_key(url),
+                      body=response.content,
+                      etag=response.headers.get("ETag"),
+                      last_modified=response.headers.get("Last-Modified"),
+                      fetched_at=time.time()), True
@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Sequence
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Headers used for every request against the Lianjia loupan pages.
+LIANJIA_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+                   "Chrome/91.0.4472.124 Safari/537.36"),
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive"
+}
+
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """
+    Async token bucket limiting how often requests may start.
+
+    Tokens are refilled continuously at ``rate`` per second up to ``capacity``. A non-positive rate disables
+    limiting entirely.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = max(1.0, capacity)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self._rate <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+
+class PageFetcher:
+    """
+    Bounded-concurrency page fetcher on top of a shared ``httpx.AsyncClient``.
+
+    At most ``max_concurrency`` requests are in flight at once, request starts are throttled by a token bucket per
+    host, and 429/5xx responses or transport errors are retried with jittered exponential backoff.
+    """
+
+    def __init__(self,
+                 client: httpx.AsyncClient,
+                 *,
+                 max_concurrency: int = 4,
+                 requests_per_second: float = 4.0,
+                 burst: int = 4,
+                 max_retries: int = 3,
+                 backoff_base: float = 0.5,
+                 backoff_max: float = 10.0):
+        self._client = client
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._requests_per_second = requests_per_second
+        self._burst = burst
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _bucket_for(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self._requests_per_second, self._burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    def _backoff_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        if response is not None and response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None:
+                try:
+                    return min(self._backoff_max, float(retry_after))
+                except ValueError:
+                    pass
+
+        delay = min(self._backoff_max, self._backoff_base * (2**attempt))
+        # Equal jitter keeps at least half of the delay while still spreading out retries.
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def fetch(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response | None:
+        """
+        Fetch a single URL, retrying transient failures.
+
+        Returns the final response, or ``None`` if the request could not be completed.
+        """
+        bucket = self._bucket_for(url)
+
+        async with self._semaphore:
+            for attempt in range(self._max_retries + 1):
+                await bucket.acquire()
+
+                response: httpx.Response | None = None
+                try:
+                    response = await self._client.get(url, headers=headers)
+                except httpx.TimeoutException:
+                    logger.error("Timeout when fetching %s (attempt %d)", url, attempt + 1)
+                except httpx.RequestError as e:
+                    logger.error("Request error when fetching %s (attempt %d): %s", url, attempt + 1, e)
+                else:
+                    if response.status_code not in _RETRY_STATUS_CODES:
+                        return response
+                    logger.warning("Received HTTP %d from %s (attempt %d)", response.status_code, url, attempt + 1)
+
+                if attempt < self._max_retries:
+                    await asyncio.sleep(self._backoff_delay(attempt, response))
+
+        logger.error("Giving up on %s after %d attempts", url, self._max_retries + 1)
+        return None
+
+    async def fetch_all(self,
+                        urls: Sequence[str],
+                        headers: dict[str, str] | None = None) -> list[httpx.Response | None]:
+        """
+        Fetch all ``urls`` concurrently. Results are returned in the same order as ``urls``.
+        """
+        return list(await asyncio.gather(*(self.fetch(url, headers=headers) for url in urls)))
@@ -13,18 +13,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
-from typing import List, Dict, Any
-
-import httpx
 import uuid
+from typing import Any
+from typing import Dict
+from typing import List
 
-from pydantic import BaseModel, Field
+import httpx
+from pydantic import BaseModel
+from pydantic import Field
 
 from aiq.builder.builder import Builder
 from aiq.builder.function_info import FunctionInfo
 from aiq.cli.register_workflow import register_function
 from aiq.data_models.function import FunctionBaseConfig
+from aiq.tool.lianjia_cache import LianjiaCacheConfig
+from aiq.tool.lianjia_cache import LianjiaPageCache
+from aiq.tool.lianjia_cache import fetch_page
+from aiq.tool.lianjia_fetcher import LIANJIA_HEADERS
+from aiq.tool.lianjia_fetcher import PageFetcher
+from aiq.tool.listing_store import get_listing_store
 
 logger = logging.getLogger(__name__)
 
@@ -40,81 +49,103 @@ class LianjiaScraperConfig(FunctionBaseConfig, name="lianjia_scraper"):
     """
     city: str = "sh"
     max_requests: int = 5
+    timeout: float = Field(default=30.0, description="单次请求超时时间（秒）")
+    max_concurrency: int = Field(default=4, ge=1, description="同时进行中的最大请求数")
+    requests_per_second: float = Field(default=4.0,
+                                       description="每个域名每秒允许发起的请求数，小于等于 0 表示不限速")
+    burst: int = Field(default=4, ge=1, description="令牌桶容量，即允许的瞬时突发请求数")
+    max_retries: int = Field(default=3, ge=0, description="遇到 429/5xx 或网络错误时的最大重试次数")
+    backoff_base: float = Field(default=0.5, description="指数退避的初始等待时间（秒）")
+    cache: LianjiaCacheConfig = Field(default_factory=LianjiaCacheConfig, description="页面缓存配置")
+    max_returned_items: int | None = Field(
+        default=20,
+        ge=1,
+        description="返回给智能体的最大房产条数，为空时返回全部。全部数据都会写入 listing_query 工具使用的数据表")
 
 @register_function(config_type=LianjiaScraperConfig)
 async def lianjia_scraper(config: LianjiaScraperConfig, builder: Builder):
 
-    async def _scrape_lianjia(
-        city: str = config.city,
-        max_requests: int = config.max_requests
-    ) -> Dict[str, Any]:
-        """
-        从链家楼盘页面采集房产数据。
-        
-        Args:
-            city: 城市代码，如 sh=上海, bj=北京
-            max_requests: 采集批次数
-            
-        Returns:
-            包含城市信息、数据总数和房产数据列表的字典
-        """
-        # Add trailing slash to handle redirect properly
-        base_url = f"https://{city}.fang.lianjia.com/loupan/pg{{page}}/?_t=1/"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive"
-        }
-        data_list: List[Dict] = []
-
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            for page in range(1, max_requests + 1):
-                url = base_url.format(page=page)
-                try:
-                    logger.info(f"Fetching page {page} for city {city}")
-                    resp = await client.get(url, headers=headers)
-                    resp.raise_for_status()
-                    
-                    # Try to parse as JSON first
-                    try:
-                        raw_data = resp.json()
-                        items = raw_data.get("data", {}).get("list", [])
-                    except Exception:
-                        # If JSON parsing fails, try to handle as plain text
-                        logger.warning(f"Failed to parse JSON response for page {page}, trying alternative parsing")
-                        items = []
-                    
-                    # Process items
-                    for item in items:
-                        data_list.append({
-                            "id": str(uuid.uuid4()),
-                            "title": item.get("title", ""),
-                            "price": item.get("average_price", ""),
-                            "location": item.get("district_name", "") + " " + item.get("bizcircle_name", ""),
-                            "url": "https://{}.fang.lianjia.com".format(city) + item.get("url", "")
-                        })
-                        
-                except httpx.TimeoutException:
-                    logger.error(f"Timeout when fetching page {page} for city {city}")
-                    continue
-                except httpx.RequestError as e:
-                    logger.error(f"Request error when fetching page {page} for city {city}: {e}")
-                    continue
-                except Exception as e:
-                    logger.error(f"Unexpected error when fetching page {page} for city {city}: {e}")
+    limits = httpx.Limits(max_connections=config.max_concurrency, max_keepalive_connections=config.max_concurrency)
+
+    # The client is shared by every invocation so connections (and TLS sessions) are reused across tool calls.
+    async with httpx.AsyncClient(timeout=config.timeout, follow_redirects=True, headers=LIANJIA_HEADERS,
+                                 limits=limits) as client:
+
+        cache = LianjiaPageCache.from_config(config.cache)
+        store = get_listing_store()
+        fetcher = PageFetcher(client,
+                              max_concurrency=config.max_concurrency,
+                              requests_per_second=config.requests_per_second,
+                              burst=config.burst,
+                              max_retries=config.max_retries,
+                              backoff_base=config.backoff_base)
+
+        async def _scrape_lianjia(
+            city: str = config.city,
+            max_requests: int = config.max_requests
+        ) -> Dict[str, Any]:
+            """
+            从链家楼盘页面采集房产数据。
+
+            Args:
+                city: 城市代码，如 sh=上海, bj=北京
+                max_requests: 采集批次数
+
+            Returns:
+                包含城市信息、数据总数和房产数据列表的字典
+            """
+            # Add trailing slash to handle redirect properly
+            base_url = f"https://{city}.fang.lianjia.com/loupan/pg{{page}}/?_t=1/"
+            data_list: List[Dict] = []
+
+            logger.info(f"Fetching {max_requests} pages for city {city}")
+            pages = await asyncio.gather(*(fetch_page(fetcher, cache, base_url.format(page=page))
+                                           for page in range(1, max_requests + 1)))
+
+            for page, (cached_page, _) in enumerate(pages, start=1):
+                if cached_page is None:
                     continue
 
-        logger.info(f"Successfully scraped {len(data_list)} items for city {city}")
-        return {
-            "city": city,
-            "count": len(data_list),
-            "data": data_list
-        }
-
-    yield FunctionInfo.from_fn(
-        _scrape_lianjia,
-        description="采集链家房产API数据，输出 JSON 格式。支持指定城市和页数。",
-        input_schema=LianjiaScraperInput
-    )
\ No newline at end of file
+                # Try to parse as JSON first
+                try:
+                    raw_data = cached_page.json()
+                    items = raw_data.get("data", {}).get("list", [])
+                except Exception:
+                    # If JSON parsing fails, try to handle as plain text
+                    logger.warning(f"Failed to parse JSON response for page {page}, trying alternative parsing")
+                    items = []
+
+                store.add_items(city, items)
+
+                # Process items
+                for item in items:
+                    data_list.append({
+                        "id": str(uuid.uuid4()),
+                        "title": item.get("title", ""),
+                        "price": item.get("average_price", ""),
+                        "location": item.get("district_name", "") + " " + item.get("bizcircle_name", ""),
+                        "url": "https://{}.fang.lianjia.com".format(city) + item.get("url", "")
+                    })
+
+            logger.info(f"Successfully scraped {len(data_list)} items for city {city}")
+            result = {
+                "city": city,
+                "count": len(data_list),
+                "data": data_list
+            }
+
+            if config.max_returned_items is not None and len(data_list) > config.max_returned_items:
+                result["data"] = data_list[:config.max_returned_items]
+                result["note"] = "仅返回部分数据，可使用 listing_query 工具对全部数据进行筛选和统计"
+
+            return result
+
+        try:
+            yield FunctionInfo.from_fn(
+                _scrape_lianjia,
+                description="采集链家房产API数据，输出 JSON 格式。支持指定城市和页数。",
+                input_schema=LianjiaScraperInput
+            )
+        finally:
+            if cache is not None:
+                cache.close()
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import typing
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from aiq.builder.builder import Builder
+from aiq.builder.function_info import FunctionInfo
+from aiq.cli.register_workflow import register_function
+from aiq.data_models.function import FunctionBaseConfig
+from aiq.tool.listing_store import Aggregate
+from aiq.tool.listing_store import GroupBy
+from aiq.tool.listing_store import Metric
+from aiq.tool.listing_store import get_listing_store
+
+logger = logging.getLogger(__name__)
+
+
+class ListingQueryInput(BaseModel):
+    """Input schema for the listing query tool"""
+    city: str | None = Field(default=None, description="城市代码，如 sh=上海, bj=北京；为空表示所有城市")
+    districts: list[str] | None = Field(default=None, description="只保留这些区县，如 [\"浦东\", \"闵行\"]")
+    bizcircles: list[str] | None = Field(default=None, description="只保留这些商圈")
+    price_min: float | None = Field(default=None, description="最低均价（元/平）")
+    price_max: float | None = Field(default=None, description="最高均价（元/平）")
+    area_min: float | None = Field(default=None, description="最小建筑面积（平方米）")
+    area_max: float | None = Field(default=None, description="最大建筑面积（平方米）")
+    metric: Metric = Field(default="price", description="统计字段：price=均价(元/平)，total_price=总价(万)，area=面积(平方米)")
+    group_by: GroupBy | None = Field(default=None, description="分组字段；为空时返回按统计字段排序的楼盘列表")
+    aggregate: Aggregate = Field(default="median", description="聚合方式")
+    sort: typing.Literal["asc", "desc"] = Field(default="asc", description="排序方向")
+    limit: int = Field(default=10, description="最多返回的分组数或楼盘数", ge=1, le=100)
+
+
+class ListingQueryToolConfig(FunctionBaseConfig, name="listing_query"):
+    """
+    对已采集的链家楼盘数据进行筛选、排序、分组和分位数统计。
+    数据来自 lianjia_scraper 和 json_fetch_tool 的采集结果，返回紧凑的统计结果而不是原始数据。
+    """
+    max_limit: int = Field(default=50, description="单次查询最多返回的分组数或楼盘数")
+
+
+@register_function(config_type=ListingQueryToolConfig)
+async def listing_query(config: ListingQueryToolConfig, builder: Builder):
+
+    store = get_listing_store()
+
+    async def _query_listings(city: str | None = None,
+                              districts: list[str] | None = None,
+                              bizcircles: list[str] | None = None,
+                              price_min: float | None = None,
+                              price_max: float | None = None,
+                              area_min: float | None = None,
+                              area_max: float | None = None,
+                              metric: str = "price",
+                              group_by: str | None = None,
+                              aggregate: str = "median",
+                              sort: str = "asc",
+                              limit: int = 10) -> dict:
+        if len(store) == 0:
+            return {"matched": 0, "message": "暂无已采集的楼盘数据，请先调用 lianjia_scraper 或 json_fetch_tool 采集数据"}
+
+        return store.query(city=city,
+                           districts=districts,
+                           bizcircles=bizcircles,
+                           price_min=price_min,
+                           price_max=price_max,
+                           area_min=area_min,
+                           area_max=area_max,
+                           metric=metric,
+                           group_by=group_by,
+                           aggregate=aggregate,
+                           sort=sort,
+                           limit=min(limit, config.max_limit))
+
+    description = ("查询已采集的链家楼盘数据并返回统计结果，支持按城市、区县、商圈、价格和面积筛选，"
+                   "按区县/商圈分组计算数量、均值、中位数、最值和分位数，例如“各区均价低于5万元/平的楼盘均价中位数”。"
+                   "需要先用 lianjia_scraper 或 json_fetch_tool 采集数据。")
+    yield FunctionInfo.from_fn(_query_listings, description=description, input_schema=ListingQueryInput)
@@ -0,0 +1,269 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import re
+import threading
+import typing
+from collections.abc import Iterable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+NUMERIC_COLUMNS = ("price", "total_price", "area")
+TEXT_COLUMNS = ("city", "district", "bizcircle", "title", "url")
+
+Metric = typing.Literal["price", "total_price", "area"]
+GroupBy = typing.Literal["district", "bizcircle", "city"]
+Aggregate = typing.Literal["count", "mean", "median", "min", "max", "p25", "p75", "p90"]
+
+
+def _to_float(value) -> float:
+    """Parse Lianjia numeric fields ("56000", 56000, "89-143㎡") into a float, ``nan`` when unknown or zero."""
+    if value is None or value == "":
+        return np.nan
+
+    if isinstance(value, (int, float)):
+        number = float(value)
+    else:
+        match = _NUMBER_RE.search(str(value))
+        if match is None:
+            return np.nan
+        number = float(match.group(0))
+
+    # Lianjia reports undisclosed prices as 0
+    return number if number > 0 else np.nan
+
+
+class ListingStore:
+    """
+    Columnar in-memory store of Lianjia listings.
+
+    Each field is held in its own NumPy array so filters, sorts and group-bys run as vectorized operations over the
+    whole column. Listings are upserted by ``(city, url)`` so repeated scrapes of the same pages refresh rows rather
+    than duplicating them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index: dict[tuple[str, str], int] = {}
+        self._size = 0
+        self._numeric = {name: np.empty(0, dtype=np.float64) for name in NUMERIC_COLUMNS}
+        self._text = {name: np.empty(0, dtype=object) for name in TEXT_COLUMNS}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index.clear()
+            self._size = 0
+
+    def _grow(self, min_capacity: int) -> None:
+        capacity = len(self._numeric["price"])
+        if capacity >= min_capacity:
+            return
+
+        new_capacity = max(min_capacity, capacity * 2, 256)
+        for name, column in self._numeric.items():
+            grown = np.full(new_capacity, np.nan, dtype=np.float64)
+            grown[:capacity] = column
+            self._numeric[name] = grown
+        for name, column in self._text.items():
+            grown = np.full(new_capacity, "", dtype=object)
+            grown[:capacity] = column
+            self._text[name] = grown
+
+    def add_items(self, city: str, items: Iterable[dict]) -> int:
+        """
+        Add raw listing items as returned by the Lianjia loupan API (``data.list``). Returns the number of items added
+        or updated.
+        """
+        count = 0
+        with self._lock:
+            for item in items:
+                url = item.get("url", "") or item.get("title", "")
+                key = (city, url)
+
+                row = self._index.get(key)
+                if row is None:
+                    row = self._size
+                    self._grow(row + 1)
+                    self._index[key] = row
+                    self._size += 1
+
+                self._numeric["price"][row] = _to_float(item.get("average_price", item.get("avg_unit_price")))
+                self._numeric["total_price"][row] = _to_float(item.get("total_price_start", item.get("total_price")))
+                self._numeric["area"][row] = _to_float(
+                    item.get("resblock_frame_area_range", item.get("resblock_frame_area")))
+                self._text["city"][row] = city
+                self._text["district"][row] = item.get("district_name", "") or ""
+                self._text["bizcircle"][row] = item.get("bizcircle_name", "") or ""
+                self._text["title"][row] = item.get("title", "") or ""
+                self._text["url"][row] = url
+                count += 1
+
+        return count
+
+    def _snapshot(self) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+        with self._lock:
+            size = self._size
+            # Slicing creates views, copying keeps queries consistent while scrapers keep writing
+            numeric = {name: column[:size].copy() for name, column in self._numeric.items()}
+            text = {name: column[:size].copy() for name, column in self._text.items()}
+        return numeric, text
+
+    def query(self,
+              *,
+              city: str | None = None,
+              districts: list[str] | None = None,
+              bizcircles: list[str] | None = None,
+              price_min: float | None = None,
+              price_max: float | None = None,
+              area_min: float | None = None,
+              area_max: float | None = None,
+              metric: Metric = "price",
+              group_by: GroupBy | None = None,
+              aggregate: Aggregate = "median",
+              sort: typing.Literal["asc", "desc"] = "asc",
+              limit: int = 10) -> dict:
+        """
+        Filter the listings and either aggregate ``metric`` per ``group_by`` value or, when ``group_by`` is ``None``,
+        return the top ``limit`` rows sorted by ``metric`` together with the overall aggregate.
+        """
+        numeric, text = self._snapshot()
+
+        mask = np.ones(len(numeric["price"]), dtype=bool)
+        if city:
+            mask &= text["city"] == city
+        if districts:
+            mask &= np.isin(text["district"], districts)
+        if bizcircles:
+            mask &= np.isin(text["bizcircle"], bizcircles)
+
+        # Comparisons against nan are False, so rows with unknown values drop out of range filters
+        for column, low, high in (("price", price_min, price_max), ("area", area_min, area_max)):
+            if low is not None:
+                mask &= numeric[column] >= low
+            if high is not None:
+                mask &= numeric[column] <= high
+
+        values = numeric[metric][mask]
+        known = ~np.isnan(values)
+
+        result: dict = {"matched": int(mask.sum()), "with_metric": int(known.sum()), "metric": metric}
+
+        if group_by is None:
+            order = np.argsort(values[known], kind="stable")
+            if sort == "desc":
+                order = order[::-1]
+            order = order[:limit]
+
+            rows = {name: column[mask][known][order] for name, column in text.items() if name != "url"}
+            rows.update({name: column[mask][known][order] for name, column in numeric.items()})
+
+            result["aggregate"] = aggregate
+            result["value"] = _round(_aggregate(values[known], aggregate))
+            result["rows"] = [{name: _to_python(column[i]) for name, column in rows.items()} for i in range(len(order))]
+            return result
+
+        keys = text[group_by][mask][known]
+        values = values[known]
+
+        result["group_by"] = group_by
+        result["aggregate"] = aggregate
+
+        if len(values) == 0:
+            result["groups"] = []
+            return result
+
+        groups, inverse = np.unique(keys, return_inverse=True)
+        # Sorting by (group, value) turns every group into a contiguous, ordered slice of ``sorted_values``
+        order = np.lexsort((values, inverse))
+        sorted_values = values[order]
+        counts = np.bincount(inverse, minlength=len(groups))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        aggregates = _grouped_aggregate(sorted_values, starts, counts, aggregate)
+
+        group_order = np.argsort(aggregates, kind="stable")
+        if sort == "desc":
+            group_order = group_order[::-1]
+        group_order = group_order[:limit]
+
+        result["groups"] = [{group_by: groups[i], "count": int(counts[i])} for i in group_order]
+        if aggregate != "count":
+            for group, i in zip(result["groups"], group_order):
+                group[aggregate] = _round(aggregates[i])
+        return result
+
+
+def _to_python(value):
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def _round(value: float) -> float | None:
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+def _aggregate(values: np.ndarray, aggregate: Aggregate) -> float:
+    if aggregate == "count":
+        return float(len(values))
+    if len(values) == 0:
+        return np.nan
+    if aggregate == "mean":
+        return float(values.mean())
+    if aggregate == "min":
+        return float(values.min())
+    if aggregate == "max":
+        return float(values.max())
+
+    percentile = {"median": 50, "p25": 25, "p75": 75, "p90": 90}[aggregate]
+    return float(np.percentile(values, percentile))
+
+
+def _grouped_aggregate(sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray,
+                       aggregate: Aggregate) -> np.ndarray:
+    """Aggregate every group at once given values sorted by (group, value) and each group's start and size."""
+    if aggregate == "count":
+        return counts.astype(np.float64)
+    if aggregate == "mean":
+        return np.add.reduceat(sorted_values, starts) / counts
+    if aggregate == "min":
+        return sorted_values[starts]
+    if aggregate == "max":
+        return sorted_values[starts + counts - 1]
+
+    # Linear interpolation between the closest ranks, same as ``np.percentile``'s default method
+    percentile = {"median": 50, "p25": 25, "p75": 75, "p90": 90}[aggregate]
+    position = starts + (counts - 1) * (percentile / 100.0)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+_default_store = ListingStore()
+
+
+def get_listing_store() -> ListingStore:
+    """Return the process-wide listing store shared by the Lianjia tools."""
+    return _default_store
@@ -15,23 +15,40 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import logging
+from collections.abc import AsyncGenerator
+from collections.abc import Awaitable
+from collections.abc import Callable
 from contextlib import asynccontextmanager
 from enum import Enum
 from typing import Any
+from typing import TypeVar
 
+import anyio
 from mcp import ClientSession
 from mcp.client.sse import sse_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+from mcp.types import CallToolResult
+from mcp.types import ServerNotification
 from mcp.types import TextContent
+from mcp.types import Tool
+from mcp.types import ToolListChangedNotification
 from pydantic import BaseModel
 from pydantic import Field
 from pydantic import create_model
 
 from aiq.tool.mcp.exceptions import MCPToolNotFoundError
+from aiq.utils.exception_handlers.mcp import extract_primary_exception
 from aiq.utils.exception_handlers.mcp import mcp_exception_handler
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 def model_from_mcp_schema(name: str, mcp_input_schema: dict) -> type[BaseModel]:
     """
@@ -107,16 +124,227 @@ def model_from_mcp_schema(name: str, mcp_input_schema: dict) -> type[BaseModel]:
     return create_model(f"{_generate_valid_classname(name)}InputSchema", **schema_dict)
 
 
+@functools.lru_cache(maxsize=256)
+def _cached_model_from_mcp_schema(name: str, mcp_input_schema_json: str) -> type[BaseModel]:
+    return model_from_mcp_schema(name, json.loads(mcp_input_schema_json))
+
+
+def cached_model_from_mcp_schema(name: str, mcp_input_schema: dict) -> type[BaseModel]:
+    """
+    Same as `model_from_mcp_schema`, returning the same class for the same tool name and input schema.
+    """
+    return _cached_model_from_mcp_schema(name, json.dumps(mcp_input_schema, sort_keys=True))
+
+
+class _PooledSession:
+    """
+    One long-lived session of an `MCPSessionPool`.
+
+    The SSE transport has to be entered and exited by the same task, so the session is owned by a background task
+    which connects, then pings the server every `health_check_interval` seconds until the session is closed. The
+    session ends if a ping fails or the server closes the connection, the next call then reconnects.
+    """
+
+    def __init__(self, pool: MCPSessionPool):
+        self._pool = pool
+        self.session: ClientSession | None = None
+        self.in_flight = 0
+        self._task: asyncio.Task | None = None
+        self._stop = asyncio.Event()
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_connected(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def connect(self) -> ClientSession:
+        """
+        Return the session, connecting it if it is not connected.
+        """
+        async with self._lock:
+            if self.is_connected:
+                return self.session
+
+            await self._close_task()
+            ready: asyncio.Future[ClientSession] = asyncio.get_running_loop().create_future()
+            self._stop = asyncio.Event()
+            self._task = asyncio.create_task(self._run(ready), name=f"mcp_session_{self._pool.url}")
+            return await ready
+
+    async def _run(self, ready: asyncio.Future[ClientSession]):
+        try:
+            async with sse_client(url=self._pool.url) as (read, write):
+                async with ClientSession(read, write, message_handler=self._pool.handle_message) as session:
+                    await session.initialize()
+                    self.session = session
+                    if not ready.done():
+                        ready.set_result(session)
+                    logger.debug("Connected MCP session to %s", self._pool.url)
+
+                    await self._health_check(session)
+        except Exception as e:  # pylint: disable=broad-except
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                while isinstance(e, ExceptionGroup):
+                    e = extract_primary_exception(list(e.exceptions))
+                logger.warning("MCP session to %s closed: %s %s", self._pool.url, type(e).__name__, e)
+        finally:
+            self.session = None
+            if not ready.done():
+                ready.set_exception(ConnectionError(f"MCP session to {self._pool.url} closed while connecting"))
+
+    async def _health_check(self, session: ClientSession):
+        interval = self._pool.health_check_interval or None
+        while True:
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+            await asyncio.wait_for(session.send_ping(), timeout=self._pool.health_check_timeout)
+
+    async def _close_task(self):
+        if self._task is not None:
+            self._stop.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def aclose(self, session: ClientSession | None = None):
+        """
+        Close the session, the next `connect` opens a new one. When `session` is given, only close it if it is still the
+        current session, another call may have reconnected already.
+        """
+        async with self._lock:
+            if session is not None and self.session is not None and self.session is not session:
+                return
+            await self._close_task()
+
+
+class MCPSessionPool:
+    """
+    Long-lived sessions to an MCP server, shared by the clients of its URL in an event loop.
+
+    Calls are multiplexed over `size` sessions, each one going to the session with the fewest calls in flight, and at
+    most `max_concurrent_calls` calls are in flight at a time. Sessions are health checked, see `_PooledSession`, and
+    reconnected when needed. A call is retried once on a new session if the session was closed before the request was
+    sent. The tools listed by the server are cached until it notifies that the list changed.
+
+    Use `acquire` to get the pool of a URL and `release` once done with it, the sessions are closed when the last user
+    releases the pool.
+
+    Args:
+        url (str): The url of the MCP server
+        size (int): The number of sessions
+        max_concurrent_calls (int): The maximum number of calls in flight
+        health_check_interval (float): Seconds between two pings of a session, 0 disables the health checks
+        health_check_timeout (float): Seconds to wait for the answer to a ping
+    """
+
+    _pools: dict[tuple[asyncio.AbstractEventLoop, str], MCPSessionPool] = {}
+
+    def __init__(self,
+                 url: str,
+                 size: int = 1,
+                 max_concurrent_calls: int = 16,
+                 health_check_interval: float = 30.0,
+                 health_check_timeout: float = 10.0):
+        self.url = url
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self._sessions = [_PooledSession(self) for _ in range(size)]
+        self._call_limiter = asyncio.Semaphore(max_concurrent_calls)
+        self._tools: list[Tool] | None = None
+        self._users = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def acquire(cls, url: str, **kwargs) -> MCPSessionPool:
+        """
+        Get the pool of `url` in the running event loop, creating it with `kwargs` if there is none yet.
+        """
+        loop = asyncio.get_running_loop()
+        for key in [key for key in cls._pools if key[0].is_closed()]:
+            del cls._pools[key]
+
+        pool = cls._pools.get((loop, url))
+        if pool is None:
+            pool = cls(url, **kwargs)
+            pool._loop = loop
+            cls._pools[(loop, url)] = pool
+        pool._users += 1
+        return pool
+
+    async def release(self):
+        """
+        Release a pool returned by `acquire`, closing its sessions if nothing else uses it.
+        """
+        self._users -= 1
+        if self._users <= 0:
+            if MCPSessionPool._pools.get((self._loop, self.url)) is self:
+                del MCPSessionPool._pools[(self._loop, self.url)]
+            await self.aclose()
+
+    async def aclose(self):
+        await asyncio.gather(*[pooled.aclose() for pooled in self._sessions])
+
+    async def handle_message(self, message) -> None:
+        if isinstance(message, ServerNotification) and isinstance(message.root, ToolListChangedNotification):
+            logger.info("Tools of MCP server %s changed", self.url)
+            self._tools = None
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncGenerator[tuple[_PooledSession, ClientSession]]:
+        async with self._call_limiter:
+            pooled = min(self._sessions, key=lambda s: (not s.is_connected, s.in_flight))
+            pooled.in_flight += 1
+            try:
+                yield pooled, await pooled.connect()
+            finally:
+                pooled.in_flight -= 1
+
+    async def _request(self, request: Callable[[ClientSession], Awaitable[_T]]) -> _T:
+        for attempt in range(2):
+            async with self._session() as (pooled, session):
+                try:
+                    return await request(session)
+                except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+                    # The request was not sent, it can be retried on a new session
+                    await pooled.aclose(session)
+                    if attempt:
+                        raise
+                    logger.info("MCP session to %s was closed, reconnecting", self.url)
+                except McpError as e:
+                    # The request may have been processed, only reconnect for the next ones
+                    if e.error.code == CONNECTION_CLOSED:
+                        await pooled.aclose(session)
+                    raise
+
+    async def list_tools(self) -> list[Tool]:
+        """
+        The tools served by the MCP server.
+        """
+        if self._tools is None:
+            result = await self._request(lambda session: session.list_tools())
+            self._tools = result.tools
+        return self._tools
+
+    async def call_tool(self, tool_name: str, tool_args: dict | None) -> CallToolResult:
+        return await self._request(lambda session: session.call_tool(tool_name, tool_args))
+
+
 class MCPSSEClient:
     """
     Client for creating a session and connecting to an MCP server using SSE
 
     Args:
       url (str): The url of the MCP server
+      pool (MCPSessionPool | None): Sessions to the server to use, a new session is opened for every request if None
     """
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, pool: MCPSessionPool | None = None):
         self.url = url
+        self._pool = pool
 
     @asynccontextmanager
     async def connect_to_sse_server(self):
@@ -128,6 +356,21 @@ class MCPSSEClient:
                 await session.initialize()
                 yield session
 
+    async def _list_tools(self) -> list[Tool]:
+        if self._pool is not None:
+            return await self._pool.list_tools()
+
+        async with self.connect_to_sse_server() as session:
+            response = await session.list_tools()
+        return response.tools
+
+    async def _call_tool(self, tool_name: str, tool_args: dict | None) -> CallToolResult:
+        if self._pool is not None:
+            return await self._pool.call_tool(tool_name, tool_args)
+
+        async with self.connect_to_sse_server() as session:
+            return await session.call_tool(tool_name, tool_args)
+
 
 class MCPBuilder(MCPSSEClient):
     """
@@ -135,10 +378,11 @@ class MCPBuilder(MCPSSEClient):
 
     Args:
         url (str): The url of the MCP server
+        pool (MCPSessionPool | None): Sessions to the server shared with the tool clients, see `MCPSSEClient`
     """
 
-    def __init__(self, url):
-        super().__init__(url)
+    def __init__(self, url, pool: MCPSessionPool | None = None):
+        super().__init__(url, pool=pool)
         self._tools = None
 
     @mcp_exception_handler
@@ -152,12 +396,16 @@ class MCPBuilder(MCPSSEClient):
         Raises:
             MCPError: If connection or tool retrieval fails
         """
-        async with self.connect_to_sse_server() as session:
-            response = await session.list_tools()
+        tools = await self._list_tools()
 
         return {
-            tool.name: MCPToolClient(self.url, tool.name, tool.description, tool_input_schema=tool.inputSchema)
-            for tool in response.tools
+            tool.name:
+                MCPToolClient(self.url,
+                              tool.name,
+                              tool.description,
+                              tool_input_schema=tool.inputSchema,
+                              pool=self._pool)
+            for tool in tools
         }
 
     @mcp_exception_handler
@@ -185,9 +433,7 @@ class MCPBuilder(MCPSSEClient):
 
     @mcp_exception_handler
     async def call_tool(self, tool_name: str, tool_args: dict | None):
-        async with self.connect_to_sse_server() as session:
-            result = await session.call_tool(tool_name, tool_args)
-            return result
+        return await self._call_tool(tool_name, tool_args)
 
 
 class MCPToolClient(MCPSSEClient):
@@ -199,13 +445,20 @@ class MCPToolClient(MCPSSEClient):
         tool_name (str): The name of the tool to wrap
         tool_description (str): The description of the tool provided by the MCP server.
         tool_input_schema (dict): The input schema for the tool.
+        pool (MCPSessionPool | None): Sessions to the server to use, see `MCPSSEClient`
     """
 
-    def __init__(self, url: str, tool_name: str, tool_description: str | None, tool_input_schema: dict | None = None):
-        super().__init__(url)
+    def __init__(self,
+                 url: str,
+                 tool_name: str,
+                 tool_description: str | None,
+                 tool_input_schema: dict | None = None,
+                 pool: MCPSessionPool | None = None):
+        super().__init__(url, pool=pool)
         self._tool_name = tool_name
         self._tool_description = tool_description
-        self._input_schema = model_from_mcp_schema(self._tool_name, tool_input_schema) if tool_input_schema else None
+        self._input_schema = cached_model_from_mcp_schema(self._tool_name,
+                                                          tool_input_schema) if tool_input_schema else None
 
     @property
     def name(self):
@@ -242,8 +495,7 @@ class MCPToolClient(MCPSSEClient):
         Args:
             tool_args (dict[str, Any]): A dictionary of key value pairs to serve as inputs for the MCP tool.
         """
-        async with self.connect_to_sse_server() as session:
-            result = await session.call_tool(self._tool_name, tool_args)
+        result = await self._call_tool(self._tool_name, tool_args)
 
         output = []
         for res in result.content:
@@ -18,6 +18,7 @@ import logging
 from pydantic import BaseModel
 from pydantic import Field
 from pydantic import HttpUrl
+from pydantic import PositiveInt
 
 from aiq.builder.builder import Builder
 from aiq.builder.function_info import FunctionInfo
@@ -45,6 +46,16 @@ class MCPToolConfig(FunctionBaseConfig, name="mcp_tool_wrapper"):
         If true, the tool will return the exception message if the tool call fails.
         If false, raise the exception.
         """)
+    session_pool_size: PositiveInt = Field(default=1,
+                                           description="""
+        Number of sessions kept open to the MCP server, calls are multiplexed over them. The tools using the same url
+        share the sessions, configured by the first one built.
+        """)
+    max_concurrent_calls: PositiveInt = Field(default=16,
+                                              description="Maximum number of calls in flight to the MCP server.")
+    health_check_interval: float = Field(default=30.0,
+                                         ge=0.0,
+                                         description="Seconds between two pings of an open session, 0 disables them.")
 
 
 @register_function(config_type=MCPToolConfig)
@@ -54,43 +65,52 @@ async def mcp_tool(config: MCPToolConfig, builder: Builder):  # pylint: disable=
     """
 
     from aiq.tool.mcp.mcp_client import MCPBuilder
+    from aiq.tool.mcp.mcp_client import MCPSessionPool
     from aiq.tool.mcp.mcp_client import MCPToolClient
 
-    client = MCPBuilder(url=str(config.url))
+    pool = MCPSessionPool.acquire(str(config.url),
+                                  size=config.session_pool_size,
+                                  max_concurrent_calls=config.max_concurrent_calls,
+                                  health_check_interval=config.health_check_interval)
+    try:
+        client = MCPBuilder(url=str(config.url), pool=pool)
 
-    tool: MCPToolClient = await client.get_tool(config.mcp_tool_name)
-    if config.description:
-        tool.set_description(description=config.description)
+        tool: MCPToolClient = await client.get_tool(config.mcp_tool_name)
 
-    logger.info("Configured to use tool: %s from MCP server at %s", tool.name, str(config.url))
+        if config.description:
+            tool.set_description(description=config.description)
 
-    def _convert_from_str(input_str: str) -> tool.input_schema:
-        return tool.input_schema.model_validate_json(input_str)
+        logger.info("Configured to use tool: %s from MCP server at %s", tool.name, str(config.url))
 
-    async def _response_fn(tool_input: BaseModel | None = None, **kwargs) -> str:
-        # Run the tool, catching any errors and sending to agent for correction
-        try:
-            if tool_input:
-                args = tool_input.model_dump()
-                return await tool.acall(args)
+        def _convert_from_str(input_str: str) -> tool.input_schema:
+            return tool.input_schema.model_validate_json(input_str)
 
-            _ = tool.input_schema.model_validate(kwargs)
-            filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
-            return await tool.acall(filtered_kwargs)
-        except Exception as e:
-            if config.return_exception:
+        async def _response_fn(tool_input: BaseModel | None = None, **kwargs) -> str:
+            # Run the tool, catching any errors and sending to agent for correction
+            try:
                 if tool_input:
-                    logger.warning("Error calling tool %s with serialized input: %s",
-                                   tool.name,
-                                   tool_input.model_dump(),
-                                   exc_info=True)
-                else:
-                    logger.warning("Error calling tool %s with input: %s", tool.name, kwargs, exc_info=True)
-                return str(e)
-            # If the tool call fails, raise the exception.
-            raise
-
-    yield FunctionInfo.create(single_fn=_response_fn,
-                              description=tool.description,
-                              input_schema=tool.input_schema,
-                              converters=[_convert_from_str])
+                    args = tool_input.model_dump()
+                    return await tool.acall(args)
+
+                _ = tool.input_schema.model_validate(kwargs)
+                filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
+                return await tool.acall(filtered_kwargs)
+            except Exception as e:
+                if config.return_exception:
+                    if tool_input:
+                        logger.warning("Error calling tool %s with serialized input: %s",
+                                       tool.name,
+                                       tool_input.model_dump(),
+                                       exc_info=True)
+                    else:
+                        logger.warning("Error calling tool %s with input: %s", tool.name, kwargs, exc_info=True)
+                    return str(e)
+                # If the tool call fails, raise the exception.
+                raise
+
+        yield FunctionInfo.create(single_fn=_response_fn,
+                                  description=tool.description,
+                                  input_schema=tool.input_schema,
+                                  converters=[_convert_from_str])
+    finally:
+        await pool.release()
@@ -33,6 +33,7 @@ from . import retriever
 from . import server_tools
 from . import json_fetch_tool
 from . import lianjia_scraper_tool
+from . import listing_query_tool
 from . import custom_tool
 from .code_execution import register
 from .github_tools import create_github_commit
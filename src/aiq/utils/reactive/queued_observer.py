@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import typing
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import TypeVar
+
+from aiq.utils.reactive.base.observer_base import ObserverBase
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")  # pylint: disable=invalid-name
+
+OverflowPolicy = typing.Literal["drop_oldest", "drop_newest", "block"]
+
+_ERROR = object()
+_COMPLETE = object()
+
+
+@dataclass
+class QueuedObserverStats:
+    delivered: int = 0
+    dropped: int = 0
+    # events delivered inline by the producer because the queue was full ("block" policy)
+    blocked: int = 0
+    max_queue_depth: int = 0
+
+
+class _LoopQueue:
+
+    __slots__ = ("items", "scheduled")
+
+    def __init__(self):
+        self.items: deque[tuple[object, typing.Any]] = deque()
+        self.scheduled = False
+
+
+class QueuedObserver(ObserverBase[_T]):
+    """
+    Delivers events to ``observer`` from the event loop instead of the producer's call stack.
+
+    Events are appended to a bounded queue owned by the running event loop (one queue per loop, so producers on
+    different loops never share a queue) and delivered in batches by a callback scheduled on that loop. When the queue
+    holds ``max_queue_size`` events, ``overflow`` decides what happens to the next one:
+
+    - ``drop_oldest``: discard the oldest queued event.
+    - ``drop_newest``: discard the new event.
+    - ``block``: the producer delivers the queued events and the new one itself, nothing is lost but the producer pays
+      for the delivery, exactly as without a queue.
+
+    ``on_error`` and ``on_complete`` are never dropped, they are queued even when the queue is full.
+
+    Events emitted outside of a running event loop are delivered inline.
+    """
+
+    def __init__(self,
+                 observer: ObserverBase[_T],
+                 max_queue_size: int = 1024,
+                 overflow: OverflowPolicy = "drop_oldest",
+                 batch_size: int = 256):
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+
+        self._observer = observer
+        self._max_queue_size = max_queue_size
+        self._overflow = overflow
+        self._batch_size = batch_size
+        self._queues: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopQueue] = weakref.WeakKeyDictionary()
+        # almost every event comes from the same loop as the previous one, skip the dictionary lookup for it
+        self._last_loop: asyncio.AbstractEventLoop | None = None
+        self._last_queue: _LoopQueue | None = None
+        self.stats = QueuedObserverStats()
+
+    def _queue_for_running_loop(self) -> tuple[asyncio.AbstractEventLoop | None, _LoopQueue | None]:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None, None
+
+        if loop is self._last_loop:
+            return loop, self._last_queue
+
+        queue = self._queues.get(loop)
+        if queue is None:
+            queue = self._queues[loop] = _LoopQueue()
+        self._last_loop, self._last_queue = loop, queue
+        return loop, queue
+
+    def _deliver(self, kind: object, value: typing.Any):
+        try:
+            if kind is _ERROR:
+                self._observer.on_error(value)
+            elif kind is _COMPLETE:
+                self._observer.on_complete()
+            else:
+                self._observer.on_next(value)
+                self.stats.delivered += 1
+        except Exception as e:
+            logger.exception("Error delivering a queued event: %s", e, exc_info=True)
+
+    def _drain(self, queue: _LoopQueue, limit: int | None = None):
+        items = queue.items
+        count = 0
+        while items and (limit is None or count < limit):
+            kind, value = items.popleft()
+            self._deliver(kind, value)
+            count += 1
+
+    def _drain_batch(self, loop: asyncio.AbstractEventLoop, queue: _LoopQueue):
+        self._drain(queue, self._batch_size)
+        if queue.items:
+            # give other callbacks a turn before the next batch
+            loop.call_soon(self._drain_batch, loop, queue)
+        else:
+            queue.scheduled = False
+
+    @staticmethod
+    def _evict_oldest_event(items: deque[tuple[object, typing.Any]]) -> bool:
+        # on_error and on_complete are never evicted, the observer would not see the stream terminate
+        for index, (kind, _) in enumerate(items):
+            if kind is None:
+                del items[index]
+                return True
+        return False
+
+    def _enqueue(self, kind: object, value: typing.Any):
+        loop, queue = self._queue_for_running_loop()
+        if queue is None:
+            self._deliver(kind, value)
+            return
+
+        items = queue.items
+        if kind is None and len(items) >= self._max_queue_size:
+            if self._overflow == "drop_newest":
+                self.stats.dropped += 1
+                return
+            if self._overflow == "drop_oldest":
+                self.stats.dropped += 1
+                if not self._evict_oldest_event(items):
+                    # only terminal events are queued, drop the new event instead
+                    return
+            else:
+                self.stats.blocked += 1
+                self._drain(queue)
+                self._deliver(kind, value)
+                return
+
+        items.append((kind, value))
+        if len(items) > self.stats.max_queue_depth:
+            self.stats.max_queue_depth = len(items)
+
+        if not queue.scheduled:
+            queue.scheduled = True
+            loop.call_soon(self._drain_batch, loop, queue)
+
+    def on_next(self, value: _T) -> None:
+        self._enqueue(None, value)
+
+    def on_error(self, exc: Exception) -> None:
+        self._enqueue(_ERROR, exc)
+
+    def on_complete(self) -> None:
+        self._enqueue(_COMPLETE, None)
+
+    def flush(self) -> None:
+        """Deliver the events queued on the running event loop now."""
+        _, queue = self._queue_for_running_loop()
+        if queue is not None:
+            self._drain(queue)
@@ -32,9 +32,11 @@ OnComplete = Callable[[], None]
 class Subject(Observable[T], Observer[T], SubjectBase[T]):
     """
     A Subject is both an Observer (receives events) and an Observable (sends events).
-    - Maintains a list of ObserverBase[T].
-    - No internal buffering or replay; events are only delivered to current subscribers.
-    - Thread-safe via a lock.
+    - Maintains an immutable snapshot of ObserverBase[T], replaced on every subscribe / unsubscribe (copy-on-write),
+      so emitting never takes a lock or copies the observers.
+    - No internal buffering or replay; events are only delivered to current subscribers. Subscribe with a
+      QueuedObserver to decouple a slow observer from the producer.
+    - Thread-safe: subscribe / unsubscribe / dispose are serialized by a lock.
 
     Once on_error or on_complete is called, the Subject is closed.
     """
@@ -44,7 +46,7 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         self._lock = threading.RLock()
         self._closed = False
         self._error: Exception | None = None
-        self._observers: list[Observer[T]] = []
+        self._observers: tuple[Observer[T], ...] = ()
         self._disposed = False
 
     # ==========================================================================
@@ -60,9 +62,16 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
                 # Already disposed => no subscription
                 return Subscription(self, None)
 
-            self._observers.append(observer)
+            self._observers = (*self._observers, observer)
             return Subscription(self, observer)
 
+    @property
+    def has_observers(self) -> bool:
+        """
+        Whether any observer is subscribed, producers can skip building items nobody receives.
+        """
+        return bool(self._observers)
+
     # ==========================================================================
     # ObserverBase[T] - for producers
     # ==========================================================================
@@ -71,13 +80,11 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         Called by producers to emit an item. Delivers synchronously to each observer.
         If closed or disposed, do nothing.
         """
-        with self._lock:
-            if self._closed or self._disposed:
-                return
-            # Copy the current observers to avoid mutation issues
-            current_observers = list(self._observers)
+        # Reading the attribute is atomic, the snapshot cannot change while it is delivered
+        current_observers = self._observers
+        if self._closed:
+            return
 
-        # Deliver outside the lock
         for obs in current_observers:
             obs.on_next(value)
 
@@ -85,10 +92,9 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         """
         Called by producers to signal an error. Notifies all observers.
         """
-        with self._lock:
-            if self._closed or self._disposed:
-                return
-            current_obs = list(self._observers)
+        current_obs = self._observers
+        if self._closed:
+            return
 
         for obs in current_obs:
             obs.on_error(exc)
@@ -101,7 +107,7 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         with self._lock:
             if self._closed or self._disposed:
                 return
-            current_observers = list(self._observers)
+            current_observers = self._observers
             self.dispose()
 
         for obs in current_observers:
@@ -113,7 +119,8 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
     def _unsubscribe_observer(self, observer: Observer[T]) -> None:
         with self._lock:
             if not self._disposed and observer in self._observers:
-                self._observers.remove(observer)
+                index = self._observers.index(observer)
+                self._observers = self._observers[:index] + self._observers[index + 1:]
 
     # ==========================================================================
     # Disposal
@@ -125,7 +132,8 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         """
         with self._lock:
             if not self._disposed:
-                self._disposed = True
-                self._observers.clear()
+                # closed first, so a concurrent on_next which already read the observers drops the event
                 self._closed = True
+                self._disposed = True
+                self._observers = ()
                 self._error = None
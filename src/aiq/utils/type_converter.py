@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
 import logging
 import typing
 from collections import OrderedDict
@@ -30,8 +31,27 @@ class ConvertException(Exception):
     pass
 
 
+@dataclasses.dataclass
+class _ConversionChain:
+    """
+    The converters of an indirect conversion, each with the type it produced.
+    """
+    steps: list[tuple[Callable, type]] = dataclasses.field(default_factory=list)
+    # False once a converter raised ConvertException, the path then depends on the value and not only on its type
+    cacheable: bool = True
+
+
+# Cached result of an indirect conversion which has no path
+_NO_PATH = object()
+# Returned by `_run_chain` when a step did not produce the type it produced when the chain was resolved
+_CHAIN_MISS = object()
+
+
 class TypeConverter:
     _global_initialized = False
+    # Incremented whenever a converter is added to any TypeConverter. Conversions fall back on the parent converter, so
+    # the resolved conversions cached by a converter depend on the converters of its parents too.
+    _generation = 0
 
     def __init__(self, converters: list[Callable[[typing.Any], typing.Any]], parent: "TypeConverter | None" = None):
         """
@@ -43,6 +63,14 @@ class TypeConverter:
         self._converters: OrderedDict[type, OrderedDict[type, Callable]] = OrderedDict()
         self._indirect_warnings_shown: set[tuple[type, type]] = set()
 
+        # Conversions resolved from the type of the data and the target type, see `_check_cache_generation`
+        self._cache_generation = TypeConverter._generation
+        self._decomposed_types: dict[type, DecomposedType] = {}
+        # dict[(from_type, target_root_type), converters], the converters tried in order by a direct conversion
+        self._direct_cache: dict[tuple[type, type], list[Callable]] = {}
+        # dict[(from_type, to_type), chain], the steps of the indirect conversion in this converter or `_NO_PATH`
+        self._indirect_cache: dict[tuple[type, type], list[tuple[Callable, type]] | object] = {}
+
         for converter in converters:
             self.add_converter(converter)
 
@@ -70,11 +98,34 @@ class TypeConverter:
         self._converters.setdefault(to_type, OrderedDict())[from_type] = converter
         # to do(MDD): If needed, sort by specificity here.
 
+        TypeConverter._generation += 1
+
+    def _check_cache_generation(self) -> None:
+        """
+        Drop the resolved conversions if a converter was added since they were resolved.
+        """
+        if self._cache_generation != TypeConverter._generation:
+            self._direct_cache.clear()
+            self._indirect_cache.clear()
+            self._cache_generation = TypeConverter._generation
+
+    def _decompose(self, to_type: type) -> DecomposedType:
+        try:
+            return self._decomposed_types[to_type]
+        except KeyError:
+            decomposed = DecomposedType(to_type)
+            self._decomposed_types[to_type] = decomposed
+            return decomposed
+        except TypeError:
+            # Unhashable type, e.g. annotated with unhashable metadata
+            return DecomposedType(to_type)
+
     def _convert(self, data, to_type: type[_T]) -> _T | None:
         """
         Attempts to convert `data` into `to_type`. Returns None if no path is found.
         """
-        decomposed = DecomposedType(to_type)
+        self._check_cache_generation()
+        decomposed = self._decompose(to_type)
 
         # 1) If data is already correct type, return it
         if to_type is None or decomposed.is_instance((data, to_type)):
@@ -83,7 +134,7 @@ class TypeConverter:
         root = decomposed.root
 
         # 2) Attempt direct in *this* converter
-        direct_result = self._try_direct_conversion(data, root)
+        direct_result = self._try_cached_direct_conversion(data, root)
         if direct_result is not None:
             return direct_result
 
@@ -124,6 +175,56 @@ class TypeConverter:
     # -------------------------------------------------
     # INTERNAL DIRECT CONVERSION (with parent fallback)
     # -------------------------------------------------
+    def _direct_converters(self, from_type: type, target_root_type: type) -> list[Callable] | None:
+        """
+        The converters `_try_direct_conversion` tries, in order and including the parents', for an instance of
+        `from_type`. Resolved once per pair of types. Returns None if they cannot be resolved from the type alone, e.g.
+        for protocols with data members, which only support `isinstance`.
+        """
+        key = (from_type, target_root_type)
+        try:
+            return self._direct_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return None
+
+        try:
+            converters = [
+                from_type_converter for convert_to_type, to_type_converters in self._converters.items()
+                if issubclass(DecomposedType(convert_to_type).root, target_root_type)
+                for convert_from_type, from_type_converter in to_type_converters.items()
+                if issubclass(from_type, DecomposedType(convert_from_type).root)
+            ]
+        except TypeError:
+            return None
+
+        if self._parent is not None:
+            self._parent._check_cache_generation()
+            parent_converters = self._parent._direct_converters(from_type, target_root_type)
+            if parent_converters is None:
+                return None
+            converters += parent_converters
+
+        self._direct_cache[key] = converters
+        return converters
+
+    def _try_cached_direct_conversion(self, data, target_root_type: type) -> typing.Any | None:
+        """
+        Same as `_try_direct_conversion` with the converters to try resolved once per type of `data`.
+        """
+        converters = self._direct_converters(type(data), target_root_type)
+        if converters is None:
+            return self._try_direct_conversion(data, target_root_type)
+
+        for converter in converters:
+            try:
+                return converter(data)
+            except ConvertException:
+                pass
+
+        return None
+
     def _try_direct_conversion(self, data, target_root_type: type) -> typing.Any | None:
         """
         Tries direct conversion in *this* converter's registry.
@@ -153,9 +254,37 @@ class TypeConverter:
         """
         Attempt indirect conversion (DFS) in *this* converter.
         If no success, fallback to parent's indirect attempt.
+
+        The chain of converters found is cached per type of `data` and replayed by later conversions, as long as each
+        step produces the same type it produced when the chain was found. Chains which depended on a converter raising
+        `ConvertException` are not cached.
         """
-        visited = set()
-        final = self._try_indirect_conversion(data, to_type, visited)
+        self._check_cache_generation()
+        key = (type(data), to_type)
+        try:
+            cached = self._indirect_cache.get(key)
+        except TypeError:
+            key = None
+            cached = None
+
+        final = None
+        if cached is _NO_PATH:
+            pass
+        elif cached is not None:
+            try:
+                final = self._run_chain(data, cached)
+            except ConvertException:
+                final = _CHAIN_MISS
+            if final is _CHAIN_MISS:
+                cached = None
+                final = None
+
+        if cached is None:
+            chain = _ConversionChain()
+            final = self._try_indirect_conversion(data, to_type, set(), chain)
+            if key is not None and chain.cacheable:
+                self._indirect_cache[key] = chain.steps if final is not None else _NO_PATH
+
         if final is not None:
             # Warn once if found a chain
             self._maybe_warn_indirect(type(data), to_type)
@@ -170,10 +299,26 @@ class TypeConverter:
 
         return None
 
-    def _try_indirect_conversion(self, data: typing.Any, to_type: type[_T], visited: set[type]) -> _T | None:
+    @staticmethod
+    def _run_chain(data: typing.Any, steps: list[tuple[Callable, type]]) -> typing.Any:
+        """
+        Replay the steps of a cached indirect conversion. Returns `_CHAIN_MISS` if a step produced a different type.
+        """
+        for converter, output_type in steps:
+            data = converter(data)
+            if type(data) is not output_type:
+                return _CHAIN_MISS
+        return data
+
+    def _try_indirect_conversion(self,
+                                 data: typing.Any,
+                                 to_type: type[_T],
+                                 visited: set[type],
+                                 chain: _ConversionChain | None = None) -> _T | None:
         """
         DFS attempt to find a chain of conversions from type(data) to to_type,
-        ignoring parent. If not found, returns None.
+        ignoring parent. If not found, returns None. The converters of the
+        chain found are recorded in `chain`.
         """
         # 1) If data is already correct type
         if isinstance(data, to_type):
@@ -192,13 +337,18 @@ class TypeConverter:
                     try:
                         next_data = from_type_converter(data)
                         if isinstance(next_data, to_type):
+                            if chain is not None:
+                                chain.steps.insert(0, (from_type_converter, type(next_data)))
                             return next_data
                         # else keep going
-                        deeper = self._try_indirect_conversion(next_data, to_type, visited)
+                        deeper = self._try_indirect_conversion(next_data, to_type, visited, chain)
                         if deeper is not None:
+                            if chain is not None:
+                                chain.steps.insert(0, (from_type_converter, type(next_data)))
                             return deeper
                     except ConvertException:
-                        pass
+                        if chain is not None:
+                            chain.cacheable = False
 
         return None
 
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+from langchain_core.agents import AgentAction
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import HumanMessage
+from langchain_core.tools import StructuredTool
+
+from aiq.agent.react_agent.agent import ReActAgentGraph
+from aiq.agent.react_agent.agent import ReActGraphState
+from aiq.agent.react_agent.agent import create_react_agent_prompt
+from aiq.agent.react_agent.register import ReActAgentWorkflowConfig
+
+
+def _make_tools(started: list[str]) -> list[StructuredTool]:
+    both_started = asyncio.Event()
+
+    async def lookup(city: str) -> str:
+        started.append(city)
+        if len(started) == 2:
+            both_started.set()
+        # only returns once the other tool call has started as well, which needs the calls to run concurrently
+        await asyncio.wait_for(both_started.wait(), timeout=5)
+        return f"sunny in {city}"
+
+    async def broken(city: str) -> str:
+        started.append(city)
+        if len(started) == 2:
+            both_started.set()
+        raise ValueError(f"no data for {city}")
+
+    return [
+        StructuredTool.from_function(coroutine=lookup, name="lookup", description="Look up the weather."),
+        StructuredTool.from_function(coroutine=broken, name="broken", description="Always fails."),
+    ]
+
+
+def _make_agent(tools: list[StructuredTool], pass_tool_call_errors_to_agent: bool = True) -> ReActAgentGraph:
+    config = ReActAgentWorkflowConfig(llm_name="llm", parallel_tool_calls=True)
+    return ReActAgentGraph(llm=FakeListChatModel(responses=["Final Answer: done"]),
+                           prompt=create_react_agent_prompt(config),
+                           tools=tools,
+                           tool_call_max_retries=1,
+                           pass_tool_call_errors_to_agent=pass_tool_call_errors_to_agent,
+                           parallel_tool_calls=True)
+
+
+def _make_state(*actions: AgentAction) -> ReActGraphState:
+    return ReActGraphState(messages=[HumanMessage(content="What is the weather?")], agent_scratchpad=list(actions))
+
+
+async def test_tool_node_runs_actions_concurrently():
+    started = []
+    agent = _make_agent(_make_tools(started))
+    state = _make_state(AgentAction("lookup", '{"city": "Paris"}', ""), AgentAction("broken", '{"city": "Rome"}', ""))
+
+    state = await agent.tool_node(state)
+
+    assert sorted(started) == ["Paris", "Rome"]
+    assert [response.name for response in state.tool_responses] == ["lookup", "broken"]
+    assert state.tool_responses[0].content == "sunny in Paris"
+    assert state.tool_responses[1].status == "error"
+    assert "no data for Rome" in state.tool_responses[1].content
+
+    # a single observation lists every result in the order the agent asked for the tools
+    assert len(state.scratchpad_messages) == 1
+    observation = state.scratchpad_messages[0].content
+    assert observation.startswith("Observation 1 (lookup): sunny in Paris\n\nObservation 2 (broken): ")
+    assert "no data for Rome" in observation
+
+
+async def test_tool_node_raises_on_failure_when_errors_are_not_passed_to_agent():
+    agent = _make_agent(_make_tools([]), pass_tool_call_errors_to_agent=False)
+    state = _make_state(AgentAction("lookup", '{"city": "Paris"}', ""), AgentAction("broken", '{"city": "Rome"}', ""))
+
+    with pytest.raises(RuntimeError, match="no data for Rome"):
+        await agent.tool_node(state)
+
+
+async def test_tool_node_only_runs_pending_actions():
+    started = []
+    agent = _make_agent(_make_tools(started))
+    state = _make_state(AgentAction("broken", '{"city": "Rome"}', ""))
+
+    state = await agent.tool_node(state)
+    assert started == ["Rome"]
+
+    # the action already has a response, it must not be run a second time
+    with pytest.raises(RuntimeError, match="No pending tool call"):
+        await agent.tool_node(state)
+    assert started == ["Rome"]
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from langchain_core.agents import AgentAction
+from langchain_core.agents import AgentFinish
+
+from aiq.agent.react_agent.output_parser import ReActOutputParser
+from aiq.agent.react_agent.output_parser import ReActOutputParserException
+
+MULTI_ACTION_OUTPUT = """Thought: I need the weather in both cities.
+Action: weather
+Action Input: {"city": "San Francisco"}
+Action: weather
+Action Input: {"city": "New York"}
+Action: current_datetime
+Action Input: None
+Observation: Waiting for the tool responses..."""
+
+
+def test_parse_multiple_actions():
+    actions = ReActOutputParser(allow_multiple_actions=True).parse(MULTI_ACTION_OUTPUT)
+
+    assert isinstance(actions, list)
+    assert [(action.tool, action.tool_input) for action in actions] == [
+        ("weather", '{"city": "San Francisco"}'),
+        ("weather", '{"city": "New York"}'),
+        ("current_datetime", "None"),
+    ]
+
+
+def test_parse_multiple_actions_disabled_returns_first_action():
+    action = ReActOutputParser().parse(MULTI_ACTION_OUTPUT)
+
+    assert isinstance(action, AgentAction)
+    assert action.tool == "weather"
+    assert action.tool_input.startswith('{"city": "San Francisco"}')
+
+
+def test_parse_single_action_with_multiple_actions_allowed():
+    text = "Thought: I need the time.\nAction: current_datetime\nAction Input: None\nObservation: Waiting..."
+
+    action = ReActOutputParser(allow_multiple_actions=True).parse(text)
+
+    assert isinstance(action, AgentAction)
+    assert (action.tool, action.tool_input) == ("current_datetime", "None")
+
+
+def test_parse_final_answer():
+    finish = ReActOutputParser(allow_multiple_actions=True).parse("Thought: I know it.\nFinal Answer: 42")
+
+    assert isinstance(finish, AgentFinish)
+    assert finish.return_values == {"output": "42"}
+
+
+def test_parse_final_answer_and_actions_raises():
+    with pytest.raises(ReActOutputParserException) as exc_info:
+        ReActOutputParser(allow_multiple_actions=True).parse(MULTI_ACTION_OUTPUT + "\nFinal Answer: 42")
+
+    assert exc_info.value.final_answer_and_action
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from aiq.builder.builder import Builder
+from aiq.builder.component_utils import build_dependency_levels
+from aiq.builder.function_info import FunctionInfo
+from aiq.cli.register_workflow import register_function
+from aiq.data_models.component import ComponentGroup
+from aiq.data_models.component_ref import FunctionRef
+from aiq.data_models.component_ref import LLMRef
+from aiq.data_models.config import AIQConfig
+from aiq.data_models.function import FunctionBaseConfig
+from aiq.llm.nim_llm import NIMModelConfig
+
+
+class _ToolConfig(FunctionBaseConfig, name="test_levels_tool"):
+    pass
+
+
+class _AgentConfig(FunctionBaseConfig, name="test_levels_agent"):
+    tool_names: list[FunctionRef] = []
+    llm_name: LLMRef | None = None
+
+
+async def _echo(value: str) -> str:
+    return value
+
+
+@register_function(config_type=_ToolConfig)
+async def _tool(config: _ToolConfig, builder: Builder):
+    yield FunctionInfo.from_fn(_echo)
+
+
+@register_function(config_type=_AgentConfig)
+async def _agent(config: _AgentConfig, builder: Builder):
+    yield FunctionInfo.from_fn(_echo)
+
+
+def _levels(config: AIQConfig) -> list[list[tuple[ComponentGroup, str]]]:
+    return [[(x.component_group, str(x.name)) for x in level] for level in build_dependency_levels(config)]
+
+
+def test_independent_components_share_a_level():
+    tools = {"search": _ToolConfig(), "listing_query": _ToolConfig(), "current_datetime": _ToolConfig()}
+    config = AIQConfig(functions=tools, workflow=_AgentConfig(tool_names=list(tools)))
+
+    levels = _levels(config)
+
+    assert len(levels) == 1
+    assert sorted(levels[0]) == [
+        (ComponentGroup.FUNCTIONS, "current_datetime"),
+        (ComponentGroup.FUNCTIONS, "listing_query"),
+        (ComponentGroup.FUNCTIONS, "search"),
+    ]
+
+
+def test_components_follow_their_references():
+    config = AIQConfig(llms={"nim": NIMModelConfig(model_name="meta/llama-3.1-70b-instruct")},
+                       functions={
+                           "search": _ToolConfig(),
+                           "researcher": _AgentConfig(tool_names=["search"], llm_name="nim"),
+                           "planner": _AgentConfig(tool_names=["researcher"], llm_name="nim"),
+                       },
+                       workflow=_AgentConfig(tool_names=["planner", "search"], llm_name="nim"))
+
+    assert _levels(config) == [
+        [(ComponentGroup.LLMS, "nim")],
+        [(ComponentGroup.FUNCTIONS, "search")],
+        [(ComponentGroup.FUNCTIONS, "researcher")],
+        [(ComponentGroup.FUNCTIONS, "planner")],
+    ]
+
+
+def test_functions_are_built_after_every_llm():
+    # the framework profiler wrappers of a function see every LLM, even ones it does not reference
+    config = AIQConfig(llms={"nim": NIMModelConfig(model_name="meta/llama-3.1-70b-instruct")},
+                       functions={"search": _ToolConfig()},
+                       workflow=_AgentConfig(tool_names=["search"]))
+
+    assert _levels(config) == [[(ComponentGroup.LLMS, "nim")], [(ComponentGroup.FUNCTIONS, "search")]]
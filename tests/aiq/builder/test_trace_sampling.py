@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from aiq.builder.context import AIQContext
+from aiq.builder.context import AIQContextState
+from aiq.builder.function import LambdaFunction
+from aiq.builder.function_info import FunctionInfo
+from aiq.data_models.function import EmptyFunctionConfig
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.observability.exporter_manager import ExporterManager
+from aiq.runtime.runner import AIQRunner
+
+
+def _workflow() -> LambdaFunction:
+    """A workflow calling a tool which calls an LLM."""
+
+    async def tool(value: str) -> str:
+        step_manager = AIQContext.get().intermediate_step_manager
+        step_manager.push_intermediate_step(
+            IntermediateStepPayload(UUID="llm-1", event_type=IntermediateStepType.LLM_START, name="nim"))
+        step_manager.push_intermediate_step(
+            IntermediateStepPayload(UUID="llm-1", event_type=IntermediateStepType.LLM_END, name="nim"))
+        return value
+
+    tool_fn = LambdaFunction.from_info(config=EmptyFunctionConfig(),
+                                       info=FunctionInfo.from_fn(tool),
+                                       instance_name="listing_query")
+
+    async def workflow(value: str) -> str:
+        return await tool_fn.ainvoke(value)
+
+    return LambdaFunction.from_info(config=EmptyFunctionConfig(),
+                                    info=FunctionInfo.from_fn(workflow),
+                                    instance_name="react_agent")
+
+
+async def _run(sample_rate: float, subscribe: bool = True) -> tuple[str, list]:
+    steps = []
+    async with AIQRunner(input_message="浦东 两房",
+                         entry_fn=_workflow(),
+                         context_state=AIQContextState.get(),
+                         exporter_manager=ExporterManager(),
+                         trace_sample_rate=sample_rate) as runner:
+        if subscribe:
+            runner.context.intermediate_step_manager.subscribe(steps.append)
+        result = await runner.result(to_type=str)
+
+    return result, steps
+
+
+async def test_sampled_run_records_the_whole_tree():
+    result, steps = await _run(sample_rate=1.0)
+
+    assert result == "浦东 两房"
+    assert [(step.event_type, step.name) for step in steps] == [
+        (IntermediateStepType.FUNCTION_START, "react_agent"),
+        (IntermediateStepType.FUNCTION_START, "listing_query"),
+        (IntermediateStepType.LLM_START, "nim"),
+        (IntermediateStepType.LLM_END, "nim"),
+        (IntermediateStepType.FUNCTION_END, "listing_query"),
+        (IntermediateStepType.FUNCTION_END, "react_agent"),
+    ]
+
+    # Every step has a recorded parent, except the workflow itself
+    start_ids = {step.UUID for step in steps if step.event_type == IntermediateStepType.FUNCTION_START}
+    assert steps[0].parent_id == "root"
+    assert all(step.parent_id in start_ids for step in steps[1:-1])
+    assert steps[2].parent_id == steps[1].UUID
+
+
+async def test_unsampled_run_records_no_steps():
+    result, steps = await _run(sample_rate=0.0)
+
+    assert result == "浦东 两房"
+    assert steps == []
+
+
+@pytest.mark.parametrize("sample_rate", [0.0, 1.0])
+async def test_run_without_subscribers(sample_rate: float):
+    result, steps = await _run(sample_rate=sample_rate, subscribe=False)
+
+    assert result == "浦东 两房"
+    assert steps == []
+    assert AIQContextState.get().active_span_id_stack.get() == ["root"]
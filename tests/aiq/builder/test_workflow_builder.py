@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import anyio
+import pytest
+
+from aiq.builder.builder import Builder
+from aiq.builder.function_info import FunctionInfo
+from aiq.builder.workflow_builder import WorkflowBuilder
+from aiq.cli.register_workflow import register_function
+from aiq.data_models.component_ref import FunctionRef
+from aiq.data_models.config import AIQConfig
+from aiq.data_models.config import GeneralConfig
+from aiq.data_models.function import FunctionBaseConfig
+
+# build and teardown events of the test functions, in the order they happened
+_events: list[str] = []
+_started: dict[str, asyncio.Event] = {}
+
+
+class _SessionToolConfig(FunctionBaseConfig, name="test_builder_session_tool"):
+    label: str
+    # the tools which must be building at the same time as this one before its build completes
+    wait_for: list[str] = []
+    fail: bool = False
+
+
+class _AgentConfig(FunctionBaseConfig, name="test_builder_agent"):
+    tool_names: list[FunctionRef] = []
+
+
+async def _echo(value: str) -> str:
+    return value
+
+
+@register_function(config_type=_SessionToolConfig)
+async def _session_tool(config: _SessionToolConfig, builder: Builder):
+    name = config.label
+    _started.setdefault(name, asyncio.Event()).set()
+    for other in config.wait_for:
+        await asyncio.wait_for(_started.setdefault(other, asyncio.Event()).wait(), timeout=5)
+    if config.fail:
+        raise ValueError(f"{name} failed")
+
+    # like an MCP client session, the task group must be exited by the task which entered it
+    async with anyio.create_task_group():
+        _events.append(f"enter {name}")
+        yield FunctionInfo.from_fn(_echo)
+        _events.append(f"exit {name}")
+
+
+@register_function(config_type=_AgentConfig)
+async def _agent(config: _AgentConfig, builder: Builder):
+    _events.append("enter workflow")
+    yield FunctionInfo.from_fn(_echo)
+    _events.append("exit workflow")
+
+
+@pytest.fixture(autouse=True)
+def reset_events_fixture():
+    _events.clear()
+    _started.clear()
+
+
+def _config(*tools: _SessionToolConfig, max_build_concurrency: int = 8) -> AIQConfig:
+    return AIQConfig(general=GeneralConfig(max_build_concurrency=max_build_concurrency),
+                     functions={tool.label: tool
+                                for tool in tools},
+                     workflow=_AgentConfig(tool_names=[tool.label for tool in tools]))
+
+
+async def test_level_is_built_concurrently():
+    config = _config(_SessionToolConfig(label="search", wait_for=["listing_query"]),
+                     _SessionToolConfig(label="listing_query", wait_for=["search"]))
+
+    async with WorkflowBuilder.from_config(config) as builder:
+        assert await builder.get_function("search").ainvoke("浦东", to_type=str) == "浦东"
+        assert sorted(_events) == ["enter listing_query", "enter search", "enter workflow"]
+
+    # every component is torn down by the task which built it, the workflow first
+    assert _events[3] == "exit workflow"
+    assert sorted(_events[4:]) == ["exit listing_query", "exit search"]
+
+
+async def test_sequential_build():
+    config = _config(_SessionToolConfig(label="search"),
+                     _SessionToolConfig(label="listing_query"),
+                     max_build_concurrency=1)
+
+    async with WorkflowBuilder.from_config(config):
+        pass
+
+    assert _events == [
+        "enter search",
+        "enter listing_query",
+        "enter workflow",
+        "exit workflow",
+        "exit listing_query",
+        "exit search",
+    ]
+
+
+async def test_failed_component_tears_down_its_level():
+    config = _config(_SessionToolConfig(label="search", wait_for=["broken"]),
+                     _SessionToolConfig(label="broken", wait_for=["search"], fail=True))
+
+    with pytest.raises(ValueError, match="broken failed"):
+        async with WorkflowBuilder.from_config(config):
+            pass
+
+    assert _events == ["enter search", "exit search"]
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from aiq.cli.entrypoint import cli
+
+
+def _step(parent_id: str, uuid: str, event_type: str, timestamp: float, name: str, data: dict | None = None) -> dict:
+    return {
+        "parent_id": parent_id,
+        "function_ancestry": {
+            "function_id": "fn-agent", "function_name": "react_agent"
+        },
+        "payload": {
+            "event_type": event_type, "event_timestamp": timestamp, "name": name, "UUID": uuid, "data": data
+        },
+    }
+
+
+def _request(index: int, start: float, llm_latency: float) -> list[dict]:
+    root = f"fn-{index}"
+    llm = f"llm-{index}"
+    return [
+        _step("root", root, "FUNCTION_START", start, "react_agent"),
+        _step(root, llm, "LLM_START", start + 0.5, "nim_llm", {"input": "浦东 两房 均价"}),
+        _step(root, llm, "LLM_END", start + 0.5 + llm_latency, "nim_llm", {"output": "Final Answer: 65000"}),
+        _step("root", root, "FUNCTION_END", start + 1.0 + llm_latency, "react_agent"),
+    ]
+
+
+@pytest.fixture(name="trace_file")
+def trace_file_fixture(tmp_path):
+    steps = _request(0, 0.0, 1.0) + _request(1, 10.0, 3.0)
+    trace_file = tmp_path / "trace.log"
+    trace_file.write_text("".join(json.dumps(step) + "\n" for step in steps), encoding="utf-8")
+    return trace_file
+
+
+def test_profile_command(trace_file, tmp_path):
+    output_dir = tmp_path / "profile"
+
+    result = CliRunner().invoke(cli, ["profile", str(trace_file), "--output_dir", str(output_dir), "--chunk_size", "3"])
+
+    assert result.exit_code == 0, result.output
+    assert "LLM latency (s)" in result.output
+    assert (output_dir / "standardized_data_all.parquet").exists()
+
+    with open(output_dir / "inference_optimization.json", encoding="utf-8") as f:
+        intervals = json.load(f)["confidence_intervals"]
+
+    assert intervals["llm_latency_confidence_intervals"]["n"] == 2
+    assert intervals["llm_latency_confidence_intervals"]["mean"] == pytest.approx(2.0)
+    assert intervals["workflow_run_time_confidence_intervals"]["mean"] == pytest.approx(3.0)
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from aiq.eval.config import EvaluationRunConfig
+from aiq.eval.runners.config import MultiEvaluationRunConfig
+from aiq.eval.runners.multi_eval_runner import MultiEvaluationRunner
+
+
+@pytest.fixture(name="config_file")
+def config_file_fixture(tmp_path: Path) -> Path:
+    dataset_file = tmp_path / "dataset.json"
+    dataset = [{"id": str(i), "question": f"question {i}", "answer": f"answer {i}"} for i in range(4)]
+    dataset_file.write_text(json.dumps(dataset), encoding="utf-8")
+
+    config = {
+        "workflow": {
+            "_type": "current_datetime"
+        },
+        "eval": {
+            "general": {
+                "output": {
+                    "dir": str(tmp_path / "output"), "cleanup": True
+                },
+                "dataset": {
+                    "_type": "json", "file_path": str(dataset_file)
+                },
+            }
+        },
+    }
+    config_file = tmp_path / "config.yml"
+    config_file.write_text(yaml.safe_dump(config), encoding="utf-8")
+    return config_file
+
+
+async def test_parallel_runs_keep_their_outputs(config_file: Path, tmp_path: Path):
+    configs = {
+        concurrency:
+            EvaluationRunConfig(config_file=config_file,
+                                override=(("eval.general.max_concurrency", str(concurrency)), ))
+        for concurrency in (1, 2)
+    }
+    runner = MultiEvaluationRunner(
+        MultiEvaluationRunConfig(configs=configs, max_parallel_runs=2, checkpoint_dir=tmp_path / "checkpoints"))
+
+    outputs = await runner.run_all()
+
+    assert outputs[1].workflow_output_file == tmp_path / "output" / "1" / "workflow_output.json"
+    assert outputs[2].workflow_output_file == tmp_path / "output" / "2" / "workflow_output.json"
+    for output in outputs.values():
+        assert len(json.loads(output.workflow_output_file.read_text(encoding="utf-8"))) == 4
+
+    assert (tmp_path / "checkpoints" / "1" / "checkpoint.jsonl").exists()
+    assert (tmp_path / "checkpoints" / "2" / "checkpoint.jsonl").exists()
@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from aiq.data_models.config import AIQConfig
+from aiq.data_models.dataset_handler import EvalDatasetJsonConfig
+from aiq.data_models.evaluate import EvalConfig
+from aiq.data_models.evaluate import EvalGeneralConfig
+from aiq.eval.evaluator.evaluator_model import EvalInput
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
+from aiq.eval.utils.eval_checkpoint import EvalCheckpoint
+from aiq.llm.nim_llm import NIMModelConfig
+
+
+def _eval_input(count: int) -> EvalInput:
+    return EvalInput(eval_input_items=[
+        EvalInputItem(id=index,
+                      input_obj=f"question {index}",
+                      expected_output_obj=None,
+                      output_obj=None,
+                      expected_trajectory=[],
+                      trajectory=[],
+                      full_dataset_entry=None) for index in range(count)
+    ])
+
+
+def _run(path, fingerprint: str, count: int, completed: list[int]) -> list[int]:
+    """Restore a checkpoint and complete the ``completed`` items, returns the ids of the restored items."""
+    checkpoint = EvalCheckpoint(path, fingerprint=fingerprint)
+    eval_input = _eval_input(count)
+    restored = checkpoint.restore(eval_input)
+    try:
+        for item in eval_input.eval_input_items:
+            if item.id in completed:
+                item.output_obj = f"answer {item.id}"
+                checkpoint.write(item)
+    finally:
+        checkpoint.close()
+    return [item.id for item in restored]
+
+
+def test_restore_with_same_fingerprint(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    _run(path, "abc", count=3, completed=[0, 2])
+
+    checkpoint = EvalCheckpoint(path, fingerprint="abc")
+    eval_input = _eval_input(3)
+    restored = checkpoint.restore(eval_input)
+
+    assert [item.id for item in restored] == [0, 2]
+    assert [item.output_obj for item in eval_input.eval_input_items] == ["answer 0", None, "answer 2"]
+
+
+def test_resume_appends(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    _run(path, "abc", count=3, completed=[0])
+    _run(path, "abc", count=3, completed=[1])
+
+    assert _run(path, "abc", count=3, completed=[]) == [0, 1]
+
+
+def test_mismatched_fingerprint_is_ignored_and_replaced(tmp_path, caplog):
+    path = tmp_path / "checkpoint.jsonl"
+    _run(path, "abc", count=3, completed=[0, 1])
+
+    assert _run(path, "def", count=3, completed=[2]) == []
+    assert "different workflow or dataset configuration" in caplog.text
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert lines[0] == {"fingerprint": "def"}
+    assert [line["id"] for line in lines[1:]] == ["2"]
+
+
+def test_incomplete_line_is_ignored(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    _run(path, "abc", count=2, completed=[0, 1])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"id": "2", "output_')
+
+    assert _run(path, "abc", count=3, completed=[]) == [0, 1]
+
+
+def test_fingerprint_config():
+    config = AIQConfig().model_copy(
+        update={
+            "llms": {
+                "nim_llm": NIMModelConfig(model_name="meta/llama-3.1-70b-instruct")
+            },
+            "eval":
+                EvalConfig(general=EvalGeneralConfig(dataset=EvalDatasetJsonConfig(file_path="data/listings.json"))),
+        })
+    fingerprint = EvalCheckpoint.fingerprint_config(config)
+
+    # Changing where the results go keeps the checkpoint
+    output_changed = config.model_copy(deep=True)
+    output_changed.eval.general.output_dir = output_changed.eval.general.output_dir / "jobs/job_1"
+    assert EvalCheckpoint.fingerprint_config(output_changed) == fingerprint
+
+    # Changing the workflow or the dataset invalidates it
+    llm_changed = config.model_copy(
+        update={"llms": {
+            "nim_llm": NIMModelConfig(model_name="meta/llama-3.3-70b-instruct")
+        }})
+    assert EvalCheckpoint.fingerprint_config(llm_changed) != fingerprint
+
+    dataset_changed = config.model_copy(deep=True)
+    dataset_changed.eval.general.dataset.file_path = "data/listings_v2.json"
+    assert EvalCheckpoint.fingerprint_config(dataset_changed) != fingerprint
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from aiq.builder.evaluator import EvaluatorInfo
+from aiq.data_models.component_ref import LLMRef
+from aiq.data_models.evaluator import EvaluatorBaseConfig
+from aiq.eval.evaluator.evaluator_model import EvalInput
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
+from aiq.eval.evaluator.evaluator_model import EvalOutput
+from aiq.eval.evaluator.evaluator_model import EvalOutputItem
+from aiq.eval.utils.evaluator_cache import EvaluatorCache
+from aiq.llm.nim_llm import NIMModelConfig
+
+
+class _JudgeEvaluatorConfig(EvaluatorBaseConfig, name="test_cache_judge"):
+    llm_name: LLMRef
+    threshold: float = 0.5
+
+
+class _Builder:
+
+    def __init__(self, llms: dict[str, NIMModelConfig]):
+        self.llms = llms
+
+    def get_llm_config(self, llm_name: str | LLMRef) -> NIMModelConfig:
+        return self.llms[llm_name]
+
+
+class _Evaluator(EvaluatorInfo):
+
+    def __init__(self, config: EvaluatorBaseConfig):
+        super().__init__(config=config, evaluate_fn=self._evaluate, description="Scores the length of the output")
+        self.evaluated: list[str] = []
+
+    async def _evaluate(self, eval_input: EvalInput) -> EvalOutput:
+        items = [
+            EvalOutputItem(id=item.id, score=len(item.output_obj), reasoning="length")
+            for item in eval_input.eval_input_items
+        ]
+        self.evaluated.extend(item.id for item in eval_input.eval_input_items)
+        # An aggregate which is not the mean of the item scores
+        return EvalOutput(average_score=max(item.score for item in items), eval_output_items=items)
+
+
+def _eval_input(*outputs: str) -> EvalInput:
+    return EvalInput(eval_input_items=[
+        EvalInputItem(id=str(index),
+                      input_obj="浦东 两房",
+                      expected_output_obj=None,
+                      output_obj=output,
+                      expected_trajectory=[],
+                      trajectory=[],
+                      full_dataset_entry=None) for index, output in enumerate(outputs)
+    ])
+
+
+@pytest.fixture(name="builder")
+def builder_fixture() -> _Builder:
+    return _Builder({"judge": NIMModelConfig(model_name="meta/llama-3.1-70b-instruct")})
+
+
+async def test_unchanged_items_are_served_from_cache(tmp_path, builder: _Builder):
+    cache = EvaluatorCache(tmp_path, builder=builder)
+    evaluator = _Evaluator(_JudgeEvaluatorConfig(llm_name="judge"))
+
+    first = await cache.evaluate("judge", evaluator, _eval_input("ab", "abcd"))
+    second = await cache.evaluate("judge", evaluator, _eval_input("ab", "abcd"))
+
+    assert evaluator.evaluated == ["0", "1"]
+    assert second == first
+    # the evaluator's own average is reused instead of the mean of the item scores
+    assert second.average_score == 4
+    assert cache.stats["judge"].hits == 2
+    assert cache.stats["judge"].misses == 2
+
+
+async def test_changed_item_is_evaluated_with_all_items(tmp_path, builder: _Builder):
+    cache = EvaluatorCache(tmp_path, builder=builder)
+    evaluator = _Evaluator(_JudgeEvaluatorConfig(llm_name="judge"))
+
+    await cache.evaluate("judge", evaluator, _eval_input("ab", "abc"))
+    output = await cache.evaluate("judge", evaluator, _eval_input("ab", "abcd"))
+
+    # the evaluator computes the average over every item again
+    assert evaluator.evaluated == ["0", "1", "0", "1"]
+    assert [item.score for item in output.eval_output_items] == [2, 4]
+    assert output.average_score == 4
+
+
+async def test_duplicate_items_keep_their_ids(tmp_path, builder: _Builder):
+    cache = EvaluatorCache(tmp_path, builder=builder)
+    evaluator = _Evaluator(_JudgeEvaluatorConfig(llm_name="judge"))
+
+    first = await cache.evaluate("judge", evaluator, _eval_input("ab", "ab", "abc"))
+    second = await cache.evaluate("judge", evaluator, _eval_input("ab", "ab", "abc"))
+
+    assert evaluator.evaluated == ["0", "1", "2"]
+    for output in (first, second):
+        assert [(item.id, item.score) for item in output.eval_output_items] == [("0", 2), ("1", 2), ("2", 3)]
+
+
+async def test_evaluator_config_change_invalidates(tmp_path, builder: _Builder):
+    cache = EvaluatorCache(tmp_path, builder=builder)
+    await cache.evaluate("judge", _Evaluator(_JudgeEvaluatorConfig(llm_name="judge")), _eval_input("ab"))
+
+    evaluator = _Evaluator(_JudgeEvaluatorConfig(llm_name="judge", threshold=0.9))
+    await cache.evaluate("judge", evaluator, _eval_input("ab"))
+
+    assert evaluator.evaluated == ["0"]
+
+
+async def test_judge_llm_change_invalidates(tmp_path, builder: _Builder):
+    cache = EvaluatorCache(tmp_path, builder=builder)
+    config = _JudgeEvaluatorConfig(llm_name="judge")
+    await cache.evaluate("judge", _Evaluator(config), _eval_input("ab"))
+
+    # Same evaluator config, the LLM it references now uses another model
+    builder.llms["judge"] = NIMModelConfig(model_name="meta/llama-3.3-70b-instruct")
+    evaluator = _Evaluator(config)
+    await cache.evaluate("judge", evaluator, _eval_input("ab"))
+
+    assert evaluator.evaluated == ["0"]
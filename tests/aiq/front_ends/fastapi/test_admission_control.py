@@ -0,0 +1,256 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import gc
+
+import pytest
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+from starlette.responses import StreamingResponse
+
+from aiq.front_ends.fastapi.admission_control import AdmissionController
+
+_SCOPE = {"type": "http", "method": "GET", "path": "/generate/stream", "headers": []}
+
+
+async def _receive():
+    await asyncio.Event().wait()
+
+
+def _streaming_endpoint(chunks: list[str]):
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    async def endpoint():
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    return endpoint
+
+
+async def test_regular_response_releases_slot():
+    controller = AdmissionController("/generate", max_concurrency=1)
+
+    async def endpoint():
+        assert controller.stats.in_flight == 1
+        return JSONResponse({"value": "浦东"})
+
+    response = await controller.wrap(endpoint)()
+
+    assert isinstance(response, JSONResponse)
+    assert controller.stats.in_flight == 0
+    assert controller.stats.admitted == 1
+
+
+async def test_streaming_response_releases_slot_once_sent():
+    controller = AdmissionController("/generate/stream", max_concurrency=1)
+    response = await controller.wrap(_streaming_endpoint(["a", "b"]))()
+
+    assert isinstance(response, StreamingResponse)
+    assert controller.stats.in_flight == 1
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await response(_SCOPE, _receive, send)
+
+    assert b"".join(message.get("body", b"") for message in messages) == b"ab"
+    assert controller.stats.in_flight == 0
+
+
+async def test_streaming_response_releases_slot_when_stream_fails():
+    controller = AdmissionController("/generate/stream", max_concurrency=1)
+
+    async def stream():
+        yield "a"
+        raise RuntimeError("workflow failed")
+
+    async def endpoint():
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    response = await controller.wrap(endpoint)()
+
+    async def send(message):
+        pass
+
+    with pytest.raises(RuntimeError):
+        await response(_SCOPE, _receive, send)
+
+    assert controller.stats.in_flight == 0
+
+
+async def test_streaming_response_releases_slot_when_client_disconnects():
+    controller = AdmissionController("/generate/stream", max_concurrency=1)
+    first_chunk_sent = asyncio.Event()
+
+    async def stream():
+        yield "a"
+        # The workflow is still generating when the client goes away
+        await asyncio.Event().wait()
+
+    async def endpoint():
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    async def receive():
+        await first_chunk_sent.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message.get("body"):
+            first_chunk_sent.set()
+
+    response = await controller.wrap(endpoint)()
+    await asyncio.wait_for(response(_SCOPE, receive, send), timeout=1)
+
+    assert controller.stats.in_flight == 0
+    # The slot is usable again
+    await asyncio.wait_for(controller.acquire(), timeout=1)
+    controller.release()
+
+
+async def test_streaming_response_releases_slot_when_send_fails():
+    controller = AdmissionController("/generate/stream", max_concurrency=1)
+    response = await controller.wrap(_streaming_endpoint(["a", "b"]))()
+
+    async def send(message):
+        raise OSError("client disconnected")
+
+    with pytest.raises(OSError):
+        await response(_SCOPE, _receive, send)
+
+    del response
+    gc.collect()
+
+    assert controller.stats.in_flight == 0
+
+
+async def test_streaming_response_releases_slot_when_never_sent():
+    controller = AdmissionController("/generate/stream", max_concurrency=1)
+    response = await controller.wrap(_streaming_endpoint(["a"]))()
+    assert controller.stats.in_flight == 1
+
+    del response
+    gc.collect()
+
+    assert controller.stats.in_flight == 0
+
+
+async def test_endpoint_error_releases_slot():
+    controller = AdmissionController("/generate", max_concurrency=1)
+
+    async def endpoint():
+        raise ValueError("workflow failed")
+
+    with pytest.raises(ValueError):
+        await controller.wrap(endpoint)()
+
+    assert controller.stats.in_flight == 0
+
+
+async def test_rejects_when_queue_is_full():
+    controller = AdmissionController("/generate", max_concurrency=1, max_queue_size=0, retry_after=7)
+    await controller.acquire()
+
+    with pytest.raises(HTTPException) as error:
+        await controller.acquire()
+
+    assert error.value.status_code == 429
+    assert error.value.headers == {"Retry-After": "7"}
+    assert controller.stats.rejected_queue_full == 1
+    controller.release()
+
+
+async def test_queued_request_is_admitted_when_slot_frees():
+    controller = AdmissionController("/generate", max_concurrency=1, max_queue_size=1, queue_timeout=5)
+    await controller.acquire()
+
+    queued = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    assert controller.stats.queue_depth == 1
+
+    controller.release()
+    await asyncio.wait_for(queued, timeout=1)
+
+    assert controller.stats.in_flight == 1
+    assert controller.stats.queue_depth == 0
+    controller.release()
+
+
+async def test_queue_timeout_keeps_permits():
+    controller = AdmissionController("/generate", max_concurrency=1, max_queue_size=1, queue_timeout=0.01)
+    await controller.acquire()
+
+    with pytest.raises(HTTPException) as error:
+        await controller.acquire()
+
+    assert error.value.status_code == 429
+    assert controller.stats.rejected_timeout == 1
+
+    # Once the admitted request is done exactly one permit is available again
+    controller.release()
+    await asyncio.wait_for(controller.acquire(), timeout=1)
+    assert controller._semaphore.locked()
+    controller.release()
+
+
+async def test_cancelled_queued_request_keeps_permits():
+    controller = AdmissionController("/generate", max_concurrency=1, max_queue_size=1, queue_timeout=5)
+    await controller.acquire()
+
+    queued = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+
+    controller.release()
+    await asyncio.sleep(0)
+    assert not controller._semaphore.locked()
+    assert controller.stats.queue_depth == 0
+
+
+async def test_forecast_rejects_requests_predicted_to_time_out():
+    controller = AdmissionController("/generate",
+                                     max_concurrency=2,
+                                     max_queue_size=8,
+                                     queue_timeout=10,
+                                     service_time=8.0)
+    await controller.acquire()
+    await controller.acquire()
+
+    # First in the queue, predicted to wait 1 * 8 / 2 = 4 seconds
+    queued = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    assert controller.stats.queue_depth == 1
+
+    # Second, third in the queue, predicted to wait 8 then 12 seconds
+    second = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    with pytest.raises(HTTPException) as error:
+        await controller.acquire()
+
+    assert error.value.status_code == 429
+    assert error.value.headers == {"Retry-After": "12"}
+    assert controller.stats.rejected_forecast == 1
+
+    for _ in range(2):
+        controller.release()
+    await asyncio.wait_for(asyncio.gather(queued, second), timeout=1)
+    for _ in range(2):
+        controller.release()
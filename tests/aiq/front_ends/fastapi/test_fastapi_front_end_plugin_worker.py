@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import sqlite3
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+
+from aiq.data_models.config import AIQConfig
+from aiq.data_models.config import GeneralConfig
+from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
+from aiq.front_ends.fastapi.fastapi_front_end_plugin_worker import FastApiFrontEndPluginWorker
+from aiq.front_ends.fastapi.register import register_fastapi_front_end  # pylint: disable=unused-import # noqa: F401
+from aiq.profiler.forecasting.models.exponentially_weighted_model import ExponentiallyWeightedModel
+
+
+@pytest.fixture(name="worker")
+def worker_fixture(tmp_path) -> FastApiFrontEndPluginWorker:
+    front_end = FastApiFrontEndConfig(
+        job_store=FastApiFrontEndConfig.JobStoreSettings(backend="sqlite", path=str(tmp_path / "jobs.sqlite")),
+        shared_state=FastApiFrontEndConfig.SharedStateSettings(backend="sqlite",
+                                                               path=str(tmp_path / "shared_state.sqlite")))
+    return FastApiFrontEndPluginWorker(AIQConfig(general=GeneralConfig(front_end=front_end)))
+
+
+async def test_shutdown_releases_shared_resources(worker: FastApiFrontEndPluginWorker):
+    worker._shared_state = worker._create_shared_state()
+    job_stores = [worker._create_job_store("async_evaluation"), worker._create_job_store("async_generation:/generate")]
+    redirect_task = asyncio.create_task(asyncio.sleep(3600))
+    worker._remote_redirect_tasks["state"] = redirect_task
+
+    await worker.shutdown(FastAPI())
+
+    assert redirect_task.cancelled()
+    assert not worker._remote_redirect_tasks
+    for job_store in job_stores:
+        with pytest.raises(sqlite3.ProgrammingError):
+            await job_store.get_all_jobs()
+    with pytest.raises(sqlite3.ProgrammingError):
+        await worker._shared_state.get("oauth2_flows", "state")
+
+
+def test_admission_control_uses_forecasting_model(tmp_path):
+    model = ExponentiallyWeightedModel(matrix_length=2)
+    # Two LLM calls of 1.5 and 2.5 seconds, the columns of CALL_COLUMNS
+    model.update([np.array([[0.0, 100, 20, 1.5], [0.1, 150, 30, 2.5]])])
+    model.save(tmp_path / "model.npz")
+
+    front_end = FastApiFrontEndConfig(admission_control=FastApiFrontEndConfig.AdmissionControl(
+        max_concurrency=2, forecasting_model=str(tmp_path / "model.npz")))
+    worker = FastApiFrontEndPluginWorker(AIQConfig(general=GeneralConfig(front_end=front_end)))
+
+    worker._admission_control.limit("/generate", lambda: None)
+    assert worker._admission_control.metrics()["/generate"]["service_time"] == pytest.approx(4.0)
@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+
+import pytest
+
+from aiq.front_ends.fastapi.job_store import InMemoryJobStore
+from aiq.front_ends.fastapi.job_store import JobStatus
+from aiq.front_ends.fastapi.job_store import JobStoreBase
+from aiq.front_ends.fastapi.job_store import SQLiteJobStore
+
+
+@pytest.fixture(name="job_store", params=["memory", "sqlite"])
+async def job_store_fixture(request, tmp_path) -> JobStoreBase:
+    if request.param == "sqlite":
+        job_store = SQLiteJobStore(tmp_path / "jobs.sqlite")
+    else:
+        job_store = InMemoryJobStore()
+    yield job_store
+    await job_store.close()
+
+
+def _expire(job_store: JobStoreBase, job_id: str, seconds_ago: int):
+    """Move the finished job ``job_id`` past its expiry time, as if it finished ``seconds_ago`` over the maximum."""
+    past = datetime.now(UTC) - timedelta(seconds=JobStoreBase.MAX_EXPIRY + seconds_ago)
+    if isinstance(job_store, SQLiteJobStore):
+        job_store._execute("UPDATE jobs SET updated_at = ?, expires_at = ? WHERE job_id = ?",
+                           (past.timestamp(), past.timestamp() + JobStoreBase.MIN_EXPIRY, job_id))
+    else:
+        job = job_store._jobs[job_id]
+        job_store._unindex(job)
+        job.updated_at = past
+        job_store._index(job)
+
+
+async def test_create_and_update(job_store: JobStoreBase):
+    job_id = await job_store.create_job(config_file="eval.yml", expiry_seconds=1)
+    job = await job_store.get_job(job_id)
+
+    assert job.status == JobStatus.SUBMITTED
+    assert job.config_file == "eval.yml"
+    assert job.expiry_seconds == JobStoreBase.MIN_EXPIRY
+    assert job_store.get_expires_at(job) is None
+
+    await job_store.update_status(job_id, "success", output_path="/tmp/out")
+    job = await job_store.get_job(job_id)
+
+    assert job.status == JobStatus.SUCCESS
+    assert job.output_path == "/tmp/out"
+    assert job_store.get_expires_at(job) == job.updated_at + timedelta(seconds=JobStoreBase.MIN_EXPIRY)
+    assert [job.job_id for job in await job_store.get_jobs_by_status("success")] == [job_id]
+    assert await job_store.get_jobs_by_status("submitted") == []
+
+
+async def test_update_unknown_job(job_store: JobStoreBase):
+    with pytest.raises(ValueError):
+        await job_store.update_status("missing", "running")
+
+
+async def test_last_job(job_store: JobStoreBase):
+    assert await job_store.get_last_job() is None
+
+    await job_store.create_job(job_id="first")
+    await job_store.create_job(job_id="second")
+
+    assert (await job_store.get_last_job()).job_id == "second"
+    assert [job.job_id for job in await job_store.get_all_jobs()] == ["first", "second"]
+
+
+async def test_cleanup_keeps_active_and_most_recent_jobs(job_store: JobStoreBase, tmp_path):
+    output_dir = tmp_path / "old"
+    output_dir.mkdir()
+    for job_id in ("old", "recent", "running"):
+        await job_store.create_job(job_id=job_id)
+    await job_store.update_status("old", "success", output_path=str(output_dir))
+    await job_store.update_status("recent", "failure", error="timeout")
+    await job_store.update_status("running", "running")
+    _expire(job_store, "old", seconds_ago=20)
+    _expire(job_store, "recent", seconds_ago=10)
+
+    await job_store.cleanup_expired_jobs()
+
+    assert sorted(job.job_id for job in await job_store.get_all_jobs()) == ["recent", "running"]
+    assert not output_dir.exists()
+
+
+async def test_stale_active_jobs_are_interrupted(tmp_path):
+    job_store = SQLiteJobStore(tmp_path / "jobs.sqlite", stale_after_seconds=0.05)
+    try:
+        await job_store.create_job(job_id="crashed")
+        await job_store.update_status("crashed", "running")
+        await job_store.create_job(job_id="alive")
+
+        await asyncio.sleep(0.1)
+        await job_store.heartbeat("alive")
+        await job_store.cleanup_expired_jobs()
+
+        crashed = await job_store.get_job("crashed")
+        assert crashed.status == JobStatus.INTERRUPTED
+        assert crashed.error
+        assert job_store.get_expires_at(crashed) is not None
+        assert (await job_store.get_job("alive")).status == JobStatus.SUBMITTED
+    finally:
+        await job_store.close()
+
+
+async def test_sqlite_store_is_shared(tmp_path):
+    writer = SQLiteJobStore(tmp_path / "jobs.sqlite", namespace="async_evaluation")
+    reader = SQLiteJobStore(tmp_path / "jobs.sqlite", namespace="async_evaluation")
+    other = SQLiteJobStore(tmp_path / "jobs.sqlite", namespace="async_generation")
+    try:
+        job_id = await writer.create_job()
+
+        assert (await reader.get_job(job_id)).job_id == job_id
+        assert await other.get_job(job_id) is None
+    finally:
+        for job_store in (writer, reader, other):
+            await job_store.close()
+
+
+async def test_sqlite_store_does_not_block_the_event_loop(tmp_path):
+    job_store = SQLiteJobStore(tmp_path / "jobs.sqlite")
+    blocker = SQLiteJobStore(tmp_path / "jobs.sqlite")
+    try:
+        # Another process holds the write lock for a while
+        blocker._execute("BEGIN IMMEDIATE")
+        create = asyncio.create_task(job_store.create_job(job_id="queued"))
+
+        start = time.monotonic()
+        await asyncio.sleep(0.05)
+        assert time.monotonic() - start < 0.5
+        assert not create.done()
+
+        blocker._execute("COMMIT")
+        assert await create == "queued"
+    finally:
+        await job_store.close()
+        await blocker.close()
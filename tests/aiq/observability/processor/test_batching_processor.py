@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from aiq.observability.processor.batching_processor import BatchingProcessor
+
+
+async def test_adaptive_exports_batches_of_a_trace_in_order():
+    exported: list[tuple[str, int]] = []
+
+    async def export(batch: list[tuple[str, int]]):
+        # The first batch of every trace is the slowest, a later batch would overtake it if it were not held back
+        await asyncio.sleep(0.05 if batch[0][1] == 0 else 0)
+        exported.extend(batch)
+
+    processor = BatchingProcessor[tuple[str, int]](batch_size=2,
+                                                   flush_interval=60.0,
+                                                   done_callback=export,
+                                                   adaptive=True,
+                                                   max_concurrent_exports=4,
+                                                   ordering_key=lambda item: item[0])
+
+    for index in range(6):
+        for trace_id in ("a", "b"):
+            assert await processor.process((trace_id, index)) == []
+
+    await processor.shutdown()
+
+    assert len(exported) == 12
+    for trace_id in ("a", "b"):
+        assert [index for key, index in exported if key == trace_id] == list(range(6))
+
+
+async def test_adaptive_bounds_concurrent_exports():
+    running = 0
+    max_running = 0
+
+    async def export(batch: list[int]):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    processor = BatchingProcessor[int](batch_size=1,
+                                       flush_interval=60.0,
+                                       done_callback=export,
+                                       adaptive=True,
+                                       max_concurrent_exports=2)
+
+    for item in range(8):
+        await processor.process(item)
+
+    await processor.shutdown()
+
+    assert max_running == 2
+    assert processor.get_stats()["exports"] == 8
+
+
+async def test_adaptive_back_pressure_blocks_and_resumes():
+    exported: list[int] = []
+    unblock = asyncio.Event()
+
+    async def export(batch: list[int]):
+        await unblock.wait()
+        exported.extend(batch)
+
+    processor = BatchingProcessor[int](batch_size=1,
+                                       flush_interval=60.0,
+                                       max_queue_size=2,
+                                       done_callback=export,
+                                       adaptive=True)
+
+    await processor.process(0)
+    await processor.process(1)
+
+    # Both queue slots are taken by items waiting for their export, the next item has to wait for one of them
+    blocked = asyncio.create_task(processor.process(2))
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+    assert processor.get_stats()["queue_overflows"] == 1
+
+    unblock.set()
+    assert await asyncio.wait_for(blocked, timeout=1) == []
+
+    await processor.shutdown()
+
+    assert exported == [0, 1, 2]
+    assert processor.get_stats()["items_dropped"] == 0
@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+
+import pandas as pd
+import pytest
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.data_models.intermediate_step import UsageInfo
+from aiq.data_models.invocation_node import InvocationNode
+from aiq.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+from aiq.profiler.inference_optimization.bottleneck_analysis import nested_stack_analysis
+from aiq.profiler.inference_optimization.experimental import concurrency_spike_analysis
+from aiq.profiler.inference_optimization.llm_metrics import LLMMetrics
+from aiq.profiler.inference_optimization.token_uniqueness import compute_inter_query_token_uniqueness_by_llm
+from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
+from aiq.profiler.utils import create_standardized_dataframe
+
+
+def _step(event_type: IntermediateStepType,
+          uuid: str,
+          timestamp: float,
+          name: str,
+          text_input: str | None = None,
+          completion_tokens: int = 0) -> IntermediatePropertyAdaptor:
+    payload = IntermediateStepPayload(event_type=event_type, event_timestamp=timestamp, UUID=uuid, name=name)
+    if text_input is not None:
+        payload.data = StreamEventData(input=text_input)
+    if completion_tokens:
+        payload.usage_info = UsageInfo(
+            token_usage=TokenUsageBaseModel(completion_tokens=completion_tokens, total_tokens=completion_tokens))
+    step = IntermediateStep(parent_id="root",
+                            function_ancestry=InvocationNode(function_id="fn-1", function_name="react_agent"),
+                            payload=payload)
+    return IntermediatePropertyAdaptor.from_intermediate_step(step)
+
+
+@pytest.fixture(name="all_steps")
+def all_steps_fixture() -> list[list[IntermediatePropertyAdaptor]]:
+    """
+    Example 0: an agent calls an LLM, then a tool which calls a second LLM that outlives the tool call.
+    Example 1: a single LLM call.
+    """
+    return [
+        [
+            _step(IntermediateStepType.FUNCTION_START, "f1", 0.0, "react_agent"),
+            _step(IntermediateStepType.LLM_START, "l1", 1.0, "nim_llm", text_input="浦东 两房 均价"),
+            _step(IntermediateStepType.LLM_END, "l1", 2.0, "nim_llm", completion_tokens=5),
+            _step(IntermediateStepType.TOOL_START, "t1", 2.0, "lianjia_scraper"),
+            _step(IntermediateStepType.LLM_START, "l2", 3.0, "nim_llm", text_input="浦东 两房 均价 闵行 三房"),
+            _step(IntermediateStepType.TOOL_END, "t1", 4.0, "lianjia_scraper"),
+            _step(IntermediateStepType.LLM_END, "l2", 5.0, "nim_llm", completion_tokens=7),
+            _step(IntermediateStepType.FUNCTION_END, "f1", 6.0, "react_agent"),
+        ],
+        [
+            _step(IntermediateStepType.LLM_START, "l3", 0.0, "nim_llm", text_input="静安"),
+            _step(IntermediateStepType.LLM_END, "l3", 1.0, "nim_llm", completion_tokens=2),
+        ],
+    ]
+
+
+def test_llm_metrics(all_steps):
+    df = LLMMetrics.compute_profiling_metrics(all_steps)
+
+    assert df["NOVA-Event-ID"].unique().tolist() == ["react_agent"]
+    assert df["NOVA-Requests-Remaining-In-Event"].tolist() == [2, 1, 1, 1, 0, 0, 0, 0, 0, 0]
+    assert df["NOVA-Time-To-Next-Event"].tolist() == [1000.0, 2000.0, 1000.0, 1000.0] + [-1.0] * 6
+    assert df["NOVA-Time-To-Event-End"].tolist() == [3000.0, 2000.0, 1000.0, 1000.0] + [-1.0] * 6
+    assert df["NOVA-Time-To-Session-End"].tolist() == [
+        6000.0, 5000.0, 4000.0, 4000.0, 3000.0, 2000.0, 1000.0, 0.0, 1000.0, 0.0
+    ]
+
+    predicted_osl = df["NOVA-Predicted-OSL"].tolist()
+    assert [predicted_osl[i] for i in (1, 4, 8)] == [5.0, 7.0, 2.0]
+    assert all(math.isnan(predicted_osl[i]) for i in (0, 2, 3, 5, 6, 7, 9))
+
+
+def test_token_uniqueness(all_steps):
+    result = compute_inter_query_token_uniqueness_by_llm(all_steps)
+
+    # Only the second prompt of example 0 has a predecessor, it adds "闵行" and "三房"
+    assert list(result.root) == ["nim_llm"]
+    assert result.root["nim_llm"].model_dump() == {"p90": 2.0, "p95": 2.0, "p99": 2.0}
+
+
+def test_nested_stack_analysis(all_steps):
+    result = nested_stack_analysis.multi_example_call_profiling(all_steps)
+
+    assert result.concurrency.timeline_segments == [(0.0, 1.0, 2), (1.0, 2.0, 2), (2.0, 3.0, 2), (3.0, 4.0, 3),
+                                                    (4.0, 5.0, 2), (5.0, 6.0, 1)]
+    assert (result.concurrency.p50, result.concurrency.p90, result.concurrency.p99) == (2.0, 3.0, 3.0)
+
+    metrics = {uuid: (m.self_time, m.subtree_time, m.concurrency_midpoint) for uuid, m in result.node_metrics.items()}
+    assert metrics == {
+        "f1": (3.0, 7.0, 3.0),
+        "l1": (1.0, 1.0, 2.0),
+        "t1": (1.0, 3.0, 3.0),
+        "l2": (2.0, 2.0, 2.0),
+        "l3": (1.0, 1.0, 2.0),
+    }
+    assert [m.uuid for m in result.top_bottlenecks] == ["f1", "t1", "l2", "l1", "l3"]
+    assert "- FUNCTION 'react_agent' (uuid=f1, start=0.00, end=6.00, dur=6.00)" in result.textual_report
+    assert "    - LLM 'nim_llm' (uuid=l2, start=3.00, end=5.00, dur=2.00)" in result.textual_report
+
+
+def test_concurrency_spike_analysis(all_steps):
+    result = concurrency_spike_analysis.concurrency_spike_analysis(all_steps)
+
+    # Only LLM and tool calls count, the tool call and the second LLM call overlap between 3 and 4
+    assert result.concurrency_distribution == {1: 4.0, 2: 1.0}
+    assert (result.p50_concurrency, result.p90_concurrency, result.p99_concurrency) == (1.0, 2.0, 2.0)
+    assert result.spike_threshold == 2
+    assert [(s.start_time, s.end_time, s.concurrency, sorted(s.active_uuids))
+            for s in result.spike_intervals] == [(3.0, 4.0, 2, ["l2", "t1"])]
+    assert result.average_latency_by_concurrency == pytest.approx({1: 4.0 / 3, 2: 2.0})
+
+
+# The spike analysis only builds trees of LLM and tool calls
+@pytest.mark.parametrize("build_call_trees, root_uuids",
+                         [
+                             (nested_stack_analysis.build_call_tree_for_example, ["f1", "l3"]),
+                             (concurrency_spike_analysis.build_call_tree_per_example, ["l1", "t1", "l3"]),
+                         ])
+def test_call_trees_accept_string_event_types(all_steps, build_call_trees, root_uuids: list[str]):
+    df = create_standardized_dataframe(all_steps)
+    event_types = [IntermediateStepType(event_type) for event_type in df["event_type"]]
+    enum_df = df.assign(event_type=pd.Series(event_types, index=df.index, dtype=object))
+    str_df = df.assign(event_type=pd.Series([e.value for e in event_types], index=df.index, dtype=object))
+
+    assert isinstance(enum_df["event_type"].iloc[0], IntermediateStepType)
+    assert type(str_df["event_type"].iloc[0]) is str
+
+    def describe(roots) -> list:
+        return [(n.uuid, n.start_time, n.end_time, describe(n.children)) for n in roots]
+
+    roots = build_call_trees(str_df)
+    assert [root.uuid for root in roots] == root_uuids
+    assert describe(roots) == describe(build_call_trees(enum_df))
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from aiq.profiler.online_statistics import OnlineMetric
+from aiq.profiler.online_statistics import TDigest
+
+QUANTILES = [0.5, 0.9, 0.95, 0.99]
+
+
+def test_tdigest_is_exact_before_the_first_merge():
+    values = np.random.default_rng(0).lognormal(0.0, 1.0, 500)
+    digest = TDigest(compression=200.0)
+    digest.update(values)
+
+    for q in QUANTILES:
+        assert digest.quantile(q) == pytest.approx(np.percentile(values, q * 100))
+
+
+def test_tdigest_quantiles_match_numpy():
+    # Latencies are heavy tailed, the tails are where the digest has to be accurate
+    values = np.random.default_rng(0).lognormal(0.0, 1.0, 100_000)
+    digest = TDigest(compression=200.0)
+    for batch in np.array_split(values, 37):
+        digest.update(batch)
+
+    assert len(digest) == len(values)
+    for q in QUANTILES:
+        estimate = digest.quantile(q)
+        # The estimate lies within half a percent of the true quantile, both by rank and by value
+        assert np.mean(values <= estimate) == pytest.approx(q, abs=0.005)
+        assert estimate == pytest.approx(np.percentile(values, q * 100), rel=0.01)
+
+
+def test_tdigest_empty():
+    assert TDigest().quantile(0.9) == 0.0
+
+
+def test_online_metric_matches_numpy():
+    values = np.random.default_rng(1).normal(1e6, 3.0, 10_000)
+    metric = OnlineMetric()
+    # Uneven batches, including a single value and an empty one, exercise the batched Welford merge
+    for batch in np.split(values, [1, 1, 10, 2_500, 7_000]):
+        metric.update(batch)
+
+    assert metric.n == len(values)
+    assert metric.mean == pytest.approx(np.mean(values), rel=1e-12)
+    assert metric.pstdev == pytest.approx(np.std(values), rel=1e-9)
+
+    intervals = metric.to_inference_metrics()
+    se = np.std(values) / np.sqrt(len(values))
+    assert intervals.ninety_fifth_interval == pytest.approx((np.mean(values) - 1.96 * se, np.mean(values) + 1.96 * se))
+    assert intervals.p90 == pytest.approx(np.percentile(values, 90), rel=1e-6)
+
+
+def test_online_metric_single_value():
+    metric = OnlineMetric()
+    metric.update([2.5])
+
+    intervals = metric.to_inference_metrics()
+    assert (intervals.n, intervals.mean, intervals.p99) == (1, 2.5, 2.5)
+    assert intervals.ninety_ninth_interval == (2.5, 2.5)
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.data_models.intermediate_step import UsageInfo
+from aiq.data_models.invocation_node import InvocationNode
+from aiq.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
+from aiq.profiler.utils import create_standardized_dataframe
+
+
+def _step(event_type: IntermediateStepType, uuid: str, timestamp: float, **kwargs) -> IntermediatePropertyAdaptor:
+    step = IntermediateStep(parent_id="root",
+                            function_ancestry=InvocationNode(function_id="fn-1", function_name="react_agent"),
+                            payload=IntermediateStepPayload(event_type=event_type,
+                                                            event_timestamp=timestamp,
+                                                            UUID=uuid,
+                                                            name="nim_llm",
+                                                            **kwargs))
+    return IntermediatePropertyAdaptor.from_intermediate_step(step)
+
+
+def test_create_standardized_dataframe():
+    usage = UsageInfo(token_usage=TokenUsageBaseModel(prompt_tokens=12, completion_tokens=3, total_tokens=15))
+    requests = [
+        [
+            _step(IntermediateStepType.LLM_START, "llm-1", 1.0, data=StreamEventData(input="浦东 两房")),
+            _step(IntermediateStepType.LLM_END, "llm-1", 2.0, data=StreamEventData(output="均价"), usage_info=usage),
+        ],
+        [_step(IntermediateStepType.LLM_START, "llm-2", 3.0, data=StreamEventData(input="闵行"))],
+    ]
+
+    df = create_standardized_dataframe(requests)
+
+    assert len(df) == 3
+    assert df["example_number"].tolist() == [0, 0, 1]
+    assert df["UUID"].tolist() == ["llm-1", "llm-1", "llm-2"]
+    assert df["total_tokens"].tolist() == [0, 15, 0]
+    assert df["llm_text_input"].iloc[0] == "浦东 两房"
+
+
+def test_create_standardized_dataframe_empty():
+    assert create_standardized_dataframe([]).empty
+    assert create_standardized_dataframe([[]]).empty
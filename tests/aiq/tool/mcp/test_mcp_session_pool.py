@@ -0,0 +1,170 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+from mcp.types import CallToolResult
+from mcp.types import ListToolsResult
+from mcp.types import ServerNotification
+from mcp.types import TextContent
+from mcp.types import Tool
+from mcp.types import ToolListChangedNotification
+
+from aiq.tool.mcp import mcp_client
+from aiq.tool.mcp.mcp_client import MCPSessionPool
+
+URL = "http://localhost:9901/sse"
+
+
+class _FakeServer:
+
+    def __init__(self):
+        self.sessions: list["_FakeSession"] = []
+        self.list_tools_calls = 0
+        self.calls_in_flight = 0
+        self.max_calls_in_flight = 0
+        # Tool calls wait for this event, set by default
+        self.respond = asyncio.Event()
+        self.respond.set()
+
+
+class _FakeSession:
+
+    def __init__(self, server: _FakeServer, message_handler):
+        self.server = server
+        self.message_handler = message_handler
+        self.open = False
+        # The connection dropped, requests fail without being sent
+        self.broken = False
+
+    async def __aenter__(self):
+        self.open = True
+        self.server.sessions.append(self)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.open = False
+
+    async def initialize(self):
+        pass
+
+    async def send_ping(self):
+        pass
+
+    async def list_tools(self) -> ListToolsResult:
+        self.server.list_tools_calls += 1
+        return ListToolsResult(tools=[Tool(name="listing_query", inputSchema={"type": "object"})])
+
+    async def call_tool(self, tool_name: str, tool_args: dict | None) -> CallToolResult:
+        if self.broken:
+            raise anyio.ClosedResourceError()
+
+        self.server.calls_in_flight += 1
+        self.server.max_calls_in_flight = max(self.server.max_calls_in_flight, self.server.calls_in_flight)
+        try:
+            await self.server.respond.wait()
+        finally:
+            self.server.calls_in_flight -= 1
+        return CallToolResult(content=[TextContent(type="text", text=f"{tool_name}: {tool_args}")])
+
+
+@pytest.fixture(name="server")
+def server_fixture(monkeypatch: pytest.MonkeyPatch) -> _FakeServer:
+    server = _FakeServer()
+
+    @asynccontextmanager
+    async def sse_client(url: str):
+        assert url == URL
+        yield None, None
+
+    monkeypatch.setattr(mcp_client, "sse_client", sse_client)
+    monkeypatch.setattr(mcp_client,
+                        "ClientSession", lambda read, write, message_handler: _FakeSession(server, message_handler))
+    return server
+
+
+async def test_reconnects_after_closed_session(server: _FakeServer):
+    pool = MCPSessionPool(URL, health_check_interval=0)
+
+    await pool.call_tool("listing_query", {"city": "sh"})
+    server.sessions[0].broken = True
+
+    # The request was not sent on the closed session, so it is retried on a new one
+    result = await pool.call_tool("listing_query", {"city": "bj"})
+
+    assert result.content[0].text == "listing_query: {'city': 'bj'}"
+    assert len(server.sessions) == 2
+    assert not server.sessions[0].open
+    assert server.sessions[1].open
+
+    await pool.aclose()
+    assert not server.sessions[1].open
+
+
+async def test_bounds_concurrent_calls(server: _FakeServer):
+    pool = MCPSessionPool(URL, size=2, max_concurrent_calls=3, health_check_interval=0)
+    server.respond.clear()
+
+    calls = [asyncio.create_task(pool.call_tool("listing_query", {"page": page})) for page in range(8)]
+    await asyncio.sleep(0.05)
+
+    assert server.calls_in_flight == 3
+    assert len(server.sessions) == 2
+
+    server.respond.set()
+    results = await asyncio.gather(*calls)
+
+    assert [result.content[0].text for result in results] == [f"listing_query: {{'page': {page}}}" for page in range(8)]
+    assert server.max_calls_in_flight == 3
+
+    await pool.aclose()
+
+
+async def test_tools_cached_until_list_changed(server: _FakeServer):
+    pool = MCPSessionPool(URL, health_check_interval=0)
+
+    assert [tool.name for tool in await pool.list_tools()] == ["listing_query"]
+    await pool.list_tools()
+    assert server.list_tools_calls == 1
+
+    notification = ServerNotification(ToolListChangedNotification(method="notifications/tools/list_changed"))
+    await server.sessions[0].message_handler(notification)
+
+    await pool.list_tools()
+    assert server.list_tools_calls == 2
+
+    await pool.aclose()
+
+
+async def test_release_closes_sessions(server: _FakeServer):
+    pool = MCPSessionPool.acquire(URL, size=2, health_check_interval=0)
+    assert MCPSessionPool.acquire(URL) is pool
+
+    await asyncio.gather(*(pool.call_tool("listing_query", None) for _ in range(2)))
+    assert [session.open for session in server.sessions] == [True, True]
+
+    # The sessions stay open while the pool is still in use
+    await pool.release()
+    assert [session.open for session in server.sessions] == [True, True]
+
+    await pool.release()
+    assert [session.open for session in server.sessions] == [False, False]
+
+    new_pool = MCPSessionPool.acquire(URL, health_check_interval=0)
+    assert new_pool is not pool
+    await new_pool.release()
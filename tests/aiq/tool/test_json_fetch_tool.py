@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from aiq.tool.json_fetch_tool import _ParquetWriter
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def test_parquet_writer_unifies_page_columns(tmp_path):
+    path = tmp_path / "listings.parquet"
+    writer = _ParquetWriter(str(path))
+    writer.write_page([{"title": "浦东花园", "avg_unit_price": 65000}])
+    writer.write_page([{"title": "闵行新苑", "tags": ["近地铁", "学区"]}])
+    writer.write_page([])
+    writer.write_page([{"avg_unit_price": 52000, "title": "徐汇公寓"}])
+    writer.close()
+
+    table = pq.read_table(path)
+    assert table.column_names == ["title", "avg_unit_price", "tags"]
+    assert table.to_pylist() == [
+        {
+            "title": "浦东花园", "avg_unit_price": "65000", "tags": None
+        },
+        {
+            "title": "闵行新苑", "avg_unit_price": None, "tags": '["近地铁", "学区"]'
+        },
+        {
+            "title": "徐汇公寓", "avg_unit_price": "52000", "tags": None
+        },
+    ]
+    assert [p.name for p in tmp_path.iterdir()] == ["listings.parquet"]
+
+
+def test_parquet_writer_without_items(tmp_path):
+    writer = _ParquetWriter(str(tmp_path / "listings.parquet"))
+    writer.write_page([])
+    writer.close()
+
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import httpx
+import pytest
+
+from aiq.tool.lianjia_cache import LianjiaPageCache
+
+
+class _FakeFetcher:
+
+    def __init__(self):
+        self.urls: list[str] = []
+
+    async def fetch(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        self.urls.append(url)
+        return httpx.Response(200, content=json.dumps({"url": url}).encode("utf-8"))
+
+
+@pytest.fixture(name="cache")
+def cache_fixture(tmp_path):
+    cache = LianjiaPageCache(str(tmp_path / "pages.sqlite"),
+                             ttl_seconds=3600,
+                             max_entries=100,
+                             max_size_bytes=1024 * 1024)
+    yield cache
+    cache.close()
+
+
+def test_make_key_normalizes_url():
+    assert LianjiaPageCache.make_key("HTTPS://SH.fang.lianjia.com/loupan/pg1/?b=2&a=1#top") == \
+        LianjiaPageCache.make_key("https://sh.fang.lianjia.com/loupan/pg1/?a=1&b=2")
+
+
+@pytest.mark.parametrize("other",
+                         [
+                             "https://sh.fang.lianjia.com/xiaoqu/pg1/",
+                             "https://sh.fang.lianjia.com/loupan/pg1/?_t=1",
+                             "https://bj.fang.lianjia.com/loupan/pg1/",
+                         ])
+def test_make_key_keeps_path_and_query(other: str):
+    assert LianjiaPageCache.make_key("https://sh.fang.lianjia.com/loupan/pg1/") != LianjiaPageCache.make_key(other)
+
+
+async def test_fetch_does_not_share_entries_across_paths(cache: LianjiaPageCache):
+    fetcher = _FakeFetcher()
+
+    loupan, _ = await cache.fetch(fetcher, "https://sh.fang.lianjia.com/loupan/pg1/")
+    xiaoqu, _ = await cache.fetch(fetcher, "https://sh.fang.lianjia.com/xiaoqu/pg1/")
+    cached, from_network = await cache.fetch(fetcher, "https://sh.fang.lianjia.com/loupan/pg1/")
+
+    assert loupan.json() == {"url": "https://sh.fang.lianjia.com/loupan/pg1/"}
+    assert xiaoqu.json() == {"url": "https://sh.fang.lianjia.com/xiaoqu/pg1/"}
+    assert cached.json() == loupan.json()
+    assert not from_network
+    assert len(fetcher.urls) == 2
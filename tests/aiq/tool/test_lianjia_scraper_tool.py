@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import re
+
+import pytest
+
+from aiq.tool import lianjia_scraper_tool
+from aiq.tool.lianjia_cache import CachedPage
+from aiq.tool.lianjia_cache import LianjiaCacheConfig
+from aiq.tool.lianjia_scraper_tool import LianjiaScraperConfig
+from aiq.tool.listing_store import get_listing_store
+
+ITEMS_PER_PAGE = 10
+
+
+@pytest.fixture(name="fake_pages", autouse=True)
+def fake_pages_fixture(monkeypatch: pytest.MonkeyPatch):
+
+    async def fetch_page(fetcher, cache, url):
+        page = int(re.search(r"/pg(\d+)/", url).group(1))
+        items = [{
+            "title": f"楼盘 {page}-{i}",
+            "average_price": 50000 + i,
+            "district_name": "浦东",
+            "bizcircle_name": "陆家嘴",
+            "url": f"/loupan/p_{page}_{i}/",
+        } for i in range(ITEMS_PER_PAGE)]
+        body = json.dumps({"data": {"list": items}}).encode("utf-8")
+        return CachedPage(key=url, body=body, etag=None, last_modified=None, fetched_at=0.0), False
+
+    monkeypatch.setattr(lianjia_scraper_tool, "fetch_page", fetch_page)
+
+    store = get_listing_store()
+    store.clear()
+    yield
+    store.clear()
+
+
+async def _scrape(config: LianjiaScraperConfig, max_requests: int) -> dict:
+    async with lianjia_scraper_tool.lianjia_scraper(config, None) as function_info:
+        return await function_info.single_fn(
+            lianjia_scraper_tool.LianjiaScraperInput(city="sh", max_requests=max_requests))
+
+
+async def test_scraper_truncates_returned_items_by_default():
+    result = await _scrape(LianjiaScraperConfig(cache=LianjiaCacheConfig(enabled=False)), max_requests=3)
+
+    assert result["count"] == 3 * ITEMS_PER_PAGE
+    assert len(result["data"]) == LianjiaScraperConfig().max_returned_items
+    assert "listing_query" in result["note"]
+    # every listing is still available to the listing_query tool
+    assert len(get_listing_store()) == 3 * ITEMS_PER_PAGE
+
+
+async def test_scraper_returns_all_items_without_limit():
+    config = LianjiaScraperConfig(cache=LianjiaCacheConfig(enabled=False), max_returned_items=None)
+
+    result = await _scrape(config, max_requests=3)
+
+    assert len(result["data"]) == 3 * ITEMS_PER_PAGE
+    assert "note" not in result
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from aiq.utils.reactive.observer import Observer
+from aiq.utils.reactive.queued_observer import QueuedObserver
+
+
+@pytest.fixture(name="events")
+def events_fixture() -> list:
+    return []
+
+
+@pytest.fixture(name="observer")
+def observer_fixture(events: list) -> Observer:
+    return Observer(on_next=events.append,
+                    on_error=lambda e: events.append(("error", str(e))),
+                    on_complete=lambda: events.append("complete"))
+
+
+async def test_events_are_delivered_from_the_loop(events: list, observer: Observer):
+    queued = QueuedObserver(observer)
+
+    queued.on_next(1)
+    queued.on_next(2)
+    assert not events
+
+    queued.flush()
+    assert events == [1, 2]
+    assert queued.stats.delivered == 2
+
+
+@pytest.mark.parametrize("overflow", ["drop_oldest", "drop_newest"])
+async def test_drop_keeps_complete(events: list, observer: Observer, overflow: str):
+    queued = QueuedObserver(observer, max_queue_size=2, overflow=overflow)
+
+    queued.on_next(1)
+    queued.on_complete()
+    # the queue is full, the next events must not evict the completion
+    queued.on_next(2)
+    queued.on_next(3)
+    queued.flush()
+
+    assert "complete" in events
+    assert queued.stats.dropped == 2
+
+
+async def test_drop_oldest_evicts_events_but_not_error(events: list):
+    queued = QueuedObserver(Observer(on_next=events.append, on_error=lambda e: events.append(("error", str(e)))),
+                            max_queue_size=3,
+                            overflow="drop_oldest")
+
+    queued.on_error(ValueError("failed"))
+    queued.on_next(1)
+    queued.on_next(2)
+    queued.on_next(3)
+    queued.on_next(4)
+    queued.flush()
+
+    assert events == [("error", "failed"), 3, 4]
+    assert queued.stats.dropped == 2
+
+
+async def test_terminal_events_are_queued_when_full(events: list, observer: Observer):
+    queued = QueuedObserver(observer, max_queue_size=1, overflow="drop_oldest")
+
+    queued.on_next(1)
+    queued.on_error(ValueError("failed"))
+    queued.on_complete()
+    queued.flush()
+
+    assert events == [1, ("error", "failed"), "complete"]
+    assert queued.stats.dropped == 0